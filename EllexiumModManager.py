@@ -33,29 +33,31 @@ import importlib.util
 import functools
 import zipfile
 import gc
-import inspect
 import random
 import traceback
+import sqlite3
 
 #from memory_profiler import profile  
 
-from collections import OrderedDict
 
+# Windows-only: hotkeys, window focus and shortcuts. Skipped elsewhere so the data
+# pipeline (and modules/benchmark.py) can import this file headless.
+if sys.platform == "win32":
+    import pydirectinput
+    import win32gui
+    import win32con
+    import win32api
+    import win32process
 
-import pydirectinput
-import win32gui
-import win32con
-import win32api
-import win32process
+    import win32com.client # For COM objects
+    import pythoncom       # For COM initialization/uninitialization
+    from win32com.shell import shell, shellcon # For getting Desktop path
 
-import win32com.client # For COM objects
-import pythoncom       # For COM initialization/uninitialization
-from win32com.shell import shell, shellcon # For getting Desktop path
+    import pywintypes
 
 
 
 import ctypes
-import pywintypes
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -73,9 +75,110 @@ from modules.config_processors import (
     reorder_output_good
 )
 
+from modules.config_info_index import (
+    ConfigInfoIndex,
+    parse_config_info_file
+)
+
+from modules.custom_picture_index import (
+    CustomPictureIndex
+)
+
+from modules.processed_data_store import (
+    ProcessedDataStore,
+    LazyFullData,
+    get_processed_data_db_path,
+    collect_folder_file_signatures,
+    group_lines_by_folder,
+    hash_folder_lines,
+    mark_processed_data_stale
+)
+
+from modules.search_index import (
+    ConfigSearchIndex,
+    SearchMatchMemo,
+    extract_config_name_from_matches_filename
+)
+
+from modules.facet_index import (
+    FacetIndex
+)
+
+from modules.filter_attributes import (
+    FILTER_ATTRIBUTES_FILE_NAME,
+    load_filter_attribute_table
+)
+
+from modules.thumbnail_cache import (
+    ThumbnailCache,
+    DEFAULT_THUMBNAIL_CACHE_MAX_BYTES,
+    get_thumbnail_cache_db_path,
+    load_thumbnail
+)
+
+from modules.caller_trace import (
+    set_caller_tracing,
+    trace_caller,
+    trace_call_stack
+)
+
+from modules.app_logging import (
+    configure_logging,
+    console_log_buffer,
+    get_logger,
+    parse_log_level,
+    set_log_level,
+    LOG_SUBSYSTEMS,
+    DEFAULT_CONSOLE_BUFFER_LINES
+)
+
+from modules.data_subset_filter import (
+    DataSubsetFilter
+)
+
+from modules.favorites_index import (
+    FavoritePathIndex,
+    FavoriteFolders,
+    PinnedFavoriteFolders,
+    file_signature,
+    split_favorite_key
+)
+
+from modules.hidden_folder_matcher import (
+    HiddenFolderMatcher
+)
+
+from modules.image_memory_cache import (
+    ImageMemoryCache,
+    DEFAULT_IMAGE_MEMORY_CACHE_MAX_BYTES
+)
+
+from modules.zip_install_times import (
+    ZipInstallTimes
+)
+
+from modules.spawn_handshake import (
+    SpawnConfirmationWatcher,
+    SpawnHandshake,
+    COMMAND_CONFIRMATION_FILE_NAME
+)
+
+from modules.virtual_grid import (
+    VirtualGridLayout,
+    HIDDEN_BORDER_SLACK
+)
+
+from modules.startup_profiler import (
+    StartupProfiler,
+    get_startup_profile_history_path,
+    read_startup_profile_history,
+    format_startup_profile_summary
+)
+
 from modules.event_handlers import (
     ModZipEventHandler,
-    CustomFileEventHandler
+    CustomFileEventHandler,
+    is_empty_zip_delta
 )
 
 from modules.ui_helpers import (
@@ -115,6 +218,13 @@ from modules.colorchange import (
     create_color_picker_window,
 )
 
+# Per-subsystem loggers; levels come from the LogLevel lines in settings.txt (see load_settings)
+data_log = get_logger("data")
+search_log = get_logger("search")
+filter_log = get_logger("filter")
+favorites_log = get_logger("favorites")
+grid_log = get_logger("grid")
+
 # ------------------------------------------------------------
 #  First time initialization
 # ------------------------------------------------------------
@@ -450,10 +560,136 @@ def write_watcher_output(file_path, check_mods, check_configs, user_vehicles_fil
 
 
 
+def list_mod_zip_files(folders):
+    """
+    Returns the names of the .zip files directly inside each folder, with one scandir per
+    folder (the directory entries already say which ones are files, no per-file stat).
+
+    Args:
+        folders (iterable): Folder paths; missing or empty entries are skipped.
+    """
+    zip_files = set()
+    for folder_path in folders:
+        if not folder_path or not os.path.isdir(folder_path):
+            continue
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(".zip") and entry.is_file():
+                        zip_files.add(entry.name)
+        except OSError as e:
+            print(f"Warning: Could not list {folder_path}: {e}")
+    return zip_files
+
+
+def list_folder_file_names(folder_path):
+    """
+    Returns {os.path.normcase(name): name} for the files in one folder, so membership tests
+    follow the same case rules os.path.exists does on this OS.
+    """
+    file_names = {}
+    if not folder_path or not os.path.isdir(folder_path):
+        return file_names
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                file_names[os.path.normcase(entry.name)] = entry.name
+    except OSError as e:
+        print(f"Warning: Could not list {folder_path}: {e}")
+    return file_names
+
+
+def get_expected_mod_file_names(line):
+    """
+    Parses one outputGOOD.txt line ("zip (package) - folder (internal folder name) - path (config picture)").
+
+    Returns:
+        tuple: (zip file name, [ConfigPics file name], [individual info, generic info file names]),
+               or None for lines that don't name a config picture.
+    """
+    if "(package)" not in line or "(config picture)" not in line:
+        return None
+    parts = line.split(" - ")
+    if len(parts) != 3:
+        return None
+    zip_package_part = parts[0]
+    internal_folder_name = parts[1].strip().replace('"', '').replace(' (internal folder name)', '')
+    config_picture_path_relative = parts[2].split("(config picture)")[0].strip().replace('"', '')
+
+    zip_file_name_from_output = zip_package_part.split(" (package)")[0].strip()
+    config_picture_filename = os.path.basename(config_picture_path_relative)
+    config_picture_filename_base = os.path.splitext(config_picture_filename)[0]
+    zip_stem = zip_file_name_from_output.replace('.zip', '')
+
+    expected_config_pic_filename = f"vehicles--{internal_folder_name}_{zip_stem}.zip--{config_picture_filename}"
+    expected_individual_info_filename = f"vehicles--INDIVIDUAL--{internal_folder_name}_{zip_stem}.zip--info_info_{config_picture_filename_base}.json"
+    expected_generic_info_filename = f"vehicles--{internal_folder_name}_{zip_stem}.zip--info.json"
+    return zip_file_name_from_output, [expected_config_pic_filename], [expected_individual_info_filename, expected_generic_info_filename]
+
+
+def find_orphaned_mod_files(existing_zip_files, config_pics_folder, config_info_folder, input_file):
+    """
+    Finds the extracted pictures and info files of archives that are no longer installed.
+
+    Only outputGOOD.txt lines whose zip is missing produce candidates, and candidates are
+    matched against one listing of ConfigPics and one of ConfigInfo instead of being
+    stat'ed one by one.
+
+    Args:
+        existing_zip_files (set): Names of the installed .zip files (see list_mod_zip_files).
+        config_pics_folder: Path to the ConfigPics folder.
+        config_info_folder: Path to the ConfigInfo folder.
+        input_file: Path to the outputGOOD.txt file.
+
+    Returns:
+        tuple: ([(filepath, reason), ...] in outputGOOD.txt order, [individual info file names that were already missing])
+    """
+    orphaned_files = []
+    missing_individual_info = []
+    if not os.path.exists(input_file):
+        return orphaned_files, missing_individual_info
+
+    config_pic_names = list_folder_file_names(config_pics_folder)
+    config_info_names = list_folder_file_names(config_info_folder)
+    seen_paths = set()
+
+    def add_if_present(folder_path, folder_names, file_name, reason):
+        existing_name = folder_names.get(os.path.normcase(file_name))
+        if existing_name is None:
+            return False
+        filepath = os.path.join(folder_path, existing_name)
+        if filepath not in seen_paths: # Several lines can share one generic info file
+            seen_paths.add(filepath)
+            orphaned_files.append((filepath, reason))
+        return True
+
+    with open(input_file, 'r', encoding="utf-8") as f:
+        for line in f:
+            expected = get_expected_mod_file_names(line.strip())
+            if expected is None:
+                continue
+            zip_file_name_from_output, (config_pic_filename,), (individual_info_filename, generic_info_filename) = expected
+            if zip_file_name_from_output in existing_zip_files:
+                continue
+
+            reason_prefix = f"Orphaned - ZIP file '{zip_file_name_from_output}' NOT found in watched folders"
+            add_if_present(config_pics_folder, config_pic_names, config_pic_filename,
+                           f"{reason_prefix} - ConfigPic, associated with ZIP: '{zip_file_name_from_output}'")
+            if not add_if_present(config_info_folder, config_info_names, individual_info_filename,
+                                  f"{reason_prefix} - Individual Info, associated with ZIP: '{zip_file_name_from_output}'"):
+                missing_individual_info.append(individual_info_filename)
+            add_if_present(config_info_folder, config_info_names, generic_info_filename,
+                           f"{reason_prefix} - Generic Info, associated with ZIP: '{zip_file_name_from_output}'")
+    return orphaned_files, missing_individual_info
+
+
 def cleanup_orphaned_mod_files_simplified(script_dir, mods_folder, repo_folder, vanilla_folder, config_pics_folder, config_info_folder, input_file):
     """
-    Simplified function to identify and log orphaned AND non-orphaned files,
-    including folder and file lists in the deletion log.
+    Deletes the extracted pictures and info files of archives that are no longer in the
+    Mods, Repo or Vanilla folders, and logs them to data/orphaned_files_deletion_log.txt.
+
+    Uses one directory listing per folder (see find_orphaned_mod_files) instead of
+    several os.path.exists calls per outputGOOD.txt line.
 
     Args:
         script_dir: Path to the script's directory.
@@ -463,204 +699,56 @@ def cleanup_orphaned_mod_files_simplified(script_dir, mods_folder, repo_folder,
         config_pics_folder: Path to the ConfigPics folder.
         config_info_folder: Path to the ConfigInfo folder.
         input_file: Path to the outputGOOD.txt file.
+
+    Returns:
+        bool: True if orphaned files were found.
     """
 
     print("\n--- STARTING SIMPLIFIED STARTUP CLEANUP FOR ORPHANED MOD FILES (VERBOSE LOG) ---")
+    start_time = time.perf_counter()
 
     # 1. Get list of existing zip files from Mods, Repo, and Vanilla folders
-    existing_zip_files = set()
-    folders_to_check = {"Mods Folder": mods_folder, "Repo Folder": repo_folder, "Vanilla Folder": vanilla_folder} # For clearer logging
+    existing_zip_files = list_mod_zip_files([mods_folder, repo_folder, vanilla_folder])
+
+    # 2. Match the outputGOOD.txt lines of missing zips against the ConfigPics / ConfigInfo listings
+    orphaned_files_log, missing_individual_info = find_orphaned_mod_files(existing_zip_files, config_pics_folder, config_info_folder, input_file)
+    scan_seconds = time.perf_counter() - start_time
 
     log_file_path = os.path.join(script_dir, "data/orphaned_files_deletion_log.txt")
     with open(log_file_path, "w", encoding="utf-8") as log_file:
         log_file.write("--- START OF ORPHANED FILE CLEANUP LOG ---\n\n")
+        log_file.write("--- Folders Being Checked for ZIP Files ---\n")
+        log_file.write("\n--- Existing ZIP Files in Folders ---\n")
 
-        log_file.write("--- Folders Being Checked for ZIP Files ---\n") # Folder List Header
-        for folder_name, folder_path in folders_to_check.items(): # Log Folders and Paths
-#            log_file.write(f"{folder_name}: {folder_path}\n")
-            pass
-            
-        log_file.write("\n--- Existing ZIP Files in Folders ---\n") # Existing ZIPs Header
-        for folder_name, folder_path in folders_to_check.items():
-            folder_zip_files = []
-            if folder_path and os.path.isdir(folder_path):
-                for item in os.listdir(folder_path):
-                    if item.lower().endswith(".zip") and os.path.isfile(os.path.join(folder_path, item)):
-                        existing_zip_files.add(item) # Populate existing_zip_files set
-                        folder_zip_files.append(item) # For folder-specific logging
-#            log_file.write(f"{folder_name}: {folder_zip_files}\n") # Log files in each folder
-#        log_file.write(f"\nCombined list of existing zip files (for internal use): {existing_zip_files}\n\n") # Log combined set for debug
-        #print(f"DEBUG: Existing zip files found: {existing_zip_files}") # Console debug print
-
-
-        orphaned_files_log = []
-        kept_files_log = []
-
-        if os.path.exists(input_file):
-#            log_file.write("\n--- Processing outputGOOD.txt lines ---\n")
-            with open(input_file, 'r', encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if "(package)" in line and "(config picture)" in line:
-                        parts = line.split(" - ")
-                        if len(parts) == 3:
-                            zip_package_part = parts[0]
-                            # --- DEFINITIVE CORRECTION: Re-assign the result of replace() to internal_folder_name ---
-                            internal_folder_name = parts[1].strip().replace('"', '').replace(' (internal folder name)', '') # CORRECTED PARSING
-                            config_picture_path_relative = parts[2].split("(config picture)")[0].strip().replace('"', '')
-
-                            zip_file_name_from_output = zip_package_part.split(" (package)")[0].strip()
-                            config_picture_filename = os.path.basename(config_picture_path_relative)
-                            config_picture_filename_base = os.path.splitext(config_picture_filename)[0]
-
-                            # Construct expected filenames (unchanged)
-                            expected_config_pic_filename = f"vehicles--{internal_folder_name}_{zip_file_name_from_output.replace('.zip', '')}.zip--{config_picture_filename}"
-                            expected_individual_info_filename = f"vehicles--INDIVIDUAL--{internal_folder_name}_{zip_file_name_from_output.replace('.zip', '')}.zip--info_info_{config_picture_filename_base}.json"
-                            expected_generic_info_filename = f"vehicles--{internal_folder_name}_{zip_file_name_from_output.replace('.zip', '')}.zip--info.json"
-
-
-#                            log_file.write(f"\n  Processing line from outputGOOD.txt: '{line}'\n")
-#                            log_file.write(f"    - Zip from line: '{zip_file_name_from_output}'\n")
-
-                            # 3. Check for ZIP file existence
-                            if zip_file_name_from_output not in existing_zip_files:
-                                # ZIP file is missing, these files are orphaned
-                                reason_prefix = f"Orphaned - ZIP file '{zip_file_name_from_output}' NOT found in watched folders"
-#                                log_file.write(f"    - ZIP '{zip_file_name_from_output}' NOT FOUND. Checking for orphaned files.\n")
-
-                                # Check ConfigPics file
-                                config_pic_filepath = os.path.join(config_pics_folder, expected_config_pic_filename)
-                                print(f"DEBUG: cleanup_orphaned_mod_files_simplified - Checking ConfigPic path: {config_pic_filepath}") # <-- DEBUG PRINT
-                                if os.path.exists(config_pic_filepath):
-                                    orphaned_files_log.append((config_pic_filepath, f"{reason_prefix} - ConfigPic, associated with ZIP: '{zip_file_name_from_output}'"))
-                                    # **CORRECTED Log Message - Use variable: expected_config_pic_filename**
-#                                    log_file.write(f"      - [ORPHANED] ConfigPic: {expected_config_pic_filename}\n")
-                                else:
-                                    # **CORRECTED Log Message - Use variable: expected_config_pic_filename**
-#                                    log_file.write(f"      - [NOT FOUND] ConfigPic: {expected_config_pic_filename} (already missing)\n")
-                                    pass
-                                    
-                                # Check ConfigInfo files
-                                individual_info_filepath = os.path.join(config_info_folder, expected_individual_info_filename)
-                                print(f"DEBUG: cleanup_orphaned_mod_files_simplified - Checking Individual Info path: {individual_info_filepath}") # <-- DEBUG PRINT
-                                if os.path.exists(individual_info_filepath):
-                                    orphaned_files_log.append((individual_info_filepath, f"{reason_prefix} - Individual Info, associated with ZIP: '{zip_file_name_from_output}'"))
-
-                                    # --- ADDED DEBUGGING PRINTS ---
-                                    #print(f"DEBUG - Individual Info - config_picture_filename_base: {config_picture_filename_base}, type: {type(config_picture_filename_base)}") # Check value and type
-                                    #print(f"DEBUG - Individual Info - expected_individual_info_filename: {expected_individual_info_filename}") # Check full constructed filename
-                                    # --- END DEBUGGING PRINTS ---
-
-                                    # Log Message (Corrected - using variables)
-#                                    log_file.write(f"      - [ORPHANED] Individual Info: {expected_individual_info_filename}\n") # <-- LINE A
-                                else:
-                                    # --- ADDED DEBUGGING PRINTS ---
-                                    #print(f"DEBUG - Individual Info (NOT FOUND) - config_picture_filename_base: {config_picture_filename_base}, type: {type(config_picture_filename_base)}") # Check value and type
-                                    #print(f"DEBUG - Individual Info (NOT FOUND) - expected_individual_info_filename: {expected_individual_info_filename}") # Check full constructed filename
-                                    # --- END DEBUGGING PRINTS ---
-
-                                    # Log Message (Corrected - using variables)
-                                    log_file.write(f"      - [NOT FOUND] Individual Info: {expected_individual_info_filename} (already missing)\n") # <-- LINE B
-
-                                generic_info_filepath = os.path.join(config_info_folder, expected_generic_info_filename)
-                                print(f"DEBUG: cleanup_orphaned_mod_files_simplified - Checking Generic Info path: {generic_info_filepath}") # <-- DEBUG PRINT
-                                if os.path.exists(generic_info_filepath):
-                                    orphaned_files_log.append((generic_info_filepath, f"{reason_prefix} - Generic Info, associated with ZIP: '{zip_file_name_from_output}'"))
-                                    # CORRECTED Log Message - Use variable: expected_generic_info_filename
-#                                    log_file.write(f"      - [ORPHANED] Generic Info: {expected_generic_info_filename}\n")
-                                    pass
-                                    
-                                else:
-                                    # CORRECTED Log Message - Use variable: expected_generic_info_filename
-#                                    log_file.write(f"      - [NOT FOUND] Generic Info: {expected_generic_info_filename} (already missing)\n")
-                                    pass
-                            else:
-                                # ZIP file exists, these files are NOT orphaned, but log kept files
-                                reason_prefix = f"Kept - ZIP file '{zip_file_name_from_output}' FOUND in watched folders"
-#                                log_file.write(f"    - ZIP '{zip_file_name_from_output}' FOUND. Keeping associated files.\n")
-                                pass
-                                
-                                # Check ConfigPics file
-                                config_pic_filepath = os.path.join(config_pics_folder, expected_config_pic_filename)
-                                #print(f"DEBUG: cleanup_orphaned_mod_files_simplified - Checking ConfigPic path (kept file): {config_pic_filepath}") # <-- DEBUG PRINT - KEPT FILE CHECK
-                                if os.path.exists(config_pic_filepath):
-                                    kept_files_log.append((config_pic_filepath, f"{reason_prefix} - ConfigPic, associated with ZIP: '{zip_file_name_from_output}'"))
-                                    # CORRECTED Log Message - Use variable: expected_config_pic_filename
-#                                    log_file.write(f"      - [KEPT] ConfigPic: {expected_config_pic_filename}\n")
-                                    pass    
-                                else:
-                                    # CORRECTED Log Message - Use variable: expected_config_pic_filename
-#                                    log_file.write(f"      - [NOT FOUND] ConfigPic: {expected_config_pic_filename} (unexpectedly missing, but ZIP exists)\n")
-                                    pass
-                                    
-                                # Check ConfigInfo files
-                                individual_info_filepath = os.path.join(config_info_folder, expected_individual_info_filename)
-                                #print(f"DEBUG: cleanup_orphaned_mod_files_simplified - Checking Individual Info path (kept file): {individual_info_filepath}") # <-- DEBUG PRINT - KEPT FILE CHECK
-                                if os.path.exists(individual_info_filepath):
-                                    kept_files_log.append((individual_info_filepath, f"{reason_prefix} - Individual Info, associated with ZIP: '{zip_file_name_from_output}'"))
-                                    # CORRECTED Log Message - Use variable: expected_individual_info_filename
-#                                    log_file.write(f"      - [KEPT] Individual Info: {expected_individual_info_filename}\n")
-                                    pass    
-                                
-                                else:
-                                    # CORRECTED Log Message - Use variable: expected_individual_info_filename
-#                                    log_file.write(f"      - [NOT FOUND] Individual Info: {expected_individual_info_filename} (unexpectedly missing, but ZIP exists)\n")
-                                    pass
-                                    
-                                generic_info_filepath = os.path.join(config_info_folder, expected_generic_info_filename)
-                                #print(f"DEBUG: cleanup_orphaned_mod_files_simplified - Checking Generic Info path (kept file): {generic_info_filepath}") # <-- DEBUG PRINT - KEPT FILE CHECK
-                                if os.path.exists(generic_info_filepath):
-                                    kept_files_log.append((generic_info_filepath, f"{reason_prefix} - Generic Info, associated with ZIP: '{zip_file_name_from_output}'"))
-                                    # Corrected Log Message - Use variable: expected_generic_info_filename
-#                                    log_file.write(f"      - [KEPT] Generic Info: {expected_generic_info_filename}\n")
-                                    pass
-                                
-                                else:
-                                    # Corrected Log Message - Use variable: expected_generic_info_filename
-#                                    log_file.write(f"      - [NOT FOUND] Generic Info: {expected_generic_info_filename} (unexpectedly missing, but ZIP exists)\n")
-                                    pass
-        
-        else:
+        if not os.path.exists(input_file):
             log_file.write(f"Warning: {input_file} not found, skipping outputGOOD.txt processing.\n")
 
+        for individual_info_filename in missing_individual_info:
+            log_file.write(f"      - [NOT FOUND] Individual Info: {individual_info_filename} (already missing)\n")
 
-        # 4. Write deletion candidates AND kept files to log file
+        # 3. Delete orphaned files and log them
         if orphaned_files_log:
             log_file.write("\n--- Orphaned Files to be DELETED (Dry Run) ---\n")
             for filepath, reason in orphaned_files_log:
                 log_file.write(f"File: {filepath}\nReason: {reason}\n\n")
-                # 5. Comment out deletion (Dry Run - Logging only)
                 try:
-                    deleted_count = 0  # <--- Initialize deleted_count INSIDE try block, BEFORE os.remove
                     os.remove(filepath)
-                    deleted_count += 1  # Increment AFTER successful deletion (though initialization already makes this redundant)
                     log_file.write(f"  [DELETED] {filepath}\n")
                 except Exception as e:
-                    log_file.write(f"  [ERROR deleting] {filepath} - {e}\n") # <-- ERROR LOG LINE - NO deleted_count HERE
+                    log_file.write(f"  [ERROR deleting] {filepath} - {e}\n")
 
-        if kept_files_log:
-#            log_file.write("\n--- Non-Orphaned Files (Kept) ---\n")
-            pass
-            
-            for filepath, reason in kept_files_log:
-#                log_file.write(f"File: {filepath}\nReason: {reason}\n\n")
-                pass
-                
-                
-        if not orphaned_files_log and not kept_files_log:
-#            log_file.write("\nNo orphaned files found.\n")
-            pass
-        
         log_file.write("\n--- END OF ORPHANED FILE CLEANUP LOG ---\n") # Log file end marker
 
-    print(f"DEBUG: Detailed log of orphaned and kept files (dry run) written to: {log_file_path}")
+    print(f"DEBUG: Detailed log of orphaned files written to: {log_file_path}")
+    print(f"DEBUG: Orphan scan took {scan_seconds * 1000:.1f} ms ({len(existing_zip_files)} installed zips), "
+          f"{(time.perf_counter() - start_time) * 1000:.1f} ms including deletion.")
 
     if orphaned_files_log:
-        print(f"Startup cleanup (simplified - dry run) completed. {len(orphaned_files_log)} orphaned files identified (deletion commented out).")
+        print(f"Startup cleanup (simplified) completed. {len(orphaned_files_log)} orphaned files deleted.")
         print("--- SIMPLIFIED STARTUP CLEANUP FOR ORPHANED MOD FILES COMPLETED - deleting garbage (VERBOSE LOG) ---\n")
         return True
     else:
-        print("Startup cleanup (simplified - dry run): No orphaned mod files found.")
+        print("Startup cleanup (simplified): No orphaned mod files found.")
         print("--- SIMPLIFIED STARTUP CLEANUP FOR ORPHANED MOD FILES COMPLETED - deleting garbage (VERBOSE LOG) ---\n") 
         return False 
             
@@ -721,21 +809,32 @@ def update_new_mods_txt_on_startup(script_dir):
     print("--- DEBUG: update_new_mods_txt_on_startup() EXIT ---\n") # DEBUG EXIT
         
 
-def generate_data_subset_favorites(script_dir):
+def generate_data_subset_favorites(script_dir, subset_lines=None, write_file=True):
     """
     Generates data_subset_favorites.txt based on favorites.txt and data_subset.txt.
+
+    Args:
+        script_dir: Path to the script's directory.
+        subset_lines: In-memory data_subset.txt lines. If None, data_subset.txt is read.
+        write_file: Whether to write data_subset_favorites.txt.
+
+    Returns:
+        list: The data_subset_favorites lines, or None if they could not be generated.
     """
     favorites_file_path = os.path.join(script_dir, "data/favorites.txt")
     data_subset_file_path = os.path.join(script_dir, "data/data_subset.txt")
     data_subset_favorites_file_path = os.path.join(script_dir, "data/data_subset_favorites.txt")
 
     if not os.path.exists(favorites_file_path):
-        print(f"Warning: {favorites_file_path} not found. data_subset_favorites.txt will not be generated.")
-        return
+        filter_log.warning('Warning: %s not found. data_subset_favorites.txt will not be generated.', favorites_file_path)
+        return None
 
-    if not os.path.exists(data_subset_file_path):
-        print(f"Warning: {data_subset_file_path} not found. data_subset_favorites.txt will not be generated.")
-        return
+    if subset_lines is None:
+        if not os.path.exists(data_subset_file_path):
+            filter_log.warning('Warning: %s not found. data_subset_favorites.txt will not be generated.', data_subset_file_path)
+            return None
+        with open(data_subset_file_path, 'r', encoding="utf-8") as f_in:
+            subset_lines = f_in.read().splitlines()
 
     favorite_configs = set()
     with open(favorites_file_path, 'r', encoding="utf-8") as f:
@@ -749,25 +848,29 @@ def generate_data_subset_favorites(script_dir):
                     favorite_configs.add((folder.strip(), config.strip()))
 
     filtered_lines = []
-    with open(data_subset_file_path, 'r', encoding="utf-8") as f_in, open(data_subset_favorites_file_path, 'w', encoding="utf-8") as f_out:
-        for line in f_in:
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = line.split('--')
-            if len(parts) >= 3:  # Basic check to ensure line structure is somewhat valid
-                folder_part = parts[1]
-                config_name_part = parts[-1]  # Assuming config name is at the end
-                config_name_base = os.path.splitext(config_name_part)[0] # Remove extension
-
-                for fav_folder, fav_config in favorite_configs:
-                    if fav_folder in folder_part and fav_config in config_name_base:
-                        filtered_lines.append(line)
-                        f_out.write(line + '\n') # Write to the output file immediately if match is found
-                        break # Optimization: no need to check other favorites once a match is found for this line
-
-    print(f"data_subset_favorites.txt generated with {len(filtered_lines)} lines.")
+    for line in subset_lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        parts = line.split('--')
+        if len(parts) >= 3:  # Basic check to ensure line structure is somewhat valid
+            folder_part = parts[1]
+            config_name_part = parts[-1]  # Assuming config name is at the end
+            config_name_base = os.path.splitext(config_name_part)[0] # Remove extension
+
+            for fav_folder, fav_config in favorite_configs:
+                if fav_folder in folder_part and fav_config in config_name_base:
+                    filtered_lines.append(line)
+                    break # Optimization: no need to check other favorites once a match is found for this line
+
+    if write_file:
+        with open(data_subset_favorites_file_path, 'w', encoding="utf-8") as f_out:
+            for line in filtered_lines:
+                f_out.write(line + '\n')
+
+    filter_log.debug('data_subset_favorites.txt generated with %s lines.', len(filtered_lines))
+    return filtered_lines
     
     
     
@@ -875,12 +978,38 @@ class ConsoleWindow(tk.Toplevel):
         self.text_area.bind("<Button-3>", self.show_shortcuts_window)
         # ---- End new code ----
 
+        # --- NEW: Output goes through console_log_buffer (modules/app_logging.py) ---
+        # write() and the log handler only append to the buffer; _poll_log_buffer inserts
+        # what was added since the last poll in one go, and only while the window is shown.
+        self.log_sequence = 0
+        self.log_poll_interval_ms = 100
+        self.max_lines = DEFAULT_CONSOLE_BUFFER_LINES
+        self.log_poll_after_id = None
+        self._poll_log_buffer() # Also shows the history logged before the window existed
+
 
     def write(self, text):
-        self.text_area.config(state=tk.NORMAL) # Enable editing temporarily
-        self.text_area.insert(tk.END, text)
-        self.text_area.see(tk.END) # Autoscroll to the bottom
-        self.text_area.config(state=tk.DISABLED) # Disable editing again
+        console_log_buffer.append(text) # Any thread; no Tk calls here
+
+    def flush(self):
+        pass
+
+    def _poll_log_buffer(self):
+        self.log_poll_after_id = None
+        try:
+            if self.winfo_viewable():
+                self.log_sequence, text = console_log_buffer.read_since(self.log_sequence)
+                if text:
+                    self.text_area.config(state=tk.NORMAL) # Enable editing temporarily
+                    self.text_area.insert(tk.END, text)
+                    excess_lines = int(self.text_area.index("end-1c").split(".")[0]) - self.max_lines
+                    if excess_lines > 0:
+                        self.text_area.delete("1.0", f"{excess_lines + 1}.0")
+                    self.text_area.see(tk.END) # Autoscroll to the bottom
+                    self.text_area.config(state=tk.DISABLED) # Disable editing again
+            self.log_poll_after_id = self.after(self.log_poll_interval_ms, self._poll_log_buffer)
+        except tk.TclError: # Window destroyed
+            pass
 
     # ---- New methods ----
     def load_shortcuts(self):
@@ -1377,10 +1506,21 @@ class ConfigViewerApp:
         self.config_pics_folder = config_pics_folder
         self.config_info_folder = config_info_folder
         self.hidden_txt_file = hidden_txt_file
+        self.hidden_folder_matchers = None # (hidden folders, regular list matcher, custom list matcher), see get_hidden_folder_matchers()
 
 
 
-        self.cache_file_path = os.path.join(self.script_dir, "data", "config_processing_cache.json")
+        self.cache_file_path = os.path.join(self.script_dir, "data", "config_processing_cache.json") # Legacy JSON cache, replaced by the SQLite store below
+        if os.path.exists(self.cache_file_path):
+            try:
+                os.remove(self.cache_file_path)
+            except OSError as e:
+                print(f"Warning: Failed to delete legacy cache file {self.cache_file_path}: {e}")
+        try:
+            self.processed_data_store = ProcessedDataStore(get_processed_data_db_path(self.script_dir))
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open processed data store: {e}")
+            self.processed_data_store = None
 
 
         self.main_window_title = "Ellexium's Advanced Vehicle Selector (ver. 0.2)"
@@ -1399,6 +1539,12 @@ class ConfigViewerApp:
         else:
             self.dev_mode = False
 
+        set_caller_tracing(self.dev_mode) # "CALLED BY" logging of the grid/details methods (modules/caller_trace.py)
+
+        # --- NEW: Log levels (modules/app_logging.py): DEBUG in dev mode, else INFO; LogLevel lines in settings.txt override ---
+        set_log_level("DEBUG" if self.dev_mode else "INFO")
+        self.log_level_settings = {} # {subsystem or None for the whole app: level name}, as read from the settings file
+
 
 
         self.show_scanning_window_count = 0 # Initialize the amount of times the window is called, the first couple of times it's called should have it be in the center of the screen, not the master
@@ -1410,6 +1556,7 @@ class ConfigViewerApp:
         self.is_console_visible = False
 
         self.ZIP_BASE_NAMES = [] 
+        self.config_info_index = None  # ConfigInfo file index + parsed info files for process_lines (modules/config_info_index.py)
 
         #if final_instantiation:
         self.setup_zip_base_names()
@@ -1427,13 +1574,31 @@ class ConfigViewerApp:
         self.SPAWN_QUEUE_TRANSIENT_FILE = "data/Spawn_Queue_Transient.lua"
         self._last_spawned_brands = []
 
+        # --- NEW: Spawn confirmation handshake (see modules/spawn_handshake.py) ---
+        self.spawn_confirmation_watcher = None # Started on the first spawn
+        self.active_spawn_handshake = None
+        self.spawn_confirmation_timeout = 3.0 # Seconds to wait for commandconfirmation.txt before sending the hotkey again
+        self.last_spawn_latency = None # Seconds from hotkey to confirmation of the last confirmed spawn
+
         self.repo_folder = repo_folder
+        self.zip_install_times = None # Archive mtimes for sorting by install date, see get_zip_install_times()
         self.vehicles_content_folder = vehicles_content_folder
         self.user_folder = user_folder
         self.config_pics_custom_folder = config_pics_custom_folder
+        self.custom_picture_index = None  # Picture names in ConfigPicsCustom for find_image_path (modules/custom_picture_index.py)
 
         self.data_subset_file = "data/data_subset.txt" # Initialize data_subset_file path
         self.data_subset_favorites_file = "data/data_subset_favorites.txt"
+        self.write_filter_output_files = False  # Set to True to also write filter_results.txt and data_subset_favorites.txt
+        self.data_subset_lines = None  # In-memory data_subset.txt lines from the last global filter run
+        self.data_subset_favorites_lines = None  # In-memory data_subset_favorites.txt lines
+        self.data_subset_filter_cache = {}  # {subset file path: (in-memory lines or file signature, DataSubsetFilter)}
+        self.search_match_memo = SearchMatchMemo() # Search results of perform_search, reused for the category header counts
+        self.filter_attribute_table = None  # Columnar Matches.txt attributes (modules/filter_attributes.py), built on first use
+        self.facet_index = None  # Sidebar dropdown values of data_cache, see get_sidebar_facet_view()
+        self.facet_view = None  # FacetView of filtered_original_data_for_brands
+        self.facet_view_source = None  # The list facet_view was built from
+        self.sidebar_facet_counts = {}  # {facet field: {value: item count}} shown next to the dropdown options
         
 
         self.matches_txt = "data/matches.txt"
@@ -1528,12 +1693,14 @@ class ConfigViewerApp:
 
             self.main_grid_widget_cache = {}  # NEW: Cache for main grid item widgets - State-Aware Cache
 
-            self.image_cache_capacity = 1500 # Example capacity - adjust as needed
-            self.image_cache = OrderedDict() # Using OrderedDict for LRU
+            # --- Byte-budgeted LRU of decoded pictures (modules/image_memory_cache.py) ---
+            # PhotoImages and PIL images share the ceiling; ImageCacheMaxMB in the settings file overrides it
+            self.image_cache_max_bytes = DEFAULT_IMAGE_MEMORY_CACHE_MAX_BYTES
+            self.image_cache = ImageMemoryCache(self.image_cache_max_bytes)
 
             self.image_load_locks = {} # To store locks per image path
             self._dict_lock = threading.Lock() # To protect access to image_load_locks dictionary
-            self.cache_access_lock = threading.Lock() # New lock for image_cache
+            self.cache_access_lock = threading.Lock() # image_cache locks itself; kept for callers that group several cache steps
 
 
             # --- NEW: Eviction Batching ---
@@ -1542,7 +1709,6 @@ class ConfigViewerApp:
             self.eviction_timer_running = False
 
 
-            self.image_cache_pil = {}  # Cache to store PIL Images
             self.individual_info_cache = {}  # NEW: In-memory cache for individual info JSON data  <--- INSERT HERE
             self.full_data_cache = {} # NEW: Cache for full_data from load_data
             self.data_cache = [] 
@@ -1561,12 +1727,31 @@ class ConfigViewerApp:
             # Initialize image counts per category
             self.image_counts = {}
 
+            # --- NEW: Virtualized main grid (a fixed pool of item widgets, rebound as the view scrolls) ---
+            self.main_grid_slot_pool = []
+            self.main_grid_layout = None # VirtualGridLayout of the current update_grid_layout, None while not shown
+            self.main_grid_cell_size = None # (width, height, (font_size_add, omit_label)) of a measured item widget
+            self.main_grid_placeholder_photo = None
+            self.main_grid_viewport_refresh_id = None
+
 
             # --- NEW: Disk Image Cache Directory --- # <---- INSERT HERE
             self.disk_image_cache_dir = os.path.join(self.script_dir, "data/image_cache_disk")
             if not os.path.exists(self.disk_image_cache_dir):
                 os.makedirs(self.disk_image_cache_dir) # Create directory if it doesn't exist
-            #disabling cache
+
+            # --- Persistent thumbnail cache (one SQLite file in disk_image_cache_dir, LRU-bounded) ---
+            self.use_disk_image_cache = True  # Set to False to disable disk image cache
+            self.disk_image_cache_max_bytes = DEFAULT_THUMBNAIL_CACHE_MAX_BYTES  # Size ceiling of the thumbnail cache
+            self.thumbnail_cache = None
+            if self.use_disk_image_cache:
+                try:
+                    self.thumbnail_cache = ThumbnailCache(
+                        get_thumbnail_cache_db_path(self.disk_image_cache_dir),
+                        max_bytes=self.disk_image_cache_max_bytes
+                    )
+                except sqlite3.Error as e:
+                    print(f"Warning: Could not open thumbnail cache, pictures will be decoded on every load: {e}")
 
 
 
@@ -1773,6 +1958,14 @@ class ConfigViewerApp:
             # --- Favorites Functionality --- called before format group data so the sorting works
 
             self.favorites_file_path = os.path.join(script_dir, "data/favorites.txt")
+            self.favorites_generation = 0 # Bumped whenever self.favorite_configs changes
+            # --- NEW: read_favorites() only re-checks favorites when one of its input files changed ---
+            self.favorite_path_index = None # FavoritePathIndex of the WatcherOutput/zip_structure paths
+            self.favorite_path_index_key = None # The input files and signatures it was built from
+            self.favorites_read_key = None # favorites.txt signature + favorite_path_index_key of the last check
+            self.favorite_folders = None # FavoriteFolders of self.favorite_configs, see get_favorite_folders()
+            self.favorite_folders_generation = None
+            self.pinned_favorite_folders = PinnedFavoriteFolders() # Pinned "Favorites" category, see get_pinned_favorite_folders()
             self.favorite_configs = self.read_favorites()
 
 
@@ -1785,7 +1978,7 @@ class ConfigViewerApp:
 
             self.original_data, self.original_full_data = self.load_data() # Load data NOW
             self.data = list(self.original_data)
-            self.full_data = dict(self.original_full_data)
+            self.full_data = self.original_full_data.copy()
             self.grouped_data = self.format_grouped_data(self.data)
 
 
@@ -1931,6 +2124,14 @@ class ConfigViewerApp:
             self.main_grid_skipped_updates_queue = []
             self.details_grid_skipped_updates_queue = []
 
+            # --- NEW: Details window image pipeline (decode/resize in the executor, PhotoImages in batches on the Tk thread) ---
+            self.details_image_generation = 0 # Bumped for every new details page; older decodes are dropped
+            self.details_photo_pending = [] # Decoded pictures waiting for their PhotoImage, filled by executor threads
+            self.details_photo_lock = threading.Lock()
+            self.details_photo_flush_scheduled = False
+            self.details_photo_flush_delay_ms = 15 # Lets a few decodes finish so they are turned into PhotoImages together
+            self.details_photo_flush_budget_ms = 12 # Tk thread time per batch before the rest is rescheduled
+
             # --- NEW: Printing Control ---  <----------------------  INSERT HERE
             self.original_print = builtins.print # Store the original print function
             self.disable_printing = False # Flag to control printing
@@ -1944,6 +2145,9 @@ class ConfigViewerApp:
             self.scroll_mouse_unhide_timer_id = None
 
             self.matches_config_data = self.load_matches_config_data()
+            self.config_search_index = None # Built on first 'Configs' search, see _get_config_search_index
+            self._config_search_cache_key = None
+            self._config_search_cache_folders = set()
 
             self.details_pause_counter = 0
 
@@ -1970,7 +2174,6 @@ class ConfigViewerApp:
             self.spawn_queue_window_was_open = False 
 
 
-            self.use_disk_image_cache = False  # Set to False to disable disk image cache
             self.use_info_file_cache = False  # Set to False to disable info file cache
 
             self.omit_label = False  # Set to True to omit labels in the main grid
@@ -2172,6 +2375,12 @@ class ConfigViewerApp:
 
 
 
+    def close_thumbnail_cache(self):
+        """Closes the thumbnail cache's SQLite connection (temporary instances in main() and on exit)."""
+        if getattr(self, "thumbnail_cache", None) is not None:
+            self.thumbnail_cache.close()
+            self.thumbnail_cache = None
+
     def disable_prints(self):
         """Disables all print statements by replacing builtins.print with a no-op function."""
         if not self.disable_printing: # To prevent accidental repeated calls
@@ -2351,6 +2560,10 @@ class ConfigViewerApp:
         print("DEBUG: throttled_resize - Unpacking (hiding) widgets in scrollable_frame during resize...")
         for widget in self.scrollable_frame.winfo_children():
             widget.pack_forget()  # Use pack_forget to hide widgets
+        # --- NEW: Pool slots are placed, not packed ---
+        self.main_grid_layout = None
+        for slot in self.main_grid_slot_pool:
+            self._release_main_grid_slot(slot)
         print("DEBUG: throttled_resize - Main grid widgets unpacked (hidden).")
 
 
@@ -2448,6 +2661,8 @@ class ConfigViewerApp:
             if os.path.exists(candidate_path):
                 try:
                     os.remove(candidate_path)
+                    if self.custom_picture_index is not None:
+                        self.custom_picture_index.discard(candidate_path)
                 except Exception as e:
                     print(f"Error removing {candidate_path}: {e}")
 
@@ -2491,10 +2706,14 @@ class ConfigViewerApp:
     # ------------------------------------------------------------
     # Run python Scripts for Mods 
     # ------------------------------------------------------------
-    def run_ahk_scripts_mods(self):
+    def run_ahk_scripts_mods(self, refresh_ui=True):
         """
         Runs the main function from mod_command_line_config_gen, 
         making it behave as if it's running from guitest.py's directory.
+
+        Args:
+            refresh_ui (bool): Search and lay out the grid afterwards (once the app is up).
+                apply_mod_zip_delta passes False and refreshes once itself.
         """
 
 
@@ -2540,7 +2759,7 @@ class ConfigViewerApp:
 
 
 
-            if self.final_instantiation:
+            if self.final_instantiation and refresh_ui:
 
 
                 print("    run_ahk_scripts_mods is calling self.perform_search()")
@@ -2626,6 +2845,8 @@ class ConfigViewerApp:
             print("Calling self.run_configpicextractor_custom_integrated() ...") # Debug
             self.run_configpicextractor_custom_integrated() # <--- DIRECT METHOD CALL - NO subprocess
             print("self.run_configpicextractor_custom_integrated() RETURNED.") # Debug
+            if self.custom_picture_index is not None:
+                self.custom_picture_index.invalidate() # The extractor rewrote ConfigPicsCustom
         except Exception as e:
             messagebox.showerror("Error", f"Error running run_configpicextractor_custom_integrated(): {e}")
             self.master.destroy()
@@ -2646,36 +2867,9 @@ class ConfigViewerApp:
     def extract_fallback_info(self, filepath):
         """
         Extracts fallback information from a JSON file, now including "Author".
+        Parsing lives in modules/config_info_index.py (one regex pass over the file).
         """
-        required_keys = [
-            "Name", "Brand", "Country", "Type", "Body Style", "Years", "Derby Class",
-            "Description", "Slogan", "default_pc", "Author"  # <-- ADDED "Author" to required keys
-        ]
-        extracted_info = {}
-
-        try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                file_content = file.read()
-                for key in required_keys:
-                    if key == "Years":
-                       pattern = r'"Years"\s*:\s*([^\}]*)' # Capture until closing curly brace
-                       match = re.search(pattern, file_content, re.IGNORECASE)
-                       if match:
-                           value_str = match.group(1)
-                           numbers = re.findall(r'\d+', value_str) # Find ALL numbers
-                           if numbers:
-                               extracted_info[key] = " ".join(numbers)
-                           else:
-                                extracted_info[key] = ""
-                    else:
-                        pattern = rf'"{key}"\s*:\s*"([^"]*)"'
-                        match = re.search(pattern, file_content, re.IGNORECASE)
-                        if match:
-                            extracted_info[key] = match.group(1)
-
-        except Exception as e:
-            print(f"Error processing {filepath}: {e}")
-        return extracted_info
+        return parse_config_info_file(filepath)
         
 
 
@@ -2686,67 +2880,114 @@ class ConfigViewerApp:
     # Find Fallback Info - THIS IS USED BY PROCESS LINES
     # ------------------------------------------------------------
     def find_fallback_info(self, picture_filename):
-        lower_filename = picture_filename.lower()
-        for base_name in self.ZIP_BASE_NAMES:
-            if base_name in lower_filename:
-                pattern = f"_{base_name}.json"
-                for root, _, files in os.walk(self.config_info_folder):
-                    for file in files:
-                        if pattern in file.lower() and file.lower().endswith(".json"):
-                            info_path = os.path.join(root, file)
-                            info_data = self.extract_fallback_info(info_path)
-                            if info_data:
-                                return info_data
-        return {}
+        return self.get_config_info_index().find_fallback_info(picture_filename)
+
+    def get_config_info_index(self):
+        """
+        Returns the ConfigInfo index process_lines resolves info files with, building it on
+        first use. _update_cache drops it before every load so new info files are picked up.
+        """
+        index = self.config_info_index
+        if index is None or index.config_info_folder != self.config_info_folder or index.zip_base_names != self.ZIP_BASE_NAMES:
+            index = ConfigInfoIndex(self.config_info_folder, self.ZIP_BASE_NAMES)
+            self.config_info_index = index
+        return index
 
     # ------------------------------------------------------------
     # Load Data
     # ------------------------------------------------------------
 
     def _load_cache(self):
-        if os.path.exists(self.cache_file_path):
-            print(f"Attempting to load data from cache: {self.cache_file_path}")
-            try:
-                with open(self.cache_file_path, 'r') as f:
-                    cache_content = json.load(f)
-                    # Basic validation: Check if keys exist
-                    if 'data' in cache_content and 'full_data' in cache_content:
-                        print("Cache loaded successfully.")
-                        return cache_content['data'], cache_content['full_data']
-                    else:
-                        print("Cache file structure is invalid. Ignoring cache.")
-                        return None, None
-            except (json.JSONDecodeError, IOError, FileNotFoundError) as e:
-                print(f"Failed to load cache file: {e}. Processing files normally.")
-                # Optionally delete the corrupted cache file
-                # try:
-                #     os.remove(self.cache_file_path)
-                # except OSError:
-                #     pass
-                return None, None
-        else:
-            print("Cache file not found. Processing files.")
+        """
+        Loads the processed dataset from the SQLite store if it is up to date.
+        Only the per-folder representative rows are read here; each folder's configs
+        are read on first access through LazyFullData.
+        """
+        store = self.processed_data_store
+        if store is None or not store.is_valid():
+            data_log.debug('Processed data store missing or stale. Processing files.')
+            return None, None
+        data_log.debug('Attempting to load data from processed data store: %s', store.db_path)
+        try:
+            data = store.load_representatives()
+            full_data = LazyFullData(store, data.keys())
+            data_log.debug('Processed data store loaded successfully.')
+            return data, full_data
+        except sqlite3.Error as e:
+            data_log.error('Failed to load processed data store: %s. Processing files normally.', e)
             return None, None
 
-    # --- Helper method to save data to cache ---
-    def _save_cache(self, data, full_data):
-        print(f"Saving data to cache: {self.cache_file_path}")
+    def _update_cache(self, regular_lines, custom_lines):
+        """
+        Brings the processed data store up to date with the given (already hidden-filtered)
+        regular and custom lines. Lines are grouped per folder and fingerprinted together with
+        the folder's ConfigInfo / ConfigPics / ConfigPicsCustom files; only folders whose
+        lines or files changed go through process_lines/_finalize_data_processing,
+        folders that disappeared (removed mods, newly hidden vehicles) are deleted, and
+        every other folder's rows are left untouched.
+
+        Returns:
+            tuple: (data dict for the main grid, full_data mapping)
+        """
+        store = self.processed_data_store
+        regular_groups = group_lines_by_folder(regular_lines, is_custom=False)
+        custom_groups = group_lines_by_folder(custom_lines, is_custom=True)
+        folder_order = list(regular_groups) + [folder for folder in custom_groups if folder not in regular_groups]
+
+        folder_files = collect_folder_file_signatures(
+            [self.config_info_folder, self.config_pics_folder, self.config_pics_custom_folder], folder_order)
+        new_hashes = {
+            folder: hash_folder_lines(regular_groups.get(folder, []), custom_groups.get(folder, []), folder_files.get(folder, ()))
+            for folder in folder_order
+        }
+        stored_hashes = store.get_source_hashes()
+        changed_folders = [folder for folder in folder_order if stored_hashes.get(folder) != new_hashes[folder]]
+        deleted_folders = [folder for folder in stored_hashes if folder not in new_hashes]
+        data_log.debug('load_data - %s folders: %s changed, %s removed, %s unchanged.', len(folder_order), len(changed_folders), len(deleted_folders), len(folder_order) - len(changed_folders))
+
+        changed_full_data = {}
+        if changed_folders:
+            self.config_info_index = None # Re-walk ConfigInfo once for this load
+            changed_regular_lines = [line for folder in changed_folders for line in regular_groups.get(folder, [])]
+            changed_custom_lines = [line for folder in changed_folders for line in custom_groups.get(folder, [])]
+            changed_full_data = self.process_lines(changed_regular_lines, changed_full_data, is_custom=False)
+            changed_full_data = self.process_lines(changed_custom_lines, changed_full_data, is_custom=True)
+        changed_data = self._finalize_data_processing(changed_full_data) if changed_full_data else {}
+
+        upserts = {
+            folder: (changed_data.get(folder), changed_full_data.get(folder, []), new_hashes[folder])
+            for folder in changed_folders
+        }
         try:
-            # Ensure the cache directory exists
-            cache_dir = os.path.dirname(self.cache_file_path)
-            os.makedirs(cache_dir, exist_ok=True)
+            store.apply_changes(upserts, deleted_folders, folder_order)
+            data = store.load_representatives()
+        except sqlite3.Error as e:
+            data_log.error('Failed to update processed data store: %s. Processing every folder without it.', e)
+            return self._process_lines_uncached(regular_lines, custom_lines)
 
-            cache_content = {
-                'data': data,
-                'full_data': full_data
-            }
-            with open(self.cache_file_path, 'w') as f:
-                json.dump(cache_content, f, indent=4) # Use indent for readability
-            print(f"Cache saved successfully.")
-        except (IOError, TypeError) as e:
-            print(f"Failed to save cache file: {e}")
+        removed_folders = deleted_folders + [folder for folder in changed_folders if folder not in changed_full_data]
+        self._update_config_search_index(changed_full_data, removed_folders)
+
+        loaded = {folder: configs for folder, configs in changed_full_data.items() if folder in data}
+        return data, LazyFullData(store, data.keys(), loaded)
 
 
+    def _process_lines_uncached(self, regular_lines, custom_lines):
+        """
+        Processes all regular and custom lines without the processed data store (used when
+        the store can't be updated), so unchanged folders don't drop out of the load.
+
+        Returns:
+            tuple: (data dict for the main grid, full_data dict)
+        """
+        self.config_info_index = None
+        full_data = self.process_lines(regular_lines, {}, is_custom=False)
+        full_data = self.process_lines(custom_lines, full_data, is_custom=True)
+        data = self._finalize_data_processing(full_data) if full_data else {}
+        self.config_search_index = None # Rebuilt from the loaded data on the next 'Configs' search
+        self.search_match_memo.clear()
+        return data, full_data
+
 
 
     def _finalize_data_processing(self, full_data):
@@ -2756,7 +2997,7 @@ class ConfigViewerApp:
         NEW Prioritization: 1. Default Config, 2. First with Main Info, 3. Absolute First.
         ADDED: Debug print for expected main info path check.
         """
-        print("\n--- _finalize_data_processing() STARTING (NEW Prioritization + Path Debug) ---") # Added Path Debug note
+        data_log.debug('\n--- _finalize_data_processing() STARTING (NEW Prioritization + Path Debug) ---') # Added Path Debug note
         data = {}
         missing_custom_pic_path = os.path.join(self.script_dir, "data/MissingCustomConfigPic.png")
         missing_zip_pic_path = os.path.join(self.script_dir, "data/MissingZipConfigPic.png")
@@ -2768,7 +3009,7 @@ class ConfigViewerApp:
             valid_config_list = [item for item in config_list if isinstance(item, (list, tuple)) and len(item) == 5]
 
             if not valid_config_list:
-                print(f"Warning: No VALID configs found for folder '{folder_name}' during finalization. Skipping.")
+                data_log.warning("Warning: No VALID configs found for folder '%s' during finalization. Skipping.", folder_name)
                 continue
 
             # Step 1: Check for Default Config
@@ -2806,14 +3047,14 @@ class ConfigViewerApp:
 
                 # Step 3: Fallback to Absolute First Config
                 if not found_with_main_info:
-                    print(f"  Finalize - Folder: {folder_name} - No default found, in addition to No config with Main Info JSON found. Falling back to ABSOLUTE FIRST config.")
+                    data_log.debug('  Finalize - Folder: %s - No default found, in addition to No config with Main Info JSON found. Falling back to ABSOLUTE FIRST config.', folder_name)
                     first_valid_item = valid_config_list[0]
                     representative_image_path = first_valid_item[0]
                     item_to_represent = first_valid_item
 
             # Final Check and Data Population (logic remains the same)
             if representative_image_path is None or not os.path.exists(representative_image_path):
-                print(f"  Finalize - Folder: {folder_name} - Representative image path missing or invalid ('{representative_image_path}'). Using PLACEHOLDER.")
+                data_log.debug("  Finalize - Folder: %s - Representative image path missing or invalid ('%s'). Using PLACEHOLDER.", folder_name, representative_image_path)
                 item_source_for_placeholder = "unknown_source"
                 if item_to_represent:
                     item_source_for_placeholder = item_to_represent[2]
@@ -2822,7 +3063,7 @@ class ConfigViewerApp:
 
                 is_item_custom = item_source_for_placeholder == "user_custom_configs"
                 representative_image_path = missing_custom_pic_path if is_item_custom else missing_zip_pic_path
-                print(f"  Finalize - Folder: {folder_name} - Selected placeholder: {os.path.basename(representative_image_path)}")
+                data_log.debug('  Finalize - Folder: %s - Selected placeholder: %s', folder_name, os.path.basename(representative_image_path))
                 if item_to_represent is None and valid_config_list:
                     item_to_represent = valid_config_list[0]
 
@@ -2830,7 +3071,7 @@ class ConfigViewerApp:
                 _, line_clean, current_zip_file_from_config, info_data, folder_name_from_config = item_to_represent
 
                 if not isinstance(info_data, dict):
-                    print(f"ERROR: Finalize - info_data in chosen representative item for '{folder_name}' is not a dict. Using default.")
+                    data_log.error("ERROR: Finalize - info_data in chosen representative item for '%s' is not a dict. Using default.", folder_name)
                     info_data = {"Name": "Data Error", "Value": 0}
                 if 'Value' not in info_data or not isinstance(info_data.get('Value'), (int, float)):
                     info_data['Value'] = 0
@@ -2843,29 +3084,30 @@ class ConfigViewerApp:
                     folder_name_from_config
                 ]
             else:
-                print(f"ERROR: Finalize - Could not determine a representative item for folder '{folder_name}'. Skipping.")
+                data_log.error("ERROR: Finalize - Could not determine a representative item for folder '%s'. Skipping.", folder_name)
 
-        print("--- _finalize_data_processing() FINISHED (NEW Prioritization + Path Debug) ---")
+        data_log.debug('--- _finalize_data_processing() FINISHED (NEW Prioritization + Path Debug) ---')
         return data
 
 
 
     def load_data(self):
         """
-        Loads configuration data, utilizing a cache if available.
-        If cache is missed, processes both regular and custom configs before saving.
+        Loads configuration data from the processed data store.
+        If the store is stale, re-reads the regular and custom config files and
+        reprocesses only the folders whose lines changed before loading.
         Handles placeholder settings and hidden folder filtering during processing.
         """
-        print("\n--- ConfigViewerApp.load_data() ENTRY ---")
+        data_log.debug('\n--- ConfigViewerApp.load_data() ENTRY ---')
 
 
 
         # 1. --- Check Cache First ---
-        # Note: self.cache_file_path should be defined in __init__
-        # e.g., self.cache_file_path = os.path.join(self.script_dir, "data", "config_processing_cache.json")
         cached_data, cached_full_data = self._load_cache()
         if cached_data is not None and cached_full_data is not None:
-            print("load_data - Cache HIT. Using cached data.")
+            data_log.debug('load_data - Cache HIT. Using cached data.')
+            self.config_search_index = None # Rebuilt from the loaded data on the next 'Configs' search
+            self.search_match_memo.clear()
             # Update internal state directly from cache
             self.full_data_cache = cached_full_data # Store the detailed config list cache
             # 'cached_data' is the dictionary for the main grid (representative images)
@@ -2875,15 +3117,14 @@ class ConfigViewerApp:
             # Apply subset filter immediately after loading from cache
             self.data_cache = self.apply_data_subset_filter(data_values)
 
-            print(f"load_data - Loaded {len(cached_data)} main items (from cache dict), {len(self.data_cache)} after subset filter.")
-            print(f"load_data - Loaded {len(self.full_data_cache)} full data groups from cache.")
-            print("--- ConfigViewerApp.load_data() EXIT (from Cache) ---")
+            data_log.debug('load_data - Loaded %s main items (from cache dict), %s after subset filter.', len(cached_data), len(self.data_cache))
+            data_log.debug('load_data - Loaded %s full data groups from cache.', len(self.full_data_cache))
+            data_log.debug('--- ConfigViewerApp.load_data() EXIT (from Cache) ---')
             # Return the format expected by the caller
             return list(self.data_cache), self.full_data_cache
 
-        # 2. --- Cache MISS - Process Fresh ---
-        print("load_data - Cache MISS. Processing files...")
-        combined_full_data = {} # Initialize empty dict to accumulate results
+        # 2. --- Cache MISS - Re-read the config files and update changed folders ---
+        data_log.debug('load_data - Cache MISS. Processing files...')
         self.individual_info_files = {} # Reset if needed
         self.config_info_cache = {} # Reset cache
 
@@ -2891,93 +3132,73 @@ class ConfigViewerApp:
         regular_input_file_orig = self.input_file # Store original path if needed
         regular_input_file_processed = os.path.join(self.script_dir, "data/outputgood_PreviewsPresent.txt")
         custom_input_file = os.path.join(self.script_dir, "data/outputGOODcustom.txt")
-        hidden_folders = self.get_hidden_folders() # Get hidden folders once
+        regular_hidden_matcher, custom_hidden_matcher = self.get_hidden_folder_matchers() # Compiled once per Hidden.txt change
 
         # Determine which regular file to read based on settings
         file_to_read_regular = None
         if self.placeholder_settings:
             # If placeholder settings is TRUE, read the original unfiltered file
             file_to_read_regular = regular_input_file_orig
-            print("load_data - Placeholder settings ON, reading original input file.")
+            data_log.debug('load_data - Placeholder settings ON, reading original input file.')
         else:
             # If placeholder settings is FALSE, run the filter and read the filtered file
             try:
-                print("load_data - Placeholder settings OFF, filtering outputgood...")
+                data_log.debug('load_data - Placeholder settings OFF, filtering outputgood...')
                 self.filter_outputgood() # Assume this creates/updates outputgood_PreviewsPresent.txt
                 file_to_read_regular = regular_input_file_processed
-                print(f"load_data - Reading filtered file: {file_to_read_regular}")
+                data_log.debug('load_data - Reading filtered file: %s', file_to_read_regular)
             except Exception as e:
-                print(f"ERROR: Failed during self.filter_outputgood(): {e}")
+                data_log.error('ERROR: Failed during self.filter_outputgood(): %s', e)
                 # Fallback to original if filtering fails? Or skip?
                 file_to_read_regular = regular_input_file_orig
-                print(f"Warning: Falling back to reading original file: {file_to_read_regular}")
+                data_log.warning('Warning: Falling back to reading original file: %s', file_to_read_regular)
 
 
-        # --- Process Regular Configs ---
+        # --- Read Regular Configs ---
+        regular_lines = []
         try:
             if file_to_read_regular and os.path.exists(file_to_read_regular):
-                print(f"Processing regular data from: {file_to_read_regular}")
+                data_log.debug('Reading regular data from: %s', file_to_read_regular)
                 with open(file_to_read_regular, "r", encoding="utf-8") as file:
                     lines = file.readlines()
 
                 # Filter lines based on hidden folders
-                filtered_lines = [
-                    line for line in lines
-                    if not any(
-                        f"vehicles/{folder}/" in line.lower() or f"vehicles\\{folder}\\" in line.lower()
-                        for folder in hidden_folders
-                    )
-                ]
-                print(f"load_data - Processing {len(filtered_lines)} regular lines after hidden folder filter.")
-                # Call the CORE processor, updating the combined dictionary
-                combined_full_data = self.process_lines(filtered_lines, combined_full_data, is_custom=False)
+                regular_lines = regular_hidden_matcher.filter_lines(lines)
+                data_log.debug('load_data - %s regular lines after hidden folder filter.', len(regular_lines))
             else:
-                print(f"Warning: Regular input file not found or not determined: {file_to_read_regular}")
+                data_log.warning('Warning: Regular input file not found or not determined: %s', file_to_read_regular)
         except Exception as e:
-            print(f"ERROR: Failed to process regular config file {file_to_read_regular}: {e}")
+            data_log.error('ERROR: Failed to read regular config file %s: %s', file_to_read_regular, e)
 
 
-        # --- Process Custom Configs ---
+        # --- Read Custom Configs ---
+        custom_lines = []
         try:
             if os.path.exists(custom_input_file):
-                print(f"Processing custom data from: {custom_input_file}")
+                data_log.debug('Reading custom data from: %s', custom_input_file)
                 with open(custom_input_file, "r", encoding="utf-8") as file:
                     lines = file.readlines()
 
-                # Filter lines based on hidden folders
-                filtered_lines = [
-                    line for line in lines
-                    if not any(
-                        # Adapt filter logic for custom file format if necessary
-                        f"vehicles/{folder}/" in line.lower() or f"vehicles\\{folder}\\" in line.lower() or f"vehicles--{folder}" in line.lower()
-                        for folder in hidden_folders
-                    )
-                ]
-                print(f"load_data - Processing {len(filtered_lines)} custom lines after hidden folder filter.")
-                # Call the CORE processor AGAIN, updating the SAME combined dictionary
-                combined_full_data = self.process_lines(filtered_lines, combined_full_data, is_custom=True)
+                # Filter lines based on hidden folders (the custom list also names them as "vehicles--<folder>")
+                custom_lines = custom_hidden_matcher.filter_lines(lines)
+                data_log.debug('load_data - %s custom lines after hidden folder filter.', len(custom_lines))
             else:
-                print(f"Warning: Custom config file not found: {custom_input_file}")
+                data_log.warning('Warning: Custom config file not found: %s', custom_input_file)
         except Exception as e:
-            print(f"ERROR: Failed to process custom config file {custom_input_file}: {e}")
+            data_log.error('ERROR: Failed to read custom config file %s: %s', custom_input_file, e)
 
 
-        # --- Finalize and Save ---
-        if not combined_full_data:
-            print("ERROR: No data was processed from regular or custom files. Cannot finalize or save cache.")
+        # --- Process changed folders and update the store ---
+        final_data_dict, combined_full_data = self._update_cache(regular_lines, custom_lines)
+
+        if not final_data_dict:
+            data_log.error('ERROR: No data was processed from regular or custom files.')
             self.original_data = {} # Or potentially self.data_cache = []
             self.grouped_data = {} # Or potentially self.full_data_cache = {}
-            print("--- ConfigViewerApp.load_data() EXIT (No Data Processed) ---")
+            data_log.debug('--- ConfigViewerApp.load_data() EXIT (No Data Processed) ---')
             # Return empty but correctly structured data
             return [], {}
 
-        print("load_data - Finalizing processed data...")
-        # This creates the dictionary for the main grid (representative images)
-        final_data_dict = self._finalize_data_processing(combined_full_data)
-
-        print("load_data - Saving combined data to cache...")
-        self._save_cache(final_data_dict, combined_full_data)
-
         # Update internal state
         self.full_data_cache = combined_full_data # Store detailed list
         data_values = list(final_data_dict.values()) # Get list of values for main grid
@@ -2985,10 +3206,10 @@ class ConfigViewerApp:
         # Apply subset filter AFTER processing and finalizing
         self.data_cache = self.apply_data_subset_filter(data_values)
 
-        print(f"load_data - Processed {len(final_data_dict)} main items (before subset filter).")
-        print(f"load_data - Processed {len(self.data_cache)} main items (after subset filter).")
-        print(f"load_data - Processed {len(self.full_data_cache)} full data groups.")
-        print("--- ConfigViewerApp.load_data() EXIT (Processed Fresh) ---")
+        data_log.debug('load_data - Processed %s main items (before subset filter).', len(final_data_dict))
+        data_log.debug('load_data - Processed %s main items (after subset filter).', len(self.data_cache))
+        data_log.debug('load_data - Processed %s full data groups.', len(self.full_data_cache))
+        data_log.debug('--- ConfigViewerApp.load_data() EXIT (Processed Fresh) ---')
 
 
         # Return the format expected by the caller
@@ -3008,6 +3229,21 @@ class ConfigViewerApp:
                         hidden_folders.append(parts[0].strip())
         return hidden_folders
 
+    def get_hidden_folder_matchers(self):
+        """
+        Returns the HiddenFolderMatchers (regular list, custom list) for the folders in
+        Hidden.txt. They are compiled again only when the hidden folders change.
+        """
+        hidden_folders = tuple(self.get_hidden_folders())
+        if self.hidden_folder_matchers is None or self.hidden_folder_matchers[0] != hidden_folders:
+            self.hidden_folder_matchers = (
+                hidden_folders,
+                HiddenFolderMatcher(hidden_folders),
+                HiddenFolderMatcher(hidden_folders, custom_format=True)
+            )
+            data_log.debug('Compiled hidden folder matchers for %s hidden folders.', len(hidden_folders))
+        return self.hidden_folder_matchers[1], self.hidden_folder_matchers[2]
+
     def filter_outputgood(self):
         """
         Filters outputgood.txt to remove lines containing "IMAGE_NOT_FOUND-USEMISSING"
@@ -3017,7 +3253,7 @@ class ConfigViewerApp:
         outputgood_PreviewsPresent = os.path.join(self.script_dir, "data/outputgood_PreviewsPresent.txt")
 
         if not os.path.exists(self.input_file):
-            print(f"Error: Input file '{self.input_file}' not found.")
+            data_log.error("Error: Input file '%s' not found.", self.input_file)
             return
 
         filtered_lines = []
@@ -3036,16 +3272,16 @@ class ConfigViewerApp:
                         filtered_lines.append(line)
 
         except Exception as e:
-            print(f"An error occurred while reading '{self.input_file}': {e}")
+            data_log.error("An error occurred while reading '%s': %s", self.input_file, e)
             return
 
         try:
             with open(outputgood_PreviewsPresent, 'w', encoding="utf-8") as outfile:
                 outfile.writelines(filtered_lines)
-            print(f"Filtered content written to '{outputgood_PreviewsPresent}'")
+            data_log.debug("Filtered content written to '%s'", outputgood_PreviewsPresent)
 
         except Exception as e:
-            print(f"An error occurred while writing to '{outputgood_PreviewsPresent}': {e}")
+            data_log.error("An error occurred while writing to '%s': %s", outputgood_PreviewsPresent, e)
     
 
 
@@ -3202,16 +3438,16 @@ class ConfigViewerApp:
     #@profile 
     def refresh_data_from_files(self):
         """Refreshes data from files, added search window update."""
-        print("\n--- ConfigViewerApp.refresh_data_from_files() ENTRY ---")
-        print("Refreshing data from files...")
-        print("Calling self.load_data() ...")
+        data_log.debug('\n--- ConfigViewerApp.refresh_data_from_files() ENTRY ---')
+        data_log.debug('Refreshing data from files...')
+        data_log.debug('Calling self.load_data() ...')
         self.original_data, self.original_full_data = self.load_data()
-        print("self.load_data() RETURNED.")
+        data_log.debug('self.load_data() RETURNED.')
         self.data = list(self.original_data)
-        self.full_data = dict(self.original_full_data)
+        self.full_data = self.original_full_data.copy()
         self.setup_sidebar_filter_dropdowns(self.sidebar_bottom_frame, 10)
         
-        print("DEBUG: refresh_data_from_files - Manually calling write_watcher_output() BEFORE read_favorites()...")
+        data_log.debug('DEBUG: refresh_data_from_files - Manually calling write_watcher_output() BEFORE read_favorites()...')
         try:
             self.write_watcher_output(
                 self.watcher_output_file,  # file_path
@@ -3224,19 +3460,19 @@ class ConfigViewerApp:
                 self.current_vanilla_files,    # vanilla_files
                 self.last_zip_count          # zip_count
             )
-            print("DEBUG: refresh_data_from_files - write_watcher_output() BEFORE read_favorites() called successfully.")
+            data_log.debug('DEBUG: refresh_data_from_files - write_watcher_output() BEFORE read_favorites() called successfully.')
         except Exception as e:
-            print(f"Warning: Error writing WatcherOutput.txt in refresh_data_from_files BEFORE read_favorites(): {e}")
+            data_log.warning('Warning: Error writing WatcherOutput.txt in refresh_data_from_files BEFORE read_favorites(): %s', e)
         
         self.read_favorites()
-        print("Calling self.perform_search() ...")
-        print("    refresh_data_from_files is calling self.perform_search()")
+        data_log.debug('Calling self.perform_search() ...')
+        data_log.debug('    refresh_data_from_files is calling self.perform_search()')
         self.perform_search()
-        print("self.perform_search() RETURNED.")
+        data_log.debug('self.perform_search() RETURNED.')
         self.canvas.yview_moveto(0)
-        print("Data refresh complete.")
+        data_log.debug('Data refresh complete.')
         self.update_search_results_window_ui() # <----- ADD THIS LINE HERE
-        print("--- ConfigViewerApp.refresh_data_from_files() EXIT ---\n")
+        data_log.debug('--- ConfigViewerApp.refresh_data_from_files() EXIT ---\n')
 
         
         
@@ -3248,20 +3484,37 @@ class ConfigViewerApp:
         base_candidate = f"vehicles--{folder_name}_user--{file_name}"
         has_extension = any(file_name.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png'])
 
+        # Case-insensitive lookup in the in-memory index instead of listing the folder per candidate
+        index = self.get_custom_picture_index()
         if has_extension:
-            candidate = base_candidate
-            for existing_file in os.listdir(self.config_pics_custom_folder):
-                if existing_file.lower() == candidate.lower():
-                    found_path = os.path.join(self.config_pics_custom_folder, existing_file)
-                    return found_path
-        else:
-            for ext in ['jpg', 'jpeg', 'png']:
-                candidate = f"{base_candidate}.{ext}"
-                for existing_file in os.listdir(self.config_pics_custom_folder):
-                    if existing_file.lower() == candidate.lower():
-                        found_path = os.path.join(self.config_pics_custom_folder, existing_file)
-                        return found_path
-        return None
+            stem, ext = os.path.splitext(base_candidate)
+            return index.find(stem, [ext[1:]])
+        return index.find(base_candidate) # jpg, then jpeg, then png
+
+    def get_zip_install_times(self):
+        """
+        Returns the in-memory archive install dates used by format_grouped_data, creating them
+        on first use. apply_mod_zip_delta and trigger_full_data_refresh_and_ui_update drop
+        the changed entries.
+        """
+        install_times = self.zip_install_times
+        if install_times is None or install_times.repo_folder != self.repo_folder:
+            install_times = ZipInstallTimes(self.repo_folder, os.path.dirname(self.repo_folder))
+            self.zip_install_times = install_times
+        return install_times
+
+
+    def get_custom_picture_index(self):
+        """
+        Returns the ConfigPicsCustom picture index, building it on first use.
+        CustomFileEventHandler keeps it current; run_python_scripts_custom drops it after the
+        custom picture extractor ran.
+        """
+        index = self.custom_picture_index
+        if index is None or index.folder != self.config_pics_custom_folder:
+            index = CustomPictureIndex(self.config_pics_custom_folder)
+            self.custom_picture_index = index
+        return index
 
 
 
@@ -4619,61 +4872,90 @@ class ConfigViewerApp:
         if not self.is_data_subset_active:
             return data_list
 
-        subset_lines = set()
         data_subset_file_path = "" # Initialize to empty string
+        in_memory_lines = None # Lines from the last global filter run, used instead of the files when available
 
         # Determine which subset file to use based on mode and filters
         if self.filter_state == 5 and self.filter_options[self.filter_state] == "Favorites": # Favorites Mode
             if self.is_data_subset_active: # Global Filters ON in Favorites Mode
                 data_subset_file_path = os.path.join(self.script_dir, "data/data_subset_favorites.txt")
-                print("DEBUG: apply_data_subset_filter - Favorites Mode AND Global Filters ON - Using data_subset_favorites.txt")
+                in_memory_lines = self.get_data_subset_favorites_lines()
+                filter_log.debug('DEBUG: apply_data_subset_filter - Favorites Mode AND Global Filters ON - Using data_subset_favorites.txt')
             else:
                 # Favorites Mode but Global Filters OFF - data_subset files are ignored for main grid filtering
-                print("DEBUG: apply_data_subset_filter - Favorites Mode BUT Global Filters OFF - Ignoring data_subset files for main grid.")
+                filter_log.debug('DEBUG: apply_data_subset_filter - Favorites Mode BUT Global Filters OFF - Ignoring data_subset files for main grid.')
                 return data_list # Return original data list - data_subset files are ignored in this case
 
         else: # NOT Favorites Mode - use regular data_subset.txt
             data_subset_file_path = os.path.join(self.script_dir, self.data_subset_file)
-            print("DEBUG: apply_data_subset_filter - NOT Favorites Mode - Using data_subset.txt")
+            in_memory_lines = self.get_data_subset_lines()
+            filter_log.debug('DEBUG: apply_data_subset_filter - NOT Favorites Mode - Using data_subset.txt')
 
 
-        if data_subset_file_path and os.path.exists(data_subset_file_path): # Check if file path is set AND file exists
-            with open(data_subset_file_path, 'r', encoding="utf-8") as f:
-                for line in f:
-                    subset_line = line.strip()
-                    if subset_line:
-                        subset_lines.add(subset_line)
-        elif data_subset_file_path: # File path is set but doesn't exist (and it's supposed to be used in current mode)
-            print(f"Warning: Data subset file not found at: {data_subset_file_path}. Returning empty subset.")
+        subset_filter = self.get_data_subset_filter(data_subset_file_path, in_memory_lines)
+        if subset_filter is None: # File path is set but doesn't exist (and it's supposed to be used in current mode)
+            filter_log.warning('Warning: Data subset file not found at: %s. Returning empty subset.', data_subset_file_path)
             return [] # Return empty list if data subset file is expected but not found
-        else: # No data_subset file path set for the current mode (e.g., Favorites Mode, Global Filters OFF)
-            return data_list # Return original list if no filtering needed
-
 
-        if not subset_lines:
+        if not subset_filter:
             return []
 
-        filtered_data = []
-        for item in data_list:
-            pic_path = item[0]
-            if pic_path:
-                pic_filename = os.path.basename(pic_path)
-                folder_name = item[4]
+        return [item for item in data_list if subset_filter.contains_item(item)]
 
-                required_prefix = f"vehicles--{folder_name}"
-                is_substring_found = False
 
-                for subset_line in subset_lines:
-                    normalized_required_prefix = required_prefix.strip().lower()
-                    normalized_subset_line = subset_line.strip().lower()
+    def get_data_subset_lines(self):
+        """
+        Returns the data subset lines of the last global filter run. After a restart they are
+        read back from data_subset.txt (which filter_config_files always writes) once, so
+        turning the subset On works without running the filter again. None if there is none.
+        """
+        if self.data_subset_lines is None:
+            data_subset_file_path = os.path.join(self.script_dir, self.data_subset_file)
+            if os.path.exists(data_subset_file_path):
+                with open(data_subset_file_path, 'r', encoding="utf-8") as f:
+                    self.data_subset_lines = [line.strip() for line in f if line.strip()]
+                filter_log.debug('DEBUG: Restored %s data subset lines from %s', len(self.data_subset_lines), data_subset_file_path)
+        return self.data_subset_lines
+
+
+    def get_data_subset_favorites_lines(self):
+        """The favorites part of the data subset, generated in memory from get_data_subset_lines() if the last run didn't keep it."""
+        if self.data_subset_favorites_lines is None:
+            subset_lines = self.get_data_subset_lines()
+            if subset_lines is not None:
+                self.data_subset_favorites_lines = generate_data_subset_favorites(
+                    self.script_dir, subset_lines, write_file=self.write_filter_output_files
+                )
+        return self.data_subset_favorites_lines
 
-                    if normalized_required_prefix in normalized_subset_line:
-                        filtered_data.append(item)
-                        is_substring_found = True
-                        break
 
+    def get_data_subset_filter(self, data_subset_file_path, in_memory_lines=None):
+        """
+        Returns the DataSubsetFilter of a data subset: in_memory_lines if the last global
+        filter run kept them, else the lines of data_subset_file_path (None if that file
+        doesn't exist). The filter is built once per subset and reused until the global
+        filter produces new lines or the file changes, so perform_search doesn't rebuild
+        it on every keystroke.
+        """
+        if in_memory_lines is not None:
+            source = in_memory_lines
+        else:
+            source = file_signature(data_subset_file_path)
+            if source is None:
+                return None
 
-        return filtered_data
+        cached = self.data_subset_filter_cache.get(data_subset_file_path)
+        if cached is not None and (cached[0] is source or (in_memory_lines is None and cached[0] == source)):
+            return cached[1]
+
+        if in_memory_lines is not None:
+            subset_filter = DataSubsetFilter(in_memory_lines)
+        else:
+            with open(data_subset_file_path, 'r', encoding="utf-8") as f:
+                subset_filter = DataSubsetFilter(f)
+        self.data_subset_filter_cache[data_subset_file_path] = (source, subset_filter)
+        filter_log.debug('DEBUG: Built data subset filter from %s lines (%s)', len(subset_filter), data_subset_file_path)
+        return subset_filter
   
 
 
@@ -4789,6 +5071,10 @@ class ConfigViewerApp:
         else:
             print(f"File not found, cannot delete: {self.data_subset_file}")
 
+        self.data_subset_lines = None
+        self.data_subset_favorites_lines = None
+        self.data_subset_filter_cache.clear()
+
         self.is_data_subset_active = False # <--- ALWAYS TURN SUBSET DATA OFF when "Clear Filters" is clicked
         self.subset_data_button.config(text="Off") # Update button text
         self.reset_button_color(self.subset_data_button, self.button_style_args)
@@ -5368,7 +5654,7 @@ class ConfigViewerApp:
                     filters_are_empty = False
                     break
         if filters_are_empty:
-            print("DEBUG: apply_filters_and_run_filter - No filters entered (all entries empty). Triggering Clear Filters behavior.")
+            filter_log.debug('DEBUG: apply_filters_and_run_filter - No filters entered (all entries empty). Triggering Clear Filters behavior.')
             self.clear_all_filters_and_files(entry_widgets, self.button_style_args) # Use self.button_style_args
             return  # Exit early, mimicking Clear button behavior
         # --- MODIFICATION END: Check if filters are empty ---
@@ -5379,17 +5665,17 @@ class ConfigViewerApp:
             self.filter_config_files(filters_variable)
             self.is_data_subset_active = True
             self.subset_data_button.config(text="On")
-            print("    apply_filters_and_run_filter is calling self.perform_search()")
+            filter_log.debug('    apply_filters_and_run_filter is calling self.perform_search()')
             self.perform_search()
-            print("Data Subset Mode: ON (Set by Apply Filters)")
+            filter_log.debug('Data Subset Mode: ON (Set by Apply Filters)')
             self.update_search_results_window_ui()
 
             # --- MODIFICATION START: Open Search Results Window after applying filters ---
             if not hasattr(self, 'search_results_window') or not self.search_results_window or not self.search_results_window.winfo_exists():
                 self.search_results_window = self.show_search_results_window(self.data) # Pass current data
-                print("DEBUG: apply_filters_and_run_filter - Search Results window CREATED after applying filters.")
+                filter_log.debug('DEBUG: apply_filters_and_run_filter - Search Results window CREATED after applying filters.')
             self.search_results_window.lift() # Bring to front if already open
-            print("DEBUG: apply_filters_and_run_filter - Search Results window LIFTED after applying filters.")
+            filter_log.debug('DEBUG: apply_filters_and_run_filter - Search Results window LIFTED after applying filters.')
             # --- MODIFICATION END: Open Search Results Window after applying filters ---
 
         self.lift_search_results_window()
@@ -5398,17 +5684,6 @@ class ConfigViewerApp:
 
 
 
-    def get_json_value_safe(self, data, key, regex_pattern=None):
-        # No JSON decoding anymore - data is always a string
-        if regex_pattern and isinstance(regex_pattern, str):
-            try:
-                match = re.search(regex_pattern, data, re.IGNORECASE | re.MULTILINE) # Added re.MULTILINE for multiline JSON
-                if match:
-                    return match.group(1).strip() if match.groups() else match.group(0).strip() # Return captured group or full match
-            except: # Regex error, return None
-                return None
-        return None # Key not found and regex failed or not provided
-
     def _parse_filters(self, filters_string):
         """Parses the filter string into individual filter conditions."""
         filter_conditions = []
@@ -5433,368 +5708,129 @@ class ConfigViewerApp:
                     country_filter = condition
         return filter_conditions, brand_filter, country_filter
 
-    def _check_condition(self, file_content, condition, filename=""):
-        """Checks if a single filter condition is met for a given file content, reading content directly."""
-        criterion = condition['criterion']
-        filter_type = condition['type']
-        filter_value = condition['value']
-        file_value = None
-
-        if file_content is None:
-            return False, f"Error: File content for {filename} is missing."
-
-        if criterion == "Brand":
-            file_value = self.get_json_value_safe(file_content, "Brand", r'"Brand"\s*:\s*"([^"]*)"')
-        elif criterion == "Country":
-            file_value = self.get_json_value_safe(file_content, "Country", r'"Country"\s*:\s*"([^"]*)"')
-        elif criterion == "Configuration":
-            file_value_json = self.get_json_value_safe(file_content, "Configuration", r'"Configuration"\s*:\s*"([^"]*)"')
-            name_parts = filename.split('--info_info_')
-            file_value_name = name_parts[1].replace(".json", "_", "-") if len(name_parts) > 1 else None
-            file_value = file_value_json or file_value_name
-        elif criterion == "Top Speed (km/h)":
-            top_speed_ms_str = self.get_json_value_safe(file_content, "Top Speed", r'"Top Speed"\s*:\s*([\d.]*)')
-            if top_speed_ms_str:
-                try:
-                    top_speed_ms = float(top_speed_ms_str)
-                    file_value = top_speed_ms * 3.6
-                except ValueError:
-                    file_value = None
-        elif criterion == "Power":
-            file_value = self.get_json_value_safe(file_content, "Power", r'"Power"\s*:\s*([\d.]*)')
-        elif criterion == "0-100 km/h":
-            file_value = self.get_json_value_safe(file_content, "0-100 km/h", r'"0-100 km/h"\s*:\s*([\d.]*)')
-        elif criterion == "Off-Road Score":
-            file_value = self.get_json_value_safe(file_content, "Off-Road Score", r'"Off-Road Score"\s*:\s*([\d.]*)')
-        elif criterion == "Braking G":
-            file_value = self.get_json_value_safe(file_content, "Braking G", r'"Braking G"\s*:\s*([\d.]*)')
-        elif criterion == "Fuel Type":
-            file_value = self.get_json_value_safe(file_content, "Fuel Type", r'"Fuel Type"\s*:\s*"([^"]*)"')
-        elif criterion == "Drivetrain":
-            file_value = self.get_json_value_safe(file_content, "Drivetrain", r'"Drivetrain"\s*:\s*"([^"]*)"')
-        elif criterion == "Transmission":
-            file_value = self.get_json_value_safe(file_content, "Transmission", r'"Transmission"\s*:\s*"([^"]*)"')
-
-        if file_value is None and filter_type not in ["Contains", "DoesNotContain"]:
-            return False, f"{criterion}: Value not found in file."
-
-        condition_met = False
-        if filter_type == "Contains":
-            condition_met = filter_value.lower() in str(file_value).lower() if file_value is not None else False
-        elif filter_type == "DoesNotContain":
-            condition_met = filter_value.lower() not in str(file_value).lower() if file_value is not None else True # Handle None as not containing
-        elif filter_type in ["Below", "Above", "Below (m/s)", "Above (m/s)"]:
-            try:
-                file_value_float = float(str(file_value)) if file_value is not None else None
-                filter_value_float = float(filter_value)
-                if file_value_float is not None: # Only compare if file_value is valid number
-                    if filter_type in ["Below", "Below (m/s)"]:
-                        condition_met = file_value_float < filter_value_float
-                    elif filter_type in ["Above", "Above (m/s)"]:
-                        condition_met = file_value_float > filter_value_float
-            except (ValueError, TypeError):
-                condition_met = False # Handle non-numeric comparisons as not met
-
-        if not condition_met and file_value is not None: # Only provide reason if we could get a file_value
-             return False, f"{criterion} {filter_type} {filter_value}, but file has value: '{file_value}'"
-        elif not condition_met:
-            return False, f"{criterion} {filter_type} {filter_value}, but value could not be determined in file." # More generic reason for no file_value
-        return True, None
-
-
 
 
+    def _get_filter_attribute_table(self):
+        """
+        Returns the columnar filter attribute table for matches.txt (modules/filter_attributes.py).
+        The in-memory table is reused until matches.txt changes; otherwise the table saved in
+        data/filter_attributes.json is loaded, or rebuilt if it is stale.
+        Returns None if matches.txt does not exist.
+        """
+        matches_file_path = os.path.join(self.script_dir, self.matches_txt)
+        table = self.filter_attribute_table
+        if table is not None and table.is_current(matches_file_path):
+            return table
 
-    def _process_main_info_files(self, matches_data, brand_filter, country_filter, outfile): # Modified to take matches_data
-        """Processes main info files from matches_data, applying brand and country filters."""
-        main_info_brand_check_results = {}
-        main_info_country_check_results = {}
-        not_matched_files_details = []
+        table_path = os.path.join(self.script_dir, "data", FILTER_ATTRIBUTES_FILE_NAME)
+        try:
+            table = load_filter_attribute_table(matches_file_path, table_path)
+        except FileNotFoundError:
+            data_log.debug('Error: %s file not found in script directory: %s', self.matches_txt, self.script_dir)
+            return None
+        self.filter_attribute_table = table
+        return table
 
-        outfile.write("---\nProcessing Main Info Files (Brand/Country Check):\n")
-        for entry in matches_data: # Iterate through matches_data
-            filename = entry['filename']
-            file_content = entry['content']
-            if "INDIVIDUAL" in filename: # Skip individual files here
-                continue
 
-            brand_check_failed_reason = None
-            country_check_failed_reason = None
-            is_match = True
-
-            if brand_filter:
-                condition_met, reason = self._check_condition(file_content, brand_filter, filename)
-                if not condition_met:
-                    is_match = False
-                    brand_check_failed_reason = reason
-
-            if country_filter:
-                condition_met, reason = self._check_condition(file_content, country_filter, filename)
-                if not condition_met:
-                    is_match = False
-                    country_check_failed_reason = reason
-                    if brand_check_failed_reason:
-                        brand_check_failed_reason += f"; and {country_check_failed_reason}"
-                    else:
-                        brand_check_failed_reason = country_check_failed_reason # Reusing variable name for combined reason
 
+    def _write_filter_results(self, table, filter_conditions, brand_filter, country_filter, matched_rows, subset_lines):
+        """Writes the filter_results.txt report: matched and not matched files with reasons, and the data subset."""
+        matched = set(matched_rows)
+        main_conditions = [(condition, table.matching_rows(condition)) for condition in (brand_filter, country_filter) if condition]
+        individual_conditions = [
+            (condition, table.matching_rows(condition))
+            for condition in filter_conditions
+            if condition['criterion'] not in ["Brand", "Country"]
+        ]
 
-            main_zip_name_match = re.search(r'vehicles--(.+?\.zip)--info\.json', filename, re.IGNORECASE)
-            main_zip_name = main_zip_name_match.group(1) if main_zip_name_match else None
-            outfile.write(f"DEBUG: Main File - Filename: {filename}, main_zip_name: '{main_zip_name}', Brand/Country Check Result: {not brand_check_failed_reason}\n")
-            main_info_brand_check_results[main_zip_name] = not brand_check_failed_reason
-            main_info_country_check_results[main_zip_name] = not country_check_failed_reason
+        with open(self.filter_output_file, 'w', encoding="utf-8") as outfile:
+            outfile.write("Filter Results:\n\n")
 
-            if brand_check_failed_reason:
-                not_matched_files_details.append({'filename': filename, 'content_summary': file_content[:200] + "...", 'reasons': [brand_check_failed_reason]})
-                outfile.write(f"  Filename: {filename} - Brand/Country Check Failed\n")
-                outfile.write(f"  Reasons: {brand_check_failed_reason}\n")
-                outfile.write("-" * 20 + "\n")
-            else:
-                outfile.write(f"  Filename: {filename} - Brand/Country Check Passed (or no brand/country filter)\n")
+            outfile.write("---\nProcessing Main Info Files (Brand/Country Check):\n")
+            for row in table.main_rows:
+                reasons = [table.describe_failure(row, condition) for condition, rows in main_conditions if row not in rows]
+                if reasons:
+                    outfile.write(f"  Filename: {table.filenames[row]} - Brand/Country Check Failed\n")
+                    outfile.write(f"  Reasons: {'; and '.join(reasons)}\n")
+                else:
+                    outfile.write(f"  Filename: {table.filenames[row]} - Brand/Country Check Passed (or no brand/country filter)\n")
                 outfile.write("-" * 20 + "\n")
 
-
-        return main_info_brand_check_results, main_info_country_check_results, not_matched_files_details
-
-
-    def _process_individual_files(self, matches_data, filter_conditions, main_info_brand_check_results, main_info_country_check_results, outfile): # Modified to take matches_data
-        """Processes individual files from matches_data, applying filters and considering main info file results."""
-        matched_files_details = []
-        not_matched_files_details = []
-        data_subset_pairs = []
-        main_info_matched_for_subset = set()
-
-        outfile.write("\n---\nProcessing Individual Files:\n")
-        for entry in matches_data: # Iterate through matches_data
-            filename = entry['filename']
-            file_content = entry['content']
-            if "INDIVIDUAL" not in filename: # Skip main files here
-                continue
-
-            is_match = True
-            reasons_not_matched = []
-            brand_check_failed = False
-            country_check_failed = False
-
-            individual_zip_name_match = re.search(r'vehicles--INDIVIDUAL--(.+?\.zip)--info_info_.*\.json', filename, re.IGNORECASE)
-            individual_zip_name = individual_zip_name_match.group(1) if individual_zip_name_match else None
-
-            related_main_info_brand_check_passed = True # Default if no brand filter
-            related_main_info_country_check_passed = True # Default if no country filter
-
-            if any(cond['criterion'] == "Brand" for cond in filter_conditions): # Check if brand filter is applied at all
-                related_main_info_brand_check_passed = main_info_brand_check_results.get(individual_zip_name, False)
-            if any(cond['criterion'] == "Country" for cond in filter_conditions): # Check if country filter is applied at all
-                related_main_info_country_check_passed = main_info_country_check_results.get(individual_zip_name, True)
-
-
-            outfile.write(f"DEBUG: Individual File - Filename: {filename}, individual_zip_name: '{individual_zip_name}', related_main_info_brand_check_passed: {related_main_info_brand_check_passed}, related_main_info_country_check_passed: {related_main_info_country_check_passed}\n")
-
-
-            if not related_main_info_brand_check_passed:
-                is_match = False
-                brand_check_failed = True
-                reasons_not_matched.append("Related Main File Failed Brand Check (or missing Main Info File with Brand Filter active)")
-
-            if not related_main_info_country_check_passed:
-                is_match = False
-                country_check_failed = True
-                if not brand_check_failed:
-                    reasons_not_matched.append("Related Main File Failed Country Check (or missing Main Info File with Country Filter active)")
-
-
-            if is_match: # Only proceed with other filters if main file brand/country check passed or no brand/country filter
-                for condition in filter_conditions:
-                    if condition['criterion'] in ["Brand", "Country"]: # Skip Brand and Country here, already handled
-                        continue
-
-                    condition_met, reason = self._check_condition(file_content, condition, filename)
-                    if not condition_met:
-                        is_match = False
-                        reasons_not_matched.append(reason)
-
-
-            if is_match:
-                matched_files_details.append({'filename': filename, 'content_summary': file_content[:200] + "...", 'reasons': "Matched all criteria"})
-                outfile.write(f"  Filename: {filename} - Matched\n")
-                outfile.write(f"  Reasons: Matched all criteria\n")
+            outfile.write("\n---\n--- Matched Files Summary ---\n")
+            for row in matched_rows:
+                outfile.write(f"Filename: {table.filenames[row]}\n")
+                outfile.write(f"Reasons: Matched all criteria\n")
                 outfile.write("-" * 20 + "\n")
-                individual_zip_name_match_subset = re.search(r'vehicles--INDIVIDUAL--(.+?\.zip)--info_info_.*\.json', filename, re.IGNORECASE) # Re-extract for subset pairing to ensure correct zip name
-                individual_zip_name_subset = individual_zip_name_match_subset.group(1) if individual_zip_name_match_subset else None
-                data_subset_pairs.append({'main_file': individual_zip_name_subset, 'individual_file': filename})
-                main_info_matched_for_subset.add(individual_zip_name_subset)
 
-            else:
-                not_matched_files_details.append({'filename': filename, 'content_summary': file_content[:200] + "...", 'reasons': reasons_not_matched})
-                outfile.write(f"  Filename: {filename} - Not Matched\n")
-                outfile.write(f"  Reasons: {reasons_not_matched}\n")
+            outfile.write("\n---\n--- Not Matched Files Summary ---\n")
+            for row in table.individual_rows:
+                if row in matched:
+                    continue
+                reasons = [table.describe_failure(row, condition) for condition, rows in individual_conditions if row not in rows]
+                if not reasons:
+                    reasons = ["Related Main File Failed Brand/Country Check (or missing Main Info File with Brand Filter active)"]
+                outfile.write(f"Filename: {table.filenames[row]}\n")
+                outfile.write(f"Reasons: {reasons}\n")
                 outfile.write("-" * 20 + "\n")
 
-
-        return matched_files_details, not_matched_files_details, data_subset_pairs, main_info_matched_for_subset
-
-
-
-    def _write_output_summary(self, outfile, matched_files_details, not_matched_files_details, data_subset_pairs, main_info_files_from_matches): # Modified to take main_info_files from matches data
-        """Writes the summary of matched and not matched files to the output file."""
-        outfile.write("\n---\n--- Matched Files Summary ---\n")
-        for file_detail in matched_files_details:
-            outfile.write(f"Filename: {file_detail['filename']}\n")
-            outfile.write(f"Reasons: {file_detail['reasons']}\n")
-            outfile.write("-" * 20 + "\n")
-
-        outfile.write("\n---\n--- Not Matched Files Summary ---\n")
-        for file_detail in not_matched_files_details:
-            outfile.write(f"Filename: {file_detail['filename']}\n")
-            outfile.write(f"Reasons: {file_detail['reasons']}\n")
-            outfile.write("-" * 20 + "\n")
-
-        main_info_files_written = set()
-
-        outfile.write("\n---\n--- DEBUG LOGS ---\n") # <--- ADDED DEBUG LOG SECTION HEADER
-
-        outfile.write("\n---\n--- Data Subset Files ---\n")
-        for pair in data_subset_pairs:
-            main_file_zip_name = pair['main_file']
-            individual_file_name = pair['individual_file']
-
-            main_info_filename = None
-            for main_filename in main_info_files_from_matches: # Use main_info_files from matches data
-                if main_file_zip_name and main_file_zip_name in main_filename:
-                    main_info_filename = main_filename
-                    break
-
-            if main_info_filename and main_info_filename not in main_info_files_written:
-                outfile.write(f"Subset Main File: {main_info_filename}\n")
-                main_info_files_written.add(main_info_filename)
-
-            if main_info_filename:
-                outfile.write(f"Subset Individual File: {individual_file_name}\n")
+            outfile.write("\n---\n--- Data Subset Files ---\n")
+            for line in subset_lines:
+                if "INDIVIDUAL" in line:
+                    outfile.write(f"Subset Individual File: {line}\n")
+                else:
+                    outfile.write(f"Subset Main File: {line}\n")
 
 
 
     def filter_config_files(self, filters_string):
-        """Filters configuration files based on the provided filter string, reading from matches.txt."""
+        """
+        Filters configuration files based on the provided filter string.
+
+        The attributes of every matches.txt entry are parsed once into a columnar table
+        (see _get_filter_attribute_table), so applying a filter is a few set operations.
+        The resulting data subset is kept in self.data_subset_lines and
+        self.data_subset_favorites_lines. data_subset.txt is always written, so the subset
+        can be turned On again after a restart (see get_data_subset_lines);
+        data_subset_favorites.txt and filter_results.txt are only written when
+        self.write_filter_output_files is True.
+        """
 
         if not os.path.exists(self.configinfo_folder):
-            print(f"Error: Configinfo folder '{self.configinfo_folder}' not found.")
+            filter_log.error("Error: Configinfo folder '%s' not found.", self.configinfo_folder)
             return
 
         filter_conditions, brand_filter, country_filter = self._parse_filters(filters_string)
 
-        matches_file_path = os.path.join(self.script_dir, self.matches_txt) # Path to matches.txt
-        matches_data = []
-        main_info_files_from_matches = [] # To track main info files from matches.txt
-
-        try:
-            with open(matches_file_path, 'r', encoding="utf-8") as f:
-                current_filename = None
-                current_content_lines = []
-                reading_content = False
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue # Skip empty lines
-
-                    if not reading_content:
-                        if line == '}': # Check if a '}' appears unexpectedly as a filename
-                            #print(f"Warning: Unexpected 'curly brace' as filename in {self.matches_txt}. Skipping line.")
-                            continue # Skip this line and move to the next
-                        current_filename = line
-                        reading_content = True
-                        if "INDIVIDUAL" not in current_filename and "info.json" in current_filename: # Track main files from matches.txt
-                            main_info_files_from_matches.append(current_filename)
-                    elif line == '}': # Assuming JSON ends with '}' at the end of content
-                        current_content_lines.append(line)
-                        content = "\n".join(current_content_lines)
-                        matches_data.append({'filename': current_filename, 'content': content})
-                        current_filename = None  # Reset filename IMMEDIATELY after processing content
-                        current_content_lines = []
-                        reading_content = False
-                    elif reading_content:
-                        current_content_lines.append(line)
-
-        except FileNotFoundError:
-            print(f"Error: {self.matches_txt} file not found in script directory: {self.script_dir}")
-            return
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON in {self.matches_txt}: {e}")
+        table = self._get_filter_attribute_table()
+        if table is None:
             return
 
+        start_time = time.perf_counter()
+        matched_rows = table.evaluate(filter_conditions, brand_filter, country_filter)
+        subset_lines = table.subset_lines(matched_rows)
+        filter_log.debug('DEBUG: filter_config_files - %s of %s configs matched in %.3fs', len(matched_rows), len(table.individual_rows), time.perf_counter() - start_time)
 
-        matched_files_details = [] # Initialize here to be used if no outfile context
-        not_matched_files_details = []
-        data_subset_pairs = []
-        main_info_brand_check_results = {}
-        main_info_country_check_results = {}
-        main_info_matched_for_subset = set()
-
-
-        with open(self.filter_output_file, 'w', encoding="utf-8") as outfile, open("data/data_subset.txt", 'w', encoding="utf-8") as subset_outfile:
-            outfile.write("Filter Results:\n\n")
-
-            main_info_brand_check_results, main_info_country_check_results, not_matched_files_details_main = self._process_main_info_files(
-                matches_data, brand_filter, country_filter, outfile # Pass matches_data
-            )
-            not_matched_files_details.extend(not_matched_files_details_main) # Combine not matched from main files
+        if self.write_filter_output_files:
+            self._write_filter_results(table, filter_conditions, brand_filter, country_filter, matched_rows, subset_lines)
+            filter_log.debug('Filter results written to %s', self.filter_output_file)
 
-            matched_files_details_ind, not_matched_files_details_ind, data_subset_pairs, main_info_matched_for_subset = self._process_individual_files(
-                matches_data, filter_conditions, main_info_brand_check_results, main_info_country_check_results, outfile # Pass matches_data
-            )
-            matched_files_details.extend(matched_files_details_ind) # Combine matched from individual files
-            not_matched_files_details.extend(not_matched_files_details_ind) # Combine not matched from individual files
+        self.data_subset_lines = self.process_individual_lines(subset_lines)
 
+        with open(self.data_subset_file, 'w', encoding="utf-8") as subset_outfile:
+            for line in self.data_subset_lines:
+                subset_outfile.write(f"{line}\n")
+        filter_log.debug('Transformed image file list written to data_subset.txt')
 
-            self._write_output_summary(outfile, matched_files_details, not_matched_files_details, data_subset_pairs, main_info_files_from_matches) # Pass main_info_files from matches
-
-            main_info_files_written = set()
-            for pair in data_subset_pairs:
-                main_file_zip_name = pair['main_file']
-                individual_file_name = pair['individual_file']
-
-                main_info_filename = None
-                for main_filename in main_info_files_from_matches: # Iterate from main_info_files_from_matches
-                    if main_file_zip_name and main_file_zip_name in main_filename:
-                        main_info_filename = main_filename
-                        break
-
-                if main_info_filename and main_info_filename not in main_info_files_written:
-                    subset_outfile.write(f"{main_info_filename}\n")
-                    main_info_files_written.add(main_info_filename)
-
-                if main_info_filename:
-                    subset_outfile.write(f"{individual_file_name}\n")
-
-
-        print(f"Filter results written to {self.filter_output_file}")
-        print(f"Data subset file list written to data_subset.txt")
-
-        transformed_lines = self.process_individual_lines() # Assuming this method exists in your class
+        self.data_subset_favorites_lines = generate_data_subset_favorites(
+            self.script_dir, self.data_subset_lines, write_file=self.write_filter_output_files
+        )
 
-        if transformed_lines is not None:
-            with open("data/data_subset.txt", 'w', encoding="utf-8") as subset_outfile: # Reopen to overwrite or consider different logic
-                for line in transformed_lines:
-                    subset_outfile.write(f"{line}\n")
-            print(f"Transformed image file list written to data_subset.txt (overwritten)")
-        else:
-            print("No transformed lines generated or error in processing.")
-
-        # Assuming generate_data_subset_favorites is a function you want to call
-        # and it's defined elsewhere or needs to be defined within the class
-        if hasattr(self, 'generate_data_subset_favorites'): # Check if it's a method of the class
-            self.generate_data_subset_favorites(self.script_dir)
-        elif 'generate_data_subset_favorites' in globals(): # Check if it's a global function (less likely in class context)
-            generate_data_subset_favorites(self.script_dir) # Call as global function
-        else:
-            print("Warning: generate_data_subset_favorites function not found or not callable as class method.") # Handle if function is missing
- 
 
 
 
-    def process_individual_lines(self):
+    def process_individual_lines(self, subset_lines=None):
         """
-        Reads the data_subset_file, processes lines containing '--INDIVIDUAL--',
+        Reads the data_subset_file (or takes subset_lines), processes lines containing '--INDIVIDUAL--',
         and returns a list of transformed lines, checking for file existence in ConfigPics.
         Includes the original line before the transformed lines in the output.
 
@@ -5805,6 +5841,9 @@ class ConfigViewerApp:
         - Checks if the file exists in the ConfigPics folder before adding to output.
         - Includes the original input line before the generated lines.
 
+        Args:
+            subset_lines (list, optional): data_subset lines to process instead of reading data_subset_file.
+
         Returns:
             list: A list of strings, where each string is a processed line,
                   with original lines preceding their transformed counterparts if applicable.
@@ -5814,39 +5853,47 @@ class ConfigViewerApp:
             #script_dir = os.path.dirname(os.path.abspath(__file__))
             config_pics_dir = os.path.join(self.script_dir, "data/ConfigPics")
 
-            with open(self.data_subset_file, 'r', encoding="utf-8") as f:
-                for line in f:
-                    original_input_line = line.strip() # Store the original stripped line for later use
-                    line = original_input_line # Use stripped line for processing
-                    if "--INDIVIDUAL--" in line:
-                        # Process individual line
-                        transformed_lines.append(original_input_line) # Add the original line first
-
-                        parts = line.split('--')
-                        if len(parts) >= 4: # Ensure enough parts to process
-                            base_path = parts[0]
-                            zip_name = parts[2] # parts[1] is INDIVIDUAL which we remove
-                            info_part = parts[3]
-
-                            # Remove "info_info_" and get the identifier
-                            identifier_with_ext = info_part.replace("info_info_", "")
-
-                            if "." in identifier_with_ext:
-                                identifier, old_ext = identifier_with_ext.rsplit('.', 1) # Split once at the first dot
-
-                                base_output_line = f"{base_path}--{zip_name}--{identifier}"
-                                extensions = ["jpg", "png", "jpeg"]
-                                for ext in extensions:
-                                    transformed_line = f"{base_output_line}.{ext}"
-                                    file_path_to_check = os.path.join(config_pics_dir, transformed_line)
-                                    if os.path.exists(file_path_to_check):
-                                        transformed_lines.append(transformed_line)
-                    # If you want to keep lines without --INDIVIDUAL-- as they are in the output file, uncomment this:
-                    # else:
-                    #     transformed_lines.append(original_input_line) # Append original line if not processed
+            if subset_lines is None:
+                with open(self.data_subset_file, 'r', encoding="utf-8") as f:
+                    subset_lines = f.read().splitlines()
+
+            # One directory listing instead of three os.path.exists calls per line
+            try:
+                config_pic_names = {os.path.normcase(name) for name in os.listdir(config_pics_dir)}
+            except OSError:
+                config_pic_names = set()
+
+            for line in subset_lines:
+                original_input_line = line.strip() # Store the original stripped line for later use
+                line = original_input_line # Use stripped line for processing
+                if "--INDIVIDUAL--" in line:
+                    # Process individual line
+                    transformed_lines.append(original_input_line) # Add the original line first
+
+                    parts = line.split('--')
+                    if len(parts) >= 4: # Ensure enough parts to process
+                        base_path = parts[0]
+                        zip_name = parts[2] # parts[1] is INDIVIDUAL which we remove
+                        info_part = parts[3]
+
+                        # Remove "info_info_" and get the identifier
+                        identifier_with_ext = info_part.replace("info_info_", "")
+
+                        if "." in identifier_with_ext:
+                            identifier, old_ext = identifier_with_ext.rsplit('.', 1) # Split once at the first dot
+
+                            base_output_line = f"{base_path}--{zip_name}--{identifier}"
+                            extensions = ["jpg", "png", "jpeg"]
+                            for ext in extensions:
+                                transformed_line = f"{base_output_line}.{ext}"
+                                if os.path.normcase(transformed_line) in config_pic_names:
+                                    transformed_lines.append(transformed_line)
+                # If you want to keep lines without --INDIVIDUAL-- as they are in the output file, uncomment this:
+                # else:
+                #     transformed_lines.append(original_input_line) # Append original line if not processed
 
         except FileNotFoundError:
-            print(f"Error: File not found: {self.data_subset_file}")
+            data_log.debug('Error: File not found: %s', self.data_subset_file)
             return [] # Or handle the error as needed
 
         return transformed_lines
@@ -6886,12 +6933,12 @@ class ConfigViewerApp:
             
 
 
-        if os.path.exists(self.cache_file_path):
+        if self.processed_data_store is not None:
             try:
-                print("deleting config_processing_cache.json")
-                os.remove(self.cache_file_path) #
-            except OSError as e:
-                print(f"Warning: Failed to delete cache file {self.cache_file_path}: {e}")
+                print("marking processed data store stale (folders whose lines change get reprocessed)")
+                self.processed_data_store.mark_stale()
+            except sqlite3.Error as e:
+                print(f"Warning: Failed to mark processed data store stale: {e}")
 
 
         self.placeholder_settings = not self.placeholder_settings
@@ -7165,6 +7212,29 @@ class ConfigViewerApp:
                                 #self.font_size_add = default_font_size_add # Use the defined default
 
 
+                        elif line.startswith("ImageCacheMaxMB:"):
+                            value_str = line[len("ImageCacheMaxMB:"):].strip()
+                            print(f"DEBUG: ImageCacheMaxMB line found, value_str: '{value_str}'")
+                            try:
+                                max_mb = int(value_str)
+                                if max_mb > 0:
+                                    self.set_image_cache_max_bytes(max_mb * 1024 * 1024)
+                                else:
+                                    print(f"Warning: Invalid ImageCacheMaxMB value: '{value_str}'. Using default.")
+                            except ValueError:
+                                print(f"Warning: Invalid ImageCacheMaxMB format: '{value_str}'. Using default.")
+
+                        elif line.startswith("LogLevel"): # "LogLevel: INFO" or "LogLevel.<subsystem>: DEBUG"
+                            key, _, value_str = line.partition(":")
+                            value_str = value_str.strip().upper()
+                            subsystem = key[len("LogLevel"):].strip().lstrip(".") or None
+                            level = parse_log_level(value_str)
+                            if level is None or (subsystem is not None and subsystem not in LOG_SUBSYSTEMS):
+                                print(f"Warning: Invalid log level setting: '{line}'. Ignoring it.")
+                            else:
+                                set_log_level(level, subsystem)
+                                self.log_level_settings[subsystem] = value_str
+
                         elif line.startswith("default_categorization_mode:"): 
                             self.default_categorization_mode = line[len("default_categorization_mode:"):].strip() 
                             print(f"DEBUG: default_categorization_mode line found, '{self.default_categorization_mode}'") # Optional: Add debug print here too
@@ -7208,17 +7278,19 @@ class ConfigViewerApp:
                 f.write(f"show_pinned_favorites_category: {'on' if self.show_pinned_favorites_category else 'off'}\n")
                 f.write(f"default_categorization_mode: {self.default_categorization_mode}\n")
                 f.write(f"FontSizeAdd: {self.font_size_add}\n")
+                f.write(f"ImageCacheMaxMB: {self.image_cache_max_bytes // (1024 * 1024)}\n")
+                for subsystem, level_name in self.log_level_settings.items():
+                    f.write(f"LogLevel{'.' + subsystem if subsystem else ''}: {level_name}\n")
 
                 if self.items_to_be_hidden or self.unhide_was_toggled_in_hidden_window:
-                    print("--- self.items_to_be_hidden or self.unhide_was_toggled_in_hidden_window are True, deleting config_processing_cache.json---\n")
+                    print("--- self.items_to_be_hidden or self.unhide_was_toggled_in_hidden_window are True, marking processed data store stale---\n")
 
-
-
-                    if os.path.exists(self.cache_file_path):
+                    # Only the hidden/unhidden folders' rows change on the next load_data()
+                    if self.processed_data_store is not None:
                         try:
-                            os.remove(self.cache_file_path) #
-                        except OSError as e:
-                            print(f"Warning: Failed to delete cache file {self.cache_file_path}: {e}")
+                            self.processed_data_store.mark_stale()
+                        except sqlite3.Error as e:
+                            print(f"Warning: Failed to mark processed data store stale: {e}")
 
 
         except Exception as e:
@@ -7297,6 +7369,11 @@ class ConfigViewerApp:
         )
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
 
+        # --- NEW: Slots of the virtualized main grid belong to the old scrollable_frame ---
+        self.main_grid_slot_pool = []
+        self.main_grid_layout = None
+        self.main_grid_labels = []
+
 
 
         
@@ -7700,7 +7777,7 @@ class ConfigViewerApp:
             # Initial bg/fg will be set by _bind_animated_hover based on is_selected
             dropdown_option_button = tk.Button( # Renamed for clarity
                 scrollable_frame,
-                text=option,
+                text=self._facet_option_label(option, "Name"),
                 font=("Segoe UI", 10 + self.font_size_add, "bold"),
                 # The command lambda captures necessary arguments for the click handler
                 command=lambda opt=option, main_btn=button, dd_win=dropdown_window: \
@@ -8285,7 +8362,7 @@ class ConfigViewerApp:
             # Initial bg/fg will be set by _bind_animated_hover based on is_selected
             dropdown_option_button = tk.Button( # Renamed to avoid confusion
                 scrollable_frame,
-                text=option,
+                text=self._facet_option_label(option, "Country"),
                 font=("Segoe UI", 10 + self.font_size_add, "bold"),
                 # The command lambda captures necessary arguments for the click handler
                 command=lambda opt=option, main_btn=button, dd_win=dropdown_window: \
@@ -8550,7 +8627,7 @@ class ConfigViewerApp:
 
         return search_entry
 
-    def _update_dropdown_options(self, scrollable_frame, search_var, original_options, button_widget, dropdown_width, on_dropdown_button_click, canvas):
+    def _update_dropdown_options(self, scrollable_frame, search_var, original_options, button_widget, dropdown_width, on_dropdown_button_click, canvas, facet_field=None):
         """Updates the dropdown options based on the search input."""
         def update_options(event=None):
             search_text = search_var.get().strip().lower()
@@ -8559,13 +8636,13 @@ class ConfigViewerApp:
             for widget in scrollable_frame.winfo_children()[1:]:  # Skip search entry (index 0)
                 widget.destroy()
 
-            self._create_dropdown_buttons(scrollable_frame, filtered_options, button_widget, dropdown_width, on_dropdown_button_click)
+            self._create_dropdown_buttons(scrollable_frame, filtered_options, button_widget, dropdown_width, on_dropdown_button_click, facet_field)
             canvas.config(scrollregion=canvas.bbox("all"))
 
         return update_options # Return the function to be bound
 
-    def _create_dropdown_buttons(self, scrollable_frame, options, button_widget, dropdown_width, on_dropdown_button_click):
-        """Creates the dropdown buttons in the scrollable frame with smooth hover."""
+    def _create_dropdown_buttons(self, scrollable_frame, options, button_widget, dropdown_width, on_dropdown_button_click, facet_field=None):
+        """Creates the dropdown buttons in the scrollable frame with smooth hover. facet_field adds the item counts of that sidebar facet to the labels."""
 
         # --- Define Colors ---
         default_bg_color = "#555555"    # Normal, non-selected background
@@ -8593,7 +8670,7 @@ class ConfigViewerApp:
             # Initial bg/fg will be set by _bind_animated_hover based on is_selected
             dropdown_option_button = tk.Button( # Renamed for clarity
                 scrollable_frame,
-                text=option,
+                text=self._facet_option_label(option, facet_field),
                 font=("Segoe UI", 10 + self.font_size_add, "bold"),
                 # The command lambda captures the option for the click handler
                 command=lambda opt=option: on_dropdown_button_click(opt), # Uses the passed click handler
@@ -8784,10 +8861,11 @@ class ConfigViewerApp:
         }
         original_options = filter_options_data[filter_name]
         current_options = list(original_options)
+        facet_field = {"Brand": "Brand", "Name": "Name", "Country": "Country", "Bodystyle": "Body Style"}.get(filter_name)
 
         on_dropdown_button_click_lambda = lambda opt: self._on_dropdown_button_click_for_brands(opt, filter_name, button_widget, dropdown_window)
         update_dropdown_options_func = self._update_dropdown_options(
-            scrollable_frame, search_var, original_options, button_widget, 240, on_dropdown_button_click_lambda, canvas
+            scrollable_frame, search_var, original_options, button_widget, 240, on_dropdown_button_click_lambda, canvas, facet_field
         )
 
         def debounced_update_dropdown_options(event):
@@ -8797,7 +8875,7 @@ class ConfigViewerApp:
 
         search_entry.bind("<KeyRelease>", debounced_update_dropdown_options)
 
-        self._create_dropdown_buttons(scrollable_frame, current_options, button_widget, 240, on_dropdown_button_click_lambda)
+        self._create_dropdown_buttons(scrollable_frame, current_options, button_widget, 240, on_dropdown_button_click_lambda, facet_field)
 
 
         dropdown_window.bind("<FocusOut>", lambda event, fname=filter_name: self.destroy_sidebar_filter_dropdown(fname))
@@ -10553,247 +10631,173 @@ class ConfigViewerApp:
 
         
 
-    def run_spawn_queue(self, retry=False, attempt_number=1):
-
-
-        if retry:
-            scanning_win = None  # Initialize scanning_win
-
-            scanning_win = self.show_scanning_window(text=f"Spawn queue spawning attempts: {attempt_number}")
-            time.sleep(0.725)
-            if scanning_win:
-                scanning_win.destroy()
-
-
-        scanning_window = None # Initialize scanning_window outside try block
-
-        scanning_window = self.show_scanning_window(text="Attempting to spawn multiple vehicles from Spawn Queue, please wait...\nPlease try not to click anything until this notification disappears.") # Show window with specific text
-        # Make the window visible
-        scanning_window.deiconify()
-        self.master.update_idletasks() # Force window to appear immediately
-
-        try:
-            with open(self.SPAWN_QUEUE_FILE, 'r', encoding="utf-8") as f:
-                commands = f.readlines()
-                pass
-
-        except FileNotFoundError:
-
-            print(f"spawn queue file doesn't exist")
-
-        
-            scanning_win = self.show_scanning_window(text="Spawn queue empty.")
-
-            if scanning_win:
-
-                def close_scanning_window():
-
-                    scanning_win.destroy()
-
-                scanning_win.after(3125, close_scanning_window)
-                self.show_spawn_queue_window()
-            return
-
-
-
-        if not self.is_beamng_running():
-            #messagebox.showerror("Error", "BeamNG.drive is not running.")
-            scanning_win = None  # Initialize scanning_win
-
-            scanning_win = self.show_scanning_window(text="BeamNG.drive does not appear to be running.")
-            time.sleep(1.125)
-            if scanning_win:
-                scanning_win.destroy()
-            return False # Indicate failure
-
-
-        print("BeamNG.drive is running.") # Added print
-        time.sleep(1.125) # Reduced time.sleep to quarter
-
-        print("Focusing BeamNG.drive window...") # Added print
-        self.focus_beamng_window()
-
-        print("Focusing BeamNG.drive window...") # Added print
-        self.focus_beamng_window()
-
-        time.sleep(1.125) # Reduced time.sleep to quarter
-        if not self.focus_beamng_window():
-
-            scanning_win = self.show_scanning_window(text="Please ensure BeamNG.drive is open and not minimized.")
-            time.sleep(1.125)
-            if scanning_win:
-                scanning_win.destroy()
-
-            #messagebox.showerror("Error", "BeamNG.drive window not found.")
-            return False # Indicate failure
-
-        print("BeamNG.drive window focused.") # Added print
-        time.sleep(1.125) # Reduced time.sleep to quarter
-
-        self.focus_beamng_window()
-
-        pydirectinput.keyDown('shift')
-        pydirectinput.keyDown('ctrl')
-        pydirectinput.keyDown('alt')
-        pydirectinput.keyDown('f11')
-
-        # Wait for the specified hold time
-        time.sleep(0.125)
-
-        pydirectinput.keyUp('f11')
-        pydirectinput.keyUp('alt')
-        pydirectinput.keyUp('ctrl')
-        pydirectinput.keyUp('shift')
-
-        self.details_window_intentionally_closed = True
-        self.on_details_window_close()
-
-        if scanning_window:
-            scanning_window.destroy() # Destroy the scanning window after spawn attempt
-        
-        print(f"Spawn Queue actions completed. ATTEMPT {attempt_number}") # Updated message
-
-
-        data_folder = self.script_dir / "data"
-        COMMANDconfirmation = data_folder / "commandconfirmation.txt"
-
-        max_attempts = 7
-
-        # --- NOW CHECK FOR THE FILE AFTER RUNNING ACTIONS ---
-        print(f"Checking for file '{COMMANDconfirmation}' - Attempt {attempt_number}/{max_attempts}...")
-        if os.path.exists(COMMANDconfirmation):
-            print(f"File '{COMMANDconfirmation}' exists after actions on attempt {attempt_number}. Deleting it.")
+    def _get_spawn_confirmation_watcher(self):
+        """Starts watching data/commandconfirmation.txt the first time a spawn needs it."""
+        if self.spawn_confirmation_watcher is None:
+            watcher = SpawnConfirmationWatcher(Path(self.script_dir) / "data" / COMMAND_CONFIRMATION_FILE_NAME)
             try:
-                os.remove(COMMANDconfirmation)
-                print(f"File '{COMMANDconfirmation}' deleted successfully.")
-                return True # Indicate success (file existed and was deleted)
-            except OSError as e:
-                print(f"Error deleting file '{COMMANDconfirmation}': {e}")
-                return False # Indicate failure (file deletion error)
-
-        else: # File does not exist AFTER running actions
-            if attempt_number >= max_attempts: # Check attempt number for max retries
-                print(f"File '{COMMANDconfirmation}' still does not exist after {max_attempts} attempts. Stopping.")
-
-                scanning_win = None  # Initialize scanning_win
-
-                scanning_win = self.show_scanning_window(text=f"Maximum number of attempts ({attempt_number}) to spawn multiple vehicles from Spawn Queue reached. \nPlease ensure EllexiumModManagerInput.zip is in the mods folder and restart the game.")
-                time.sleep(5.725)
-                if scanning_win:
-                    scanning_win.destroy()
-
-                return False # Indicate failure (file never appeared after max attempts)
-            else:
-                print(f"File '{COMMANDconfirmation}' does not exist on attempt {attempt_number}. Retrying function...")
-                time.sleep(1.125) # Reduced time.sleep to quarter
-                return self.run_spawn_queue(retry=True, attempt_number=attempt_number + 1) # Recursive call, incrementing attempt_number
-
-
-    def run_spawn_queue_transient(self, retry=False, attempt_number=1): # NEW FUNCTION FOR TRANSIENT QUEUE, added retry parameter
-
-
-        if retry:
-            scanning_win = None  # Initialize scanning_win
-
-            scanning_win = self.show_scanning_window(text=f"Spawn/Replace/Delete/Save attempts: {attempt_number}")
-            time.sleep(0.725)
-            if scanning_win:
-                scanning_win.destroy()
-
+                watcher.start()
+            except Exception as e:
+                # Without the observer the handshake still checks for the file at every attempt timeout
+                print(f"Warning: Could not watch '{watcher.confirmation_path}' for spawn confirmations: {e}")
+            self.spawn_confirmation_watcher = watcher
+        return self.spawn_confirmation_watcher
 
+    def _show_spawn_notification(self, text, duration_ms):
+        scanning_win = self.show_scanning_window(text=text)
+        if scanning_win:
+            scanning_win.after(duration_ms, lambda: scanning_win.destroy() if scanning_win.winfo_exists() else None)
 
-        # --- RUN THE FUNCTION ACTIONS FIRST ---
+    def _send_spawn_hotkey(self, hotkey, after_sent=None):
+        """
+        Focuses BeamNG.drive and presses the spawn queue hotkey (shift+ctrl+alt+hotkey).
+        The key presses are spread over Tk timers instead of sleeps so the UI keeps running.
+        Returns False if the game isn't running or its window can't be focused.
+        """
         if not self.is_beamng_running():
-            #messagebox.showerror("Error", "BeamNG.drive is not running.")
-            scanning_win = None  # Initialize scanning_win
-
-            scanning_win = self.show_scanning_window(text="BeamNG.drive does not appear to be running.")
-            time.sleep(1.125)
-            if scanning_win:
-                scanning_win.destroy()
-            return False # Indicate failure
-
-
-        print("BeamNG.drive is running.") # Added print
-        time.sleep(1.125) # Reduced time.sleep to quarter
+            self._show_spawn_notification("BeamNG.drive does not appear to be running.", 1125)
+            return False
 
         print("Focusing BeamNG.drive window...") # Added print
-        self.focus_beamng_window()
-
-        time.sleep(1.125) # Reduced time.sleep to quarter
         if not self.focus_beamng_window():
-
-            scanning_win = self.show_scanning_window(text="Please ensure BeamNG.drive is open and not minimized.")
-            time.sleep(1.125)
-            if scanning_win:
-                scanning_win.destroy()
-
-            #messagebox.showerror("Error", "BeamNG.drive window not found.")
-            return False # Indicate failure
-
+            self._show_spawn_notification("Please ensure BeamNG.drive is open and not minimized.", 1125)
+            return False
         print("BeamNG.drive window focused.") # Added print
 
-        self.focus_beamng_window()
+        modifier_keys = ['shift', 'ctrl', 'alt']
 
-        # Press and hold Shift, Ctrl, and Alt keys
-        pydirectinput.keyDown('shift')
-        pydirectinput.keyDown('ctrl')
-        pydirectinput.keyDown('alt')
-        pydirectinput.keyDown('f12')
-
-        # Wait for the specified hold time
-        time.sleep(0.125)
+        def key_up():
+            pydirectinput.keyUp(hotkey)
+            for key in reversed(modifier_keys):
+                pydirectinput.keyUp(key)
+            if after_sent:
+                after_sent()
 
+        def key_down():
+            self.focus_beamng_window() # Focus again in case the window was still being restored
+            for key in modifier_keys:
+                pydirectinput.keyDown(key)
+            pydirectinput.keyDown(hotkey)
+            self.master.after(125, key_up) # Hold time
 
-        pydirectinput.keyUp('f12')
-        pydirectinput.keyUp('alt')
-        pydirectinput.keyUp('ctrl')
-        pydirectinput.keyUp('shift')
+        self.master.after(150, key_down) # Let the game window come to the foreground
+        return True
 
-            
-        if not self.leave_config_window_open:
-            self.details_window_intentionally_closed = True        
+    def _start_spawn_handshake(self, hotkey, retry_text, failure_text, after_sent=None, on_done=None):
+        """
+        Sends hotkey to the game and waits, without blocking, for commandconfirmation.txt.
+        A handshake that is still waiting is cancelled first.
+        """
+        if self.active_spawn_handshake is not None and not self.active_spawn_handshake.done:
+            print("DEBUG: Cancelling the pending spawn handshake for a new spawn request.")
+            self.active_spawn_handshake.cancel()
+
+        def on_handshake_done(result):
+            if self.active_spawn_handshake is handshake:
+                self.active_spawn_handshake = None
+            if result.status == "confirmed":
+                self.last_spawn_latency = result.latency
+                print(f"DEBUG: Spawn confirmed by BeamNG.drive in {result.latency * 1000:.0f} ms "
+                      f"(attempt {result.attempts}, {result.attempt_latency * 1000:.0f} ms after the last hotkey).")
+            elif result.status == "timeout":
+                print(f"File '{self.spawn_confirmation_watcher.confirmation_path}' still does not exist after {result.attempts} attempts. Stopping.")
+                self._show_spawn_notification(failure_text.format(attempts=result.attempts), 5725)
+            else:
+                print(f"DEBUG: Spawn handshake ended: {result.status} (attempt {result.attempts}).")
+            if on_done:
+                on_done(result.status == "confirmed")
+
+        def on_retry(attempt):
+            print(f"No spawn confirmation yet, sending the hotkey again (attempt {attempt}).")
+            self._show_spawn_notification(f"{retry_text}: {attempt}", 725)
+
+        handshake = SpawnHandshake(
+            self._get_spawn_confirmation_watcher(),
+            trigger=lambda attempt: self._send_spawn_hotkey(hotkey, after_sent),
+            schedule=self.master.after,
+            unschedule=self.master.after_cancel,
+            attempt_timeout=self.spawn_confirmation_timeout,
+            on_retry=on_retry,
+            on_done=on_handshake_done
+        )
+        self.active_spawn_handshake = handshake
+        return handshake.start()
 
+    def cancel_spawn_handshake(self):
+        """Stops waiting for the game to confirm the current spawn request."""
+        if self.active_spawn_handshake is not None:
+            self.active_spawn_handshake.cancel()
 
-            self.master.after(2000, self.on_details_window_close)
-        
+    def run_spawn_queue(self, on_done=None):
+        """
+        Spawns the vehicles in the spawn queue: sends shift+ctrl+alt+F11 to BeamNG.drive and
+        waits for the game to write commandconfirmation.txt. The hotkey is sent again if the
+        game doesn't confirm within spawn_confirmation_timeout seconds, up to 7 times.
+        Returns right away; the UI keeps running while the game is spawning.
 
-        print(f"Transient Spawn Queue actions completed. ATTEMPT {attempt_number}") # Updated message
+        Args:
+            on_done (callable, optional): Called with True once the game confirmed, False if
+                                          the hotkey couldn't be sent, timed out or was cancelled.
 
+        Returns:
+            SpawnHandshake or None: The pending handshake, or None if the queue is empty.
+        """
+        if not os.path.exists(self.SPAWN_QUEUE_FILE):
+            print(f"spawn queue file doesn't exist")
+            self._show_spawn_notification("Spawn queue empty.", 3125)
+            self.show_spawn_queue_window()
+            return None
 
-        data_folder = self.script_dir / "data"
-        COMMANDconfirmation = data_folder / "commandconfirmation.txt"
+        scanning_window = self.show_scanning_window(text="Attempting to spawn multiple vehicles from Spawn Queue, please wait...\nPlease try not to click anything until this notification disappears.") # Show window with specific text
+        if scanning_window:
+            # Make the window visible
+            scanning_window.deiconify()
+            self.master.update_idletasks() # Force window to appear immediately
 
-        max_attempts = 7 #change back to 7
+        def after_sent():
+            self.details_window_intentionally_closed = True
+            self.on_details_window_close()
+            if scanning_window and scanning_window.winfo_exists():
+                scanning_window.destroy() # Destroy the scanning window after spawn attempt
 
-        # --- NOW CHECK FOR THE FILE AFTER RUNNING ACTIONS ---
-        print(f"Checking for file '{COMMANDconfirmation}' - Attempt {attempt_number}/{max_attempts}...")
-        if os.path.exists(COMMANDconfirmation):
-            print(f"File '{COMMANDconfirmation}' exists after actions on attempt {attempt_number}. Deleting it.")
-            try:
-                os.remove(COMMANDconfirmation)
-                print(f"File '{COMMANDconfirmation}' deleted successfully.")
-                return True # Indicate success (file existed and was deleted)
-            except OSError as e:
-                print(f"Error deleting file '{COMMANDconfirmation}': {e}")
-                return False # Indicate failure (file deletion error)
+        def queue_done(success):
+            if scanning_window and scanning_window.winfo_exists():
+                scanning_window.destroy()
+            if on_done:
+                on_done(success)
+
+        return self._start_spawn_handshake(
+            'f11',
+            retry_text="Spawn queue spawning attempts",
+            failure_text="Maximum number of attempts ({attempts}) to spawn multiple vehicles from Spawn Queue reached. \nPlease ensure EllexiumModManagerInput.zip is in the mods folder and restart the game.",
+            after_sent=after_sent,
+            on_done=queue_done
+        )
 
-        else: # File does not exist AFTER running actions
-            if attempt_number >= max_attempts: # Check attempt number for max retries
-                print(f"File '{COMMANDconfirmation}' still does not exist after {max_attempts} attempts. Stopping.")
 
-                scanning_win = None  # Initialize scanning_win
+    def run_spawn_queue_transient(self, on_done=None): # NEW FUNCTION FOR TRANSIENT QUEUE
+        """
+        Runs the transient spawn queue (spawn/replace/delete/save) with shift+ctrl+alt+F12.
+        Same handshake as run_spawn_queue.
 
-                scanning_win = self.show_scanning_window(text=f"Maximum number of attempts ({attempt_number}) to spawn, replace, save or delete vehicle(s) reached. \nPlease ensure EllexiumModManagerInput.zip is in the mods folder and restart the game.")
-                time.sleep(5.725)
-                if scanning_win:
-                    scanning_win.destroy()
+        Args:
+            on_done (callable, optional): Called with True once the game confirmed, False otherwise.
 
-                return False # Indicate failure (file never appeared after max attempts)
-            else:
-                print(f"File '{COMMANDconfirmation}' does not exist on attempt {attempt_number}. Retrying function...")
-                time.sleep(1.125) # Reduced time.sleep to quarter
-                return self.run_spawn_queue_transient(retry=True, attempt_number=attempt_number + 1) # Recursive call, incrementing attempt_number
+        Returns:
+            SpawnHandshake: The pending handshake.
+        """
+        def after_sent():
+            if not self.leave_config_window_open:
+                self.details_window_intentionally_closed = True
+                self.master.after(2000, self.on_details_window_close)
+
+        return self._start_spawn_handshake(
+            'f12',
+            retry_text="Spawn/Replace/Delete/Save attempts",
+            failure_text="Maximum number of attempts ({attempts}) to spawn, replace, save or delete vehicle(s) reached. \nPlease ensure EllexiumModManagerInput.zip is in the mods folder and restart the game.",
+            after_sent=after_sent,
+            on_done=on_done
+        )
 
 
     def spawn_random_vehicle(self, event=None, vehicle_type=None, replace_current=False):
@@ -11048,26 +11052,24 @@ class ConfigViewerApp:
             if scanning_window and scanning_window.winfo_exists(): scanning_window.destroy()
             return
 
-        # 7. Trigger the spawn action
-        print("  Triggering transient spawn queue execution...")
-        # Pass the *Python-accessible* path to the confirmation file if needed by run_spawn_queue_transient
-        success = self.run_spawn_queue_transient(retry=False, attempt_number=1) # Modify call if needed
-
-        # 8. Handle result and close scanning window
-        if success:
+        # 8. Handle result and close scanning window (called once BeamNG confirms, or gives up)
+        def on_spawn_done(success):
             action_desc = "replacement" if replace_current else "spawn"
-            print(f"  Random vehicle {action_desc} initiated successfully (BeamNG confirmation received).")
-        else:
-            action_desc = "replacement" if replace_current else "spawn"
-            print(f"  Random vehicle {action_desc} failed or timed out (BeamNG confirmation not received).")
-            # Optionally show an error message to the user here
-            # messagebox.showwarning("Spawn Failed", "Could not confirm vehicle spawn/replacement in BeamNG.")
+            if success:
+                print(f"  Random vehicle {action_desc} initiated successfully (BeamNG confirmation received).")
+            else:
+                print(f"  Random vehicle {action_desc} failed or timed out (BeamNG confirmation not received).")
+                # Optionally show an error message to the user here
+                # messagebox.showwarning("Spawn Failed", "Could not confirm vehicle spawn/replacement in BeamNG.")
 
+            if scanning_window and scanning_window.winfo_exists():
+                # Add a slight delay before closing the window so the user can read it
+                delay_ms = 2000 if success else 3000 # Longer delay on failure?
+                self.master.after(delay_ms, lambda: scanning_window.destroy() if scanning_window and scanning_window.winfo_exists() else None)
 
-        if scanning_window and scanning_window.winfo_exists():
-            # Add a slight delay before closing the window so the user can read it
-            delay_ms = 2000 if success else 3000 # Longer delay on failure?
-            self.master.after(delay_ms, lambda: scanning_window.destroy() if scanning_window and scanning_window.winfo_exists() else None)
+        # 7. Trigger the spawn action
+        print("  Triggering transient spawn queue execution...")
+        self.run_spawn_queue_transient(on_done=on_spawn_done)
 
         print(f"--- spawn_random_vehicle() EXIT ---")
 
@@ -11090,7 +11092,7 @@ class ConfigViewerApp:
         # --- MODIFIED: Write to transient spawn queue file instead of clipboard ---
         try:
             print(f"Running Spawn Queue Transient Directly (likely through the color picker)")
-            self.run_spawn_queue_transient(retry=False, attempt_number=1)
+            self.run_spawn_queue_transient()
         except Exception as e:
             #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
             print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11165,7 +11167,7 @@ class ConfigViewerApp:
                         f.write(modified_spawn_cmd + '\n') # Write command to file
                     #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                     print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                    self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                    self.run_spawn_queue_transient()
                 except Exception as e:
                     #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                     print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11246,7 +11248,7 @@ class ConfigViewerApp:
                         f.write(modified_spawn_cmd + '\n') # Write command to file
                     #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                     print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                    self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                    self.run_spawn_queue_transient()
                 except Exception as e:
                     #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                     print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11364,7 +11366,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11401,7 +11403,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd2 + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11437,7 +11439,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11473,7 +11475,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11522,7 +11524,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd2 + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11536,106 +11538,22 @@ class ConfigViewerApp:
      
      
     def on_delete_parked_and_traffic_vehicles_button_click(self):
-        self.on_delete_parked_and_traffic_vehicles_button_click_handle(retry=False, attempt_number=1)
-
-
-    def on_delete_parked_and_traffic_vehicles_button_click_handle(self, retry=False, attempt_number=1):
-
-
-        if retry:
-            scanning_win = None  # Initialize scanning_win
-
-            scanning_win = self.show_scanning_window(text=f"Delete attempts: {attempt_number}")
-            time.sleep(0.725)
-            if scanning_win:
-                scanning_win.destroy()
-
-
-        if not self.is_beamng_running():
-            #messagebox.showerror("Error", "BeamNG.drive is not running.")
-            scanning_win = None  # Initialize scanning_win
-
-            scanning_win = self.show_scanning_window(text="BeamNG.drive does not appear to be running.")
-            time.sleep(1.125)
-            if scanning_win:
-                scanning_win.destroy()
-            return False # Indicate failure
-
-
-
-        print("BeamNG.drive is running.") # Added print
-        time.sleep(1.125) # Reduced time.sleep to quarter
-
-        print("Focusing BeamNG.drive window...") # Added print
-        self.focus_beamng_window()
-
-        time.sleep(1.125) # Reduced time.sleep to quarter
-        if not self.focus_beamng_window():
-
-            scanning_win = self.show_scanning_window(text="Please ensure BeamNG.drive is open and not minimized.")
-            time.sleep(1.125)
-            if scanning_win:
-                scanning_win.destroy()
-
-            #messagebox.showerror("Error", "BeamNG.drive window not found.")
-            return False # Indicate failure
-
-        print("BeamNG.drive window focused.") # Added print
-
-        self.focus_beamng_window()
-
-        pydirectinput.keyDown('shift')
-        pydirectinput.keyDown('ctrl')
-        pydirectinput.keyDown('alt')
-        pydirectinput.keyDown('f10')
-
-        # Wait for the specified hold time
-        time.sleep(0.125)
+        self.on_delete_parked_and_traffic_vehicles_button_click_handle()
 
-        pydirectinput.keyUp('f10')
-        pydirectinput.keyUp('alt')
-        pydirectinput.keyUp('ctrl')
-        pydirectinput.keyUp('shift')
 
-        self.details_window_intentionally_closed = True
-        self.on_details_window_close()
-
-        print(f"Deletion completed. ATTEMPT {attempt_number}") # Updated message
-
-
-        data_folder = self.script_dir / "data"
-        COMMANDconfirmation = data_folder / "commandconfirmation.txt"
-
-        max_attempts = 7
-
-        # --- NOW CHECK FOR THE FILE AFTER RUNNING ACTIONS ---
-        print(f"Checking for file '{COMMANDconfirmation}' - Attempt {attempt_number}/{max_attempts}...")
-        if os.path.exists(COMMANDconfirmation):
-            print(f"File '{COMMANDconfirmation}' exists after actions on attempt {attempt_number}. Deleting it.")
-            try:
-                os.remove(COMMANDconfirmation)
-                print(f"File '{COMMANDconfirmation}' deleted successfully.")
-                return True # Indicate success (file existed and was deleted)
-            except OSError as e:
-                print(f"Error deleting file '{COMMANDconfirmation}': {e}")
-                return False # Indicate failure (file deletion error)
-
-        else: # File does not exist AFTER running actions
-            if attempt_number >= max_attempts: # Check attempt number for max retries
-                print(f"File '{COMMANDconfirmation}' still does not exist after {max_attempts} attempts. Stopping.")
-
-                scanning_win = None  # Initialize scanning_win
-
-                scanning_win = self.show_scanning_window(text=f"Maximum number of attempts ({attempt_number}) to delete vehicle(s) reached. \nPlease ensure EllexiumModManagerInput.zip is in the mods folder and restart the game.")
-                time.sleep(5.725)
-                if scanning_win:
-                    scanning_win.destroy()
+    def on_delete_parked_and_traffic_vehicles_button_click_handle(self, on_done=None):
+        """Deletes parked and traffic vehicles with shift+ctrl+alt+F10, same handshake as run_spawn_queue."""
+        def after_sent():
+            self.details_window_intentionally_closed = True
+            self.on_details_window_close()
 
-                return False # Indicate failure (file never appeared after max attempts)
-            else:
-                print(f"File '{COMMANDconfirmation}' does not exist on attempt {attempt_number}. Retrying function...")
-                time.sleep(1.125) # Reduced time.sleep to quarter
-                return self.on_delete_parked_and_traffic_vehicles_button_click_handle(retry=True, attempt_number=attempt_number + 1) # Recursive call, incrementing attempt_number
+        return self._start_spawn_handshake(
+            'f10',
+            retry_text="Delete attempts",
+            failure_text="Maximum number of attempts ({attempts}) to delete vehicle(s) reached. \nPlease ensure EllexiumModManagerInput.zip is in the mods folder and restart the game.",
+            after_sent=after_sent,
+            on_done=on_done
+        )
   
      
      
@@ -11662,7 +11580,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: '{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11748,7 +11666,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: {self.SPAWN_QUEUE_TRANSIENT_FILE}") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -11825,7 +11743,7 @@ class ConfigViewerApp:
                     f.write(spawn_cmd + '\n') # Write command to file
                 #messagebox.showinfo("Spawn Queue", f"Configuration '{self.extract_name_from_spawn_command(spawn_cmd)}' added to transient spawn queue file: \n\n'{self.SPAWN_QUEUE_TRANSIENT_FILE}'") # Inform user
                 print(f"DEBUG: Command written to transient spawn queue file: {self.SPAWN_QUEUE_TRANSIENT_FILE}") # Debug
-                self.run_spawn_queue_transient(retry=False, attempt_number=1)
+                self.run_spawn_queue_transient()
             except Exception as e:
                 #messagebox.showerror("Error", f"Failed to write to transient spawn queue file: {e}") # Error message if writing fails
                 print(f"ERROR: Failed to spawn: {e}") # Error print
@@ -12353,7 +12271,7 @@ class ConfigViewerApp:
     def on_spawn_queue_spawn_button_click(self):
         """Handles the 'Spawn' button click in the Spawn Queue window."""
         self.destroy_spawn_queue_window()
-        self.run_spawn_queue(retry=False, attempt_number=1) # Execute spawn queue commands
+        self.run_spawn_queue() # Execute spawn queue commands
 
 
     def on_spawn_queue_clear_button_click(self):
@@ -13001,6 +12919,9 @@ class ConfigViewerApp:
 
     def custom_scrollbar_set(self, *args):
         """Custom scrollbar set command to update thumb position."""
+        # --- NEW: Virtualized main grid - rebind the slot pool to whatever scrolled into view ---
+        self.schedule_main_grid_viewport_refresh()
+
         if self.scrollbar_thumb_dragging:
             return # Prevent updates if dragging manually
 
@@ -13405,11 +13326,11 @@ class ConfigViewerApp:
 
 
     def format_grouped_data(self, data_list):
-        print("\n--- format_grouped_data() [WITH FAVORITES LOGIC] DEBUG ENTRY ---")
-        print(f"  DEBUG: self.sort_by_install_date: {self.sort_by_install_date}")
-        print(f"  DEBUG: self.collapse_categories_by_default: {self.collapse_categories_by_default}")
-        print(f"  DEBUG: self.show_pinned_favorites_category: {self.show_pinned_favorites_category}")
-        print(f"  DEBUG: self.categorization_mode: {self.categorization_mode}")
+        data_log.debug('\n--- format_grouped_data() [WITH FAVORITES LOGIC] DEBUG ENTRY ---')
+        data_log.debug('  DEBUG: self.sort_by_install_date: %s', self.sort_by_install_date)
+        data_log.debug('  DEBUG: self.collapse_categories_by_default: %s', self.collapse_categories_by_default)
+        data_log.debug('  DEBUG: self.show_pinned_favorites_category: %s', self.show_pinned_favorites_category)
+        data_log.debug('  DEBUG: self.categorization_mode: %s', self.categorization_mode)
 
         grouped = {}
         zip_creation_times = {} # For sorting items within categories by install date
@@ -13419,13 +13340,15 @@ class ConfigViewerApp:
         create_favorites_category_active = self.show_pinned_favorites_category and \
                                            self.categorization_mode in ["Type", "Country", "None"]
         
-        print(f"  DEBUG: create_favorites_category_active: {create_favorites_category_active}")
+        data_log.debug('  DEBUG: create_favorites_category_active: %s', create_favorites_category_active)
 
         folders_added_to_favorites_pin = set() # To ensure a folder rep is added only once to the pinned "Favorites"
+        # --- NEW: Folders with a favorite config, kept between regroups (see get_pinned_favorite_folders) ---
+        pinned_favorite_folders = self.get_pinned_favorite_folders() if create_favorites_category_active else frozenset()
 
         # --- 1. Populate zip_creation_times and folder_zip_latest_mtimes (if sorting by install date) ---
         if self.sort_by_install_date:
-            parent_dir = os.path.dirname(self.repo_folder) # Assuming self.repo_folder is valid
+            zip_install_times = self.get_zip_install_times() # In memory; only archives not seen yet are stat'ed
             for item_for_time_check in data_list: # Iterate over the full data_list once for times
                 # Ensure item_for_time_check has the expected structure
                 if not (isinstance(item_for_time_check, (list, tuple)) and len(item_for_time_check) == 5):
@@ -13435,18 +13358,7 @@ class ConfigViewerApp:
                 folder_name_for_time = item_for_time_check[4]
 
                 if zip_file_for_time != "user_custom_configs":
-                    zip_file_name_actual = zip_file_for_time
-                    if not zip_file_name_actual.lower().endswith(".zip"):
-                        zip_file_name_actual += ".zip"
-                    
-                    zip_path_repo = os.path.join(self.repo_folder, zip_file_name_actual)
-                    zip_path_parent_mods = os.path.join(parent_dir, zip_file_name_actual) # Path in mods/
-                    
-                    modification_time = 0
-                    if os.path.exists(zip_path_repo):
-                        modification_time = os.path.getmtime(zip_path_repo)
-                    elif os.path.exists(zip_path_parent_mods): # Check in mods/ folder
-                        modification_time = os.path.getmtime(zip_path_parent_mods)
+                    modification_time = zip_install_times.get(zip_file_for_time) # repo/ first, then mods/
                     
                     # Store modification time for the specific zip_file (original name, not with .zip)
                     zip_creation_times[zip_file_for_time] = modification_time
@@ -13462,7 +13374,7 @@ class ConfigViewerApp:
         for item in data_list:
             # Ensure item has the expected structure before unpacking
             if not (isinstance(item, (list, tuple)) and len(item) == 5):
-                print(f"  WARN: Skipping malformed item in data_list: {str(item)[:100]}")
+                data_log.warning('  WARN: Skipping malformed item in data_list: %s', str(item)[:100])
                 continue
 
             pic, spawn_cmd, zip_file, info_data, folder_name = item
@@ -13489,38 +13401,20 @@ class ConfigViewerApp:
             grouped.setdefault(normal_category_key, []).append(item)
 
             # b. Conditionally add to pinned "Favorites" category
-            if create_favorites_category_active and folder_name not in folders_added_to_favorites_pin:
-                if folder_name in self.full_data:
-                    folder_data_entry = self.full_data[folder_name]
-                    all_configs_in_folder_list = []
-                    if isinstance(folder_data_entry, list):
-                        all_configs_in_folder_list = folder_data_entry
-                    elif isinstance(folder_data_entry, dict) and 'configs' in folder_data_entry:
-                        all_configs_in_folder_list = folder_data_entry.get('configs', [])
-
-                    for config_tuple_in_folder in all_configs_in_folder_list:
-                        if not isinstance(config_tuple_in_folder, (list, tuple)) or len(config_tuple_in_folder) < 2:
-                            continue
-                        config_spawn_cmd = config_tuple_in_folder[1]
-                        if not isinstance(config_spawn_cmd, str):
-                            continue
-                        
-                        pc_filename_for_fav_check = self.extract_name_from_spawn_command(config_spawn_cmd) + ".pc"
-                        if self.is_favorite(folder_name, pc_filename_for_fav_check):
-                            grouped.setdefault("Favorites", []).append(item) # Add the FOLDER REPRESENTATIVE
-                            folders_added_to_favorites_pin.add(folder_name)
-                            print(f"  DEBUG: Added '{folder_name}' to pinned 'Favorites' because '{pc_filename_for_fav_check}' is a favorite.")
-                            break 
+            if folder_name in pinned_favorite_folders and folder_name not in folders_added_to_favorites_pin:
+                grouped.setdefault("Favorites", []).append(item) # Add the FOLDER REPRESENTATIVE
+                folders_added_to_favorites_pin.add(folder_name)
+                data_log.debug("  DEBUG: Added '%s' to pinned 'Favorites' because one of its configs is a favorite.", folder_name)
         
         # Cleanup empty "Favorites" category if it was created but no items were added
         if "Favorites" in grouped and not grouped["Favorites"]:
             del grouped["Favorites"]
-            print(f"  DEBUG: Removed empty pinned 'Favorites' category.")
+            data_log.debug("  DEBUG: Removed empty pinned 'Favorites' category.")
 
         # --- 3. Representative Image Selection (Your existing logic) ---
         # This will also apply to the "Favorites" category if it exists.
         # The representative image for "Favorites" will be based on the first item added to it.
-        print("\n  --- Representative Image Selection ---")
+        data_log.debug('\n  --- Representative Image Selection ---')
         # self.clear_main_grid_cache() # Already called in your original, ensure it's intended here
         # updated_data_items = [] # Not used in your provided code snippet for this part
         for category, items_in_cat in grouped.items():
@@ -13551,17 +13445,17 @@ class ConfigViewerApp:
                         item_list_mutable = list(items_in_cat[i])
                         item_list_mutable[0] = representative_picture
                         items_in_cat[i] = tuple(item_list_mutable)
-        print("  --- Representative Image Selection END ---")
+        data_log.debug('  --- Representative Image Selection END ---')
 
         # --- 4. Collapse Categories by Default Logic (Your existing logic) ---
-        print("  DEBUG: Applying Collapse Categories Logic (Persistent).")
+        data_log.debug('  DEBUG: Applying Collapse Categories Logic (Persistent).')
         for category_key_for_collapse in grouped: # Iterate over keys in grouped
             self.category_hidden_states.setdefault(category_key_for_collapse, self.collapse_categories_by_default)
         # Special handling for "Favorites" - if it exists, it should respect collapse_categories_by_default
         # or you can force it to be expanded if self.show_pinned_favorites_category is True
         if "Favorites" in grouped:
             self.category_hidden_states["Favorites"] = self.collapse_categories_by_default
-            print(f"  DEBUG: 'Favorites' category hidden state set to: {self.category_hidden_states['Favorites']}")
+            data_log.debug("  DEBUG: 'Favorites' category hidden state set to: %s", self.category_hidden_states['Favorites'])
 
 
         # # --- 5. Sort items WITHIN each category ---
@@ -13586,7 +13480,7 @@ class ConfigViewerApp:
 
 
         # --- 5. Sort items WITHIN each category ---
-        print("  DEBUG: Sorting items WITHIN each category...")
+        data_log.debug('  DEBUG: Sorting items WITHIN each category...')
         for category_key_for_sort, items_to_sort in grouped.items():
             if self.sort_by_install_date:
                 # Sort by install date (primary), then folder name (for user_custom within date), then Brand, then Name
@@ -13602,7 +13496,7 @@ class ConfigViewerApp:
                 # - Categorization mode is 'None' (so category is "All Items")
                 # - AND we are NOT sorting by install date (the 'if' above was false)
                 # - AND the current category being processed is indeed "All Items".
-                print(f"  DEBUG: Applying IMPLICIT custom sort order for items in '{category_key_for_sort}'")
+                data_log.debug("  DEBUG: Applying IMPLICIT custom sort order for items in '%s'", category_key_for_sort)
 
                 def get_implicit_sort_group_for_item(item_tuple):
                     # item_tuple structure: (pic, spawn_cmd, zip_file, info_data, folder_name)
@@ -13642,17 +13536,17 @@ class ConfigViewerApp:
                     items_to_sort.sort(key=lambda x: (x[4].lower(), os.path.splitext(os.path.basename(x[0]))[0].lower()))
                 else:
                     items_to_sort.sort(key=lambda x: (x[3].get("Brand", "").lower(), x[3].get("Name", "").lower()))
-        print("  DEBUG: Sorting items WITHIN categories COMPLETE.")
+        data_log.debug('  DEBUG: Sorting items WITHIN categories COMPLETE.')
 
 
         # --- 6. Sort the CATEGORIES themselves ---
-        print("  DEBUG: Sorting CATEGORIES (Refined Logic - Install Date only for intra-category sort)...")
+        data_log.debug('  DEBUG: Sorting CATEGORIES (Refined Logic - Install Date only for intra-category sort)...')
         ordered_category_keys = []
         
         # Always pin "Favorites" to the top if it exists and is active
         if "Favorites" in grouped: # Assumes "Favorites" is only in grouped if create_favorites_category_active was true
             ordered_category_keys.append("Favorites")
-            print(f"  DEBUG: Pinned 'Favorites' to top of category order.")
+            data_log.debug("  DEBUG: Pinned 'Favorites' to top of category order.")
 
         # Get other categories (excluding "Favorites" if already added)
         other_categories_to_sort = [cat_key for cat_key in grouped.keys() if cat_key != "Favorites"]
@@ -13670,8 +13564,8 @@ class ConfigViewerApp:
             else:
                 regular_categories.append(cat_name)
         
-        print(f"  DEBUG: Regular categories to sort: {regular_categories}")
-        print(f"  DEBUG: Unknown categories to sort: {unknown_categories}")
+        data_log.debug('  DEBUG: Regular categories to sort: %s', regular_categories)
+        data_log.debug('  DEBUG: Unknown categories to sort: %s', unknown_categories)
 
         # Sort the "regular" categories:
         # Primary sort: by index in category_order_main_grid if present
@@ -13684,23 +13578,23 @@ class ConfigViewerApp:
             )
         )
         ordered_category_keys.extend(sorted_regular_categories)
-        print(f"  DEBUG: Regular categories sorted and appended: {sorted_regular_categories}")
+        data_log.debug('  DEBUG: Regular categories sorted and appended: %s', sorted_regular_categories)
 
         # Sort the "unknown" categories alphabetically and add them last
         sorted_unknown_categories = sorted(unknown_categories, key=lambda x: x.lower())
         ordered_category_keys.extend(sorted_unknown_categories)
-        print(f"  DEBUG: Unknown categories sorted and appended: {sorted_unknown_categories}")
+        data_log.debug('  DEBUG: Unknown categories sorted and appended: %s', sorted_unknown_categories)
         
-        print(f"  DEBUG: Final proposed category order before reconstruction: {ordered_category_keys}")
+        data_log.debug('  DEBUG: Final proposed category order before reconstruction: %s', ordered_category_keys)
 
         # Reconstruct grouped dictionary to ensure order for UI iteration
         final_ordered_grouped_data = {cat_key: grouped[cat_key] for cat_key in ordered_category_keys if cat_key in grouped}
         grouped = final_ordered_grouped_data # Replace original with ordered one
         
-        print(f"  DEBUG: Final category order after reconstruction: {list(grouped.keys())}")
-        print("  DEBUG: Sorting CATEGORIES COMPLETE.")
+        data_log.debug('  DEBUG: Final category order after reconstruction: %s', list(grouped.keys()))
+        data_log.debug('  DEBUG: Sorting CATEGORIES COMPLETE.')
 
-        print("--- format_grouped_data() [WITH FAVORITES LOGIC] DEBUG EXIT ---\n")  
+        data_log.debug('--- format_grouped_data() [WITH FAVORITES LOGIC] DEBUG EXIT ---\n')  
         return grouped
 
         
@@ -13717,10 +13611,10 @@ class ConfigViewerApp:
         #print(f"  DEBUG: Constructed vehicle_folder_path: {vehicle_folder_path}") # Debug - Constructed path
 
         if not os.path.isdir(vehicle_folder_path):
-            print(f"  WARNING: Vehicle folder NOT FOUND: {vehicle_folder_path}") # Debug - Folder not found
+            data_log.warning('  WARNING: Vehicle folder NOT FOUND: %s', vehicle_folder_path) # Debug - Folder not found
             return None
         else:
-            print(f"  DEBUG: Vehicle folder FOUND: {vehicle_folder_path}") # Debug - Folder found
+            data_log.debug('  DEBUG: Vehicle folder FOUND: %s', vehicle_folder_path) # Debug - Folder found
 
         image_extensions = ['.png', '.jpg', '.jpeg']
         for filename in os.listdir(vehicle_folder_path):
@@ -13729,12 +13623,12 @@ class ConfigViewerApp:
                 pc_candidate_path = os.path.join(vehicle_folder_path, f"{base}.pc")
                 if os.path.exists(pc_candidate_path):
                     image_path = os.path.join(vehicle_folder_path, filename)
-                    print(f"  DEBUG: Found representative image in folder: {image_path}") # Debug
-                    print("--- find_representative_image_in_folder() DEBUGGING END ---\n") # Debug Exit
+                    data_log.debug('  DEBUG: Found representative image in folder: %s', image_path) # Debug
+                    data_log.debug('--- find_representative_image_in_folder() DEBUGGING END ---\n') # Debug Exit
                     return image_path  # Return the first suitable image found
 
-        print(f"  DEBUG: No representative image with corresponding .pc found in folder: {vehicle_folder_path}") # Debug
-        print("--- find_representative_image_in_folder() DEBUGGING END ---\n") # Debug Exit
+        data_log.debug('  DEBUG: No representative image with corresponding .pc found in folder: %s', vehicle_folder_path) # Debug
+        data_log.debug('--- find_representative_image_in_folder() DEBUGGING END ---\n') # Debug Exit
         return None
 
 
@@ -14207,22 +14101,50 @@ class ConfigViewerApp:
     # ------------------------------------------------------------
     # sidebar filters
     # ------------------------------------------------------------
+    def get_sidebar_facet_view(self):
+        """
+        Returns the FacetView of the current search and filter result
+        (filtered_original_data_for_brands), or None before the first search. The FacetIndex
+        is built once per data_cache list; a new result only looks its items up in it.
+        """
+        if not hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
+            return None
+        if self.facet_index is None or self.facet_index.items is not self.data_cache:
+            self.facet_index = FacetIndex(self.data_cache)
+            self.facet_view_source = None
+            filter_log.debug('DEBUG: Built sidebar facet index of %s items.', len(self.facet_index))
+        source = self.filtered_original_data_for_brands
+        if self.facet_view is None or self.facet_view_source is not source:
+            self.facet_view = self.facet_index.view(source)
+            self.facet_view_source = source
+        return self.facet_view
+
+
+    def _get_sidebar_facet_values(self, field, constraints=None, exclude=("",)):
+        """
+        Sorted values of one sidebar facet in the current results, optionally only of the items
+        matching constraints ({field: value}). Their counts go to sidebar_facet_counts for the
+        dropdown option labels.
+        """
+        facet_view = self.get_sidebar_facet_view()
+        if facet_view is None:
+            return []
+        value_counts = facet_view.counts(field, constraints, exclude)
+        self.sidebar_facet_counts[field] = value_counts
+        return sorted(value_counts)
+
+
+    def _facet_option_label(self, option, field):
+        """Dropdown button text of a sidebar filter option: the value and its item count in the current results."""
+        count = self.sidebar_facet_counts.get(field, {}).get(option)
+        return option if count is None else f"{option} ({count})"
+
+
     def get_unique_brands(self):
         """
         Extracts unique brand names from the **filtered_original_data_for_brands** data set. - MODIFIED TO USE FILTERED DATA
         """
-        brands = set()
-        # Iterate over self.filtered_original_data_for_brands to get filtered brands
-        if hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
-            for item in self.filtered_original_data_for_brands: # <--- MODIFIED: Use filtered data source
-                _, _, _, info_data, _ = item
-                brand = info_data.get("Brand", "").strip()
-                if brand:
-                    brands.add(brand)
-        else:
-            #print("Warning: filtered_original_data_for_brands attribute not initialized. Returning empty brand list.") # Defensive warning
-            pass
-        return sorted(list(brands))
+        return self._get_sidebar_facet_values("Brand")
     
     
     def get_unique_names(self, selected_brand="All Brands"):
@@ -14230,27 +14152,11 @@ class ConfigViewerApp:
         Extracts unique names, dynamically filtered by brand and respecting the main search query.
         - MODIFIED to use filtered_original_data_for_brands and respect selected_brand
         """
-        names = set()
-        if hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
-            filtered_data_source = self.filtered_original_data_for_brands # <--- MODIFIED: Use filtered data source
-
-            if selected_brand != "All Brands": # Apply brand filter if a specific brand is selected
-                filtered_data = [
-                    item for item in filtered_data_source # <--- MODIFIED: Iterate over filtered data source
-                    if item[3].get("Brand", "").strip() == selected_brand
-                ]
-            else:
-                filtered_data = filtered_data_source # <--- MODIFIED: Use filtered data source directly for 'All Brands'
-
-            for item in filtered_data: # Iterate over filtered data
-                _, _, _, info_data, _ = item
-                name = info_data.get("Name", "").strip()
-                if name:
-                    names.add(name)
-        else:
+        if not hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
             print("Warning: filtered_original_data_for_brands attribute not initialized. Returning empty name list.") # Defensive warning
-
-        return sorted(list(names))
+            return []
+        constraints = {"Brand": selected_brand} if selected_brand != "All Brands" else None
+        return self._get_sidebar_facet_values("Name", constraints)
 
 
     def get_unique_body_styles(self, selected_brand="All Brands", selected_name="All Names", selected_country="All Countries"):
@@ -14258,65 +14164,19 @@ class ConfigViewerApp:
         Extracts unique body style names, now dynamically filtered by selected brand, name, AND country,
         and respecting the main search query. - MODIFIED to use filtered_original_data_for_brands
         """
-        body_styles = set()
-        if hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
-            filtered_data_source = self.filtered_original_data_for_brands # Use filtered data source
-
-
-            if selected_name != "All Names": # Name filter still has highest priority
-                for item in filtered_data_source:
-                    _, _, _, info_data, _ = item
-                    name = info_data.get("Name", "").strip()
-                    if name == selected_name:
-                        body_style = info_data.get("Body Style", "").strip()
-                        if body_style:
-                            body_styles.add(body_style)
-                return sorted(list(body_styles)) # Return early - name filter takes precedence
-
-
-            if selected_country != "All Countries":
-                country_filtered_data = []
-                for item in filtered_data_source:
-                    _, _, _, info_data, _ = item
-                    country = info_data.get("Country", "").strip()
-                    if country == selected_country:
-                        country_filtered_data.append(item)
-
-                if selected_brand != "All Brands":
-                    for item in country_filtered_data:
-                        _, _, _, info_data, _ = item
-                        brand = info_data.get("Brand", "").strip()
-                        if brand == selected_brand:
-                            body_style = info_data.get("Body Style", "").strip()
-                            if body_style:
-                                body_styles.add(body_style)
-                else: # If "All Brands" with Country filter
-                    for item in country_filtered_data:
-                         _, _, _, info_data, _ = item
-                         body_style = info_data.get("Body Style", "").strip()
-                         if body_style:
-                             body_styles.add(body_style)
-
-
-            elif selected_brand != "All Brands": # Brand filter (if no Name or Country filter)
-                for item in filtered_data_source:
-                    _, _, _, info_data, _ = item
-                    brand = info_data.get("Brand", "").strip()
-                    if brand == selected_brand:
-                        body_style = info_data.get("Body Style", "").strip()
-                        if body_style:
-                            body_styles.add(body_style)
-
-            else: # "All Brands" and "All Names" and "All Countries" case
-                for item in filtered_data_source:
-                    _, _, _, info_data, _ = item
-                    body_style = info_data.get("Body Style", "").strip()
-                    if body_style:
-                        body_styles.add(body_style)
-        else:
+        if not hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
             print("Warning: filtered_original_data_for_brands attribute not initialized. Returning empty body style list.") # Defensive warning
+            return []
 
-        return sorted(list(body_styles))
+        constraints = {}
+        if selected_name != "All Names": # Name filter still has highest priority
+            constraints["Name"] = selected_name
+        else:
+            if selected_country != "All Countries":
+                constraints["Country"] = selected_country
+            if selected_brand != "All Brands":
+                constraints["Brand"] = selected_brand
+        return self._get_sidebar_facet_values("Body Style", constraints)
         
 
 
@@ -14325,42 +14185,18 @@ class ConfigViewerApp:
         Extracts unique country names, now dynamically filtered by selected brand AND name,
         and respecting the main search query. - MODIFIED to use filtered_original_data_for_brands
         """
-        countries = set()
-        if hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
-            filtered_data_source = self.filtered_original_data_for_brands # Use filtered data source
-
-            if selected_name != "All Names":
-                # If a specific name is selected, get countries for that name only (within selected brand, if any)
-                for item in filtered_data_source:
-                    _, _, _, info_data, _ = item
-                    name = info_data.get("Name", "").strip()
-                    if name == selected_name:
-                        country = info_data.get("Country", "").strip()
-                        if country and country != "N/A":
-                            countries.add(country)
-                return sorted(list(countries)) # Return early - name filter takes precedence for countries
-
-
-            if selected_brand != "All Brands":
-                # If a specific brand is selected (and no specific name), get countries for that brand
-                for item in filtered_data_source:
-                    _, _, _, info_data, _ = item
-                    brand = info_data.get("Brand", "").strip()
-                    if brand == selected_brand:
-                        country = info_data.get("Country", "").strip()
-                        if country and country != "N/A":
-                            countries.add(country)
-            else:
-                # If "All Brands" and "All Names" are selected, get all countries from the filtered data
-                for item in filtered_data_source:
-                    _, _, _, info_data, _ = item
-                    country = info_data.get("Country", "").strip()
-                    if country and country != "N/A":
-                        countries.add(country)
-        else:
+        if not hasattr(self, 'filtered_original_data_for_brands'): # Defensive check
             print("Warning: filtered_original_data_for_brands attribute not initialized. Returning empty country list.") # Defensive warning
+            return []
 
-        return sorted(list(countries))
+        if selected_name != "All Names":
+            # If a specific name is selected, get countries for that name only (name filter takes precedence)
+            constraints = {"Name": selected_name}
+        elif selected_brand != "All Brands":
+            constraints = {"Brand": selected_brand}
+        else:
+            constraints = None
+        return self._get_sidebar_facet_values("Country", constraints, exclude=("", "N/A"))
 
 
 
@@ -14513,7 +14349,7 @@ class ConfigViewerApp:
             # Initial bg/fg will be set by _bind_animated_hover based on is_selected
             dropdown_option_button = tk.Button( # Renamed to avoid confusion with 'button' from args
                 scrollable_frame,
-                text=option,
+                text=self._facet_option_label(option, "Body Style"),
                 font=("Segoe UI", 10 + self.font_size_add, "bold"),
                 # The command lambda captures necessary arguments for the click handler
                 command=lambda opt=option, main_btn=button, dd_win=dropdown_window: \
@@ -14571,25 +14407,25 @@ class ConfigViewerApp:
     
     def _initialize_search_attributes(self):
         """Initializes search-related attributes and handles default search mode."""
-        print("    _initialize_search_attributes()")
+        search_log.debug('    _initialize_search_attributes()')
         if not hasattr(self, 'search_mode'):
-            print("    Warning: search_mode attribute not initialized. Defaulting to 'General'.")
+            search_log.warning("    Warning: search_mode attribute not initialized. Defaulting to 'General'.")
             self.search_mode = "General"
 
     def _reset_sidebar_filters_on_search(self):
         """Resets sidebar filters to 'All...' when a search is initiated."""
-        print("    _reset_sidebar_filters_on_search()")
+        search_log.debug('    _reset_sidebar_filters_on_search()')
 
         # 1. Repopulate FIRST to create the new buttons based on fresh data
         #    This assumes _repopulate_sidebar_dropdowns_on_reset handles destroying
         #    the old frame and creating the new one with buttons in self.sidebar_filter_buttons
-        print("    DEBUG: Calling _repopulate_sidebar_dropdowns_on_reset() first...")
+        search_log.debug('    DEBUG: Calling _repopulate_sidebar_dropdowns_on_reset() first...')
         self._repopulate_sidebar_dropdowns_on_reset()
-        print("    DEBUG: _repopulate_sidebar_dropdowns_on_reset() returned.")
+        search_log.debug('    DEBUG: _repopulate_sidebar_dropdowns_on_reset() returned.')
 
         # 2. Now configure the NEWLY created buttons
         if hasattr(self, 'sidebar_filter_buttons') and self.sidebar_filter_buttons:
-            print("    DEBUG: Configuring NEW sidebar filter buttons to 'All...'")
+            search_log.debug("    DEBUG: Configuring NEW sidebar filter buttons to 'All...'")
             filter_names = ["Brand", "Name", "Bodystyle", "Country"] # Only configure existing ones
             for filter_name in filter_names:
                 button = self.sidebar_filter_buttons.get(filter_name)
@@ -14605,16 +14441,16 @@ class ConfigViewerApp:
                     try:
                         if button.winfo_exists():
                             button.config(text=all_text)
-                            print(f"      DEBUG: Configured NEW {filter_name} button to '{all_text}'")
+                            search_log.debug("      DEBUG: Configured NEW %s button to '%s'", filter_name, all_text)
                         else:
-                            print(f"      WARN: NEW {filter_name} button widget does not exist after repopulate. Skipping config.")
+                            search_log.warning('      WARN: NEW %s button widget does not exist after repopulate. Skipping config.', filter_name)
                     except tk.TclError as e:
-                        print(f"      ERROR: TclError configuring NEW {filter_name} button: {e}")
+                        search_log.error('      ERROR: TclError configuring NEW %s button: %s', filter_name, e)
 
                 else:
-                    print(f"    WARN: Button for '{filter_name}' not found in self.sidebar_filter_buttons AFTER repopulate.")
+                    search_log.warning("    WARN: Button for '%s' not found in self.sidebar_filter_buttons AFTER repopulate.", filter_name)
         else:
-            print("    Warning: sidebar_filter_buttons not initialized AFTER repopulate. Cannot configure buttons.")
+            search_log.warning('    Warning: sidebar_filter_buttons not initialized AFTER repopulate. Cannot configure buttons.')
 
     def _repopulate_sidebar_dropdowns_on_reset(self):
         print("      _repopulate_sidebar_dropdowns_on_reset()")
@@ -14636,6 +14472,22 @@ class ConfigViewerApp:
         else:
             print("        ERROR: Cannot recreate dropdowns, sidebar_bottom_frame does not exist.")
 
+    def _item_matches_search(self, query, item):
+        """
+        _perform_item_search, evaluated at most once per item for the current query, search
+        mode, main filter and favorites (see SearchMatchMemo). perform_search records every
+        item it checks, so the grid layout that follows reads the results back.
+        """
+        if not query:
+            return True
+        memo = self.search_match_memo
+        memo.reset((query, self.search_mode, self.filter_state, self.favorites_generation), self.full_data)
+        matches = memo.get(item)
+        if matches is None:
+            matches = self._perform_item_search(query, item)
+            memo.record(item, matches)
+        return matches
+
     def _perform_item_search(self, query, item):
         """Performs the actual search logic for a single item based on search mode."""
         pic, spawn_cmd, zip_file, info_data, folder_name = item
@@ -14652,49 +14504,19 @@ class ConfigViewerApp:
     def _check_config_search_matches(self, query, item):
         """
         Checks if an item matches the search query in 'Configs' search mode,
-        matching against Configuration values in ALL matches_config.txt entries
-        associated with the representative image's folder, and PC filename.
-        Loads and parses matches_config.txt entries DIRECTLY within this function (no cache).
+        matching against Configuration values in matches_config.txt entries of the
+        item's folder, the .pc names of the folder's configs, and the PC filename of
+        the representative config. Folder matches come from the config search index,
+        so this is a set lookup per item instead of a scan over every config.
         """
         pic, spawn_cmd, zip_file, info_data, folder_name = item
-        associated_config_names = set()
-        is_favorites_filter_active = (self.filter_state == 5 and self.filter_options[self.filter_state] == "Favorites")
-        favorite_configs_set = self.favorite_configs if is_favorites_filter_active else None
-
-        zip_file_base_name = zip_file.replace(".zip", "") # Remove extension
-        pc_file_name_match = False # Initialize PC file name match flag - keep this check
-
-        # --- NEW: Iterate through matches_config_data to find associated configs ---
-        for filename, config_name_from_file in self.matches_config_data.items(): # Iterate through ALL matches_config.txt entries
-            if folder_name in filename and "--INDIVIDUAL--" in filename: # Check if folder_name is in the filename AND it's an individual config
-                # --- NEW: Apply Favorites Filter to matches_config.txt entries ---
-                if is_favorites_filter_active: # If Favorites filter is active
-                    config_name_base_inner = self.extract_name_from_spawn_command_from_matches_config_filename(filename) # Extract config name from filename
-                    if config_name_base_inner:
-                        fav_key = f"{folder_name}|{config_name_base_inner}.pc" # Construct favorite key
-                        if fav_key not in favorite_configs_set:
-                            continue # Skip to the next config if not a favorite
-                # --- NEW: Apply Favorites Filter to matches_config.txt entries ---
-
-                if query in config_name_from_file.lower(): # Check query against config name from matches_config.txt
-                    associated_config_names.add(config_name_from_file.lower()) # Add config name to associated names
-
-        # --- NEW: Check PC Filename Match (as before) ---
-        pc_file_name = self.extract_name_from_spawn_command(spawn_cmd) # Keep PC filename check as is, OUTSIDE the loop
-        if pc_file_name and query in pc_file_name.lower():
-            pc_file_name_match = True # Set PC filename match flag if matched
-        # --- NEW: Check PC Filename Match (as before) ---
-
-
-        is_match_normal = bool(associated_config_names) or pc_file_name_match # Check for match in associated config names OR PC filename
 
-        # --- CALL PC_PRIORITY VERSION ---
-        is_match_pc_priority = self._check_config_search_matches_PC_PRIORITY(query, item)
-        # --- CALL PC_PRIORITY VERSION ---
+        # --- PC Filename Match (representative config, never hidden by the Favorites filter) ---
+        pc_file_name = self.extract_name_from_spawn_command(spawn_cmd)
+        if pc_file_name and query in pc_file_name.lower():
+            return True
 
-        # --- COMBINE RESULTS ---
-        is_match_combined = is_match_normal or is_match_pc_priority
-        return is_match_combined
+        return folder_name in self._get_config_search_matching_folders(query)
 
 
     def extract_name_from_spawn_command_from_matches_config_filename(self, matches_config_filename):
@@ -14702,109 +14524,61 @@ class ConfigViewerApp:
         Extracts config name base from matches_config.txt filename (similar to extract_name_from_spawn_command).
         e.g., from "vehicles--INDIVIDUAL--pickup_pickup.zip--info_info_config_name.json" to "config_name".
         """
-        match = re.search(r'--info_info_([^\.]+)\.json', matches_config_filename, re.IGNORECASE)
-        if match:
-            return match.group(1) # Returns the config name (e.g., "config_name")
-        return None # Returns None if no match found
+        return extract_config_name_from_matches_filename(matches_config_filename)
 
 
-    def _check_config_search_matches_PC_PRIORITY(self, query, item):
+    def _get_config_search_index(self):
         """
-        Checks if an item matches the search query in 'Configs' search mode,
-        matching against Configuration values in ALL matches_config.txt entries
-        associated with the representative image's folder, AND PC filename (prioritized). <--- MODIFIED DOCSTRING
-        Loads and parses associated JSON files DIRECTLY within this function (no cache).
+        Returns the config search index, building it from full_data and matches_config.txt
+        the first time 'Configs' search runs after a data load.
         """
-        pic, spawn_cmd, zip_file, info_data, folder_name = item
-        associated_config_names = set()
-        is_favorites_filter_active = (self.filter_state == 5 and self.filter_options[self.filter_state] == "Favorites")
-        favorite_configs_set = self.favorite_configs if is_favorites_filter_active else None
-
-        zip_file_base_name = zip_file.replace(".zip", "") # Remove extension
-        config_name_base = self.extract_name_from_spawn_command(spawn_cmd)
-
-        # --- NEW: Check PC Filename Match FIRST and PRIORITIZE it ---
-        pc_file_name_match = False  # Initialize PC file name match flag
-        pc_file_name = self.extract_name_from_spawn_command(spawn_cmd)
-        if pc_file_name and query in pc_file_name.lower():
-            pc_file_name_match = True  # Set PC filename match flag if matched
-            #print(f"DEBUG: _check_config_search_matches - PC Filename MATCH FOUND for query '{query}' - Filename: {os.path.basename(pic)}, PC Filename: {pc_file_name}") # Debug - PC Filename Match
-
-        if pc_file_name_match: # If PC filename matches, return True immediately - PRIORITIZE PC FILENAME MATCH
-            return True # <-- EARLY RETURN if PC filename matches
-        # --- NEW: Check PC Filename Match FIRST and PRIORITIZE it ---
-
-        '''
-        # --- Open constructednames.txt for writing (append mode) ---
-        constructed_names_file = os.path.join(self.script_dir, "constructednames.txt")
-        try:
-            with open(constructed_names_file, "a") as outfile: # Open in append mode
-                #outfile.write(f"\n--- Checking item: {os.path.basename(pic)} ---\n") # --- Log START of item check ---
-                pass
-        '''        
-        if folder_name in self.full_data:
-            for config_item in self.full_data[folder_name]:
-                config_spawn_cmd = config_item[1]
-                config_name_base_inner = self.extract_name_from_spawn_command(config_spawn_cmd)
-                if is_favorites_filter_active:
-                    fav_key = f"{folder_name}|{config_name_base_inner}.pc"
-                    if fav_key not in favorite_configs_set:
-                        continue
-
-                if config_name_base_inner:
-                    associated_config_names.add(config_name_base_inner.lower())
-
-                    ''' # --- REMOVED: not needed in PC Priority, this just makes the search slower and it doesn't work properly ---
-                    # Construct the expected filename for individual info file
-                    individual_info_filename = (
-                        f"vehicles--INDIVIDUAL--{folder_name}_{zip_file_base_name}.zip--info_info_{config_name_base_inner}.json"
-                    )
+        if self.config_search_index is None:
+            start_time = time.perf_counter()
+            index = ConfigSearchIndex()
+            for folder_name, config_items in self.full_data.items():
+                index.set_folder_configs(folder_name, config_items, self.extract_name_from_spawn_command)
+            index.set_matches_config(self.matches_config_data, list(self.full_data.keys()))
+            self.config_search_index = index
+            search_log.debug('DEBUG: Built config search index for %s folders in %.3fs', len(self.full_data), time.perf_counter() - start_time)
+        return self.config_search_index
 
-                    # --- NEW: Write constructed filename to file ---
-                    #outfile.write(f"    DEBUG: Constructed Filename: {individual_info_filename}\n") # Log constructed filename
-
-                    # --- MODIFIED: Load config name DIRECTLY from file (NO cache, NO _load_individual_info) ---
-                    individual_info_path = self.find_individual_info_file(
-                        folder_name,
-                        zip_file_base_name=zip_file_base_name,
-                        config_name=config_name_base_inner
-                    )
-                    if individual_info_path and os.path.exists(individual_info_path):
-                        try:
-                            with open(individual_info_path, 'r', encoding='utf-8') as f: # Open and read file directly
-                                file_content = f.read()
-                                config_info_value = self.get_json_value_safe(file_content, "Configuration", r'"Configuration"\s*:\s*"([^"]*)"') # Extract config name using regex
-                                if config_info_value:
-                                    associated_config_names.add(config_info_value.lower()) # Use config name from file
-                        except Exception as e_load:
-                            print(f"Warning: Error loading/parsing {individual_info_path}: {e_load}") # Print warning on file load/parse error
-                        '''
-
-        #except Exception as e_file_write: # Catch file writing errors
-            #print(f"Warning: Error writing to constructednames.txt: {e_file_write}") # Print error message
-        #    pass
-            
-
-        found_in_any_config_name = False
-        for config_name in associated_config_names:
-            if query in config_name:
-                found_in_any_config_name = True
-                break
 
+    def _update_config_search_index(self, changed_full_data, removed_folders):
+        """Applies a load_data() delta to the config search index, if it has been built."""
+        index = getattr(self, "config_search_index", None)
+        if index is None:
+            return
+        self.search_match_memo.clear()
+        for folder_name in removed_folders:
+            index.remove_folder(folder_name)
+        for folder_name, config_items in changed_full_data.items():
+            index.set_folder_configs(folder_name, config_items, self.extract_name_from_spawn_command)
+        index.set_matches_config(self.matches_config_data, list(changed_full_data.keys()))
 
-        is_match = found_in_any_config_name or pc_file_name_match # Check for match in associated config names OR PC filename
 
-        # --- NEW: Debug Print - Log matching filenames to console ---
-        #if is_match:
-        #    print(f"DEBUG: _check_config_search_matches - MATCH FOUND for query '{query}' - Representative Image: {os.path.basename(pic)}") # Print filename if it's a match
-        # --- NEW: Debug Print - Log matching filenames to console ---
+    def _get_config_search_matching_folders(self, query):
+        """
+        Returns the set of folders whose configs match query in 'Configs' search mode.
+        The result is computed once per query / Favorites filter state / favorites change /
+        index change and reused for every item of the same search pass.
+        """
+        index = self._get_config_search_index()
+        is_favorites_filter_active = (self.filter_state == 5 and self.filter_options[self.filter_state] == "Favorites")
+        cache_key = (query, is_favorites_filter_active, self.favorites_generation, index.generation)
+        if self._config_search_cache_key != cache_key:
+            favorite_configs_set = self.favorite_configs if is_favorites_filter_active else None
+            self._config_search_cache_folders = index.search(query, favorite_configs_set)
+            self._config_search_cache_key = cache_key
+        return self._config_search_cache_folders
 
-        # --- NEW: Debug Print - Log NOT matching filenames to console ---
-        #if not is_match:
-        #    print(f"DEBUG: _check_config_search_matches - MATCH NOT FOUND for query '{query}' - Representative Image: {os.path.basename(pic)}") # Print filename if it's NOT a match
-        # --- NEW: Debug Print - Log NOT matching filenames to console ---
 
-        return is_match
+    def _check_config_search_matches_PC_PRIORITY(self, query, item):
+        """
+        Checks if an item matches the search query in 'Configs' search mode
+        (PC filename prioritized). Kept for callers of the old name; the config
+        search index covers both the matches_config.txt and .pc name checks.
+        """
+        return self._check_config_search_matches(query, item)
         
         
  
@@ -14865,11 +14639,12 @@ class ConfigViewerApp:
  
 
 
-        print("    _apply_main_filter()")
+        search_log.debug('    _apply_main_filter()')
         final_list = []
         filtered_original_data_for_brands = [] # For brand filter later
         default_zips = [name.lower() for name in self.ZIP_BASE_NAMES]
         current_filter = self.filter_options[self.filter_state]
+        favorite_folders_lower = self.get_favorite_folders().lower_folders if current_filter == "Favorites" else None
 
         for it in filtered_items:
             zip_lower = it[2].lower()
@@ -14900,10 +14675,7 @@ class ConfigViewerApp:
                     final_list.append(it)
                     include_for_brand_filter = True
             elif current_filter == "Favorites":
-                fav_folders = set()
-                for fav in self.favorite_configs:
-                    fav_folders.add(fav.split('|')[0].lower())
-                if folder_lower in fav_folders:
+                if folder_lower in favorite_folders_lower:
                     final_list.append(it)
                     include_for_brand_filter = True
             else: # Default case - should not be reached, but for safety
@@ -14920,16 +14692,16 @@ class ConfigViewerApp:
     def _update_search_results_ui(self, final_list, current_filter):
         """Updates the UI elements after search and filtering are complete."""
 
-        print("\n--- _update_search_results_ui() DEBUG ENTRY ---") # Debug Entry
-        print(f"DEBUG: _update_search_results_ui - final_list received (count): {len(final_list)}") 
+        search_log.debug('\n--- _update_search_results_ui() DEBUG ENTRY ---') # Debug Entry
+        search_log.debug('DEBUG: _update_search_results_ui - final_list received (count): %s', len(final_list)) 
 
-        print("    _update_search_results_ui()")
+        search_log.debug('    _update_search_results_ui()')
         self.data = final_list[:]
-        print("    Calling self.format_grouped_data() ...")
+        search_log.debug('    Calling self.format_grouped_data() ...')
         self.grouped_data = self.format_grouped_data(self.data)
-        print("    self.format_grouped_data() RETURNED.")
+        search_log.debug('    self.format_grouped_data() RETURNED.')
 
-        print("    _update_search_results_ui is calling self.update_grid_layout()")
+        search_log.debug('    _update_search_results_ui is calling self.update_grid_layout()')
         self.update_grid_layout()
         self.canvas.yview_moveto(0)
         item_count = len(final_list)
@@ -14939,17 +14711,17 @@ class ConfigViewerApp:
 
     def perform_search(self):
         
-        print("\n--- ConfigViewerApp.perform_search() ENTRY ---")
+        search_log.debug('\n--- ConfigViewerApp.perform_search() ENTRY ---')
 
         if self.items_to_be_hidden:
-            print("--- self.items_to_be_hidden = True ---\n")
+            search_log.debug('--- self.items_to_be_hidden = True ---\n')
 
             scanning_win = None  # Initialize scanning_win
 
             scanning_win = self.show_scanning_window(text="Cannot search while there are pending hidden vehicles.")
 
             self.search_var.set("")
-            print("\n--- canceling ConfigViewerApp.perform_search() ---")
+            search_log.debug('\n--- canceling ConfigViewerApp.perform_search() ---')
 
             if scanning_win:
 
@@ -14963,8 +14735,8 @@ class ConfigViewerApp:
 
 
         if self.skip_perform_search:
-            print("\n--- self.skip_perform_search evaluated to TRUE, not executing perform_search")
-            print("\n--- canceling ConfigViewerApp.perform_search() ---")
+            search_log.debug('\n--- self.skip_perform_search evaluated to TRUE, not executing perform_search')
+            search_log.debug('\n--- canceling ConfigViewerApp.perform_search() ---')
             return
 
         self._initialize_search_attributes()
@@ -14978,7 +14750,7 @@ class ConfigViewerApp:
         data_to_search = self.apply_data_subset_filter(data_to_search)
 
         for item in data_to_search:
-            if self._perform_item_search(query, item):
+            if self._item_matches_search(query, item):
                 filtered.append(item)
 
         final_list = self._apply_main_filter(filtered)
@@ -14986,26 +14758,26 @@ class ConfigViewerApp:
 
         # --- MODIFICATION START: Check for empty query AND "View All" filter AND GLOBAL FILTERS OFF to close search results window ---
         # --- MODIFIED CONDITION: Added DEBUG prints to check condition values ---
-        print("DEBUG: perform_search - Checking window destruction condition:")
-        print(f"  DEBUG: perform_search - query is empty: {not query}")
-        print(f"  DEBUG: perform_search - self.filter_state == 0 (View All): {self.filter_state == 0}")
-        print(f"  DEBUG: perform_search - not self.is_data_subset_active (Global Filters OFF): {not self.is_data_subset_active}")
+        search_log.debug('DEBUG: perform_search - Checking window destruction condition:')
+        search_log.debug('  DEBUG: perform_search - query is empty: %s', not query)
+        search_log.debug('  DEBUG: perform_search - self.filter_state == 0 (View All): %s', self.filter_state == 0)
+        search_log.debug('  DEBUG: perform_search - not self.is_data_subset_active (Global Filters OFF): %s', not self.is_data_subset_active)
 
         if not query and self.filter_state == 0 and not self.is_data_subset_active:
-            print("  DEBUG: perform_search - Condition MET for Search Results window DESTRUCTION.") # Debug - Condition Met
+            search_log.debug('  DEBUG: perform_search - Condition MET for Search Results window DESTRUCTION.') # Debug - Condition Met
             if hasattr(self, 'search_results_window') and self.search_results_window and self.search_results_window.winfo_exists():
 
                   
                 self.destroy_search_results_window()
                 self.search_results_window = None
                 self.is_search_results_window_active = False
-                print(f"!!!!!!!!!! self.is_search_results_window_active SET TO FALSE by perform_search. Timestamp: {time.time()} !!!!!!!!!!")
+                search_log.debug('!!!!!!!!!! self.is_search_results_window_active SET TO FALSE by perform_search. Timestamp: %s !!!!!!!!!!', time.time())
 
 
 
-                print("DEBUG: perform_search - Search Results window DESTROYED (Empty query AND View All filter AND Global Filters OFF).")
+                search_log.debug('DEBUG: perform_search - Search Results window DESTROYED (Empty query AND View All filter AND Global Filters OFF).')
             else:
-                print("DEBUG: perform_search - Search Results window NOT open, no need to destroy (Empty query AND View All filter AND Global Filters OFF).") # Debug - Window Not Open
+                search_log.debug('DEBUG: perform_search - Search Results window NOT open, no need to destroy (Empty query AND View All filter AND Global Filters OFF).') # Debug - Window Not Open
             self.data = final_list[:] # Still update self.data
             self.grouped_data = self.format_grouped_data(self.data) # Still update grouped_data
             item_count = len(final_list)
@@ -15014,21 +14786,21 @@ class ConfigViewerApp:
             self.update_search_results_window_ui() # Update search results window if open
             
             self.trigger_toggle_sort_by_install_date_after_search_results_window_close()
-            print("--- ConfigViewerApp.perform_search() EXIT - Skipped Layout Update AND Destroyed Search Results Window ---\n")
+            search_log.debug('--- ConfigViewerApp.perform_search() EXIT - Skipped Layout Update AND Destroyed Search Results Window ---\n')
             return  # Exit here, skipping full layout update and destroying search results window
         # --- MODIFICATION END: Check for empty query AND "View All" filter AND GLOBAL FILTERS OFF to close search results window ---
 
 
         # --- MODIFICATION START: Check for empty query and skip layout update ---
         if not query:
-            print("DEBUG: perform_search - Empty query detected. Skipping full update_grid_layout().")
+            search_log.debug('DEBUG: perform_search - Empty query detected. Skipping full update_grid_layout().')
             self.data = final_list[:] # Still update self.data
             self.grouped_data = self.format_grouped_data(self.data) # Still update grouped_data
             item_count = len(final_list)
             self.filter_button.config(text=f"{current_filter} [{item_count}]")
             self._update_filters_label_status()
             self.update_search_results_window_ui() # Update search results window if open
-            print("--- ConfigViewerApp.perform_search() EXIT - Skipped Layout Update ---\n")
+            search_log.debug('--- ConfigViewerApp.perform_search() EXIT - Skipped Layout Update ---\n')
             return # Exit here, skipping full layout update
         # --- MODIFICATION END: Check for empty query and skip layout update ---
 
@@ -15036,14 +14808,14 @@ class ConfigViewerApp:
         if query:
             if not hasattr(self, 'search_results_window') or not self.search_results_window or not self.search_results_window.winfo_exists():
                 self.search_results_window = self.show_search_results_window(final_list)
-                print("DEBUG: perform_search - Search Results window CREATED. is_search_results_window_active set to TRUE")
+                search_log.debug('DEBUG: perform_search - Search Results window CREATED. is_search_results_window_active set to TRUE')
 
             self.search_results_window.lift()
         elif hasattr(self, 'search_results_window') and self.search_results_window and self.search_results_window.winfo_exists():
             self.destroy_search_results_window()
             self.search_results_window = None
             self.is_search_results_window_active = False
-            print(f"!!!!!!!!!! self.is_search_results_window_active SET TO FALSE by perform_search. Timestamp: {time.time()} !!!!!!!!!!")
+            search_log.debug('!!!!!!!!!! self.is_search_results_window_active SET TO FALSE by perform_search. Timestamp: %s !!!!!!!!!!', time.time())
 
 
         if self.search_mode == "Configs":
@@ -15054,18 +14826,18 @@ class ConfigViewerApp:
             for category in categories_to_remove:
                 del self.grouped_data[category]
 
-        print(f"DEBUG: perform_search - final_list (count): {len(final_list)}") # <-- ADD THIS LINE
+        search_log.debug('DEBUG: perform_search - final_list (count): %s', len(final_list)) # <-- ADD THIS LINE
 
 
 
 
-        print(f"DEBUG: perform_search - calling _update_search_results_ui")
+        search_log.debug('DEBUG: perform_search - calling _update_search_results_ui')
         self._update_search_results_ui(final_list, current_filter)
         self.update_search_results_window_ui()
         self.master.after(50, self.inherit_category_visibility_search_results)
         self.lift_search_results_window()
 
-        print("--- ConfigViewerApp.perform_search() EXIT ---\n")
+        search_log.debug('--- ConfigViewerApp.perform_search() EXIT ---\n')
 
         
  
@@ -15087,22 +14859,7 @@ class ConfigViewerApp:
         """
         print(f"!!!!!!!!!! show_search_results_window CALLED! Timestamp: {time.time()} !!!!!!!!!!")
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- show_search_results_window() CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("show_search_results_window()")
 
 
         self.loading_search_results_window = True
@@ -15318,22 +15075,7 @@ class ConfigViewerApp:
     def destroy_search_results_window(self):
 
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- destroy_search_results_window() CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("destroy_search_results_window()")
 
         if self.filter_state != 0:
             print("    destroy_search_results_window() - filter_state != 0, not destroying search results window.")
@@ -15443,10 +15185,7 @@ class ConfigViewerApp:
     def condcheck(self):
 
         
-        print("--- condcheck() CALLED BY: ---")
-        for frame_info in inspect.stack()[1:3]: # Look at immediate caller and its caller
-            print(f"  File \"{frame_info.filename}\", line {frame_info.lineno}, in {frame_info.function}")
-        print("-----------------------------")
+        trace_call_stack("condcheck()", skip=1, limit=2) # Immediate caller and its caller
 
 
         # Inside condcheck
@@ -15663,22 +15402,7 @@ class ConfigViewerApp:
         """
 
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- lupdate_search_results_window_ui CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("lupdate_search_results_window_ui")
 
 
 
@@ -15712,22 +15436,7 @@ class ConfigViewerApp:
         # --- Start: Keep original logic for item details extraction ---
 
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- load_image_item_search_results CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("load_image_item_search_results")
 
 
 
@@ -15818,9 +15527,7 @@ class ConfigViewerApp:
             # --- Image Loading ---
             if picture_path and os.path.exists(picture_path):
                 try:
-                    img = Image.open(picture_path).convert("RGBA")
-                    img = img.resize((250, 140), self.RESAMPLE_FILTER)
-                    pil_image = img.copy()
+                    pil_image = load_thumbnail(self.thumbnail_cache, picture_path, (250, 140), "RGBA", self.RESAMPLE_FILTER)
                 except Exception as e_img: pil_image = None
             else: pil_image = None
             if pil_image is None:
@@ -16028,22 +15735,7 @@ class ConfigViewerApp:
         """Populates the given scrollable frame with search results data, ensuring correct label-pictures order and toggling."""
 
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- load_image_item_search_results CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("populate_search_results_window")
 
 
 
@@ -16609,23 +16301,21 @@ class ConfigViewerApp:
     def load_and_display_image(self, picture_path, parent_frame, zip_file, spawn_cmd, info_data, folder_name, category_context):
         try:
             if picture_path is None:
-                print(f"DEBUG: load_and_display_image - picture_path is None. Skipping.")
+                grid_log.debug('DEBUG: load_and_display_image - picture_path is None. Skipping.')
                 return
 
+            if hasattr(parent_frame, "virtual_grid_item") and not self._main_grid_slot_shows(parent_frame, picture_path, folder_name):
+                return # Pool slot was rebound to another item before this load started
+
             normalized_picture_path = os.path.normpath(os.path.abspath(picture_path))
             cache_key = normalized_picture_path
 
             # --- Optimized Cache: Check Memory Cache (LRU) FIRST ---
-            photo_from_cache = None
-            cache_hit_initial = False
-            with self.cache_access_lock: # <<< Protect cache access
-                if cache_key in self.image_cache:
-                    photo_from_cache = self.image_cache[cache_key]
-                    self.image_cache.move_to_end(cache_key) # Update LRU
-                    cache_hit_initial = True
+            photo_from_cache = self.image_cache.get(cache_key) # Updates LRU on a hit
+            cache_hit_initial = photo_from_cache is not None
             
             if cache_hit_initial:
-                print(f"DEBUG: load_and_display_image - Memory Cache HIT for: {category_context} - {picture_path}\n")
+                grid_log.debug('DEBUG: load_and_display_image - Memory Cache HIT for: %s - %s\n', category_context, picture_path)
                 # Use photo_from_cache
                 if self.pause_loading:
                     self.main_grid_skipped_updates_queue.append((parent_frame, photo_from_cache, None, zip_file, spawn_cmd, info_data, picture_path, folder_name, category_context))
@@ -16645,16 +16335,11 @@ class ConfigViewerApp:
 
             with path_specific_lock:
                 # --- Re-check Memory Cache (LRU) INSIDE path_specific_lock ---
-                photo_from_cache_after_lock = None
-                cache_hit_after_path_lock = False
-                with self.cache_access_lock: # <<< Protect cache access
-                    if cache_key in self.image_cache:
-                        photo_from_cache_after_lock = self.image_cache[cache_key]
-                        self.image_cache.move_to_end(cache_key)
-                        cache_hit_after_path_lock = True
+                photo_from_cache_after_lock = self.image_cache.get(cache_key, record_stats=False) # The miss was counted above
+                cache_hit_after_path_lock = photo_from_cache_after_lock is not None
 
                 if cache_hit_after_path_lock:
-                    print(f"DEBUG: load_and_display_image - Memory Cache HIT (after path_specific_lock) for: {picture_path}")
+                    grid_log.debug('DEBUG: load_and_display_image - Memory Cache HIT (after path_specific_lock) for: %s', picture_path)
                     # Use photo_from_cache_after_lock
                     if self.pause_loading:
                         self.main_grid_skipped_updates_queue.append((parent_frame, photo_from_cache_after_lock, None, zip_file, spawn_cmd, info_data, picture_path, folder_name, category_context))
@@ -16671,15 +16356,13 @@ class ConfigViewerApp:
                 # --- If still not in cache, proceed with disk loading ---
                 try:
                     if not os.path.exists(normalized_picture_path):
-                        print(f"DEBUG: load_and_display_image - Path does not exist (under lock): {normalized_picture_path}")
+                        grid_log.debug('DEBUG: load_and_display_image - Path does not exist (under lock): %s', normalized_picture_path)
                         with self._dict_lock: # Remove from image_load_locks if path DNE
                             if self.image_load_locks.get(cache_key) == path_specific_lock:
                                 del self.image_load_locks[cache_key]
                         return
 
-                    img = Image.open(normalized_picture_path).convert("RGBA")
-                    img = img.resize((250, 140), self.RESAMPLE_FILTER)
-                    pil_image = img.copy()
+                    pil_image = load_thumbnail(self.thumbnail_cache, normalized_picture_path, (250, 140), "RGBA", self.RESAMPLE_FILTER)
 
                     self.master.after(
                         0,
@@ -16687,8 +16370,8 @@ class ConfigViewerApp:
                             self._create_photo_image_and_update_ui(p_img, pf, zf, sc, idt, pp, fn, ck, save_to_disk_cache=False, cat_ctx=cat_ctx)
                     )
                 except Exception as e_load:
-                    print(f"Error loading image {normalized_picture_path} (under path_specific_lock): {e_load}")
-                    print(f"Exception type: {type(e_load)}, repr: {repr(e_load)}")
+                    grid_log.error('Error loading image %s (under path_specific_lock): %s', normalized_picture_path, e_load)
+                    grid_log.error('Exception type: %s, repr: %s', type(e_load), repr(e_load))
                     print(traceback.format_exc())
                     with self._dict_lock: # Remove from image_load_locks if loading failed
                         if self.image_load_locks.get(cache_key) == path_specific_lock:
@@ -16696,8 +16379,8 @@ class ConfigViewerApp:
             
         except Exception as e_outer:
             path_for_error_msg = picture_path if 'picture_path' in locals() and picture_path is not None else "Unknown"
-            print(f"Outer error in load_and_display_image for {path_for_error_msg}: {e_outer}")
-            print(f"Exception type: {type(e_outer)}, repr: {repr(e_outer)}")
+            grid_log.error('Outer error in load_and_display_image for %s: %s', path_for_error_msg, e_outer)
+            grid_log.error('Exception type: %s, repr: %s', type(e_outer), repr(e_outer))
             print(traceback.format_exc())
 
 
@@ -16723,7 +16406,7 @@ class ConfigViewerApp:
                 )
 
          except Exception as e:
-             print(f"Error creating PhotoImage or updating UI: {e}")
+             grid_log.error('Error creating PhotoImage or updating UI: %s', e)
              
              
 
@@ -16731,18 +16414,25 @@ class ConfigViewerApp:
 
 
     def _add_to_cache(self, cache_key, photo_image):
-        """Adds a PhotoImage to the LRU cache, evicting the least recently used if full."""
-        with self.cache_access_lock: # <<< Protect all cache modifications
-            self.image_cache[cache_key] = photo_image # Add/update item
-            self.image_cache.move_to_end(cache_key)   # Mark as recently used
-
-            if len(self.image_cache) > self.image_cache_capacity:
-
-                lru_key, _ = self.image_cache.popitem(last=False) 
-                print(f"DEBUG: _add_to_cache - Evicted {lru_key} due to capacity.") # Log which key was evicted
-                self.eviction_count += 1
-                if not self.eviction_timer_running:
-                    self._start_eviction_timer()
+        """Adds a PhotoImage to the LRU cache, evicting the least recently used until it is back under its byte ceiling."""
+        evicted = self.image_cache.put(cache_key, photo_image)
+        for lru_key, _ in evicted:
+            grid_log.debug('DEBUG: _add_to_cache - Evicted %s due to capacity.', lru_key) # Log which key was evicted
+        if evicted:
+            self.eviction_count += len(evicted)
+            if not self.eviction_timer_running:
+                self._start_eviction_timer()
+
+    def get_image_cache_stats(self):
+        """Hit/miss/eviction counters, current bytes and ceiling of the in-memory image cache."""
+        return self.image_cache.stats()
+
+    def set_image_cache_max_bytes(self, max_bytes):
+        """Changes the in-memory image cache ceiling; evicts right away if the cache is over it."""
+        self.image_cache_max_bytes = max_bytes
+        evicted = self.image_cache.set_max_bytes(max_bytes)
+        if evicted:
+            print(f"DEBUG: set_image_cache_max_bytes - Evicted {len(evicted)} items to fit {max_bytes / (1024 * 1024):.0f} MB.")
 
 
     def _start_eviction_timer(self):
@@ -16754,7 +16444,8 @@ class ConfigViewerApp:
     def _print_eviction_summary(self):
         """Prints the eviction summary and resets the counter and timer flag."""
         if self.eviction_count > 0:
-            print(f"DEBUG: _add_to_cache - Evicted {self.eviction_count} items in the last {self.eviction_batch_delay_ms/1000} seconds.")
+            stats = self.image_cache.stats()
+            grid_log.debug('DEBUG: _add_to_cache - Evicted %s items in the last %s seconds. Image cache: %s items, %.1f of %.0f MB, %s hits, %s misses, %s evictions.', self.eviction_count, self.eviction_batch_delay_ms/1000, stats['entries'], stats['bytes'] / (1024 * 1024), stats['max_bytes'] / (1024 * 1024), stats['hits'], stats['misses'], stats['evictions'])
             self.eviction_count = 0
         self.eviction_timer_running = False # Reset timer flag - allows timer to be restarted on next eviction
 
@@ -16770,8 +16461,18 @@ class ConfigViewerApp:
         if not parent_frame.winfo_exists():
             return
 
+        # --- NEW: Virtualized main grid - drop results for an item the slot no longer shows ---
+        if hasattr(parent_frame, "virtual_grid_item") and not self._main_grid_slot_shows(parent_frame, picture_path, folder_name):
+            return
+
         # --- Image Label (similar to details view) ---
-        lbl_img = tk.Label(parent_frame, image=photo, cursor="hand2", bg="white") # <--- DARKER GRAY bg for lbl_img, MODIFIED HERE
+        # Pool slots keep their labels between items, only their content and bindings change
+        lbl_img = getattr(parent_frame, "main_grid_lbl_img", None)
+        if lbl_img is None:
+            lbl_img = tk.Label(parent_frame, image=photo, cursor="hand2", bg="white") # <--- DARKER GRAY bg for lbl_img, MODIFIED HERE
+            parent_frame.main_grid_lbl_img = lbl_img
+        else:
+            lbl_img.config(image=photo)
         lbl_img.image = photo
         lbl_img.pack(padx=0, pady=0)
 
@@ -16827,23 +16528,29 @@ class ConfigViewerApp:
         label_text_with_count = f"{combined_text} - [{subgrid_item_count}]" # Append count in brackets
 
 
-        lbl_info = tk.Label(
-            parent_frame,
-            text=label_text_with_count, # Use text with count
-            wraplength=200, #label length, don't remove current
-            justify="center",
-            fg=text_color, # Use DEFAULT text color here - HIGHLIGHTING IS HANDLED SEPARATELY
-            font=("Segoe UI", 10+self.font_size_add, "bold"),
-            cursor="hand2",
-            bg="#444444", # <--- DARKER GRAY bg for lbl_info
-            height=3,
-            anchor=tk.N
-        )
+        lbl_info = getattr(parent_frame, "main_grid_lbl_info", None)
+        if lbl_info is None:
+            lbl_info = tk.Label(
+                parent_frame,
+                text=label_text_with_count, # Use text with count
+                wraplength=200, #label length, don't remove current
+                justify="center",
+                fg=text_color, # Use DEFAULT text color here - HIGHLIGHTING IS HANDLED SEPARATELY
+                font=("Segoe UI", 10+self.font_size_add, "bold"),
+                cursor="hand2",
+                bg="#444444", # <--- DARKER GRAY bg for lbl_info
+                height=3,
+                anchor=tk.N
+            )
+            parent_frame.main_grid_lbl_info = lbl_info
+            self.main_grid_labels.append(lbl_info) # Append lbl_info to the list
+        else:
+            lbl_info.config(text=label_text_with_count, fg=text_color, font=("Segoe UI", 10+self.font_size_add, "bold"))
         if not self.omit_label:
             lbl_info.pack(padx=00, pady=(2, 0))
+        else:
+            lbl_info.pack_forget()
 
-
-        self.main_grid_labels.append(lbl_info) # Append lbl_info to the list
         #print(f"DEBUG: create_main_item_widgets - Added label widget to self.main_grid_labels - Label Widget ID: {id(lbl_info)}, List Size: {len(self.main_grid_labels)}") # Debug - List Add
 
 
@@ -16902,11 +16609,11 @@ class ConfigViewerApp:
             search_query = self.search_var.get().strip().lower()
             combined_text_lower = lbl_info.cget("text").lower()
             if self.is_search_results_window_active: # <-- NEW: Check if in Search Results window
-                print("DEBUG: on_hover_leave - Inside Search Results Window block. Removing highlight.") # <-- DEBUG PRINT
+                grid_log.debug('DEBUG: on_hover_leave - Inside Search Results Window block. Removing highlight.') # <-- DEBUG PRINT
                 lbl_info.config(fg=lbl_info.default_fg_color) # Always remove highlight in Search Results
                 lbl_img.config(bg=lbl_img.default_bg_color)
             elif search_query and search_query in combined_text_lower: # Original logic for main window
-                print("DEBUG: on_hover_leave - Inside Main Window block (search match). Keeping yellow highlight.") # <-- DEBUG PRINT
+                grid_log.debug('DEBUG: on_hover_leave - Inside Main Window block (search match). Keeping yellow highlight.') # <-- DEBUG PRINT
 
 
                 # Check if lbl_img is already red before changing bg
@@ -17079,167 +16786,42 @@ class ConfigViewerApp:
 
             is_cached = normalized_picture_path in self.image_cache # Check CACHE using NORMALIZED PATH
             is_placeholder_img = self.is_placeholder(picture_path)
-            # print(f"  Checking: {os.path.basename(picture_path)}, Normalized Path: {normalized_picture_path}, Cached: {is_cached}, Placeholder: {is_placeholder_img}")
-            if not is_cached and not is_placeholder_img:
-                # print("    NOT all images cached - returning False")
-                return False
-        print("  All images cached (or placeholder) - returning True")
-
-
-
-
-        return True
-
-        
-    #@profile
-    def load_next_batch(self):
-
-        #print(f"@@@ ENTERING load_next_batch - pause_loading: {self.pause_loading}, category_index: {self.current_category_index}, batch_index: {self.current_batch_index}")
-        if self.scanning_win:
-            self.scanning_win.destroy()
-
- 
-        self.scanning_win = None
-        
-        if self.pause_loading:
-            # If loading is paused, try again after 100ms
-            self.master.after(100, self.load_next_batch)
-            # print("Load Next Batch - PAUSED (Main Grid - Paused Flag Active)") # Debug Print - MODIFIED message
-            return  # EXIT if loading is paused
-
-        if self.current_category_index >= len(self.category_batches):
-            # All categories loaded
-            self.canvas.config(scrollregion=self.canvas.bbox("all"))
-
-            #self.master.update_idletasks() # Ensure scrollable_frame has its new size
-            #s_frame_height = self.scrollable_frame.winfo_reqheight()
-            #s_frame_width = self.scrollable_frame.winfo_reqwidth()
-            #self.canvas.config(scrollregion=(0, 0, s_frame_width, s_frame_height))
-            #print(f"DEBUG: Manually set scrollregion to: 0, 0, {s_frame_width}, {s_frame_height}")
-            #self.canvas.update()
-
-            # Stop loading animation
-            self.stop_loading_animation()
-            self.hide_progress_bar_main() # ADDED back to hide progress bar when all done
-            # --- NEW: Call cache check AFTER loading completes ---
-            self.check_all_main_grid_images_cached()  # CALL CACHE CHECK HERE!
-
-
-
-            return
-
-        category, batches, category_subframe = self.category_batches[self.current_category_index]
-
-        # --- NEW: Check if category is hidden (collapsed) ---
-        if self.category_hidden_states.get(category, False):
-            print(f"DEBUG: load_next_batch - Category '{category}' is collapsed. Skipping image loading.")
-            self.current_category_index += 1  # Move to the next category
-            self.current_batch_index = 0      # Reset batch index for the next category
-            self.current_main_batch_index_in_sequence = 0 # Reset sequence index for new category
-            self.master.after(0, self.load_next_batch) # Schedule next category batch
-            return  # Skip loading for this category
-
-        if self.current_batch_index >= len(batches):
-            # Finished batches in current category, move to next category
-            self.current_category_index += 1
-            self.current_batch_index = 0
-            self.current_main_batch_index_in_sequence = 0 # Reset sequence index for new category
-            self.master.after(0, self.load_next_batch)  # Schedule next category batch
-            return
-
-        batch = batches[self.current_batch_index]
-        self.current_batch_index += 1
-
-
-        if self.dev_mode_check:
-            try:
-                with open(self.dev_mode_check, 'r', encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith("self.main_grid_batch_sizes = "):
-                            try:
-                                # Extract the string part representing the list
-                                value_str = line.split('= ', 1)[1].strip()
-
-
-                                import ast
-                                self.main_grid_batch_sizes = ast.literal_eval(value_str)
-
-
-                            except (IndexError, ValueError, SyntaxError) as e_parse:
-
-                                print(f"Error parsing line '{line.strip()}': {e_parse}")
-
-
-            except Exception as e:
-                print(f"Error reading {self.dev_mode_check}: {e}.")
-
+            # print(f"  Checking: {os.path.basename(picture_path)}, Normalized Path: {normalized_picture_path}, Cached: {is_cached}, Placeholder: {is_placeholder_img}")
+            if not is_cached and not is_placeholder_img:
+                # print("    NOT all images cached - returning False")
+                return False
+        print("  All images cached (or placeholder) - returning True")
 
-        # --- NEW: Dynamic Batch Size Logic + Cached Images Batching ---
-        if self.all_main_grid_images_cached:
-            batch_size_to_load = 50 # Load in larger batches if all cached
-            print("  Using batch_size_to_load = 50 (all_main_grid_images_cached is True)") # ADDED
 
 
-        else:    
-            if self.current_main_batch_index_in_sequence < len(self.main_grid_batch_sizes):
-                batch_size_to_load = self.main_grid_batch_sizes[self.current_main_batch_index_in_sequence]
-                print(f"  Using batch_size_to_load = {batch_size_to_load} (dynamic batch size sequence)") # ADDED
-            else:
-                batch_size_to_load = self.default_batch_size # Use default after sequence
-                print(f"  Using batch_size_to_load = {batch_size_to_load} (default batch size)") # ADDED
 
-        items_to_load_this_time = batch[:batch_size_to_load] # Load only up to batch_size_to_load items
-        batch = batch[batch_size_to_load:] # Update batch to remove loaded items - for next iteration
-        batches[self.current_batch_index - 1] = batch # Update the batches list in category_batches
+        return True
 
-        if not items_to_load_this_time: # If no more items to load in this batch (batch is now empty)
-            self.current_main_batch_index_in_sequence += 1 # Move to next batch size in sequence
-            self.master.after(100, self.load_next_batch) # Schedule next batch load immediately
-            return
+        
+    #@profile
+    def load_next_batch(self):
+        """
+        Renders the virtualized main grid: binds the items in view to the slot pool and
+        finishes the loading UI. update_grid_layout calls this once; the pause/resume paths
+        (details window, resize) call it again to resume the main grid.
+        """
+        if self.scanning_win:
+            self.scanning_win.destroy()
 
-        total_items_in_grid = sum(len(b) for _, batches, _ in self.category_batches for b in batches)
-        items_loaded_so_far = 0
-
-        # Recalculate items_loaded_so_far more accurately
-        for cat_index in range(self.current_category_index): # Loop through previous categories
-            cat_batches = self.category_batches[cat_index][1] # Get batches for category
-            for bat in cat_batches:
-                if isinstance(bat, list):
-                    items_loaded_so_far += len(bat)
-        # Add items from already loaded batches in the current category
-        current_cat_batches = self.category_batches[self.current_category_index][1] # Get batches for current category
-        for batch_index in range(self.current_batch_index - 1): # Loop through previous batches in current category
-            bat = current_cat_batches[batch_index]
-            if isinstance(bat, list):
-                items_loaded_so_far += len(bat)
-        # Add items to be loaded in this batch
-        items_loaded_so_far += len(items_to_load_this_time)
-
-        self.update_progress_bar_main(items_loaded_so_far, total_items_in_grid)
-
-        for item in items_to_load_this_time: # Iterate over items to load in THIS batch iteration
-            if item is None:
-                continue
-            if isinstance(item, dict) and 'configs' in item:
-                for config in item['configs']:
-                    self.load_image_item(config, category_subframe, category)
-            else:
-                if len(item) == 5:
-                    picture_path, spawn_cmd, zip_file, info_data, folder_name = item
-                    self.load_image_item(item, category_subframe, category)
-                else:
-                    continue
+ 
+        self.scanning_win = None
+        
+        if self.pause_loading:
+            # If loading is paused, try again after 100ms
+            self.master.after(100, self.load_next_batch)
+            return  # EXIT if loading is paused
 
-        self.current_main_batch_index_in_sequence += 1 # Move to next batch size in sequence
+        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        self.refresh_main_grid_viewport()
 
-        # Schedule the next batch after a short delay (e.g., 150 milliseconds)
-        if self.all_main_grid_images_cached:
-            self.master.after(150, self.load_next_batch) # Load next batch immediately if all cached
-            # print("load_next_batch EXIT (Scheduled next batch - all cached - after 0ms)") # ADDED
-        else:
-            self.master.after(150, self.load_next_batch) # Schedule the next batch after a short delay (e.g., 150 milliseconds)
-            # print("load_next_batch EXIT (Scheduled next batch - not all cached - after 150ms)") # ADDED			
+        # Stop loading animation
+        self.stop_loading_animation()
+        self.hide_progress_bar_main()
     
     
 
@@ -17249,38 +16831,23 @@ class ConfigViewerApp:
     def load_next_batch_details(self):
         # Added print at start for easier debugging of sequence
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- load_next_batch_details CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("load_next_batch_details")
 
 
 
-        print(f"@@@ load_next_batch_details START - Index: {self.current_details_batch_index}, Seq Index: {self.current_details_batch_index_in_sequence}, Placed: {self.total_details_items_placed}, Pause: {self.pause_loading}")
+        grid_log.debug('@@@ load_next_batch_details START - Index: %s, Seq Index: %s, Placed: %s, Pause: %s', self.current_details_batch_index, self.current_details_batch_index_in_sequence, self.total_details_items_placed, self.pause_loading)
 
         if self.pause_loading:
             self.details_pause_counter += 1
-            print(f"Load Next Batch Details - PAUSED (Details Window - Paused Flag Active) - Count: {self.details_pause_counter}")
+            grid_log.debug('Load Next Batch Details - PAUSED (Details Window - Paused Flag Active) - Count: %s', self.details_pause_counter)
             # Simplified pause logic slightly - adjust threshold as needed
             # NOTE: Threshold was mentioned as potentially lower than 10 earlier
             PAUSE_THRESHOLD = 2 # Or your actual lower value
             if self.details_pause_counter > PAUSE_THRESHOLD:
-                print(f"DEBUG: load_next_batch_details - PAUSE COUNT EXCEEDED THRESHOLD ({PAUSE_THRESHOLD}). FORCING UNPAUSE.")
+                grid_log.debug('DEBUG: load_next_batch_details - PAUSE COUNT EXCEEDED THRESHOLD (%s). FORCING UNPAUSE.', PAUSE_THRESHOLD)
                 self.pause_loading = False
                 self.details_pause_counter = 0
-                print("DEBUG: load_next_batch_details - pause_loading FORCE-SET to FALSE, counter RESET.")
+                grid_log.debug('DEBUG: load_next_batch_details - pause_loading FORCE-SET to FALSE, counter RESET.')
                 # Continue processing immediately instead of scheduling again
             else:
                 # Reschedule the check if still paused
@@ -17296,7 +16863,7 @@ class ConfigViewerApp:
 
         # Check if all batches for the current page have been processed
         if self.current_details_batch_index >= len(self.details_batches):
-            print(f"DEBUG: load_next_batch_details - All batches for current page (Index {self.current_details_batch_index}) loaded.")
+            grid_log.debug('DEBUG: load_next_batch_details - All batches for current page (Index %s) loaded.', self.current_details_batch_index)
             if hasattr(self, 'details_canvas_sub') and self.details_canvas_sub and self.details_canvas_sub.winfo_exists():
                 # Update scroll region one last time at the end
                 try:
@@ -17304,34 +16871,34 @@ class ConfigViewerApp:
                     frame_bbox = self.details_scrollable_frame.bbox("all")
                     if frame_bbox:
                         self.details_canvas_sub.config(scrollregion=frame_bbox)
-                        print(f"DEBUG: Final scrollregion update: {frame_bbox}")
+                        grid_log.debug('DEBUG: Final scrollregion update: %s', frame_bbox)
                     else: # Fallback
                         self.details_canvas_sub.config(scrollregion=self.details_canvas_sub.bbox("all"))
-                        print(f"DEBUG: Final scrollregion update (canvas fallback)")
+                        grid_log.debug('DEBUG: Final scrollregion update (canvas fallback)')
                 except Exception as e:
-                    print(f"ERROR during final scrollregion update: {e}")
+                    grid_log.error('ERROR during final scrollregion update: %s', e)
             self.stop_details_loading_animation()
             self.hide_progress_bar_details()
 
 
             # ---vvv ADDED BACK - Start vvv---
             # Resume main grid loading after a delay, similar to the old version's behavior.
-            print("DEBUG: load_next_batch_details - Details batch load complete. Resuming main grid loading in 3 seconds...")
+            grid_log.debug('DEBUG: load_next_batch_details - Details batch load complete. Resuming main grid loading in 3 seconds...')
 
             def resume_main_grid_loading():
                 # Check if the necessary attributes/methods exist before using them
                 if hasattr(self, 'pause_loading'):
-                    print("DEBUG: resume_main_grid_loading - Setting pause_loading = False")
+                    grid_log.debug('DEBUG: resume_main_grid_loading - Setting pause_loading = False')
                     self.pause_loading = False
                 else:
-                    print("WARN: resume_main_grid_loading - self.pause_loading attribute not found.")
+                    grid_log.warning('WARN: resume_main_grid_loading - self.pause_loading attribute not found.')
 
                 if hasattr(self, 'load_next_batch') and callable(getattr(self, 'load_next_batch')):
-                    print("DEBUG: resume_main_grid_loading - Calling self.load_next_batch()")
+                    grid_log.debug('DEBUG: resume_main_grid_loading - Calling self.load_next_batch()')
                     self.load_next_batch()
-                    print("DEBUG: resume_main_grid_loading - Main grid loading RESUMED (after 3-second delay).")
+                    grid_log.debug('DEBUG: resume_main_grid_loading - Main grid loading RESUMED (after 3-second delay).')
                 else:
-                    print("ERROR: resume_main_grid_loading - self.load_next_batch method not found or not callable.")
+                    grid_log.error('ERROR: resume_main_grid_loading - self.load_next_batch method not found or not callable.')
 
             # Schedule the resumption using a 3000ms (3 second) delay
             self.master.after(3000, resume_main_grid_loading)
@@ -17339,7 +16906,7 @@ class ConfigViewerApp:
 
 
 
-            print("DEBUG: load_next_batch_details - Details page batch load complete. Main grid resume scheduled.")
+            grid_log.debug('DEBUG: load_next_batch_details - Details page batch load complete. Main grid resume scheduled.')
             # Maybe lift windows one last time?
             if hasattr(self, 'details_window') and self.details_window and self.details_window.winfo_exists():
                 self.details_window.lift()
@@ -17349,20 +16916,20 @@ class ConfigViewerApp:
         try:
             # Check index validity before accessing
             if not (0 <= self.current_details_batch_index < len(self.details_batches)):
-                print(f"ERROR: Invalid current_details_batch_index {self.current_details_batch_index} vs len {len(self.details_batches)}. Aborting.")
+                grid_log.error('ERROR: Invalid current_details_batch_index %s vs len %s. Aborting.', self.current_details_batch_index, len(self.details_batches))
                 self.stop_details_loading_animation()
                 self.hide_progress_bar_details()
                 return
             current_main_batch = self.details_batches[self.current_details_batch_index]
             # Ensure it's a list (might become None or empty if modified unexpectedly)
             if not isinstance(current_main_batch, list):
-                print(f"ERROR: Batch at index {self.current_details_batch_index} is not a list ({type(current_main_batch)}). Assuming empty.")
+                grid_log.error('ERROR: Batch at index %s is not a list (%s). Assuming empty.', self.current_details_batch_index, type(current_main_batch))
                 current_main_batch = []
                 self.details_batches[self.current_details_batch_index] = current_main_batch # Correct it
 
         except IndexError:
             # This shouldn't happen with the check above, but added safety
-            print(f"ERROR: IndexError accessing details_batches at index {self.current_details_batch_index}. Aborting batch load.")
+            grid_log.error('ERROR: IndexError accessing details_batches at index %s. Aborting batch load.', self.current_details_batch_index)
             self.stop_details_loading_animation()
             self.hide_progress_bar_details()
             return
@@ -17377,12 +16944,12 @@ class ConfigViewerApp:
 
         # Update the main batch in the list with the remaining items
         self.details_batches[self.current_details_batch_index] = remaining_batch_items
-        print(f"  DEBUG: Slice taken: {len(items_to_load_this_time)} items. Remaining in batch[{self.current_details_batch_index}]: {len(remaining_batch_items)}")
+        grid_log.debug('  DEBUG: Slice taken: %s items. Remaining in batch[%s]: %s', len(items_to_load_this_time), self.current_details_batch_index, len(remaining_batch_items))
 
         # If the slice is empty, it means the current main batch was already exhausted
         # Move to the next main batch immediately
         if not items_to_load_this_time:
-            print(f"  DEBUG: No items in this slice (batch {self.current_details_batch_index} likely exhausted). Moving to next batch.")
+            grid_log.debug('  DEBUG: No items in this slice (batch %s likely exhausted). Moving to next batch.', self.current_details_batch_index)
             self.current_details_batch_index += 1
             self.current_details_batch_index_in_sequence = 0 # Reset sequence for the new main batch
             self.master.after(50, self.load_next_batch_details) # Schedule next check quickly
@@ -17399,28 +16966,28 @@ class ConfigViewerApp:
         # --- Check/Recalculate layout BEFORE the loop ---
         try:
             if not hasattr(self, 'details_columns') or self.details_columns is None or not isinstance(self.details_columns, tuple) or len(self.details_columns) < 1:
-                print("WARN: self.details_columns is not valid before loop. Attempting recalculation.")
+                grid_log.warning('WARN: self.details_columns is not valid before loop. Attempting recalculation.')
                 # Ensure canvas exists and has a width
                 if hasattr(self, 'details_canvas_sub') and self.details_canvas_sub and self.details_canvas_sub.winfo_exists() and self.details_canvas_sub.winfo_width() > 0:
                     canvas_width = self.details_canvas_sub.winfo_width() - 20 # Example margin
                     potential_cols, potential_pad = self.calculate_columns_for_width(canvas_width, is_details=True)
                     self.details_columns = (potential_cols, potential_pad)
                     self.details_column_padding = potential_pad
-                    print(f"  Recalculated details_columns: {self.details_columns}, padding: {self.details_column_padding}")
+                    grid_log.debug('  Recalculated details_columns: %s, padding: %s', self.details_columns, self.details_column_padding)
                 else:
-                    print("ERROR: Cannot recalculate columns, canvas invalid or width=0. Using fallback.")
+                    grid_log.error('ERROR: Cannot recalculate columns, canvas invalid or width=0. Using fallback.')
                     # Fallback to prevent crash - adjust as needed
                     self.details_columns = (getattr(self, 'default_columns', 4), getattr(self, 'default_padding', 5))
                     self.details_column_padding = self.details_columns[1]
 
             # Ensure padding exists even if columns were valid
             elif not hasattr(self, 'details_column_padding') or self.details_column_padding is None:
-                print("WARN: details_column_padding was missing, setting from details_columns tuple.")
+                grid_log.warning('WARN: details_column_padding was missing, setting from details_columns tuple.')
                 self.details_column_padding = self.details_columns[1]
 
         except Exception as layout_err:
-            print(f"!!!!!!!!!! HIT LAYOUT PRE-CHECK EXCEPTION !!!!!!!!!!!!!!")
-            print(f"ERROR: Failed during layout pre-check/recalculation: {layout_err}. Aborting slice.")
+            grid_log.debug('!!!!!!!!!! HIT LAYOUT PRE-CHECK EXCEPTION !!!!!!!!!!!!!!')
+            grid_log.error('ERROR: Failed during layout pre-check/recalculation: %s. Aborting slice.', layout_err)
             # Avoid infinite loop if canvas width is consistently bad
             # Maybe stop loading for this page?
             # For now, schedule next attempt but log error clearly.
@@ -17431,19 +16998,19 @@ class ConfigViewerApp:
         # --- Process items in the current slice ---
         for idx_in_batch, item in enumerate(items_to_load_this_time):
             if item is None:
-                print(f"WARN: Skipping None item at index {idx_in_batch} in slice.")
+                grid_log.warning('WARN: Skipping None item at index %s in slice.', idx_in_batch)
                 continue
 
             # Ensure item is structured as expected before unpacking
             if not isinstance(item, (list, tuple)) or len(item) != 5:
-                print(f"ERROR: Skipping malformed item: {item}")
+                grid_log.error('ERROR: Skipping malformed item: %s', item)
                 continue
 
             picture_path, spawn_cmd, zip_file, info_data, folder_name = item
 
             # Check if the target frame exists before creating item container
             if not hasattr(self, 'details_scrollable_frame') or not self.details_scrollable_frame or not self.details_scrollable_frame.winfo_exists():
-                print("ERROR: details_scrollable_frame does not exist. Aborting item processing for this slice.")
+                grid_log.error('ERROR: details_scrollable_frame does not exist. Aborting item processing for this slice.')
                 # Stop processing this slice, maybe schedule next?
                 self.master.after(100, self.load_next_batch_details)
                 return
@@ -17461,10 +17028,10 @@ class ConfigViewerApp:
 
             # Keep TypeError catch as safety, though less likely with pre-check
             except TypeError as e:
-                print(f"ERROR: TypeError in load_next_batch_details (grid calculation - total items): {e}. Retrying batch.")
+                grid_log.error('ERROR: TypeError in load_next_batch_details (grid calculation - total items): %s. Retrying batch.', e)
                 self.details_batch_retry_count += 1
                 if self.details_batch_retry_count > getattr(self, 'MAX_DETAILS_BATCH_RETRIES', 3): # Use getattr for safety
-                    print(f"ERROR: Exceeded maximum retries. Aborting.")
+                    grid_log.error('ERROR: Exceeded maximum retries. Aborting.')
                     # Consider restart or just stopping the details load
                     # self.restart_script() # Optional: if critical failure requires restart
                     return # Stop loading
@@ -17475,7 +17042,7 @@ class ConfigViewerApp:
                 failed_batch_part = items_to_load_this_time[idx_in_batch:]
                 # Prepend the failed part back to the *remaining* items for the current batch index
                 self.details_batches[self.current_details_batch_index] = failed_batch_part + current_batch_list
-                print(f"  Reverted batch state. Items to retry: {len(failed_batch_part)}. Rescheduling.")
+                grid_log.debug('  Reverted batch state. Items to retry: %s. Rescheduling.', len(failed_batch_part))
                 self.master.after(100, self.load_next_batch_details) # Reschedule the same batch/slice
                 return # Exit current execution
 
@@ -17502,14 +17069,14 @@ class ConfigViewerApp:
                     # Optional: print for debugging scroll updates
                     # print(f"DEBUG: Updated scrollregion after slice: {frame_bbox}")
             except Exception as e:
-                print(f"ERROR updating scrollregion after slice: {e}")
+                grid_log.error('ERROR updating scrollregion after slice: %s', e)
 
         # --- Advance sequence index AFTER processing slice ---
         self.current_details_batch_index_in_sequence += 1
 
         # Check if the current main batch is now empty AFTER taking the slice
         if not self.details_batches[self.current_details_batch_index]:
-            print(f"  DEBUG: Batch {self.current_details_batch_index} is now empty. Moving to next batch index.")
+            grid_log.debug('  DEBUG: Batch %s is now empty. Moving to next batch index.', self.current_details_batch_index)
             self.current_details_batch_index += 1
             self.current_details_batch_index_in_sequence = 0 # Reset sequence for the new main batch
 
@@ -17541,12 +17108,12 @@ class ConfigViewerApp:
                 self.update_details_sidebar_content(info_data, picture_path, zip_file, folder_name)
                 
                 self.no_configs_messagebox_condition = False # Reset flag
-                print("DEBUG:  @@@ CONDITION MET --- no_configs_messagebox_condition ---  load_next_batch_details - Updated details sidebar for LAST item in SLICE.")
+                grid_log.debug('DEBUG:  @@@ CONDITION MET --- no_configs_messagebox_condition ---  load_next_batch_details - Updated details sidebar for LAST item in SLICE.')
             else:
-                print("WARN: Could not update sidebar, last item in slice was invalid.")
+                grid_log.warning('WARN: Could not update sidebar, last item in slice was invalid.')
         # --- End Update Sidebar ---
 
-        print("--- load_next_batch_details() EXIT (Scheduled next) ---\n")
+        grid_log.debug('--- load_next_batch_details() EXIT (Scheduled next) ---\n')
 #        '''
 
 
@@ -17555,55 +17122,55 @@ class ConfigViewerApp:
 ############
         
         
-    def load_image_item(self, item, category_subframe, category):
-        # Extract item details
-        if isinstance(item, dict) and 'configs' in item:
-            config = item['configs'][0]  # Adjust if necessary
-            picture_path, spawn_cmd, zip_file, info_data, folder_name = config
-        else:
-            picture_path, spawn_cmd, zip_file, info_data, folder_name = item
+    # ------------------------------------------------------------
+    # Virtualized Main Grid
+    # ------------------------------------------------------------
+    def _create_main_grid_slot(self):
+        """Adds one item widget to the main grid slot pool."""
+        slot = tk.Frame(self.scrollable_frame, bg="#444444")
+        slot.virtual_grid_key = None # (category, index in category) currently shown
+        slot.virtual_grid_item = None
+        slot.virtual_grid_position = None
+        self.main_grid_slot_pool.append(slot)
+        return slot
+
+    def _main_grid_slot_shows(self, slot, picture_path, folder_name):
+        """True if the pool slot is still bound to the item with this picture and folder."""
+        item = slot.virtual_grid_item
+        if item is None or item[4] != folder_name or not item[0] or not picture_path:
+            return False
+        return item[0] == picture_path or os.path.normpath(os.path.abspath(item[0])) == os.path.normpath(os.path.abspath(picture_path))
 
-        # Retrieve current image count for the category
-        count = self.image_counts.get(category, 0)
-        row = count // self.columns[0]  # Access the first element of the tuple (number of columns)
-        col = count % self.columns[0]  # Access the first element of the tuple (number of columns)
+    def _bind_main_grid_slot(self, slot, key, item):
+        """
+        Shows item in a pool slot. A memory-cached picture is shown right away; otherwise
+        the slot shows a blank picture with the item's label and the picture is loaded in
+        the executor like before.
+        """
+        picture_path, spawn_cmd, zip_file, info_data, folder_name = item
+        category = key[0]
+        slot.virtual_grid_key = key
+        slot.virtual_grid_item = item
 
-        # **CHECK IF PARENT EXISTS BEFORE CREATING CHILD**
-        if not category_subframe.winfo_exists():
-            print(f"Warning: Parent frame {category_subframe} no longer exists BEFORE frame creation, skipping item creation.") # DEBUG - BEFORE
+        if picture_path is None:
+            for child in slot.winfo_children():
+                child.pack_forget()
             return
 
-        # print(f"Debug: Attempting to create item_frame in {category_subframe}") # DEBUG - ATTEMPTING CREATE
-
-        # Create the container for the image and labels
-        try:
-            item_frame = tk.Frame(category_subframe, bg="#444444") # Frame creation
-            # print(f"Debug: item_frame created successfully: {item_frame}") # DEBUG - AFTER CREATE
-        except Exception as frame_create_error:
-            print(f"Error: Failed to create item_frame in {category_subframe}: {frame_create_error}") # DEBUG - CREATE ERROR
-            return # Exit if frame creation failed
-
-
-        item_frame.grid(row=row, column=col, padx=self.column_padding, pady=5, sticky="n") # USE DYNAMIC PADDING
-
-
-        # Increment the image count for the category
-        self.image_counts[category] += 1
-
-        # Submit image loading to the executor
-
-        ConfigViewerApp.item_number += 1
-
-
-
+        cache_key = os.path.normpath(os.path.abspath(picture_path))
+        photo = self.image_cache.get(cache_key) # Updates LRU on a hit
 
+        if photo is not None:
+            self.create_main_item_widgets(slot, photo, None, zip_file, spawn_cmd, info_data, picture_path, folder_name, category)
+            return
 
-        print(f"DEBUG: load_image_item  at  item_number = {ConfigViewerApp.item_number}, picture_path = {picture_path}")
-        
+        if self.main_grid_placeholder_photo is None:
+            self.main_grid_placeholder_photo = tk.PhotoImage(master=self.master, width=250, height=140)
+        self.create_main_item_widgets(slot, self.main_grid_placeholder_photo, None, zip_file, spawn_cmd, info_data, picture_path, folder_name, category)
         self.executor.submit(
             self.load_and_display_image,
             picture_path,
-            item_frame,
+            slot,
             zip_file,
             spawn_cmd,
             info_data,
@@ -17611,6 +17178,76 @@ class ConfigViewerApp:
             category
         )
 
+    def _place_main_grid_slot(self, slot, x, y):
+        if slot.virtual_grid_position != (x, y):
+            slot.place(x=x, y=y)
+            slot.virtual_grid_position = (x, y)
+
+    def _release_main_grid_slot(self, slot):
+        slot.place_forget()
+        slot.virtual_grid_key = None
+        slot.virtual_grid_item = None
+        slot.virtual_grid_position = None
+
+    def _measure_main_grid_cell(self, key, item):
+        """
+        Returns the (width, height) of a main grid item widget, measured on a pool slot
+        bound to item. Only re-measured when the font size or label visibility changes.
+        """
+        measure_key = (self.font_size_add, self.omit_label)
+        if self.main_grid_cell_size and self.main_grid_cell_size[2] == measure_key:
+            return self.main_grid_cell_size[:2]
+
+        slot = self.main_grid_slot_pool[0] if self.main_grid_slot_pool else self._create_main_grid_slot()
+        self._bind_main_grid_slot(slot, key, item)
+        slot.update_idletasks()
+        size = (slot.winfo_reqwidth(), slot.winfo_reqheight())
+        grid_log.debug('DEBUG: _measure_main_grid_cell - item widget size %s for font_size_add=%s, omit_label=%s', size, self.font_size_add, self.omit_label)
+        self.main_grid_cell_size = size + (measure_key,)
+        return size
+
+    def schedule_main_grid_viewport_refresh(self):
+        """Coalesces scroll events into one viewport refresh per idle cycle."""
+        if self.main_grid_viewport_refresh_id is None and self.main_grid_layout is not None:
+            self.main_grid_viewport_refresh_id = self.master.after_idle(self.refresh_main_grid_viewport)
+
+    def refresh_main_grid_viewport(self):
+        """
+        Binds the main grid items intersecting the viewport (plus overscan rows) to pool
+        slots. Slots already showing the right item are only moved if needed, the others
+        are rebound, and slots the view doesn't need are unplaced. New slots are created
+        only when the viewport needs more than the pool holds, so the widget count follows
+        the window size rather than the number of matching vehicles.
+        """
+        self.main_grid_viewport_refresh_id = None
+        layout = self.main_grid_layout
+        if layout is None or not self.canvas or not self.canvas.winfo_exists():
+            return
+
+        view_top = self.canvas.canvasy(0)
+        view_bottom = view_top + self.canvas.winfo_height()
+        wanted = {}
+        for category, index, item, x, y in layout.visible_cells(view_top, view_bottom):
+            wanted[(category, index)] = (item, x, y)
+
+        free_slots = []
+        for slot in self.main_grid_slot_pool:
+            cell = wanted.get(slot.virtual_grid_key)
+            if cell is not None and cell[0] is slot.virtual_grid_item:
+                del wanted[slot.virtual_grid_key]
+                self._place_main_grid_slot(slot, cell[1], cell[2])
+            else:
+                free_slots.append(slot)
+
+        for key, (item, x, y) in wanted.items():
+            slot = free_slots.pop() if free_slots else self._create_main_grid_slot()
+            self._bind_main_grid_slot(slot, key, item)
+            self._place_main_grid_slot(slot, x, y)
+
+        for slot in free_slots:
+            if slot.virtual_grid_position is not None:
+                self._release_main_grid_slot(slot)
+
 
 
 
@@ -17619,10 +17256,11 @@ class ConfigViewerApp:
         Loads and displays an image item in the details window's grid layout.
         Applies dynamic padding based on the current layout configuration.
         (Modified to extract and pass folder_name, zip_file_base_name, config_name)
-        (MODIFIED to use disk cache) <--- ADDED DISK CACHE COMMENT
+        The picture is read through the thumbnail cache in the executor; only the PhotoImage
+        is created on the Tk thread, batched with other finished pictures (_flush_details_photos).
         """
 
-        print("\n--- load_image_item_details() DEBUG ENTRY ---") # <--- DEBUG ENTRY
+        grid_log.debug('\n--- load_image_item_details() DEBUG ENTRY ---') # <--- DEBUG ENTRY
 
         picture_path, spawn_cmd, zip_file, info_data, folder_name = item # folder_name is ALREADY unpacked here
 
@@ -17636,69 +17274,73 @@ class ConfigViewerApp:
             picture_path = os.path.join(self.script_dir, "data/MissingCustomConfigPic.png")
 
         try:
-            # --- Normalize picture_path ---
-            normalized_picture_path = os.path.normpath(os.path.abspath(picture_path))
-            cache_key = normalized_picture_path # Use normalized path as cache key
-
-            # --- NEW: Check Disk Cache FIRST (for details images too) ---
-            disk_cache_path = os.path.join(self.disk_image_cache_dir, os.path.basename(cache_key))
-            if os.path.exists(disk_cache_path):
-                #print(f"DEBUG: load_image_item_details - Disk Cache HIT for: {picture_path}") # Debug print - disk cache hit
-                try:
-                    img = Image.open(disk_cache_path).convert("RGB") # Load from disk cache
-                    photo = ImageTk.PhotoImage(img)
-                    pil_image = img.copy() # Create PIL copy
-                    # Note: No in-memory cache update for details images in this version (as requested)
-                    if container.winfo_exists():
-                        self.master.after(
-                            0,
-                            lambda: self.create_details_item_widgets(
-                                container, photo, pil_image, spawn_cmd, info_data, zip_file, picture_path, folder_name, zip_file_base_name, config_name
-                            )
-                        )
-                    return # Exit after using disk cached image
-                except Exception as e_disk_load:
-                    print(f"Warning: Error loading from disk cache (details) {disk_cache_path}: {e_disk_load}. Falling back to original load.") # Fallback message
-
-            # --- If no disk cache hit, load from original path ---
-            img = Image.open(picture_path).convert("RGB")
-            img = img.resize((250, 140), self.RESAMPLE_FILTER) # SUBGRID IMAGES
-            pil_image = img.copy()
-            photo = ImageTk.PhotoImage(pil_image)
-
-            # --- NEW: Save to Disk Cache (for details images too) ---
-            disk_cache_path = os.path.join(self.disk_image_cache_dir, os.path.basename(cache_key))
-            try:
-                #pil_image.save(disk_cache_path, "PNG") # Save to disk cache
-                #print(f"DEBUG: Saved details image to disk cache: {disk_cache_path}") # Debug print - disk cache save
-                #disabling cache
-                pass
-            except Exception as e_save:
-                print(f"Warning: Error saving details image to disk cache {disk_cache_path}: {e_save}") # Warning message on save error
-            # --- NEW: Save to Disk Cache (for details images too) ---
+            self.executor.submit(
+                self._decode_details_image,
+                self.details_image_generation,
+                (container, spawn_cmd, info_data, zip_file, picture_path, folder_name, zip_file_base_name, config_name)
+            )
+            grid_log.debug('--- load_image_item_details() DEBUG EXIT ---\n') # <--- DEBUG EXIT
 
+        except Exception as e:
+            grid_log.error('Error loading subgrid image %s: %s', picture_path, e)
 
-            # --- NEW: Check pause_loading and queue Details UI update if paused ---
-            if self.pause_loading:
-                print(f"Queueing Details UI update for {os.path.basename(picture_path)} - Loading PAUSED (Details)") # Debug Print
-                self.details_grid_skipped_updates_queue.append((container, photo, pil_image, spawn_cmd, info_data, zip_file, picture_path, folder_name, zip_file_base_name, config_name)) # Queue update args - ADDED folder_name, zip_file_base_name, config_name
-                return  # EXIT and don't schedule Details UI update NOW
-            # --- END: Pause Check and Queue ---
+    def _decode_details_image(self, generation, widget_args):
+        """Executor thread: decodes/resizes one details picture and queues it for _flush_details_photos."""
+        if generation != self.details_image_generation:
+            return # The details page changed while this waited in the executor
+        picture_path = widget_args[4]
+        try:
+            # --- Load through the persistent thumbnail cache (the source is only decoded on a miss) ---
+            pil_image = load_thumbnail(self.thumbnail_cache, picture_path, (250, 140), "RGB", self.RESAMPLE_FILTER) # SUBGRID IMAGES
+        except Exception as e:
+            grid_log.error('Error loading subgrid image %s: %s', picture_path, e)
+            return
 
-            if container.winfo_exists():
-                # Schedule GUI update in the main thread
-                self.master.after(
-                    0,
-                    lambda: self.create_details_item_widgets(
-                        container, photo, pil_image, spawn_cmd, info_data, zip_file, picture_path, folder_name, zip_file_base_name, config_name # Pass folder_name, zip_file_base_name, config_name
-                    )
-                )
+        with self.details_photo_lock:
+            self.details_photo_pending.append((generation, pil_image, widget_args))
+            if self.details_photo_flush_scheduled:
+                return
+            self.details_photo_flush_scheduled = True
+        try:
+            self.master.after(self.details_photo_flush_delay_ms, self._flush_details_photos)
+        except Exception as e: # Main window already gone
+            grid_log.warning('Warning: Could not schedule details picture update: %s', e)
 
-            print("--- load_image_item_details() DEBUG EXIT ---\n") # <--- DEBUG EXIT
+    def _flush_details_photos(self):
+        """
+        Tk thread: turns the decoded details pictures into PhotoImages and item widgets, as
+        many as fit in details_photo_flush_budget_ms; the rest goes to the next event loop turn so
+        scrolling and clicks keep getting through while a large page fills.
+        """
+        with self.details_photo_lock:
+            pending = self.details_photo_pending
+            self.details_photo_pending = []
 
+        deadline = time.perf_counter() + self.details_photo_flush_budget_ms / 1000
+        index = 0
+        for index, (generation, pil_image, widget_args) in enumerate(pending, start=1):
+            container = widget_args[0]
+            try:
+                if generation != self.details_image_generation or not container.winfo_exists():
+                    continue
+                photo = ImageTk.PhotoImage(pil_image)
+                # --- NEW: Check pause_loading and queue Details UI update if paused ---
+                if self.pause_loading:
+                    grid_log.debug('Queueing Details UI update for %s - Loading PAUSED (Details)', os.path.basename(widget_args[4])) # Debug Print
+                    self.details_grid_skipped_updates_queue.append((container, photo, pil_image) + widget_args[1:])
+                else:
+                    self.create_details_item_widgets(container, photo, pil_image, *widget_args[1:])
+            except Exception as e:
+                grid_log.error('Error creating subgrid PhotoImage for %s: %s', widget_args[4], e)
+            if time.perf_counter() >= deadline:
+                break
 
-        except Exception as e:
-            print(f"Error loading subgrid image {picture_path}: {e}")
+        with self.details_photo_lock:
+            self.details_photo_pending = pending[index:] + self.details_photo_pending
+            if not self.details_photo_pending:
+                self.details_photo_flush_scheduled = False
+                return
+        self.master.after(1, self._flush_details_photos) # Lets pending input events run first
 
 
 
@@ -20687,11 +20329,7 @@ class ConfigViewerApp:
 
     def check_favorites_exist_for_folder(self, folder_name):
         """Checks if there are any favorites for the given folder in favorites.txt."""
-        for fav_config in self.favorite_configs:
-            fav_folder = fav_config.split('|')[0]
-            if fav_folder == folder_name:
-                return True
-        return False
+        return self.get_favorite_folders().has_folder(folder_name)
     
 
     def reopen_details_window_in_current_mode(self):
@@ -21164,11 +20802,7 @@ class ConfigViewerApp:
                 items_on_current_page_before_deletion = self.details_filtered_data[start_index:end_index]
 
                 # --- NEW: Check if this was the last favorite for the folder ---
-                remaining_favorites_in_folder = 0
-                for fav_config in self.favorite_configs:
-                    fav_folder, fav_pc_file = fav_config.split('|')
-                    if fav_folder == folder_name:
-                        remaining_favorites_in_folder += 1
+                remaining_favorites_in_folder = self.get_favorite_folders().count_in_folder(folder_name)
                 print(f"DEBUG: on_details_sidebar_favorites_click - Remaining favorites in folder '{folder_name}': {remaining_favorites_in_folder}")
 
 
@@ -21213,7 +20847,7 @@ class ConfigViewerApp:
         self.update_details_sidebar_favorites_button_text() # Call update to ensure correct text after any action
         self.lift_search_results_window()
 
-        generate_data_subset_favorites(self.script_dir)
+        self.data_subset_favorites_lines = generate_data_subset_favorites(self.script_dir, self.data_subset_lines, write_file=self.write_filter_output_files)
 
         self._count_unique_folders_in_favorites(called_to_retrieve_old_current_favorites_amount=None)
         unique_favorite_folder_count_after_fav_update = self.current_favorites_amount
@@ -21239,42 +20873,20 @@ class ConfigViewerApp:
 
     def _count_unique_folders_in_favorites(self, called_to_retrieve_old_current_favorites_amount=None):
         """
-        Reads the favorites file and counts the number of unique folder names.
+        Counts the number of unique folder names among the favorites. self.favorite_configs
+        is what write_favorites() last wrote to favorites.txt, so the file isn't read again.
 
         Returns:
-            int: The count of unique folder names found in favorites.txt.
-                 Returns 0 if the file doesn't exist or is empty.
+            int: The count of unique folder names in the favorites (0 if there are none).
         """
-        unique_folders = set()
-        if not hasattr(self, 'favorites_file_path') or not self.favorites_file_path:
-            print("Warning: favorites_file_path attribute not set. Cannot count favorite folders.")
-            return 0
+        unique_folder_count = len(self.get_favorite_folders())
+        favorites_log.debug('  DEBUG: _count_unique_folders_in_favorites - Found %s unique folders in the favorites', unique_folder_count)
 
-        if os.path.exists(self.favorites_file_path):
-            try:
-                with open(self.favorites_file_path, 'r', encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line: # Ensure line is not empty
-                            parts = line.split('|', 1) # Split only on the first '|'
-                            if len(parts) > 0:
-                                folder_name = parts[0].strip()
-                                if folder_name: # Ensure folder_name is not empty
-                                    unique_folders.add(folder_name)
-                print(f"  DEBUG: _count_unique_folders_in_favorites - Found {len(unique_folders)} unique folders in {self.favorites_file_path}")
-                
-                if not called_to_retrieve_old_current_favorites_amount:
+        if not called_to_retrieve_old_current_favorites_amount:
 
-                    self.current_favorites_amount = len(unique_folders)
+            self.current_favorites_amount = unique_folder_count
 
-                return len(unique_folders)
-            
-            except Exception as e:
-                print(f"Error reading or parsing {self.favorites_file_path}: {e}")
-                return 0 # Return 0 on error
-        else:
-            print(f"Warning: Favorites file not found at {self.favorites_file_path}. Returning 0 unique folders.")
-            return 0
+        return unique_folder_count
 
 
 
@@ -21409,8 +21021,6 @@ class ConfigViewerApp:
         """
         favorites = set()
         valid_favorites = set()
-        watcher_filepaths = set() # Set to store filepaths from WatcherOutput.txt
-        zip_structure_lines = set() # Set to store lines from zip_structure.txt
 
 
         watcher_output_file = os.path.join(self.script_dir, "data/WatcherOutput.txt")
@@ -21424,13 +21034,19 @@ class ConfigViewerApp:
 
         if os.path.exists(backup_zip_structure_file):
 
-            print(f"backup input files exist (read_favorites)")
+            favorites_log.debug('backup input files exist (read_favorites)')
 
             zip_structure_file = backup_zip_structure_file
             watcher_output_file = backup_watcher_output_file
 
             
 
+        # --- NEW: Nothing to re-check if favorites.txt and both input files are unchanged since the last call ---
+        path_index_key = (watcher_output_file, file_signature(watcher_output_file), zip_structure_file, file_signature(zip_structure_file))
+        read_key = (file_signature(self.favorites_file_path), path_index_key)
+        if read_key == self.favorites_read_key:
+            favorites_log.debug('DEBUG: read_favorites - favorites and input files unchanged, reusing %s favorites.', len(self.favorite_configs))
+            return self.favorite_configs
 
 
         # --- 1. Read Favorites.txt ---
@@ -21441,7 +21057,54 @@ class ConfigViewerApp:
                     if line:
                         favorites.add(line)
 
-        # --- 2. Read WatcherOutput.txt and collect filepaths ---
+        # --- 2./3. Index the WatcherOutput.txt filepaths and zip_structure.txt lines (once per change of either file) ---
+        favorite_path_index = self._get_favorite_path_index(watcher_output_file, zip_structure_file)
+
+        # --- 4. Check favorites against WatcherOutput and zip_structure ---
+        for fav_key in favorites:
+            parts = split_favorite_key(fav_key)
+            if parts is not None:
+                folder_name, pc_filename = parts
+                if favorite_path_index.contains(folder_name, pc_filename): # Found in WatcherOutput or zip_structure
+                    valid_favorites.add(fav_key)
+                else:
+                    favorites_log.debug("DEBUG: Favorite '%s' not found in WatcherOutput.txt OR zip_structure.txt, removing from favorites.", fav_key) # Debug print for removed favorite
+            else:
+                favorites_log.warning("Warning: Invalid favorite key format: '%s'. Skipping.", fav_key) # Warning for invalid format
+
+        # --- 5. Update favorites and write back to file ---
+        if valid_favorites != favorites: # Only write if there were changes
+            self.favorite_configs = valid_favorites
+
+            self.write_favorites()
+            self.unique_favorite_folder_count = self._count_unique_folders_in_favorites() # Update the count
+            favorites_log.debug('DEBUG: Updated unique_favorite_folder_count to: %s', self.unique_favorite_folder_count)
+
+
+
+            favorites_log.debug('DEBUG: Favorites.txt updated, invalid entries removed.') # Debug print for update
+        else:
+            self.favorite_configs = valid_favorites # Ensure self.favorite_configs is updated even if no changes to write
+            self.favorites_generation += 1
+            favorites_log.debug('DEBUG: No invalid favorites found, Favorites.txt not updated.') # Debug print for no update
+
+        self.favorites_read_key = (file_signature(self.favorites_file_path), path_index_key) # After write_favorites() above
+
+        return self.favorite_configs
+
+
+    def _get_favorite_path_index(self, watcher_output_file, zip_structure_file):
+        """
+        Returns the FavoritePathIndex of the WatcherOutput.txt filepaths and zip_structure.txt
+        lines, rebuilding it only if either file was rewritten since the last call.
+        """
+        path_index_key = (watcher_output_file, file_signature(watcher_output_file), zip_structure_file, file_signature(zip_structure_file))
+        if self.favorite_path_index is not None and self.favorite_path_index_key == path_index_key:
+            return self.favorite_path_index
+
+        watcher_filepaths = set() # Set to store filepaths from WatcherOutput.txt
+        zip_structure_lines = set() # Set to store lines from zip_structure.txt
+
         if os.path.exists(watcher_output_file):
             check_mods, check_configs, user_vehicles_files, config_pics_custom_files, mods_files, repo_files, vanilla_files, last_zip_count = read_watcher_output(watcher_output_file)
             # Collect all filepaths from WatcherOutput.txt
@@ -21451,7 +21114,6 @@ class ConfigViewerApp:
             watcher_filepaths.update(repo_files.keys())
             watcher_filepaths.update(vanilla_files.keys())
 
-        # --- NEW: 3. Read zip_structure.txt and collect lines ---
         if os.path.exists(zip_structure_file):
             try:
                 with open(zip_structure_file, 'r', encoding="utf-8") as f:
@@ -21460,64 +21122,37 @@ class ConfigViewerApp:
                         if line:
                             zip_structure_lines.add(line) # Add each line from zip_structure.txt
             except Exception as e:
-                print(f"Warning: Error reading zip_structure.txt: {e}")
-        # --- NEW: 3. Read zip_structure.txt and collect lines ---
-
-
-        # --- 4. Check favorites against WatcherOutput and zip_structure ---
-        for fav_key in favorites:
-            parts = fav_key.split('|')
-            if len(parts) == 2:
-                folder_name, pc_filename = parts
-                pc_filename_base = os.path.splitext(pc_filename)[0] # Get base name without extension
-                search_substring = f"{folder_name.lower()}/{pc_filename_base.lower()}" # Construct substring for search
-
-                found_in_watcher_output = False
-                for filepath in watcher_filepaths:
-                    normalized_filepath = filepath.lower().replace('\\', '/')
-                    if search_substring in normalized_filepath: # Check if substring is IN filepath
-                        found_in_watcher_output = True
-                        break # No need to check other filepaths if found
-
-                # --- NEW: Check in zip_structure_lines if not found in WatcherOutput ---
-                found_in_zip_structure = False
-                if not found_in_watcher_output: # Only check zip_structure if NOT found in WatcherOutput
-                    for zip_line in zip_structure_lines:
-                        normalized_zip_line = zip_line.lower().replace('\\', '/')
-                        if search_substring in normalized_zip_line: # Check if substring is IN zip_structure line
-                            found_in_zip_structure = True
-                            break # No need to check other zip_structure lines if found
-                # --- NEW: Check in zip_structure_lines if not found in WatcherOutput ---
-
-
-                if found_in_watcher_output or found_in_zip_structure: # MODIFIED CHECK - OR condition
-                    valid_favorites.add(fav_key) # Add to valid favorites if found in either file
-                else:
-                    print(f"DEBUG: Favorite '{fav_key}' not found in WatcherOutput.txt OR zip_structure.txt, removing from favorites.") # Debug print for removed favorite
-            else:
-                print(f"Warning: Invalid favorite key format: '{fav_key}'. Skipping.") # Warning for invalid format
-
-        # --- 5. Update favorites and write back to file ---
-        if valid_favorites != favorites: # Only write if there were changes
-            self.favorite_configs = valid_favorites
-
-            self.write_favorites()
-            self.unique_favorite_folder_count = self._count_unique_folders_in_favorites() # Update the count
-            print(f"DEBUG: Updated unique_favorite_folder_count to: {self.unique_favorite_folder_count}")
+                favorites_log.warning('Warning: Error reading zip_structure.txt: %s', e)
 
+        self.favorite_path_index = FavoritePathIndex(watcher_filepaths | zip_structure_lines)
+        self.favorite_path_index_key = path_index_key
+        favorites_log.debug('DEBUG: Built favorites path index from %s paths.', len(self.favorite_path_index))
+        return self.favorite_path_index
 
 
-            print("DEBUG: Favorites.txt updated, invalid entries removed.") # Debug print for update
-        else:
-            self.favorite_configs = valid_favorites # Ensure self.favorite_configs is updated even if no changes to write
-            print("DEBUG: No invalid favorites found, Favorites.txt not updated.") # Debug print for no update
+    def get_favorite_folders(self):
+        """FavoriteFolders of self.favorite_configs, rebuilt once per favorites change (favorites_generation)."""
+        if self.favorite_folders is None or self.favorite_folders_generation != self.favorites_generation:
+            self.favorite_folders = FavoriteFolders(self.favorite_configs)
+            self.favorite_folders_generation = self.favorites_generation
+        return self.favorite_folders
 
 
-        return self.favorite_configs
+    def get_pinned_favorite_folders(self):
+        """
+        Returns the folders of the pinned "Favorites" category (a frozenset). Recomputed only
+        when the favorites change (add_to_favorites / remove_from_favorites bump
+        favorites_generation) or full_data is reloaded; delete_item and isolate_item
+        invalidate it after removing a folder from full_data.
+        """
+        return self.pinned_favorite_folders.get(
+            self.full_data, self.get_favorite_folders(), self.favorites_generation,
+            self.extract_name_from_spawn_command)
 
 
     def write_favorites(self):
         """Writes the current set of favorite configurations to Favorites.txt."""
+        self.favorites_generation += 1 # Invalidates results cached against the favorites set
 
 
 
@@ -21751,6 +21386,7 @@ class ConfigViewerApp:
                 paged_data[i: i + details_batch_size]
                 for i in range(0, len(paged_data), details_batch_size)
             ]
+            self.details_image_generation += 1 # Drop pictures still decoding for the previous page
             print(f"  DEBUG: Initial Load - Number of batches created: {len(self.details_batches)}")
             if self.details_batches:
                 print(f"  DEBUG: Initial Load - Size of first batch: {len(self.details_batches[0]) if self.details_batches else 0}")
@@ -22692,22 +22328,7 @@ class ConfigViewerApp:
     def perform_details_search(self):
         """Performs search in details view, enforcing Favorites filter and ZIP filter."""
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- perform_details_search CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("perform_details_search")
 
 
         scanning_win = self.show_scanning_window(text="Loading...")
@@ -23114,28 +22735,12 @@ class ConfigViewerApp:
         if not self.is_data_subset_active:
             return True  # If data subset is not active, all paths are considered in subset
 
-        subset_files = set()
         data_subset_file_path = os.path.join(self.script_dir, self.data_subset_file)
-        if os.path.exists(data_subset_file_path):
-            with open(data_subset_file_path, 'r', encoding="utf-8") as f:
-                for line in f:
-                    filename = line.strip()
-                    if filename:
-                        subset_files.add(filename)
-
-        if not subset_files:
-            return False  # If data_subset.txt is empty, no files are in subset
-
-        pic_filename = os.path.basename(picture_path)
+        subset_filter = self.get_data_subset_filter(data_subset_file_path, self.get_data_subset_lines())
+        if not subset_filter:
+            return False  # No data subset, or an empty one: no files are in subset
 
-        # Extract "vehicles--[foldername]" part from filename
-        match = re.match(r"vehicles--([^-]+)", pic_filename)
-        if match:
-            folder_name_prefix = match.group(0)  # "vehicles--[foldername]--"
-            if folder_name_prefix[:-2] in subset_files: # Remove last two "--" and check
-                return True
-
-        return False
+        return subset_filter.contains_line(os.path.basename(picture_path))
 
 
     def apply_data_subset_filter_details(self, data_list):
@@ -23168,22 +22773,7 @@ class ConfigViewerApp:
         Rebuilds the details window's subgrid, respecting pagination and filters.
         """
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- rebuild_simple_details CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("rebuild_simple_details")
 
 
         
@@ -23332,6 +22922,7 @@ class ConfigViewerApp:
             paged_data[i: i + self.details_batch_size]
             for i in range(0, len(paged_data), self.details_batch_size)
         ]
+        self.details_image_generation += 1 # Drop pictures still decoding for the previous page
         self.current_details_batch_index = 0 # Reset batch index for the new page load
         self.current_details_batch_index_in_sequence = 0 # Also reset sequence index
         print(f"  DEBUG: rebuild_simple_details - Created batches for page, count: {len(self.details_batches)}")
@@ -23375,22 +22966,7 @@ class ConfigViewerApp:
         Handles the details window resize event with debounce, only updating layout on column breakpoint change.
         """
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            #print(f"    Code context: {caller_code_context}") # Might be None
-
-        #print(f"--- throttled_details_resize CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        #trace_caller("throttled_details_resize")
 
 
         if self.details_window and event.widget == self.details_window:
@@ -23415,22 +22991,7 @@ class ConfigViewerApp:
         Updates the subgrid layout only if the number of columns needs to change.
         """
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- on_details_resize_complete CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("on_details_resize_complete")
 
 
         details_canvas_width = self.details_canvas_sub.winfo_width() - 20 # Adjust for margins
@@ -23459,22 +23020,7 @@ class ConfigViewerApp:
         """
 
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- update_subgrid_layout_on_resize CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("update_subgrid_layout_on_resize")
 
 
         print("\n--- update_subgrid_layout_on_resize() ENTRY ---") # Debug Entry
@@ -23575,55 +23121,33 @@ class ConfigViewerApp:
         Makes the mouse cursor change on hover over any part of the category header.
         """
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- update_grid_layout CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("update_grid_layout")
 
         ConfigViewerApp.item_number = 0
 
         self.update_grid_layout_run = True
 
-        print(f"--- update_grid_layout called by stack: ---")
-        # Limit the depth if it gets too long, e.g., inspect.stack(0, 10) for 10 levels
-        for frame_info in inspect.stack():
-            print(f"  File \"{frame_info.filename}\", line {frame_info.lineno}, in {frame_info.function}")
-            # Optional: print context code
-            if frame_info.code_context:
-                print(f"    Code: {frame_info.code_context[0].strip()}")
-        print("----------------------------------------")
+        trace_call_stack("update_grid_layout")
 
 
         if self.update_grid_layout_called_first_time:
             self.update_grid_layout_called_first_time = False 
-            print("DEBUG: update_grid_layout SKIPPED ENTRY - self.update_grid_layout_called_first_time is true ")
+            grid_log.debug('DEBUG: update_grid_layout SKIPPED ENTRY - self.update_grid_layout_called_first_time is true ')
             return
 
-        print("DEBUG: update_grid_layout - self.pause_loading = False")
+        grid_log.debug('DEBUG: update_grid_layout - self.pause_loading = False')
             
         self.pause_loading = False
 
         self._update_filters_label_status()
 
         if self.is_search_results_window_active:
-            print("DEBUG: update_grid_layout - Search Results window is active. and fav amount is the same - SKIPPING main grid layout update.")
+            grid_log.debug('DEBUG: update_grid_layout - Search Results window is active. and fav amount is the same - SKIPPING main grid layout update.')
 
             return
         
         if self.favorites_amount_changed == True:
-            print("resetting favorites_amount_changed to FALSE, we entered update grid layout with it set to True")
+            grid_log.debug('resetting favorites_amount_changed to FALSE, we entered update grid layout with it set to True')
             self.favorites_amount_changed = False
 
         try:
@@ -23633,12 +23157,15 @@ class ConfigViewerApp:
             scanning_win = self.show_scanning_window(text="Updating UI data...")
 
 
-            # Clear the existing grid
-            print("DEBUG: update_grid_layout - destroying widgets")
+            # Clear the existing grid, except the virtualized grid's slot pool which gets rebound
+            grid_log.debug('DEBUG: update_grid_layout - destroying widgets')
+            self.main_grid_layout = None
+            pool_slots = set(self.main_grid_slot_pool)
             for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
-
-            self.main_grid_labels = [] # Clear the list to prevent accumulation
+                if widget not in pool_slots:
+                    widget.destroy()
+            for slot in self.main_grid_slot_pool:
+                slot.virtual_grid_key = None # Labels depend on more than the item (hidden state, folder setting), rebind them all
 
 
             # Determine the available width for images
@@ -23652,7 +23179,7 @@ class ConfigViewerApp:
             else:
                 _, self.column_padding = self.calculate_columns_for_width(width)
 
-            columns = self.columns
+            columns = self.columns[0] if isinstance(self.columns, tuple) else self.columns
             fixed_padding_x = self.column_padding
             single_column_pixel_width = image_width + fixed_padding_x
 
@@ -23669,7 +23196,7 @@ class ConfigViewerApp:
             # Determine if label should be omitted based on item count
             self.omit_label = len(self.data) >= 1100 # Set flag based on total item count, set to impossibly high number, we're paginating the main grid
 
-            self.category_batches = []
+            grid_sections = []
             for category in ordered_categories:
                 category_hidden = self.category_hidden_states.get(category, False)
 
@@ -23682,11 +23209,9 @@ class ConfigViewerApp:
                 header_frame = tk.Frame(self.scrollable_frame, bg="#444444", cursor="hand2")
                 header_frame.pack(fill=tk.X, pady=(5, 0))
 
+                # Results of the search pass perform_search just made; only items it didn't check are evaluated
                 search_query = self.search_var.get().strip().lower()
-                matching_item_count = 0
-                for item in self.grouped_data[category]:
-                    if self._perform_item_search(search_query, item):
-                        matching_item_count += 1
+                matching_item_count = sum(1 for item in self.grouped_data[category] if self._item_matches_search(search_query, item))
 
                 header_text = category
                 if category_hidden:
@@ -23719,17 +23244,11 @@ class ConfigViewerApp:
                 header_frame.bind("<Leave>", lambda event, cat=category, header=header_label, sep=separator, count=matching_item_count: self.on_category_hover_leave(event, cat, header, sep, count))
                 header_frame.bind("<Button-1>", lambda event, cat=category: self.toggle_category_visibility(cat))
 
-                category_subframe = tk.Frame(self.scrollable_frame, bg="#444444")
-                if not category_hidden:
-                    category_subframe.pack(fill="x")
-                else:
-                    category_subframe.pack_forget()
-
                 self.image_counts[category] = 0
 
+                all_items = []
                 items = self.grouped_data[category]
                 if isinstance(items, list):
-                    all_items = []
                     for item in items:
                         if isinstance(item, dict) and 'configs' in item:
                             for config in item['configs']:
@@ -23737,24 +23256,55 @@ class ConfigViewerApp:
                         elif len(item) == 5:
                             all_items.append(item)
 
+                # The category's items aren't widgets of their own: a spacer sized to the
+                # category's rows reserves the space and pool slots are placed over it
+                spacer = None
+                if not category_hidden:
+                    spacer = tk.Frame(self.scrollable_frame, bg="#444444")
+                    spacer.pack(fill="x")
+                    self.image_counts[category] = len(all_items)
+                    ConfigViewerApp.item_number += len(all_items)
+
+                grid_sections.append((category, header_frame, spacer, all_items))
+
+            probe = None
+            for category, header_frame, spacer, section_items in grid_sections:
+                if spacer is not None and section_items:
+                    probe = ((category, 0), section_items[0])
+                    break
+            item_width, item_height = self._measure_main_grid_cell(*probe) if probe else (0, 0)
+
+            padding_x = int(round(fixed_padding_x))
+            layout = VirtualGridLayout(
+                columns,
+                item_width + HIDDEN_BORDER_SLACK + 2 * padding_x,
+                item_height + HIDDEN_BORDER_SLACK + 10, # pady=5 above and below each item
+                padding_x,
+                5
+            )
+            for category, header_frame, spacer, section_items in grid_sections:
+                if spacer is not None:
+                    spacer.config(width=layout.grid_width(), height=layout.section_height(len(section_items)))
 
-                    batch_size = 50 # THIS NUMBER CANNOT BE BIGGER THAN 
-                                    # ANYTHING IN self.main_grid_batch_sizes
-                                    # AND IT ALSO CAN'T BE BIGGER THAN 
-                                    # batch_size_to_load under 
-                                    # self.all_main_grid_images_cached
+            self.scrollable_frame.update_idletasks()
+            section_top = 0
+            for category, header_frame, spacer, section_items in grid_sections:
+                section_top += 5 + header_frame.winfo_reqheight() # header_frame is packed with pady=(5, 0)
+                if spacer is not None:
+                    layout.add_section(category, section_items, section_top)
+                    section_top += spacer.winfo_reqheight()
 
-                    batches = [all_items[i:i + batch_size] for i in range(0, len(all_items), batch_size)]
-                    self.category_batches.append((category, batches, category_subframe))
+            for slot in self.main_grid_slot_pool:
+                slot.lift() # Spacers were created after the pool, keep the slots stacked above them
 
-            self.current_category_index = 0
-            self.current_batch_index = 0
+            grid_log.debug('DEBUG: update_grid_layout - %s items in %s sections, %s pooled item widgets', layout.item_count(), len(layout.sections), len(self.main_grid_slot_pool))
+            self.main_grid_layout = layout
 
             self.load_next_batch()
 
 
         except Exception as e:
-            print(f"Error in update_grid_layout: {e}")
+            grid_log.error('Error in update_grid_layout: %s', e)
 
 
         if scanning_win:
@@ -23763,7 +23313,7 @@ class ConfigViewerApp:
 
 
 
-        print("DEBUG: update_grid_layout - EXIT")
+        grid_log.debug('DEBUG: update_grid_layout - EXIT')
 
             
 
@@ -23909,20 +23459,20 @@ class ConfigViewerApp:
         **NOW WITH WIDGET COUNT LIMIT and DEBUG PRINT.**
         """
 
-        print("\n--- create_details_item_widgets() DEBUG ENTRY ---") # <--- DEBUG ENTRY
-        print(f"  DEBUG: create_details_item_widgets - Widget Count (at entry): {ConfigViewerApp.details_widget_count}") # Debug - Count at Entry
-        print(f"  DEBUG: create_details_item_widgets - File: {os.path.basename(picture_path)}") # Debug - Filename
-        print(f"  DEBUG: create_details_item_widgets - Parent Frame: {parent_frame}") # Debug - Parent Frame Widget
+        grid_log.debug('\n--- create_details_item_widgets() DEBUG ENTRY ---') # <--- DEBUG ENTRY
+        grid_log.debug('  DEBUG: create_details_item_widgets - Widget Count (at entry): %s', ConfigViewerApp.details_widget_count) # Debug - Count at Entry
+        grid_log.debug('  DEBUG: create_details_item_widgets - File: %s', os.path.basename(picture_path)) # Debug - Filename
+        grid_log.debug('  DEBUG: create_details_item_widgets - Parent Frame: %s', parent_frame) # Debug - Parent Frame Widget
 
         if not parent_frame.winfo_exists():
-            print("  DEBUG: create_details_item_widgets - Parent frame no longer exists, exiting.") # Debug - Parent Frame Missing
-            print("--- create_details_item_widgets() DEBUG EXIT (Parent Frame Missing) ---\n") # Debug Exit - Parent Missing
+            grid_log.debug('  DEBUG: create_details_item_widgets - Parent frame no longer exists, exiting.') # Debug - Parent Frame Missing
+            grid_log.debug('--- create_details_item_widgets() DEBUG EXIT (Parent Frame Missing) ---\n') # Debug Exit - Parent Missing
             return
 
-        print(f"DEBUG: create_details_item_widgets - START - Widget Count: {ConfigViewerApp.details_widget_count}, File: {os.path.basename(picture_path)}") # <--- DEBUG PRINT - WIDGET COUNT
+        grid_log.debug('DEBUG: create_details_item_widgets - START - Widget Count: %s, File: %s', ConfigViewerApp.details_widget_count, os.path.basename(picture_path)) # <--- DEBUG PRINT - WIDGET COUNT
 
         if ConfigViewerApp.details_widget_count >= 50: # <--- CHECK WIDGET COUNT LIMIT
-            print(f"DEBUG: create_details_item_widgets - Widget limit reached (50), skipping widget creation for: {os.path.basename(picture_path)}") # Debug - Limit Reached
+            grid_log.debug('DEBUG: create_details_item_widgets - Widget limit reached (50), skipping widget creation for: %s', os.path.basename(picture_path)) # Debug - Limit Reached
             return # Skip widget creation if limit is reached
 
         # --- Image Label (similar to details view) ---
@@ -23953,7 +23503,7 @@ class ConfigViewerApp:
                 if configuration_text:
                     label_text = configuration_text
             except Exception as e:
-                print(f"  WARNING: Error loading/parsing individual info file for label {individual_info_path}: {e}. Using default name.")
+                grid_log.warning('  WARNING: Error loading/parsing individual info file for label %s: %s. Using default name.', individual_info_path, e)
 
 
         # --- MODIFIED: Set label color based on picture_path ---
@@ -24074,7 +23624,7 @@ class ConfigViewerApp:
                     self._hex_to_rgb(lbl_name.default_fg_color)
                     default_name_fg = lbl_name.default_fg_color
                 except (ValueError, TypeError, AttributeError): # Catch if default_fg_color is not valid hex or not string
-                    print(f"Warning: Invalid or missing default_fg_color for {lbl_name}. Using black.")
+                    grid_log.warning('Warning: Invalid or missing default_fg_color for %s. Using black.', lbl_name)
 
             # Robustly get default colors for lbl_img, ensure they are valid hex
             default_img_bg = "#FFFFFF" # Fallback
@@ -24084,7 +23634,7 @@ class ConfigViewerApp:
                     self._hex_to_rgb(lbl_img.default_bg_color)
                     default_img_bg = lbl_img.default_bg_color
                 except (ValueError, TypeError, AttributeError): # Catch if default_bg_color is not valid hex or not string
-                    print(f"Warning: Invalid or missing default_bg_color for {lbl_img}. Using white.")
+                    grid_log.warning('Warning: Invalid or missing default_bg_color for %s. Using white.', lbl_img)
 
 
             if search_query and config_name_for_search and search_query in config_name_for_search:
@@ -24187,7 +23737,7 @@ class ConfigViewerApp:
         parent_frame.item_data_tuple = (pil_image, info_data, picture_path, zip_file, folder_name, spawn_cmd, lbl_img, lbl_name) # Store labels instead of button
         # --- NEW: Store item-specific data ---
 
-        print(f"DEBUG: create_details_item_widgets - Incrementing widget count for: {os.path.basename(picture_path)}, Current Count BEFORE increment: {ConfigViewerApp.details_widget_count}") # <--- DEBUG PRINT - WIDGET COUNT
+        grid_log.debug('DEBUG: create_details_item_widgets - Incrementing widget count for: %s, Current Count BEFORE increment: %s', os.path.basename(picture_path), ConfigViewerApp.details_widget_count) # <--- DEBUG PRINT - WIDGET COUNT
 
         ConfigViewerApp.details_widget_count += 1 # <--- INCREMENT WIDGET COUNT
         
@@ -24392,16 +23942,9 @@ class ConfigViewerApp:
         if not self.is_data_subset_active:  # Respect global filter toggle
             return data_to_filter
 
-        subset_filepaths = set()
         data_subset_file_path = os.path.join(self.script_dir, self.data_subset_file)
-        if os.path.exists(data_subset_file_path):
-            with open(data_subset_file_path, 'r', encoding="utf-8") as f:
-                for line in f:
-                    filepath = line.strip().lower().replace('\\', '/')  # Normalize subset filepaths
-                    if filepath:
-                        subset_filepaths.add(filepath)
-
-        if not subset_filepaths:
+        subset_filter = self.get_data_subset_filter(data_subset_file_path, self.get_data_subset_lines())
+        if not subset_filter:
             return []
 
         filtered_data = []
@@ -24414,32 +23957,8 @@ class ConfigViewerApp:
                 if normalized_pic_path.startswith(config_pics_path_lower):
                     normalized_pic_path = normalized_pic_path[len(config_pics_path_lower):].lstrip('/')
 
-                is_exact_match_found = False
-                for subset_line in subset_filepaths:
-                    normalized_subset_line = subset_line.strip().lower()
-
-                    # --- NEW: DEBUG PRINTS - Inspect normalized prefixes just before comparison ---
-                    #print("DEBUG: Details Subset Filter - Comparing:")
-                    #print(f"       Normalized Item Path: '{normalized_pic_path}'") # Print normalized item path
-                    #print(f"       Normalized Subset Line: '{normalized_subset_line}'") # Print normalized subset line
-                    # --- NEW: DEBUG PRINTS ---
-
-
-                    if normalized_pic_path == normalized_subset_line:  # Check for EXACT MATCH
-                        filtered_data.append(item)
-                        is_exact_match_found = True
-                        print(f"       - EXACT MATCH FOUND in data_subset.txt") # Debug - Match Found
-                        break
-
-                if not is_exact_match_found:
-                    pass
-                    #print(f"DEBUG: Subset Filter FAIL - Folder: '{item[4]}'")
-                    #print(f"       Required prefix line (Normalized): '{normalized_pic_path}'")
-                    #print(f"       NO EXACT LINE MATCH in data_subset.txt (Normalized Lines Comparison)")
-                    #print(f"       data_subset.txt LINES (Normalized): { [line.strip().lower() for line in subset_filepaths]}")
-                    #print(f"       Raw data_subset.txt LINES: {list(subset_filepaths)}")
-                    #print(f"       Raw Required Prefix Line: '{pic_path}'") # Raw pic_path here (not prefix)
-
+                if subset_filter.contains_line(normalized_pic_path):  # EXACT line match, one set lookup
+                    filtered_data.append(item)
 
         #print(f"DEBUG: _apply_details_data_subset_filter - Filtered details data to {len(filtered_data)} items (Full Path Match).")
         return filtered_data
@@ -25961,6 +25480,7 @@ class ConfigViewerApp:
             #messagebox.showinfo("Deletion Successful", f"Deleted '{zip_file}' and related files.")
             self.data = [d for d in self.data if d[2].lower() != zip_file.lower()]
             self.full_data.pop(zip_file, None)
+            self.pinned_favorite_folders.invalidate()
             self.grouped_data = self.format_grouped_data(self.data)
             self.is_search_results_window_active_bypass_flag = True
 
@@ -26026,6 +25546,7 @@ class ConfigViewerApp:
             #messagebox.showinfo("Deletion Successful", f"Deleted '{zip_file}' and related files.")
             self.data = [d for d in self.data if d[2].lower() != zip_file.lower()]
             self.full_data.pop(zip_file, None)
+            self.pinned_favorite_folders.invalidate()
             self.grouped_data = self.format_grouped_data(self.data)
 
             self.is_search_results_window_active_bypass_flag = True
@@ -26298,10 +25819,9 @@ class ConfigViewerApp:
         print("--- refresh_details_window_after_deletion() EXIT ---\n") # Debug - Exit
         
     def clear_main_grid_cache(self):
-        """Clears the main grid image cache (both PhotoImage and PIL Image caches)."""
+        """Clears the main grid image cache (both PhotoImages and PIL Images)."""
         print("Clearing Main Grid Image Cache...") # Debug Print
         self.image_cache.clear()
-        self.image_cache_pil.clear()
         print("Main Grid Image Cache Cleared.") # Debug Print
         
 
@@ -26315,22 +25835,7 @@ class ConfigViewerApp:
         print(f"details_window is None: {self.details_window is None}")
 
 
-        stack = inspect.stack()
-        caller_function_name = "<unknown>"
-        caller_filename = "<unknown>"
-        caller_lineno = 0
-        if len(stack) > 1:
-            # stack[0] is the current frame (update_grid_layout)
-            # stack[1] is the caller's frame
-            caller_frame_record = stack[1]
-            caller_function_name = caller_frame_record.function
-            caller_filename = caller_frame_record.filename
-            caller_lineno = caller_frame_record.lineno
-            # You can even get the specific code line that made the call:
-            caller_code_context = caller_frame_record.code_context
-            print(f"    Code context: {caller_code_context}") # Might be None
-
-        print(f"--- on_details_window_close CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+        trace_caller("on_details_window_close")
 
 
         '''
@@ -26493,6 +25998,8 @@ class ConfigViewerApp:
             "outputBAD.txt",
             "outputGOOD (Original).txt",
             "zip_structure.txt",
+            "zip_index.json",
+            "filter_attributes.json",
 
             "non_existent_item.xyz" # Example: safe to include non-existent items
         ]
@@ -26557,6 +26064,13 @@ class ConfigViewerApp:
                 print("Backup process completed successfully (or skipped missing files).")
             print("-" * 20) # Separator
 
+            # The processed data store is open by this app, so empty it instead of deleting the file
+            if self.processed_data_store is not None:
+                try:
+                    self.processed_data_store.clear()
+                except sqlite3.Error as e:
+                    print(f"Warning: Failed to clear processed data store: {e}")
+
             # 2. --- Proceed with Deletions ---
             print(f"\n--- Attempting deletion of configured items in '{data_folder}'... ---")
             scanning_win = self.show_scanning_window(text="Refreshing data and preparing for full rescan...")
@@ -26719,6 +26233,7 @@ class ConfigViewerApp:
             print("Clearing Main Grid Cache before refresh...") # Debug Print
             self.clear_main_grid_cache() # Call the new cache clearing function
             print("Main Grid Cache Cleared.") # Debug Print
+            self.get_zip_install_times().invalidate() # Archive install dates are read again after the rescan
 
             # --- NEW: Close details window if it's open (as before) ---
             if self.details_window and not self.details_window_closed:
@@ -26780,6 +26295,109 @@ class ConfigViewerApp:
 
 
 
+    def apply_mod_zip_delta(self, delta, mods_files, repo_files):
+        """
+        Updates the app for the mod archives ModZipEventHandler saw change, instead of the
+        full rescan in trigger_full_data_refresh_and_ui_update:
+        - NewMods.txt lists only the added/modified archives, and is written BEFORE the scan so
+          the info/picture extractors open just those;
+        - load_data reprocesses only the folders whose lines changed, plus the folders of
+          modified archives (their lines can stay the same);
+        - only the changed archives' pictures are dropped from the main grid image cache;
+        - the data is reloaded, searched and laid out once.
+
+        Args:
+            delta (ZipDelta): Added, removed and modified archives ({normalized zip path: mtime}).
+            mods_files (dict): Known zips under the mods folder after the delta (for WatcherOutput.txt).
+            repo_files (dict): Known zips under the repo folder after the delta (for WatcherOutput.txt).
+        """
+        if is_empty_zip_delta(delta):
+            return
+
+        start_time = time.perf_counter()
+        extract_zip_names = [os.path.basename(path) for path in list(delta.added) + list(delta.modified)]
+        modified_zip_names = [os.path.basename(path) for path in delta.modified]
+        delta_zip_names = extract_zip_names + [os.path.basename(path) for path in delta.removed]
+        print(f"\n--- ConfigViewerApp.apply_mod_zip_delta() ENTRY - {len(delta.added)} added, "
+              f"{len(delta.removed)} removed, {len(delta.modified)} modified ---")
+
+        self.set_filter_to_view_all_and_turn_subset_off()
+        self.destroy_search_results_window()
+        self.show_scanning_window(text="Mods changed, updating...")
+
+        if self.details_window and not self.details_window_closed:
+            print("Closing Details Window before refresh...")
+            self.details_window_intentionally_closed = True
+            self.on_details_window_close()
+
+        try:
+            self.update_new_mods_txt_with_new_zips(extract_zip_names)
+            self.run_ahk_scripts_mods(refresh_ui=False)
+
+            if self.processed_data_store is not None:
+                try:
+                    invalidated_folders = self.processed_data_store.invalidate_zip_files(modified_zip_names)
+                    if invalidated_folders:
+                        print(f"DEBUG: apply_mod_zip_delta - {len(invalidated_folders)} folder(s) of modified archives will be reprocessed.")
+                    self.processed_data_store.mark_stale()
+                except sqlite3.Error as e:
+                    print(f"Warning: Failed to mark processed data store stale: {e}")
+
+            evicted_count = self.evict_main_grid_cache_for_zips(delta_zip_names)
+            print(f"DEBUG: apply_mod_zip_delta - Evicted {evicted_count} cached picture(s) of changed archives.")
+            self.get_zip_install_times().invalidate(delta_zip_names) # Install date sorting re-reads only these
+
+            self.update_watcher_output_zip_lists(mods_files, repo_files)
+
+            self.search_var.set("") # Search results window was closed above
+            self.refresh_data_from_files()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error while updating changed mods: {e}")
+        finally:
+            self.update_grid_layout()
+
+            if hasattr(self, 'trigger_refresh_scanning_win') and self.trigger_refresh_scanning_win is not None:
+                try:
+                    self.trigger_refresh_scanning_win.destroy()
+                except tk.TclError as e:
+                    print(f"TclError while destroying trigger_refresh_scanning_win (might be already gone): {e}")
+                finally:
+                    self.trigger_refresh_scanning_win = None
+
+            print(f"--- ConfigViewerApp.apply_mod_zip_delta() EXIT - {time.perf_counter() - start_time:.2f}s ---\n")
+
+    def evict_main_grid_cache_for_zips(self, zip_names):
+        """
+        Drops the main grid pictures of the given archives from the image caches and keeps
+        every other entry. ConfigPics names embed the archive as "..._<zip name>--<config>.png".
+
+        Returns:
+            int: Number of evicted entries.
+        """
+        markers = tuple(f"_{zip_name.lower()}--" for zip_name in zip_names)
+        if not markers:
+            return 0
+        return self.image_cache.discard_where(
+            lambda key: any(marker in os.path.basename(str(key)).lower() for marker in markers)
+        )
+
+    def update_watcher_output_zip_lists(self, mods_files, repo_files):
+        """Rewrites the [ModsFiles]/[RepoFiles] sections and zip count of WatcherOutput.txt, keeping everything else."""
+        watcher_output_file = os.path.join(self.script_dir, "data/WatcherOutput.txt")
+        check_mods, check_configs, user_vehicles_files, config_pics_custom_files, _, _, vanilla_files, _ = read_watcher_output(watcher_output_file)
+        self.last_zip_count = len(mods_files) + len(repo_files) + len(vanilla_files)
+        write_watcher_output(
+            watcher_output_file,
+            check_mods,
+            check_configs,
+            user_vehicles_files,
+            config_pics_custom_files,
+            mods_files,
+            repo_files,
+            vanilla_files,
+            self.last_zip_count
+        )
+
     def update_new_mods_txt_with_new_zips(self, newly_detected_zip_files):
         """
         Updates NewMods.txt with a list of newly detected ZIP files.
@@ -27854,6 +27472,12 @@ def main():
     
     script_dir_str = str(script_dir) # Keep script_dir_str for existing parts of your code if needed
 
+    configure_logging() # Logger output to the terminal and the console window's buffer (modules/app_logging.py)
+
+    # --- NEW: Per-phase startup timing (wall, CPU, peak RSS), appended to data/startup_profile_history.jsonl ---
+    startup_profiler = StartupProfiler(get_startup_profile_history_path(script_dir))
+    startup_profiler.start_phase("prepare_data_files")
+
 
 
 
@@ -28051,6 +27675,11 @@ def main():
             "outputBAD.txt",
             "outputGOOD (Original).txt",
             "zip_structure.txt",
+            "zip_index.json",
+            "filter_attributes.json",
+            "config_processing_cache.sqlite3",
+            "config_processing_cache.sqlite3-wal",
+            "config_processing_cache.sqlite3-shm",
 
             "non_existent_item.xyz" # Example: safe to include non-existent items
         ]
@@ -28307,6 +27936,7 @@ def main():
         # No message needed if file didn't exist AND writing failed previously due to errors
 
 
+    startup_profiler.start_phase("bootstrap_app")
     app = ConfigViewerApp(
         master=root, # Use the hidden root window - no GUI needed for this step
         script_dir=script_dir,
@@ -28388,6 +28018,7 @@ def main():
     # --- Example of how to use it in your main script ---
     vanilla_vehicles_path_file = script_dir / "data/beamng_VANILLA_vehicles_folder.txt"
 
+    startup_profiler.start_phase("find_beamng_vehicles_path")
     vehicles_folder_path = get_beamng_vehicles_path(app)
 
     if vehicles_folder_path: # Check if a valid path was returned
@@ -28430,8 +28061,10 @@ def main():
                 sys.exit(1)
 
     # Read settings and last known file lists from WatcherOutput.txt, including last zip count
+    startup_profiler.start_phase("read_watcher_output")
     check_mods, check_configs, last_user_vehicles_files, last_config_pics_custom_files, last_mods_files, last_repo_files, last_vanilla_files, last_zip_count = read_watcher_output(watcher_output_file)
 
+    startup_profiler.start_phase("orphan_cleanup")
     orphaned_files_detected = cleanup_orphaned_mod_files_simplified(
         script_dir=script_dir,
         mods_folder=mods_folder,
@@ -28444,6 +28077,7 @@ def main():
 
 
     # Scan folders for current file lists and modification times (including vanilla)
+    startup_profiler.start_phase("scan_watched_folders")
     current_user_vehicles_files = scan_folder_for_watched_files(user_vehicles_folder)
     current_config_pics_custom_files = scan_folder_for_watched_files(config_pics_custom_folder)
     current_mods_files = scan_folders_for_mod_zips([mods_folder])
@@ -28454,6 +28088,7 @@ def main():
     current_zip_count = len(current_mods_files) + len(current_repo_files) + len(current_vanilla_files)
 
     # Conditional mod scanning
+    startup_profiler.start_phase("mod_scan")
     run_mod_scan_on_startup = False
     if current_zip_count > last_zip_count:
         run_mod_scan_on_startup = True
@@ -28512,14 +28147,8 @@ def main():
             print(f"DEBUG: module.main() RETURNED successfully (DIRECT CALL).") # Debug - Direct Call Return
 
 
-            # *** ADD CACHE DELETION HERE ***
-            cache_file_path = script_dir / "data" / "config_processing_cache.json"
-            if cache_file_path.exists():
-                try:
-                    cache_file_path.unlink()
-                    print(f"DEBUG: Deleted cache file due to mod scan: {cache_file_path}")
-                except OSError as e:
-                    print(f"Warning: Failed to delete cache file {cache_file_path}: {e}")
+            # *** MARK PROCESSED DATA STALE HERE (only changed folders get reprocessed) ***
+            mark_processed_data_stale(script_dir)
 
 
 
@@ -28546,8 +28175,10 @@ def main():
         print(f"No new zip files detected ({current_zip_count} is equal to  {last_zip_count}). Skipping mod scan and generation of Matches.txt.")
 
 
+    startup_profiler.start_phase("generate_matches_txt")
     generate_matches_txt(script_dir, config_info_folder)
 
+    startup_profiler.start_phase("generate_matches_config_txt")
     app.generate_matches_config_txt(config_info_folder, script_dir)
 
 
@@ -28562,6 +28193,7 @@ def main():
 
 
 
+    startup_profiler.start_phase("detect_file_changes")
     file_changes_detected = False
     mod_zip_changes_detected = False
     vanilla_zip_changes_detected = False
@@ -28672,6 +28304,7 @@ def main():
     check_mods = mod_zip_changes_detected or vanilla_zip_changes_detected
 
 
+    startup_profiler.start_phase("startup_mod_scripts")
     if run_mod_scan_on_startup and check_mods: # Only run if new zips and check_mods is true
 
 
@@ -28707,11 +28340,13 @@ def main():
                 final_instantiation=False
             )
             temp_app.run_ahk_scripts_mods()
+            temp_app.close_thumbnail_cache()
         except Exception as e:
             messagebox.showerror("Error", f"Error running AHK scripts for mods: {e}")
             root.destroy()
             sys.exit(1)
 
+    startup_profiler.start_phase("custom_config_scan")
     if check_configs and user_vehicles_folder:
 
 
@@ -28747,8 +28382,10 @@ def main():
             final_instantiation=False
         )
         temp_app.run_python_scripts_custom()
+        temp_app.close_thumbnail_cache()
 
 
+    startup_profiler.start_phase("orphan_rescan")
     if orphaned_files_detected: # Check the boolean return value
         print("DEBUG: Orphaned files detected by cleanup_orphaned_mod_files_simplified(). Calling run_ahk_scripts_mods() ...") # Debug
 
@@ -28779,6 +28416,8 @@ def main():
         current_zip_count
     )
 
+    app.close_thumbnail_cache() # The final ConfigViewerApp below opens its own
+
 
     root.destroy()
 
@@ -28798,6 +28437,7 @@ def main():
     if not os.path.exists(vehicles_content_folder):
         print(f"Warning: Extra vehicles folder not found: {vehicles_content_folder}")
 
+    startup_profiler.start_phase("main_window")
     root_main = tk.Tk()
     root_main.title("BeamNG Config Viewer")
     root_main.geometry("1200x800")
@@ -28850,6 +28490,7 @@ def main():
 
         
         
+    startup_profiler.start_phase("observers")
     if user_vehicles_folder and os.path.isdir(user_vehicles_folder):
         event_handler = CustomFileEventHandler(app, debounce_delay=1.0)
         observer = Observer()
@@ -28877,6 +28518,14 @@ def main():
         app._stop_keyboard_diff_monitoring()
         app._stop_switcher_monitoring()
 
+        if getattr(app, "thumbnail_cache", None) is not None:
+            print(f"DEBUG: Thumbnail cache stats: {app.thumbnail_cache.stats()}")
+        app.close_thumbnail_cache()
+
+        app.cancel_spawn_handshake()
+        if app.spawn_confirmation_watcher is not None:
+            app.spawn_confirmation_watcher.stop()
+
         new_mods_file = os.path.join(script_dir, "data/NewMods.txt")
         if os.path.exists(new_mods_file):
             try:
@@ -28917,6 +28566,13 @@ def main():
             root_main.destroy()
 
     root_main.protocol("WM_DELETE_WINDOW", on_closing)
+    # --- NEW: The last phase ends once the event loop first goes idle, i.e. the window is usable ---
+    def finish_startup_profile():
+        if startup_profiler.finish() is not None:
+            print(format_startup_profile_summary(read_startup_profile_history(startup_profiler.history_path)))
+
+    startup_profiler.start_phase("first_idle")
+    root_main.after_idle(finish_startup_profile)
     root_main.mainloop()
 
 
@@ -1,12 +1,15 @@
 import os
-import zipfile
 import re
 import time
+import sys
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from PIL import Image  # Import the Pillow library for image processing
+from concurrent.futures import ProcessPoolExecutor
 import tkinter as tk
 
+# Make the side-effect-free worker module importable here and in the worker processes
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from configpicworkerNEWMODS import extract_zip_pictures, get_worker_count, CONFIG_PICTURE_PATTERN
+
 
 
 # ========================
@@ -166,12 +169,13 @@ def preload_existing_files(folder_path):
 # ========================
 
 async def process_zip_file(zip_file, config_pictures, existing_config_pics, executor, mods_dir):
-    """Processes a single ZIP file, extracting specified config pictures and resizing them."""
+    """
+    Processes a single ZIP file, extracting specified config pictures and resizing them.
+    Path parsing and skip checks run here; the zip read, decode, resize and save run in
+    a worker process of the executor so zips are processed across all CPU cores.
+    """
     global extracted_count, skipped_count, error_count, log_messages, error_messages, original_extensions
 
-    #print(f"mods_dir: {mods_dir}")  # Debug: Print mods_dir
-    #print(f"zip_file: {zip_file}")  # Debug: Print zip_file
-
     full_zip_path = os.path.join(mods_dir, zip_file)
 
     if not os.path.exists(full_zip_path):
@@ -180,83 +184,73 @@ async def process_zip_file(zip_file, config_pictures, existing_config_pics, exec
         error_count += 1
         return
 
-    loop = asyncio.get_event_loop()
-    zip_skipped = False # Flag to indicate if any file in the zip was skipped
+    jobs = []
+    for config_picture_path in config_pictures:
+        # Extract the vehicle name and config name from the configPicturePath
+        match = CONFIG_PICTURE_PATTERN.match(config_picture_path)
+        if not match:
+            error_message = f"Unexpected internal path format: {config_picture_path} in {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            error_messages.append(error_message)
+            error_count += 1
+            continue
+
+        vehicle_name = match.group(1)
+        config_picture_file = match.group(2)
+        file_extension = match.group(3)
+        config_name = os.path.splitext(config_picture_file)[0]
+
+        # Construct the output file name (initially PNG)
+        output_picture_name = f"vehicles--{vehicle_name}_{zip_file}--{config_name}.png" # Force PNG output
+        output_picture_path = os.path.join(CONFIG_PICS_FOLDER, output_picture_name)
+
+        # Check if the output file already exists (or is already queued from another mods folder)
+        if output_picture_name in existing_config_pics:
+            log_message = f"WOULD HAVE SKIPPED - Skipped (already exists): {output_picture_name} from {zip_file} - Skipping entire zip file at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            log_messages.append(log_message)
+            skipped_count += len(config_pictures) # Increment skipped count by the number of config pictures in this zip
+            continue # Skip to the next config_picture_path
+
+        existing_config_pics.add(output_picture_name) # Reserve the name before handing the job to a worker
+        jobs.append((config_picture_path, output_picture_path, file_extension))
 
+    if not jobs:
+        return
+
+    loop = asyncio.get_running_loop()
     try:
-        with zipfile.ZipFile(full_zip_path, 'r') as zfile:
-            for config_picture_path in config_pictures:
-                # If the entire zip is already skipped, no need to process further files
-                if zip_skipped:
-                    continue
-
-                # Extract the vehicle name and config name from the configPicturePath
-                match = re.match(r"^vehicles/([^/]+)/([^/]+\.(png|jpg|jpeg))$", config_picture_path)
-                if not match:
-                    error_message = f"Unexpected internal path format: {config_picture_path} in {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                    error_messages.append(error_message)
-                    error_count += 1
-                    continue
-
-                vehicle_name = match.group(1)
-                config_picture_file = match.group(2)
-                file_extension = match.group(3)
-                config_name = os.path.splitext(config_picture_file)[0]
-
-                # Construct the output file name (initially PNG)
-                output_picture_name = f"vehicles--{vehicle_name}_{zip_file}--{config_name}.png" # Force PNG output
-                output_picture_path = os.path.join(CONFIG_PICS_FOLDER, output_picture_name)
-
-                # Check if the output file already exists
-                if output_picture_name in existing_config_pics:
-                    log_message = f"WOULD HAVE SKIPPED - Skipped (already exists): {output_picture_name} from {zip_file} - Skipping entire zip file at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                    log_messages.append(log_message)
-                    skipped_count += len(config_pictures) # Increment skipped count by the number of config pictures in this zip
-                    zip_skipped = False # Set the flag to skip the rest of the files in this zip - CHANGED TO FALSE TO PREVENT ZIP SKIPPING
-                    continue # Skip to the next config_picture_path
-
-                try:
-                    if config_picture_path not in zfile.namelist():
-                        error_message = f"Error: {config_picture_path} not found in {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                        error_messages.append(error_message)
-                        error_count += 1
-                        continue
-
-                    # Extract the specific picture (in memory), resize, and save
-                    with zfile.open(config_picture_path) as source, open(output_picture_path, 'wb') as target:
-                        try:
-                            img = Image.open(source)
-                            resized_img = img.resize((200, 110)) # Resize the image to 200x110
-                            resized_img.save(target, "PNG") # Save the resized image as PNG, explicitly specifying format
-                            original_extensions[output_picture_name] = file_extension # Store original extension
-                        except Exception as image_error:
-                            error_message = f"Error resizing image {config_picture_path} from {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}: {image_error} - Original Extension: {file_extension}\n" # Added original extension to error log
-                            error_messages.append(error_message)
-                            error_count += 1
-                            # If resizing fails, we still count it as an error but continue processing other files.
-                            continue # Skip to the next config_picture_path in the zip
-
-                    # Log the successful extraction and resizing
-                    log_message = f"Extracted and resized: {output_picture_name} from {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                    log_messages.append(log_message)
-                    extracted_count += 1
-                    existing_config_pics.add(output_picture_name)
-
-                except Exception as e:
-                    error_message = f"Error: Failed to extract {config_picture_path} from {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}: {e}\n"
-                    error_messages.append(error_message)
-                    error_count += 1
-            if zip_skipped: # Log that the entire zip was skipped after processing all files in it (or skipping early)
-                log_message = f"Skipped entire zip file: {zip_file} because at least one config picture already existed. at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                log_messages.append(log_message)
-
-
-    except zipfile.BadZipFile:
-        error_message = f"Error: Bad zip file encountered: {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        results = await loop.run_in_executor(executor, extract_zip_pictures, full_zip_path, jobs)
+    except Exception as e:
+        error_message = f"Error: Worker failed on {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}: {e}\n"
         error_messages.append(error_message)
         error_count += 1
         return
 
+    for status, config_picture_path, output_picture_path, file_extension, error_text in results:
+        if status == "bad_zip":
+            error_message = f"Error: Bad zip file encountered: {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            error_messages.append(error_message)
+            error_count += 1
+            return
+
+        output_picture_name = os.path.basename(output_picture_path)
+        if status == "ok":
+            original_extensions[output_picture_name] = file_extension # Store original extension
+            # Log the successful extraction and resizing
+            log_message = f"Extracted and resized: {output_picture_name} from {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            log_messages.append(log_message)
+            extracted_count += 1
+            continue
+
+        existing_config_pics.discard(output_picture_name) # Let another mods folder retry it
+        if status == "missing":
+            error_message = f"Error: {config_picture_path} not found in {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        elif status == "resize_error":
+            error_message = f"Error resizing image {config_picture_path} from {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}: {error_text} - Original Extension: {file_extension}\n" # Added original extension to error log
+        else:
+            error_message = f"Error: Failed to extract {config_picture_path} from {zip_file} at {time.strftime('%Y-%m-%d %H:%M:%S')}: {error_text}\n"
+        error_messages.append(error_message)
+        error_count += 1
+
 async def main():
     """Main function to control the script's execution flow."""
     global extracted_count, skipped_count, error_count, log_messages, error_messages, log_file_obj, error_log_obj, original_extensions
@@ -309,8 +303,10 @@ async def main():
     # Step 4: Preload Existing ConfigPics
     existing_config_pics = preload_existing_files(CONFIG_PICS_FOLDER)
 
-    # Step 5: Process Each ZIP File Asynchronously
-    with ThreadPoolExecutor(max_workers=5) as executor:  # Limit the number of threads
+    # Step 5: Process Each ZIP File in a process pool (one worker per core, never more than there are zips)
+    worker_count = max(1, min(get_worker_count(), len(zip_files)))
+    print(f"Extracting config pictures from {len(zip_files)} zip files with {worker_count} worker processes")
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
         tasks = []
         mods_dirs = [MODS_PATH, MODS_REPO_PATH]
 
@@ -0,0 +1,82 @@
+import os
+import io
+import re
+import zipfile
+from PIL import Image  # Import the Pillow library for image processing
+
+# ========================
+# Worker side of configpicextractorNEWMODS.py
+# ========================
+# This module has no import-time side effects (no Tk window, no log files) so it can be
+# imported by the worker processes of a ProcessPoolExecutor on every platform, including
+# the "spawn" start method used on Windows.
+
+CONFIG_PICTURE_PATTERN = re.compile(r"^vehicles/([^/]+)/([^/]+\.(png|jpg|jpeg))$")
+THUMBNAIL_SIZE = (200, 110)
+
+
+def get_worker_count():
+    """Number of worker processes to use: one per CPU core."""
+    return max(1, os.cpu_count() or 1)
+
+
+def resize_config_picture(image_bytes):
+    """
+    Decodes and resizes one config picture, returning the PNG bytes.
+    Uses exactly the same Pillow calls as the original serial extractor so the
+    output is byte-identical.
+    """
+    img = Image.open(io.BytesIO(image_bytes))
+    resized_img = img.resize(THUMBNAIL_SIZE) # Resize the image to 200x110
+    output = io.BytesIO()
+    resized_img.save(output, "PNG") # Save the resized image as PNG, explicitly specifying format
+    return output.getvalue()
+
+
+def extract_zip_pictures(full_zip_path, jobs):
+    """
+    Extracts, resizes and saves the given pictures from one zip file.
+    Runs inside a worker process; the zip is opened once per call.
+
+    Args:
+        full_zip_path (str): Path to the zip file.
+        jobs (list): (config_picture_path, output_picture_path, file_extension) tuples.
+
+    Returns:
+        list: One (status, config_picture_path, output_picture_path, file_extension, error_text)
+              tuple per job, where status is "ok", "missing", "resize_error" or "extract_error".
+              A single ("bad_zip", None, None, None, None) tuple is returned for corrupt zips.
+    """
+    results = []
+    try:
+        with zipfile.ZipFile(full_zip_path, 'r') as zfile:
+            names = set(zfile.namelist())
+            for config_picture_path, output_picture_path, file_extension in jobs:
+                if config_picture_path not in names:
+                    results.append(("missing", config_picture_path, output_picture_path, file_extension, None))
+                    continue
+                try:
+                    image_bytes = zfile.read(config_picture_path)
+                except Exception as e:
+                    results.append(("extract_error", config_picture_path, output_picture_path, file_extension, str(e)))
+                    continue
+                try:
+                    png_bytes = resize_config_picture(image_bytes)
+                except Exception as image_error:
+                    # The serial path opened the target before decoding, leaving an empty file behind
+                    try:
+                        open(output_picture_path, 'wb').close()
+                    except OSError:
+                        pass
+                    results.append(("resize_error", config_picture_path, output_picture_path, file_extension, str(image_error)))
+                    continue
+                try:
+                    with open(output_picture_path, 'wb') as target:
+                        target.write(png_bytes)
+                except Exception as e:
+                    results.append(("extract_error", config_picture_path, output_picture_path, file_extension, str(e)))
+                    continue
+                results.append(("ok", config_picture_path, output_picture_path, file_extension, None))
+    except zipfile.BadZipFile:
+        return [("bad_zip", None, None, None, None)]
+    return results
@@ -0,0 +1,114 @@
+import sys
+import logging
+import threading
+from collections import deque
+
+
+LOGGER_NAME = "ellexium"
+LOG_SUBSYSTEMS = ("data", "search", "filter", "favorites", "grid")
+DEFAULT_LOG_LEVEL = logging.INFO
+DEFAULT_CONSOLE_BUFFER_LINES = 5000  # Log records/printed chunks the console window can show
+LOG_FORMAT = "%(message)s"  # Same lines the print() calls produced
+
+
+def get_logger(subsystem):
+    """Logger of one subsystem ("data", "search", ...), a child of the app's logger."""
+    return logging.getLogger(f"{LOGGER_NAME}.{subsystem}")
+
+
+def parse_log_level(value):
+    """Returns the logging level for a name ("DEBUG", "info", ...) or number, or None if it isn't one."""
+    value = str(value).strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else None
+
+
+class LogRingBuffer:
+    """
+    Last capacity entries of console output: log records (formatted only when read) and
+    text written through print(). The console window reads what was added since its last
+    read and inserts it into its Text widget in one go, so nothing touches Tk while it is
+    hidden, and a window opened later still shows the recent history.
+    """
+
+    def __init__(self, capacity=DEFAULT_CONSOLE_BUFFER_LINES):
+        self._lock = threading.Lock()
+        self._entries = deque(maxlen=capacity)  # (sequence number, LogRecord or str)
+        self._next_sequence = 0
+        self.formatter = logging.Formatter(LOG_FORMAT)
+
+    def append(self, entry):
+        with self._lock:
+            self._entries.append((self._next_sequence, entry))
+            self._next_sequence += 1
+
+    def read_since(self, sequence):
+        """
+        Returns (next sequence, text added since sequence). Entries that dropped out of
+        the buffer in between are skipped.
+        """
+        with self._lock:
+            next_sequence = self._next_sequence
+            if sequence >= next_sequence:
+                return next_sequence, ""
+            first_kept = self._entries[0][0] if self._entries else next_sequence
+            entries = list(self._entries)[max(0, sequence - first_kept):]
+        parts = []
+        for _, entry in entries:
+            if isinstance(entry, logging.LogRecord):
+                try:
+                    parts.append(self.formatter.format(entry) + "\n")
+                except Exception as e:
+                    parts.append(f"<unformattable log record {entry.msg!r}: {e}>\n")
+            else:
+                parts.append(entry)
+        return next_sequence, "".join(parts)
+
+
+class RingBufferHandler(logging.Handler):
+    """Hands records to a LogRingBuffer unformatted; formatting waits until the console shows them."""
+
+    def __init__(self, ring_buffer):
+        super().__init__()
+        self.ring_buffer = ring_buffer
+
+    def emit(self, record):
+        self.ring_buffer.append(record)
+
+
+console_log_buffer = LogRingBuffer()
+_configured = False
+
+
+def configure_logging(default_level=DEFAULT_LOG_LEVEL, subsystem_levels=None, stream=None):
+    """
+    Sets up the app's logger once: records at or above the level go to the console ring
+    buffer and to stream (the original stdout by default; skipped if there is none, as
+    in a windowed build). Calling it again only changes the levels.
+
+    Args:
+        default_level (int): Level of the app's logger; subsystems without their own level inherit it.
+        subsystem_levels (dict, optional): {subsystem: level} overrides.
+    """
+    global _configured
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(default_level)
+    if not _configured:
+        logger.propagate = False
+        logger.addHandler(RingBufferHandler(console_log_buffer))
+        stream = stream if stream is not None else sys.__stdout__
+        if stream is not None:
+            stream_handler = logging.StreamHandler(stream)
+            stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            logger.addHandler(stream_handler)
+        _configured = True
+    for subsystem, level in (subsystem_levels or {}).items():
+        set_log_level(level, subsystem)
+
+
+def set_log_level(level, subsystem=None):
+    """Sets the level of one subsystem, or of the whole app if subsystem is None."""
+    logger = get_logger(subsystem) if subsystem else logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
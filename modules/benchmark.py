@@ -0,0 +1,1209 @@
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import random
+import zipfile
+import argparse
+import platform
+import tempfile
+import threading
+import statistics
+import subprocess
+import inspect
+import contextlib
+import importlib
+import importlib.util
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+# ========================
+# End-to-end benchmark of the mod data pipeline (run this file directly)
+# ========================
+# Builds a throwaway mods folder with synthetic BeamNG-style mod zips, copies this
+# project's modules into mods/EllexiumModManager/ next to them, and times every stage
+# from the zip scan to the global filter on it. Nothing here needs Windows or a display:
+# ConfigViewerApp is driven through HeadlessConfigViewer below, which only sets up the
+# state the data pipeline reads.
+#
+#   python modules/benchmark.py --vehicles 500 --output data/benchmark_results.json
+#
+# Results are one JSON document (see run_pipeline_benchmark) so runs from different
+# commits can be diffed or compared by a script.
+
+BENCHMARK_RESULTS_VERSION = 1
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+import EllexiumModManager # noqa: E402 - needs PROJECT_DIR on sys.path
+from modules.app_logging import configure_logging, parse_log_level # noqa: E402
+from modules import caller_trace # noqa: E402
+from modules import spawn_handshake # noqa: E402
+from modules.hidden_folder_matcher import HiddenFolderMatcher # noqa: E402
+
+PIC_WORKER_PATH = PROJECT_DIR / "data" / "PicInfoExtractForNewMods" / "configpicworkerNEWMODS.py"
+PLACEHOLDER_PICTURES = ("MissingZipConfigPic.png", "MissingCustomConfigPic.png")
+
+BRANDS = ["Gavril", "ETK", "Ibishu", "Hirochi", "Bruckell", "Civetta", "Autobello", "Cherrier", "Soliad", "Burnside"]
+COUNTRIES = ["United States", "Germany", "Japan", "Italy", "France", "United Kingdom", "Sweden"]
+BODY_STYLES = ["Sedan", "Coupe", "Wagon", "Pickup", "SUV", "Hatchback", "Van", "Bus", "Truck"]
+VEHICLE_TYPES = ["Car", "Truck", "Prop"]
+FUEL_TYPES = ["Gasoline", "Diesel", "Electricity"]
+DRIVETRAINS = ["RWD", "FWD", "AWD", "4WD"]
+TRANSMISSIONS = ["Manual", "Automatic", "Sequential", "DCT"]
+TRIMS = ["base", "sport", "luxury", "race", "offroad", "police", "taxi", "drift", "rally", "custom"]
+
+# Default queries for the perform_search stage: a brand, a body style, a trim that only
+# 'Configs' mode sees in the config names, and one that matches nothing.
+DEFAULT_SEARCH_QUERIES = ["gavril", "wagon", "sport", "zzz_no_match"]
+DEFAULT_GLOBAL_FILTER = 'Brand Contains "Ibishu" | Power Above 250 | Drivetrain Contains "AWD"'
+DEFAULT_UNINSTALLED_EVERY = 10  # Every nth zip is moved out of the mods folder for the orphan scan stages
+DEFAULT_CUSTOM_PICTURES = 5000  # Pictures written to ConfigPicsCustom for the find_image_path stage
+DEFAULT_SUBSET_LINES = 10000  # Lines of the data subset that is active for the perform_search (data subset) stages
+DEFAULT_TRACE_REFRESHES = 200  # Main grid refreshes per run of the grid_refresh_tracing stages
+TRACE_STACK_DEPTH = 40  # Stack depth those refreshes run at, about that of a Tk callback
+DEFAULT_HIDDEN_FILTER_LINES = 50000  # Config list lines filtered against Hidden.txt in the hidden_folder_filter stages
+HIDDEN_FILTER_HIDDEN_FOLDERS = 1000  # Hidden.txt entries for those stages...
+HIDDEN_FILTER_FOLDERS = 3000  # ...out of this many vehicle folders in the lines
+HIDDEN_FILTER_ANY_SAMPLE_LINES = 2000  # Lines the any() baseline is timed on (it takes minutes on all of them)
+DEFAULT_PICTURE_ZIPS = 500  # Zips of the config_picture_extract stages (two 1280x720 JPG pictures each)
+PICTURES_PER_ZIP = 2
+# Speedup the process pool should reach over the serial path on an 8-core machine
+# with the DEFAULT_PICTURE_ZIPS corpus.
+PICTURE_POOL_SPEEDUP_TARGET = 3.0
+DEFAULT_SPAWNS = 20  # Handshakes against the stand-in game for the spawn_handshake results
+CUSTOM_PICTURE_EXTENSIONS = ("jpg", "png", "jpeg")
+
+
+# ========================
+# Synthetic corpus
+# ========================
+
+def _encode_picture(color, size, image_format):
+    buffer = io.BytesIO()
+    image = Image.new("RGB", size, color)
+    if image_format == "JPEG":
+        image.save(buffer, image_format, quality=85)
+    else:
+        image.save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def generate_synthetic_corpus(mods_dir, vehicles=200, configs_per_vehicle=8, info_files_per_vehicle=6,
+                              pictures_per_vehicle=8, png_every=3, picture_size=(480, 270), seed=1234):
+    """
+    Writes one BeamNG-style mod zip per vehicle into mods_dir.
+
+    Each zip holds vehicles/<folder>/info.json, configs_per_vehicle .pc files, an
+    info_<config>.json for the first info_files_per_vehicle configs and a config picture
+    for the first pictures_per_vehicle configs (every png_every-th one a PNG, the rest JPG).
+    The same seed always produces the same corpus.
+
+    Returns:
+        dict: The corpus parameters and the number of files of each kind written.
+    """
+    rng = random.Random(seed)
+    os.makedirs(mods_dir, exist_ok=True)
+    info_files_per_vehicle = min(info_files_per_vehicle, configs_per_vehicle)
+    pictures_per_vehicle = min(pictures_per_vehicle, configs_per_vehicle)
+    counts = {"zips": 0, "pc_files": 0, "info_files": 0, "jpg_pictures": 0, "png_pictures": 0}
+
+    for vehicle_index in range(vehicles):
+        folder = f"synth{vehicle_index:04d}"
+        zip_name = f"synthetic_{vehicle_index:04d}.zip"
+        brand = rng.choice(BRANDS)
+        country = rng.choice(COUNTRIES)
+        body_style = rng.choice(BODY_STYLES)
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        encoded = {} # One encode per format per vehicle, the pixels don't matter here
+        config_names = [f"{TRIMS[i % len(TRIMS)]}_{i}" for i in range(configs_per_vehicle)]
+
+        with zipfile.ZipFile(os.path.join(mods_dir, zip_name), "w") as zfile:
+            main_info = {
+                "Name": f"Synthetic {vehicle_index}",
+                "Brand": brand,
+                "Country": country,
+                "Body Style": body_style,
+                "Type": rng.choice(VEHICLE_TYPES),
+                "Years": {"min": 1960 + vehicle_index % 50, "max": 1975 + vehicle_index % 50},
+                "Author": "Benchmark",
+                "default_pc": config_names[0] if config_names else "",
+                "Description": f"Synthetic test vehicle {vehicle_index}",
+            }
+            zfile.writestr(f"vehicles/{folder}/info.json", json.dumps(main_info, indent=2))
+
+            for config_index, config_name in enumerate(config_names):
+                pc_content = {"format": 2, "model": folder, "parts": {f"{folder}_body": f"{folder}_body_{config_name}"}}
+                zfile.writestr(f"vehicles/{folder}/{config_name}.pc", json.dumps(pc_content, indent=2))
+                counts["pc_files"] += 1
+
+                if config_index < info_files_per_vehicle:
+                    config_info = {
+                        "Configuration": f"{config_name.replace('_', ' ').title()} {brand}",
+                        "Value": rng.randrange(5000, 150000),
+                        "Power": rng.randrange(60, 800),
+                        "Torque": rng.randrange(100, 1200),
+                        "Weight": rng.randrange(800, 4000),
+                        "Top Speed": round(rng.uniform(30.0, 110.0), 2),
+                        "0-100 km/h": round(rng.uniform(2.5, 20.0), 2),
+                        "Off-Road Score": rng.randrange(0, 100),
+                        "Braking G": round(rng.uniform(0.6, 1.6), 2),
+                        "Fuel Type": rng.choice(FUEL_TYPES),
+                        "Drivetrain": rng.choice(DRIVETRAINS),
+                        "Transmission": rng.choice(TRANSMISSIONS),
+                        "Config Type": "Factory",
+                    }
+                    zfile.writestr(f"vehicles/{folder}/info_{config_name}.json", json.dumps(config_info, indent=2))
+                    counts["info_files"] += 1
+
+                if config_index < pictures_per_vehicle:
+                    if png_every and config_index % png_every == png_every - 1:
+                        image_format, extension = "PNG", "png"
+                    else:
+                        image_format, extension = "JPEG", "jpg"
+                    if image_format not in encoded:
+                        encoded[image_format] = _encode_picture(color, picture_size, image_format)
+                    zfile.writestr(f"vehicles/{folder}/{config_name}.{extension}", encoded[image_format])
+                    counts[f"{extension}_pictures"] += 1
+        counts["zips"] += 1
+
+    return {
+        "vehicles": vehicles,
+        "configs_per_vehicle": configs_per_vehicle,
+        "info_files_per_vehicle": info_files_per_vehicle,
+        "pictures_per_vehicle": pictures_per_vehicle,
+        "png_every": png_every,
+        "picture_size": list(picture_size),
+        "seed": seed,
+        **counts,
+    }
+
+
+def create_sandbox(root):
+    """
+    Lays out root/mods/EllexiumModManager/ the way the app is installed: a copy of the
+    modules folder (zippy and mod_command_line_config_gen find everything relative to
+    their own file) and a data folder holding the placeholder pictures.
+
+    Returns:
+        tuple: (mods_dir, project_dir) as Paths.
+    """
+    mods_dir = Path(root) / "mods"
+    project_dir = mods_dir / "EllexiumModManager"
+    (project_dir / "data").mkdir(parents=True, exist_ok=True)
+    shutil.copytree(PROJECT_DIR / "modules", project_dir / "modules",
+                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+    for picture in PLACEHOLDER_PICTURES:
+        shutil.copy2(PROJECT_DIR / "data" / picture, project_dir / "data" / picture)
+    return mods_dir, project_dir
+
+
+def write_user_files(project_dir, corpus, hidden_vehicles=10, favorites=25):
+    """Writes Hidden.txt (every few vehicles hidden) and favorites.txt (first config of the first vehicles)."""
+    data_dir = Path(project_dir) / "data"
+    vehicles = corpus["vehicles"]
+    step = max(1, vehicles // hidden_vehicles) if hidden_vehicles else 0
+    hidden = [f"synth{i:04d}" for i in range(0, vehicles, step)][:hidden_vehicles] if step else []
+    with open(data_dir / "Hidden.txt", "w", encoding="utf-8") as f:
+        for folder in hidden:
+            f.write(f"{folder}|||synthetic_{folder[5:]}.zip\n")
+    with open(data_dir / "favorites.txt", "w", encoding="utf-8") as f:
+        for i in range(min(favorites, vehicles)):
+            if corpus["configs_per_vehicle"]:
+                f.write(f"synth{i:04d}|{TRIMS[0]}_0.pc\n")
+    return {"hidden_vehicles": len(hidden), "favorites": min(favorites, vehicles) if corpus["configs_per_vehicle"] else 0}
+
+
+def extract_config_assets(mods_dir, project_dir):
+    """
+    Stands in for configinfoextractorNEWMODS / configpicextractorNEWMODS, which open Tk
+    windows at import: writes data/ConfigInfo and data/ConfigPics exactly as they name
+    them, resizing pictures with the extractor's own worker function.
+    """
+    pic_worker = _load_module("configpicworkerNEWMODS", PIC_WORKER_PATH)
+    config_info_dir = Path(project_dir) / "data" / "ConfigInfo"
+    config_pics_dir = Path(project_dir) / "data" / "ConfigPics"
+    config_info_dir.mkdir(parents=True, exist_ok=True)
+    config_pics_dir.mkdir(parents=True, exist_ok=True)
+
+    for zip_path in sorted(Path(mods_dir).glob("*.zip")):
+        zip_file = zip_path.name
+        jobs = []
+        with zipfile.ZipFile(zip_path, "r") as zfile:
+            for internal_file in zfile.namelist():
+                parts = internal_file.split("/")
+                if len(parts) != 3 or parts[0] != "vehicles":
+                    continue
+                vehicle_path, file_name = parts[1], parts[2]
+                base_name, extension = os.path.splitext(file_name)
+                if file_name == "info.json":
+                    output_info_name = f"vehicles--{vehicle_path}_{zip_file}--info.json"
+                elif extension == ".json" and base_name.startswith("info_"):
+                    output_info_name = f"vehicles--INDIVIDUAL--{vehicle_path}_{zip_file}--info_{base_name}.json"
+                else:
+                    match = pic_worker.CONFIG_PICTURE_PATTERN.match(internal_file)
+                    if match:
+                        output_picture_name = f"vehicles--{vehicle_path}_{zip_file}--{base_name}.png"
+                        jobs.append((internal_file, str(config_pics_dir / output_picture_name), match.group(3)))
+                    continue
+                with zfile.open(internal_file) as source, open(config_info_dir / output_info_name, "wb") as target:
+                    shutil.copyfileobj(source, target)
+        if jobs:
+            pic_worker.extract_zip_pictures(str(zip_path), jobs)
+
+
+def build_picture_zip_corpus(corpus_dir, zip_count, pics_per_zip=PICTURES_PER_ZIP):
+    """
+    Writes zip_count mod zips, each holding pics_per_zip large JPG config pictures.
+    Returns (zip path, [(config picture path, output picture name, extension)]) per zip.
+    """
+    os.makedirs(corpus_dir, exist_ok=True)
+    tasks = []
+    for zip_index in range(zip_count):
+        zip_name = f"picture_mod_{zip_index:04d}.zip"
+        jobs = []
+        with zipfile.ZipFile(os.path.join(corpus_dir, zip_name), "w") as zfile:
+            for pic_index in range(pics_per_zip):
+                color = ((zip_index * 7) % 256, (pic_index * 31) % 256, 128)
+                internal_path = f"vehicles/car{zip_index}/config_{pic_index}.jpg"
+                zfile.writestr(internal_path, _encode_picture(color, (1280, 720), "JPEG"))
+                jobs.append((internal_path, f"vehicles--car{zip_index}_{zip_name}--config_{pic_index}.png", "jpg"))
+        tasks.append((os.path.join(corpus_dir, zip_name), jobs))
+    return tasks
+
+
+# ========================
+# Headless app
+# ========================
+
+class HeadlessWidget:
+    """Takes the place of the Tk widgets the pipeline configures or lifts; every call does nothing."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def winfo_exists(self):
+        return True
+
+
+class HeadlessVar:
+    """tk.StringVar without a Tk interpreter."""
+
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class HeadlessConfigViewer(EllexiumModManager.ConfigViewerApp):
+    """
+    ConfigViewerApp for the benchmark. ConfigViewerApp.__init__ is not called (it builds
+    the whole GUI); only the state load_data, perform_search and the global filter read
+    is set up here, with the same values __init__ uses. Methods that only refresh
+    windows are no-ops, everything else runs the app's own code.
+
+    Paths use the exact folder case main() creates (ConfigInfo, Matches.txt), since
+    Linux file systems are case-sensitive.
+    """
+
+    def __init__(self, project_dir):
+        project_dir = Path(project_dir)
+        self.master = HeadlessWidget()
+        self.script_dir = project_dir
+        self.input_file = os.path.join(project_dir, "data/outputGOOD.txt")
+        self.config_pics_folder = os.path.join(project_dir, "data/ConfigPics")
+        self.config_info_folder = os.path.join(project_dir, "data/ConfigInfo")
+        self.config_pics_custom_folder = os.path.join(project_dir, "data/ConfigPicsCustom")
+        self.hidden_txt_file = os.path.join(project_dir, "data/Hidden.txt")
+        self.hidden_folder_matchers = None
+        self.repo_folder = str(project_dir.parent / "repo")
+        self.zip_install_times = None
+        self.user_folder = ""
+        self.vehicles_content_folder = ""
+        self.processed_data_store = EllexiumModManager.ProcessedDataStore(
+            EllexiumModManager.get_processed_data_db_path(project_dir))
+        self.ZIP_BASE_NAMES = []
+        self.config_info_index = None
+        self.custom_picture_index = None
+
+        self.individual_info_cache = {}
+        self.full_data_cache = {}
+        self.data_cache = []
+        self.config_info_cache = {}
+        self.individual_info_files = {}
+        self._view_all_data_cache = {}
+
+        self.placeholder_settings = False
+        self.sort_by_install_date = False
+        self.collapse_categories_by_default = False
+        self.show_pinned_favorites_category = True
+        self.default_categorization_mode = 'Type'
+        self.categorization_mode = 'Type'
+        self.category_hidden_states = {}
+        self.font_size_add = 0
+
+        self.data_subset_file = os.path.join(project_dir, "data/data_subset.txt")
+        self.write_filter_output_files = False
+        self.data_subset_lines = None
+        self.data_subset_favorites_lines = None
+        self.data_subset_filter_cache = {}
+        self.filter_attribute_table = None
+        self.facet_index = None
+        self.facet_view = None
+        self.facet_view_source = None
+        self.sidebar_facet_counts = {}
+        self.matches_txt = "data/Matches.txt"
+        self.configinfo_folder = self.config_info_folder
+        self.filter_output_file = os.path.join(project_dir, "data/filter_results.txt")
+        self.is_data_subset_active = False
+
+        self.favorites_file_path = os.path.join(project_dir, "data/favorites.txt")
+        self.favorites_generation = 0
+        self.favorite_path_index = None
+        self.favorite_path_index_key = None
+        self.favorites_read_key = None
+        self.favorite_folders = None
+        self.favorite_folders_generation = None
+        self.pinned_favorite_folders = EllexiumModManager.PinnedFavoriteFolders()
+        self.favorite_configs = set()
+        self.current_favorites_amount = 0
+        self.favorites_amount_changed = False
+        self.unique_favorite_folder_count = 0
+
+        self.matches_config_data = {}
+        self.config_search_index = None
+        self._config_search_cache_key = None
+        self.search_match_memo = EllexiumModManager.SearchMatchMemo()
+        self._config_search_cache_folders = set()
+
+        self.filter_state = 0
+        self.filter_options = [
+            "View All",
+            "Items with Config Preview Images [debug]",
+            "Items Without Config Preview Images [debug]",
+            "Only Mods",
+            "Vanilla",
+            "Favorites",
+            "Unpacked Mods"
+        ]
+        self.items_to_be_hidden = False
+        self.skip_perform_search = False
+        self.search_mode = "General"
+        self.search_var = HeadlessVar()
+        self.search_results_window = None
+        self.is_search_results_window_active = False
+        self.window_size_changed_during_details_window = False
+        self.current_details_sidebar_spawn_cmd = None
+
+        self.filter_button = HeadlessWidget()
+        self.subset_data_button = HeadlessWidget()
+        self.canvas = HeadlessWidget()
+
+        self.original_data = []
+        self.original_full_data = {}
+        self.data = []
+        self.full_data = {}
+        self.grouped_data = {}
+
+    def close(self):
+        if self.processed_data_store is not None:
+            self.processed_data_store.close()
+
+    # --- UI refreshes: nothing to draw ---
+
+    def update_grid_layout(self, *args, **kwargs):
+        pass
+
+    def show_search_results_window(self, final_list=None):
+        self.is_search_results_window_active = True
+        return HeadlessWidget()
+
+    def destroy_search_results_window(self, *args, **kwargs):
+        self.search_results_window = None
+
+    def lift_search_results_window(self, event=None):
+        pass
+
+    def update_search_results_window_ui(self, *args, **kwargs):
+        pass
+
+    def inherit_category_visibility_search_results(self, *args, **kwargs):
+        pass
+
+    def trigger_toggle_sort_by_install_date_after_search_results_window_close(self, *args, **kwargs):
+        pass
+
+    def _update_filters_label_status(self, *args, **kwargs):
+        pass
+
+    def _repopulate_sidebar_dropdowns_on_reset(self):
+        pass
+
+    # --- Driving the pipeline the way main() and the search bar do ---
+
+    def load(self):
+        """load_data() plus the bookkeeping ConfigViewerApp.__init__ does right after it."""
+        self.original_data, self.original_full_data = self.load_data()
+        self.data = list(self.original_data)
+        self.full_data = self.original_full_data.copy()
+        self.grouped_data = self.format_grouped_data(self.data)
+        return self.data
+
+    def search(self, query, search_mode="General"):
+        """Types query into the search bar. Returns the number of items shown."""
+        self.search_mode = search_mode
+        self.search_var.set(query)
+        self.perform_search()
+        return len(self.data)
+
+    def apply_global_filter(self, filters_string):
+        """The Apply button of the Filters window (apply_filters_and_run_filter) minus the widgets."""
+        self.filter_config_files(filters_string)
+        self.is_data_subset_active = True
+        self.perform_search()
+        return len(self.data)
+
+    def clear_global_filter(self):
+        self.is_data_subset_active = False
+        self.data_subset_lines = None
+        self.data_subset_favorites_lines = None
+        self.data_subset_filter_cache.clear()
+
+
+# ========================
+# Timing
+# ========================
+
+def _load_module(module_name, module_path):
+    """Loads a module from a file, the same way mod_command_line_config_gen loads zippy."""
+    spec = importlib.util.spec_from_file_location(module_name, str(module_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _CurrentStdout:
+    """Log stream that writes to whatever sys.stdout is at the time, so _quiet discards log output too."""
+
+    def write(self, text):
+        return sys.stdout.write(text)
+
+    def flush(self):
+        sys.stdout.flush()
+
+
+@contextlib.contextmanager
+def _quiet(verbose):
+    """The pipeline prints a lot; that output is not what is being measured."""
+    if verbose:
+        yield
+        return
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _time_stage(stages, name, func, repeat=1, setup=None, verbose=False):
+    """
+    Runs func repeat times (calling setup before each run, untimed) and records the
+    timings under stages[name]. Returns func's result from the last run.
+    """
+    runs = []
+    result = None
+    for _ in range(repeat):
+        with _quiet(verbose):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = func()
+            runs.append(time.perf_counter() - start)
+    stages[name] = {
+        "seconds": round(statistics.median(runs), 6),
+        "min_seconds": round(min(runs), 6),
+        "runs": [round(run, 6) for run in runs],
+    }
+    return result
+
+
+def _get_git_commit():
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], cwd=PROJECT_DIR, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if output.returncode != 0:
+        return None
+    return output.stdout.strip() or None
+
+
+def _find_orphaned_mod_files_per_line_stats(zip_folders, config_pics_folder, config_info_folder, input_file):
+    """
+    The startup orphan scan as it worked before find_orphaned_mod_files: os.listdir plus an
+    isfile per zip, then an os.path.exists per expected picture/info file of every
+    outputGOOD.txt line. Baseline for the orphan_scan stages.
+
+    Returns:
+        tuple: (orphaned file paths, number of os.path.exists calls)
+    """
+    existing_zip_files = set()
+    for folder_path in zip_folders:
+        for item in os.listdir(folder_path):
+            if item.lower().endswith(".zip") and os.path.isfile(os.path.join(folder_path, item)):
+                existing_zip_files.add(item)
+
+    orphaned_files = []
+    exists_calls = 0
+    with open(input_file, "r", encoding="utf-8") as f:
+        for line in f:
+            expected = EllexiumModManager.get_expected_mod_file_names(line.strip())
+            if expected is None:
+                continue
+            zip_file_name, config_pic_names, config_info_names = expected
+            candidates = ([os.path.join(config_pics_folder, name) for name in config_pic_names]
+                          + [os.path.join(config_info_folder, name) for name in config_info_names])
+            for filepath in candidates:
+                exists_calls += 1
+                if os.path.exists(filepath) and zip_file_name not in existing_zip_files:
+                    orphaned_files.append(filepath)
+    return orphaned_files, exists_calls
+
+
+def _hidden_folder_filter_per_line_any(lines, hidden_folders):
+    """
+    The load_data filter against Hidden.txt as it worked before HiddenFolderMatcher: an
+    any() over every hidden folder for each line. Baseline for the hidden_folder_filter stages.
+    """
+    return [
+        line for line in lines
+        if not any(
+            f"vehicles/{folder}/" in line.lower() or f"vehicles\\{folder}\\" in line.lower()
+            for folder in hidden_folders
+        )
+    ]
+
+
+def build_hidden_filter_lines(line_count, folders):
+    """outputGOOD.txt-style lines (picture line, spawn line, blank line) for configs of the given folders."""
+    rng = random.Random(1)
+    lines = []
+    while len(lines) < line_count:
+        folder = rng.choice(folders)
+        config = f"config_{rng.randrange(100)}"
+        lines.append(f'{folder}.zip (package)  - "{folder}" (internal folder name) - "vehicles/{folder}/{config}.jpg" (config picture)\n')
+        lines.append(f"core_vehicles.spawnNewVehicle(\"{folder}\", {{config = 'vehicles/{folder}/{config}.pc'}})\n")
+        lines.append("\n")
+    return lines[:line_count]
+
+
+def _extract_zip_pictures_zfile_open(full_zip_path, jobs):
+    """
+    configpicextractorNEWMODS before configpicworkerNEWMODS: each picture is decoded
+    straight from zfile.open() and saved into the open target file. Baseline for the
+    config_picture_extract stages.
+    """
+    with zipfile.ZipFile(full_zip_path, "r") as zfile:
+        for config_picture_path, output_picture_path, _ in jobs:
+            with zfile.open(config_picture_path) as source, open(output_picture_path, "wb") as target:
+                img = Image.open(source)
+                resized_img = img.resize((200, 110))
+                resized_img.save(target, "PNG")
+
+
+def _import_pic_worker():
+    """Imports configpicworkerNEWMODS by name, as the extractor does, so pool workers can unpickle its functions."""
+    if str(PIC_WORKER_PATH.parent) not in sys.path:
+        sys.path.insert(0, str(PIC_WORKER_PATH.parent))
+    return importlib.import_module("configpicworkerNEWMODS")
+
+
+def _time_config_picture_extract(stages, work_dir, zip_count, verbose=False):
+    """
+    Times the picture extraction of zip_count synthetic zips: the zfile.open() baseline,
+    extract_zip_pictures serially, and extract_zip_pictures in a process pool as
+    configpicextractorNEWMODS runs it. Returns the counts for the results.
+    """
+    pic_worker = _import_pic_worker()
+    root = Path(work_dir) / "picture_extract"
+    tasks = build_picture_zip_corpus(str(root / "mods"), zip_count)
+    workers = pic_worker.get_worker_count()
+
+    def jobs_for(output_dir, jobs):
+        return [(path, os.path.join(output_dir, name), extension) for path, name, extension in jobs]
+
+    def run_serial(extract, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        for zip_path, jobs in tasks:
+            extract(zip_path, jobs_for(output_dir, jobs))
+
+    def run_pool(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(pic_worker.extract_zip_pictures, zip_path, jobs_for(output_dir, jobs))
+                       for zip_path, jobs in tasks]
+            for future in futures:
+                future.result()
+
+    output_dirs = {name: str(root / name) for name in ("zfile_open", "serial", "pool")}
+    _time_stage(stages, f"config_picture_extract (zfile.open per picture, serial, {zip_count} zips)",
+                lambda: run_serial(_extract_zip_pictures_zfile_open, output_dirs["zfile_open"]), verbose=verbose)
+    serial_stage = f"config_picture_extract (extract_zip_pictures, serial, {zip_count} zips)"
+    _time_stage(stages, serial_stage, lambda: run_serial(pic_worker.extract_zip_pictures, output_dirs["serial"]), verbose=verbose)
+    pool_stage = f"config_picture_extract (extract_zip_pictures, {workers}-process pool, {zip_count} zips)"
+    _time_stage(stages, pool_stage, lambda: run_pool(output_dirs["pool"]), verbose=verbose)
+
+    # Every output must match the baseline's byte for byte
+    baseline_files = sorted(os.listdir(output_dirs["zfile_open"]))
+    identical = bool(baseline_files)
+    for name in ("serial", "pool"):
+        identical = identical and sorted(os.listdir(output_dirs[name])) == baseline_files
+    for file_name in baseline_files if identical else ():
+        baseline_bytes = Path(output_dirs["zfile_open"], file_name).read_bytes()
+        if any(Path(output_dirs[name], file_name).read_bytes() != baseline_bytes for name in ("serial", "pool")):
+            identical = False
+            break
+    shutil.rmtree(root, ignore_errors=True)
+
+    pool_seconds = stages[pool_stage]["seconds"]
+    return {
+        "pictures": sum(len(jobs) for _, jobs in tasks),
+        "workers": workers,
+        "pool_speedup": round(stages[serial_stage]["seconds"] / pool_seconds, 2) if pool_seconds else None,
+        "pool_speedup_target": PICTURE_POOL_SPEEDUP_TARGET,
+        "matches_baseline": identical,
+    }
+
+
+def _inspect_stack_refresh():
+    # The three caller lookups of a main grid refresh before modules/caller_trace.py:
+    # update_grid_layout printed its caller and its whole stack, and
+    # calculate_columns_for_width printed its caller, each through inspect.stack().
+    stack = inspect.stack()
+    if len(stack) > 1:
+        caller_frame_record = stack[1]
+        _ = (caller_frame_record.function, caller_frame_record.filename, caller_frame_record.lineno, caller_frame_record.code_context)
+    for frame_info in inspect.stack():
+        _ = (frame_info.filename, frame_info.lineno, frame_info.function, frame_info.code_context)
+    stack = inspect.stack()
+    if len(stack) > 1:
+        _ = (stack[1].function, stack[1].filename, stack[1].lineno, stack[1].code_context)
+
+
+def _caller_trace_refresh():
+    # The same three lookups through modules/caller_trace.py
+    caller_trace.trace_caller("update_grid_layout")
+    caller_trace.trace_call_stack("update_grid_layout")
+    caller_trace.trace_caller("calculate_columns_for_width")
+
+
+def _no_trace_refresh():
+    pass
+
+
+def _run_at_depth(depth, func):
+    if depth <= 0:
+        return func()
+    return _run_at_depth(depth - 1, func)
+
+
+def _run_refreshes(refresh, refreshes, depth=TRACE_STACK_DEPTH):
+    for _ in range(refreshes):
+        _run_at_depth(depth, refresh)
+
+
+def _time_grid_refresh_tracing(stages, refreshes, repeat):
+    """
+    Times refreshes main grid refreshes' worth of caller tracing at TRACE_STACK_DEPTH:
+    no tracing (the cost of reaching the depth), the inspect.stack() lookups before
+    caller_trace, and caller_trace off and on (its printing goes to _quiet's devnull).
+    Returns {variant: microseconds per refresh over no tracing}.
+    """
+    variants = (
+        ("no tracing", _no_trace_refresh, False),
+        ("inspect.stack, before", _inspect_stack_refresh, False),
+        ("caller_trace off", _caller_trace_refresh, False),
+        ("caller_trace on", _caller_trace_refresh, True),
+    )
+    previous_state = caller_trace.is_caller_tracing_enabled()
+    stage_names = {}
+    try:
+        for label, refresh, tracing in variants:
+            caller_trace.set_caller_tracing(tracing)
+            stage_name = f"grid_refresh_tracing ({label}, {refreshes} refreshes)"
+            _time_stage(stages, stage_name, lambda r=refresh: _run_refreshes(r, refreshes), repeat)
+            stage_names[label] = stage_name
+    finally:
+        caller_trace.set_caller_tracing(previous_state)
+    baseline = stages[stage_names["no tracing"]]["seconds"]
+    return {
+        label: round(max(0.0, stages[stage_name]["seconds"] - baseline) / refreshes * 1e6, 2)
+        for label, stage_name in stage_names.items() if label != "no tracing"
+    }
+
+
+# The real spawn hotkey only reaches BeamNG.drive on Windows. The stand-in game below plays
+# the game's part on any OS: it waits for a trigger file (the "hotkey"), then writes the
+# confirmation file like the Lua side of EllexiumModManagerInput.zip does. It runs as a
+# separate process (this file with --stand-in-game).
+
+STAND_IN_TRIGGER_FILE_NAME = "standin_hotkey.txt"
+STAND_IN_STOP_FILE_NAME = "standin_stop.txt"
+
+
+def run_stand_in_game(data_dir, reaction_delay=0.05, frame_time=1 / 60, ignore_every=0):
+    """
+    Stand-in game loop. Checks for the trigger file once per frame, then writes the
+    confirmation file after reaction_delay seconds. With ignore_every=n, every nth hotkey
+    is swallowed, like a game that didn't have focus.
+    """
+    trigger_path = os.path.join(data_dir, STAND_IN_TRIGGER_FILE_NAME)
+    stop_path = os.path.join(data_dir, STAND_IN_STOP_FILE_NAME)
+    confirmation_path = os.path.join(data_dir, spawn_handshake.COMMAND_CONFIRMATION_FILE_NAME)
+    hotkeys_seen = 0
+    while not os.path.exists(stop_path):
+        if os.path.exists(trigger_path):
+            os.remove(trigger_path)
+            hotkeys_seen += 1
+            if ignore_every and hotkeys_seen % ignore_every == 0:
+                continue
+            time.sleep(reaction_delay)
+            with open(confirmation_path, "w", encoding="utf-8") as f:
+                f.write("ok")
+        time.sleep(frame_time)
+
+
+def _thread_schedule(delay_ms, callback):
+    timer = threading.Timer(delay_ms / 1000, callback)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+def _thread_unschedule(timer):
+    timer.cancel()
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+
+def run_spawn_handshake_benchmark(spawns=DEFAULT_SPAWNS, reaction_delay=0.05, attempt_timeout=1.0, ignore_every=5):
+    """
+    Starts the stand-in game and runs spawns handshakes (modules/spawn_handshake.py) against it.
+    Returns a dict with the end-to-end latencies (first hotkey to confirmation) in ms, and
+    checks that a cancelled handshake reports "cancelled".
+    """
+    with tempfile.TemporaryDirectory() as data_dir:
+        game = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--stand-in-game", data_dir,
+                                 str(reaction_delay), str(ignore_every)])
+        watcher = spawn_handshake.SpawnConfirmationWatcher(
+            os.path.join(data_dir, spawn_handshake.COMMAND_CONFIRMATION_FILE_NAME))
+        watcher.start()
+        trigger_path = os.path.join(data_dir, STAND_IN_TRIGGER_FILE_NAME)
+
+        def send_hotkey(attempt):
+            with open(trigger_path, "w", encoding="utf-8") as f:
+                f.write(str(attempt))
+
+        def run_one(cancel_after=None):
+            finished = threading.Event()
+            handshake = spawn_handshake.SpawnHandshake(watcher, send_hotkey, _thread_schedule, _thread_unschedule,
+                                                       attempt_timeout=attempt_timeout,
+                                                       on_done=lambda result: finished.set())
+            handshake.start()
+            if cancel_after is not None:
+                time.sleep(cancel_after)
+                handshake.cancel()
+            finished.wait(attempt_timeout * (spawn_handshake.DEFAULT_MAX_ATTEMPTS + 1))
+            return handshake.result
+
+        try:
+            results = [run_one() for _ in range(spawns)]
+            # Hotkey the game never answers in time: cancelling must end the handshake right away
+            cancelled = run_one(cancel_after=0.0)
+            time.sleep(reaction_delay * 3) # Let the stand-in answer the cancelled hotkey before stopping
+        finally:
+            with open(os.path.join(data_dir, STAND_IN_STOP_FILE_NAME), "w", encoding="utf-8") as f:
+                f.write("stop")
+            game.wait(timeout=10)
+            watcher.stop()
+
+    latencies = sorted(result.latency * 1000 for result in results if result and result.status == "confirmed")
+    return {
+        "spawns": spawns,
+        "confirmed": len(latencies),
+        "retried": sum(1 for result in results if result and result.attempts > 1),
+        "stand_in_reaction_ms": round(reaction_delay * 1000, 1),
+        "latency_median_ms": round(_percentile(latencies, 0.5), 1) if latencies else None,
+        "latency_p95_ms": round(_percentile(latencies, 0.95), 1) if latencies else None,
+        "latency_max_ms": round(latencies[-1], 1) if latencies else None,
+        "cancel_status": cancelled.status if cancelled else None,
+    }
+
+
+def _count_lines(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return sum(1 for _ in f)
+    except OSError:
+        return 0
+
+
+def build_data_subset_lines(items, line_count):
+    """
+    data_subset.txt-style lines for line_count lines: the picture names of every second
+    item, padded with picture names of folders that don't exist.
+    """
+    lines = [os.path.basename(item[0]) for item in items[::2] if item[0]][:line_count]
+    for index in range(line_count - len(lines)):
+        lines.append(f"vehicles--nomatch{index:06d}_nomatch{index:06d}.zip--base_0.jpg")
+    return lines
+
+
+def write_custom_pictures(config_pics_custom_folder, count, user_vehicles=50):
+    """
+    Writes count empty pictures named like the custom picture extractor does
+    (vehicles--<folder>_user--<config>.<ext>, mixed case and extensions) and returns the
+    (folder_name, file_name) pairs find_image_path is called with for them: half without
+    an extension, half with one in a different case than on disk.
+    """
+    os.makedirs(config_pics_custom_folder, exist_ok=True)
+    lookups = []
+    for i in range(count):
+        folder_name = f"custom_{i % user_vehicles:03d}"
+        config_name = f"Config_{i:05d}"
+        extension = CUSTOM_PICTURE_EXTENSIONS[i % len(CUSTOM_PICTURE_EXTENSIONS)]
+        file_name = f"vehicles--{folder_name}_user--{config_name}.{extension}"
+        with open(os.path.join(config_pics_custom_folder, file_name), "wb"):
+            pass
+        lookups.append((folder_name, config_name.lower() if i % 2 else f"{config_name}.{extension.upper()}"))
+    return lookups
+
+
+def run_pipeline_benchmark(vehicles=200, configs_per_vehicle=8, info_files_per_vehicle=6, pictures_per_vehicle=8,
+                           png_every=3, hidden_vehicles=10, favorites=25, repeat=3,
+                           search_queries=None, global_filter=DEFAULT_GLOBAL_FILTER,
+                           uninstalled_every=DEFAULT_UNINSTALLED_EVERY, custom_pictures=DEFAULT_CUSTOM_PICTURES,
+                           subset_lines=DEFAULT_SUBSET_LINES, trace_refreshes=DEFAULT_TRACE_REFRESHES,
+                           hidden_filter_lines=DEFAULT_HIDDEN_FILTER_LINES, picture_zips=DEFAULT_PICTURE_ZIPS,
+                           spawns=DEFAULT_SPAWNS, work_dir=None, verbose=False, log_level="INFO"):
+    """
+    Generates a synthetic corpus and times each pipeline stage on it.
+
+    Stages are timed in the order the app runs them:
+        zippy.main (cold, then warm with the zip index), extract_config_assets (stand-in for
+        the NEWMODS extractors), the config picture extraction of picture_zips separate
+        zips (zfile.open baseline vs. extract_zip_pictures, serially and in a process pool),
+        mod_command_line_config_gen.main, the startup orphan scan
+        (per-line stats vs. find_orphaned_mod_files, with every uninstalled_every-th zip
+        moved out of the mods folder), process_lines, find_fallback_info for every picture,
+        find_image_path for custom_pictures pictures in ConfigPicsCustom (index build included),
+        generate_matches_txt, generate_matches_config_txt, load_data (cold store, rescan
+        with an up-to-date store, cache hit), perform_search per query and search mode,
+        the global filter apply, and perform_search per query with a subset_lines-line
+        data subset active. Then the caller tracing of trace_refreshes main grid refreshes,
+        before and after modules/caller_trace.py, the Hidden.txt filter of load_data on
+        hidden_filter_lines synthetic config list lines (any() per line on a sample vs.
+        HiddenFolderMatcher), and spawns spawn handshakes against the
+        stand-in game (counts["spawn_handshake"]).
+
+    Args:
+        repeat (int): Runs per stage that can be repeated without changing its input;
+                      each stage reports the median and the minimum.
+        work_dir (str, optional): Where to build the sandbox (kept afterwards). A temporary
+                                  folder that is removed again is used by default.
+        log_level (str): Level of the app's loggers during the run ("DEBUG" formats and
+                         writes every debug line, as the print() calls used to).
+
+    Returns:
+        dict: JSON-serializable results.
+    """
+    search_queries = DEFAULT_SEARCH_QUERIES if search_queries is None else search_queries
+    level = parse_log_level(log_level)
+    if level is None:
+        raise ValueError(f"Unknown log level: {log_level}")
+    configure_logging(level, stream=_CurrentStdout())
+    stages = {}
+    counts = {}
+    original_cwd = os.getcwd()
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix="ellexium_benchmark_")
+        work_dir = temp_dir.name
+
+    app = None
+    try:
+        mods_dir, project_dir = create_sandbox(work_dir)
+        generate_start = time.perf_counter()
+        corpus = generate_synthetic_corpus(mods_dir, vehicles, configs_per_vehicle, info_files_per_vehicle,
+                                           pictures_per_vehicle, png_every)
+        corpus["generate_seconds"] = round(time.perf_counter() - generate_start, 6)
+        corpus.update(write_user_files(project_dir, corpus, hidden_vehicles, favorites))
+        os.chdir(project_dir) # Some data paths in the app are relative to the working directory
+        data_dir = project_dir / "data"
+
+        zippy = _load_module("zippy", project_dir / "modules" / "zippy.py")
+        config_gen = _load_module("mod_command_line_config_gen", project_dir / "modules" / "mod_command_line_config_gen.py")
+
+        def clear_zip_index():
+            for name in ("zip_structure.txt", zippy.ZIP_INDEX_FILE_NAME):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(data_dir / name)
+
+        _time_stage(stages, "zippy.main (cold)", zippy.main, repeat, setup=clear_zip_index, verbose=verbose)
+        _time_stage(stages, "zippy.main (warm)", zippy.main, repeat, verbose=verbose)
+        _time_stage(stages, "extract_config_assets", lambda: extract_config_assets(mods_dir, project_dir), verbose=verbose)
+        if picture_zips:
+            counts["config_picture_extract"] = _time_config_picture_extract(stages, work_dir, picture_zips, verbose)
+        _time_stage(stages, "mod_command_line_config_gen.main", config_gen.main, repeat, verbose=verbose)
+        counts["outputgood_lines"] = _count_lines(data_dir / "outputGOOD.txt")
+
+        if uninstalled_every:
+            uninstalled_dir = Path(work_dir) / "uninstalled"
+            uninstalled_dir.mkdir(exist_ok=True)
+            uninstalled_zips = sorted(Path(mods_dir).glob("*.zip"))[::uninstalled_every]
+            for zip_path in uninstalled_zips:
+                shutil.move(str(zip_path), str(uninstalled_dir / zip_path.name))
+            try:
+                orphan_scan_args = (str(data_dir / "ConfigPics"), str(data_dir / "ConfigInfo"), str(data_dir / "outputGOOD.txt"))
+                reference_orphans, exists_calls = _time_stage(
+                    stages, "orphan_scan (per-line stats)",
+                    lambda: _find_orphaned_mod_files_per_line_stats([str(mods_dir)], *orphan_scan_args), repeat, verbose=verbose)
+                orphans, _ = _time_stage(
+                    stages, "orphan_scan (scandir)",
+                    lambda: EllexiumModManager.find_orphaned_mod_files(EllexiumModManager.list_mod_zip_files([str(mods_dir)]), *orphan_scan_args),
+                    repeat, verbose=verbose)
+            finally:
+                for zip_path in uninstalled_zips:
+                    shutil.move(str(uninstalled_dir / zip_path.name), str(zip_path))
+            counts["orphan_scan_uninstalled_zips"] = len(uninstalled_zips)
+            counts["orphan_scan_exists_calls (per-line stats)"] = exists_calls
+            counts["orphan_scan_orphaned_files"] = len(orphans)
+            counts["orphan_scan_matches_baseline"] = sorted(filepath for filepath, _ in orphans) == sorted(set(reference_orphans))
+
+        app = HeadlessConfigViewer(project_dir)
+        with _quiet(verbose):
+            app.favorite_configs = app.read_favorites()
+            with open(app.input_file, "r", encoding="utf-8") as f:
+                output_good_lines = f.readlines()
+
+        def reset_config_info_index():
+            app.config_info_index = None
+
+        full_data = _time_stage(stages, "process_lines", lambda: app.process_lines(output_good_lines, {}, is_custom=False),
+                                repeat, setup=reset_config_info_index, verbose=verbose)
+        counts["process_lines_folders"] = len(full_data)
+        counts["process_lines_configs"] = sum(len(configs) for configs in full_data.values())
+        counts["config_info_files"] = app.config_info_index.file_count()
+        counts["config_info_files_parsed"] = app.config_info_index.parsed_files
+
+        # Vanilla-style fallback lookups: every zip stem counts as a base name, so each picture
+        # name matches one and its (missing) "_<stem>.json" file is searched for
+        picture_names = sorted(os.listdir(app.config_pics_folder))
+        app.ZIP_BASE_NAMES = sorted(Path(zip_path).stem for zip_path in Path(mods_dir).glob("*.zip"))
+        _time_stage(stages, "find_fallback_info (every picture)",
+                    lambda: [app.find_fallback_info(name) for name in picture_names],
+                    repeat, setup=reset_config_info_index, verbose=verbose)
+        counts["find_fallback_info_pictures"] = len(picture_names)
+        app.ZIP_BASE_NAMES = []
+        reset_config_info_index()
+
+        if custom_pictures:
+            custom_lookups = write_custom_pictures(app.config_pics_custom_folder, custom_pictures)
+
+            def reset_custom_picture_index():
+                app.custom_picture_index = None
+
+            found = _time_stage(stages, "find_image_path (every custom picture)",
+                                lambda: sum(1 for folder_name, file_name in custom_lookups
+                                            if app.find_image_path(folder_name, file_name)),
+                                repeat, setup=reset_custom_picture_index, verbose=verbose)
+            counts["custom_pictures"] = custom_pictures
+            counts["custom_pictures_found"] = found
+
+        def remove_matches_files():
+            for name in ("Matches.txt", "matches_config.txt"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(data_dir / name)
+
+        _time_stage(stages, "generate_matches_txt",
+                    lambda: EllexiumModManager.generate_matches_txt(str(project_dir), app.config_info_folder),
+                    repeat, setup=remove_matches_files, verbose=verbose)
+        _time_stage(stages, "generate_matches_config_txt",
+                    lambda: app.generate_matches_config_txt(app.config_info_folder, str(project_dir)), verbose=verbose)
+        with _quiet(verbose):
+            app.matches_config_data = app.load_matches_config_data()
+
+        def reset_app_caches():
+            app.config_search_index = None
+            app.filter_attribute_table = None
+
+        _time_stage(stages, "load_data (cold)", app.load, repeat,
+                    setup=lambda: (app.processed_data_store.clear(), reset_app_caches()), verbose=verbose)
+        _time_stage(stages, "load_data (rescan)", app.load, repeat,
+                    setup=lambda: (app.processed_data_store.mark_stale(), reset_app_caches()), verbose=verbose)
+        _time_stage(stages, "load_data (cached)", app.load, repeat, setup=reset_app_caches, verbose=verbose)
+        counts["load_data_items"] = len(app.data)
+        counts["load_data_folders"] = len(app.full_data)
+
+        counts["search_results"] = {}
+        for search_mode in ("General", "Configs"):
+            for query in search_queries:
+                stage_name = f"perform_search ({search_mode}: {query})"
+                shown = _time_stage(stages, stage_name, lambda q=query, m=search_mode: app.search(q, m), repeat,
+                                    setup=lambda: app.search("", "General"), verbose=verbose)
+                counts["search_results"][stage_name] = shown
+        with _quiet(verbose):
+            app.search("", "General")
+
+        counts["global_filter_items"] = _time_stage(stages, "global_filter_apply (cold)",
+                                                    lambda: app.apply_global_filter(global_filter), repeat,
+                                                    setup=lambda: (app.clear_global_filter(), reset_app_caches()), verbose=verbose)
+        _time_stage(stages, "global_filter_apply (warm)", lambda: app.apply_global_filter(global_filter), repeat,
+                    setup=app.clear_global_filter, verbose=verbose)
+        counts["global_filter_subset_lines"] = len(app.data_subset_lines or [])
+
+        if subset_lines:
+            with _quiet(verbose):
+                app.clear_global_filter()
+                app.data_subset_lines = build_data_subset_lines(app.original_data, subset_lines)
+                app.is_data_subset_active = True
+            for query in search_queries:
+                stage_name = f"perform_search (General: {query}, {subset_lines}-line data subset)"
+                shown = _time_stage(stages, stage_name, lambda q=query: app.search(q, "General"), repeat,
+                                    setup=lambda: app.search("", "General"), verbose=verbose)
+                counts["search_results"][stage_name] = shown
+            with _quiet(verbose):
+                app.clear_global_filter()
+                app.search("", "General")
+
+        if trace_refreshes:
+            counts["grid_refresh_tracing_us_per_refresh"] = _time_grid_refresh_tracing(stages, trace_refreshes, repeat)
+
+        if hidden_filter_lines:
+            folders = [f"vehicle_{index:05d}" for index in range(HIDDEN_FILTER_FOLDERS)]
+            hidden_folders = random.Random(2).sample(folders, min(HIDDEN_FILTER_HIDDEN_FOLDERS, len(folders)))
+            filter_lines = build_hidden_filter_lines(hidden_filter_lines, folders)
+            sample_lines = filter_lines[:HIDDEN_FILTER_ANY_SAMPLE_LINES]
+            matcher = _time_stage(stages, f"hidden_folder_filter (HiddenFolderMatcher compile, {len(hidden_folders)} folders)",
+                                  lambda: HiddenFolderMatcher(hidden_folders), repeat, verbose=verbose)
+            sample_stage = f"hidden_folder_filter (any() per line, {len(sample_lines)}-line sample)"
+            reference_kept = _time_stage(stages, sample_stage,
+                                         lambda: _hidden_folder_filter_per_line_any(sample_lines, hidden_folders), repeat, verbose=verbose)
+            kept = _time_stage(stages, f"hidden_folder_filter (HiddenFolderMatcher, {len(filter_lines)} lines)",
+                               lambda: matcher.filter_lines(filter_lines), repeat, verbose=verbose)
+            counts["hidden_folder_filter_kept_lines"] = len(kept)
+            counts["hidden_folder_filter_matches_baseline"] = matcher.filter_lines(sample_lines) == reference_kept
+            counts["hidden_folder_filter_any_seconds_estimated_for_all_lines"] = round(
+                stages[sample_stage]["seconds"] * len(filter_lines) / max(1, len(sample_lines)), 3)
+
+        if spawns:
+            counts["spawn_handshake"] = run_spawn_handshake_benchmark(spawns)
+    finally:
+        if app is not None:
+            app.close()
+        os.chdir(original_cwd)
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    return {
+        "version": BENCHMARK_RESULTS_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": _get_git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "corpus": corpus,
+        "search_queries": list(search_queries),
+        "global_filter": global_filter,
+        "log_level": log_level,
+        "stages": stages,
+        "counts": counts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times the mod data pipeline on a synthetic mod corpus and prints JSON results.")
+    parser.add_argument("--vehicles", type=int, default=200, help="Mod zips to generate (one vehicle each).")
+    parser.add_argument("--configs", type=int, default=8, help=".pc configs per vehicle.")
+    parser.add_argument("--info-files", type=int, default=6, help="info_*.json files per vehicle.")
+    parser.add_argument("--pictures", type=int, default=8, help="Config pictures per vehicle.")
+    parser.add_argument("--png-every", type=int, default=3, help="Every nth picture is a PNG, the rest JPG (0: JPG only).")
+    parser.add_argument("--hidden", type=int, default=10, help="Vehicles listed in Hidden.txt.")
+    parser.add_argument("--favorites", type=int, default=25, help="Configs listed in favorites.txt.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per repeatable stage.")
+    parser.add_argument("--query", action="append", dest="queries", help="Search query (repeatable; replaces the defaults).")
+    parser.add_argument("--filter", default=DEFAULT_GLOBAL_FILTER, help="Global filter string, as built by the Filters window.")
+    parser.add_argument("--uninstalled-every", type=int, default=DEFAULT_UNINSTALLED_EVERY,
+                        help="Move every nth zip out for the orphan scan stages (0: skip them).")
+    parser.add_argument("--custom-pictures", type=int, default=DEFAULT_CUSTOM_PICTURES,
+                        help="Pictures in ConfigPicsCustom for the find_image_path stage (0: skip it).")
+    parser.add_argument("--subset-lines", type=int, default=DEFAULT_SUBSET_LINES,
+                        help="Lines of the data subset for the perform_search (data subset) stages (0: skip them).")
+    parser.add_argument("--trace-refreshes", type=int, default=DEFAULT_TRACE_REFRESHES,
+                        help="Main grid refreshes per run of the grid_refresh_tracing stages (0: skip them).")
+    parser.add_argument("--hidden-filter-lines", type=int, default=DEFAULT_HIDDEN_FILTER_LINES,
+                        help="Config list lines for the hidden_folder_filter stages (0: skip them).")
+    parser.add_argument("--picture-zips", type=int, default=DEFAULT_PICTURE_ZIPS,
+                        help="Zips for the config_picture_extract stages (0: skip them).")
+    parser.add_argument("--spawns", type=int, default=DEFAULT_SPAWNS,
+                        help="Spawn handshakes against the stand-in game (0: skip them).")
+    parser.add_argument("--work-dir", help="Build the sandbox here and keep it (default: a temporary folder).")
+    parser.add_argument("--output", help="Also write the JSON results to this file.")
+    parser.add_argument("--verbose", action="store_true", help="Show the pipeline's own output.")
+    parser.add_argument("--log-level", default="INFO", help="Level of the app's loggers (DEBUG, INFO, WARNING, ...).")
+    args = parser.parse_args()
+
+    # Without --verbose, stdout is only the JSON results: anything the pipeline prints
+    # outside _quiet is caught here and reported on stderr instead.
+    stray_output = io.StringIO()
+    with contextlib.redirect_stdout(stray_output) if not args.verbose else contextlib.nullcontext():
+        results = run_pipeline_benchmark(
+            vehicles=args.vehicles,
+            configs_per_vehicle=args.configs,
+            info_files_per_vehicle=args.info_files,
+            pictures_per_vehicle=args.pictures,
+            png_every=args.png_every,
+            hidden_vehicles=args.hidden,
+            favorites=args.favorites,
+            repeat=max(1, args.repeat),
+            search_queries=args.queries,
+            global_filter=args.filter,
+            uninstalled_every=max(0, args.uninstalled_every),
+            custom_pictures=max(0, args.custom_pictures),
+            subset_lines=max(0, args.subset_lines),
+            trace_refreshes=max(0, args.trace_refreshes),
+            hidden_filter_lines=max(0, args.hidden_filter_lines),
+            picture_zips=max(0, args.picture_zips),
+            spawns=max(0, args.spawns),
+            work_dir=args.work_dir,
+            verbose=args.verbose,
+            log_level=args.log_level,
+        )
+    if stray_output.getvalue():
+        print("Output from outside the timed stages (kept out of the JSON results):", file=sys.stderr)
+        print(stray_output.getvalue(), end="", file=sys.stderr)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--stand-in-game":
+        run_stand_in_game(sys.argv[2],
+                          reaction_delay=float(sys.argv[3]) if len(sys.argv) > 3 else 0.05,
+                          ignore_every=int(sys.argv[4]) if len(sys.argv) > 4 else 0)
+    else:
+        main()
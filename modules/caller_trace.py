@@ -0,0 +1,56 @@
+import sys
+
+
+# Off unless turned on with set_caller_tracing (the app does that in dev mode).
+# While off, trace_caller / trace_call_stack return before touching any frame.
+_caller_tracing_enabled = False
+
+
+def set_caller_tracing(enabled):
+    global _caller_tracing_enabled
+    _caller_tracing_enabled = bool(enabled)
+
+
+def is_caller_tracing_enabled():
+    return _caller_tracing_enabled
+
+
+def get_caller(depth=1):
+    """
+    Returns (function name, file name, line number) of the frame depth levels above the
+    function calling get_caller (1: its caller), or None if the stack isn't that deep.
+    Reads the frame objects directly; unlike inspect.stack() no source lines are loaded
+    and no records are built for the rest of the stack.
+    """
+    try:
+        frame = sys._getframe(depth + 1)
+    except ValueError:
+        return None
+    return frame.f_code.co_name, frame.f_code.co_filename, frame.f_lineno
+
+
+def trace_caller(label):
+    """Prints "--- <label> CALLED BY: <function> in <file> at line <n> ---" for the caller of the traced function."""
+    if not _caller_tracing_enabled:
+        return
+    caller = get_caller(2) # 0: trace_caller, 1: the traced function, 2: its caller
+    if caller is None:
+        caller = ("<unknown>", "<unknown>", 0)
+    print(f"--- {label} CALLED BY: {caller[0]} in {caller[1]} at line {caller[2]} ---")
+
+
+def trace_call_stack(label, skip=0, limit=None):
+    """
+    Prints the call stack of the traced function, innermost first: skip drops that many
+    frames starting with the traced function itself, limit caps the number printed.
+    """
+    if not _caller_tracing_enabled:
+        return
+    print(f"--- {label} called by stack: ---")
+    frame = sys._getframe(1 + skip)
+    printed = 0
+    while frame is not None and (limit is None or printed < limit):
+        print(f"  File \"{frame.f_code.co_filename}\", line {frame.f_lineno}, in {frame.f_code.co_name}")
+        frame = frame.f_back
+        printed += 1
+    print("----------------------------------------")
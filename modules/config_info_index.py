@@ -0,0 +1,159 @@
+import os
+import re
+
+
+CONFIG_INFO_KEYS = [
+    "Name", "Brand", "Country", "Type", "Body Style", "Years", "Derby Class",
+    "Description", "Slogan", "default_pc", "Author"
+]
+_STRING_KEYS = {key.lower(): key for key in CONFIG_INFO_KEYS if key != "Years"}
+# One pass over the file for every string key; the first match of each key wins, like a separate re.search per key
+CONFIG_INFO_STRING_PATTERN = re.compile(
+    r'"(' + "|".join(re.escape(key) for key in _STRING_KEYS) + r')"\s*:\s*"([^"]*)"', re.IGNORECASE
+)
+CONFIG_INFO_YEARS_PATTERN = re.compile(r'"Years"\s*:\s*([^\}]*)', re.IGNORECASE) # Capture until closing curly brace
+NUMBER_PATTERN = re.compile(r'\d+')
+
+
+def parse_config_info_text(file_content):
+    """
+    Extracts the fallback info fields (see CONFIG_INFO_KEYS) from an info JSON file's text.
+    The files are not always valid JSON, so this matches "key": "value" pairs case-insensitively
+    instead of parsing; Years becomes the numbers found in its value, space separated.
+    """
+    found = {}
+    for match in CONFIG_INFO_STRING_PATTERN.finditer(file_content):
+        key = _STRING_KEYS[match.group(1).lower()]
+        if key not in found:
+            found[key] = match.group(2)
+            if len(found) == len(_STRING_KEYS):
+                break
+
+    years_match = CONFIG_INFO_YEARS_PATTERN.search(file_content)
+    if years_match:
+        found["Years"] = " ".join(NUMBER_PATTERN.findall(years_match.group(1)))
+
+    return {key: found[key] for key in CONFIG_INFO_KEYS if key in found}
+
+
+def parse_config_info_file(filepath):
+    """Reads and parses one info JSON file. Returns {} if it cannot be read."""
+    try:
+        with open(filepath, "r", encoding="utf-8") as file:
+            return parse_config_info_text(file.read())
+    except Exception as e:
+        print(f"Error processing {filepath}: {e}")
+        return {}
+
+
+def _fallback_base_names(lower_file_name, base_names):
+    """Yields every base name b with "_b.json" in the (lowercase) file name."""
+    json_position = lower_file_name.find(".json")
+    while json_position != -1:
+        underscore_position = lower_file_name.rfind("_", 0, json_position)
+        while underscore_position != -1:
+            candidate = lower_file_name[underscore_position + 1:json_position]
+            if candidate in base_names:
+                yield candidate
+            underscore_position = lower_file_name.rfind("_", 0, underscore_position)
+        json_position = lower_file_name.find(".json", json_position + 1)
+
+
+class ConfigInfoIndex:
+    """
+    File name index of the ConfigInfo folder plus memoized parsed info files, for resolving
+    the info of many spawn lines in one load.
+
+    The folder is walked once, on first use. After that, checking whether an info file
+    exists is a dict lookup, each file is read and parsed at most once, and the vanilla
+    fallback search (find_fallback_info) looks at the few files indexed under a base name
+    instead of walking ConfigInfo again.
+
+    Build a new index for every load: files written after the walk are not seen.
+    Lookups hand out copies, since process_lines adds keys to the info dicts it gets.
+    """
+
+    def __init__(self, config_info_folder, zip_base_names):
+        self.config_info_folder = config_info_folder
+        self.zip_base_names = list(zip_base_names)
+        self._file_names = None  # {os.path.normcase(name): name} of the files directly in the folder
+        self._base_name_files = None  # {base name: [info file paths in os.walk order]}
+        self._records = {}  # {normalized path: parsed info}
+        self._fallback_by_picture = {}  # {lowercase picture file name: fallback info}
+        self.parsed_files = 0
+
+    def _build(self):
+        file_names = {}
+        base_name_files = {}
+        base_names = set(self.zip_base_names)
+        folder = self.config_info_folder
+        if folder and os.path.isdir(folder):
+            normalized_folder = os.path.normcase(os.path.normpath(folder))
+            for root, _, files in os.walk(folder):
+                is_top_folder = os.path.normcase(os.path.normpath(root)) == normalized_folder
+                for file in files:
+                    if is_top_folder:
+                        file_names[os.path.normcase(file)] = file
+                    lower_file = file.lower()
+                    if base_names and lower_file.endswith(".json"):
+                        for base_name in set(_fallback_base_names(lower_file, base_names)):
+                            base_name_files.setdefault(base_name, []).append(os.path.join(root, file))
+        self._file_names = file_names
+        self._base_name_files = base_name_files
+
+    def _ensure_built(self):
+        if self._file_names is None:
+            self._build()
+
+    def has_file(self, file_name):
+        """Same answer as os.path.exists(os.path.join(config_info_folder, file_name)) at build time."""
+        if os.sep in file_name or "/" in file_name:
+            return os.path.exists(os.path.join(self.config_info_folder, file_name))
+        self._ensure_built()
+        return os.path.normcase(file_name) in self._file_names
+
+    def file_count(self):
+        self._ensure_built()
+        return len(self._file_names)
+
+    def _get_record(self, filepath):
+        key = os.path.normcase(os.path.normpath(filepath))
+        record = self._records.get(key)
+        if record is None:
+            record = parse_config_info_file(filepath)
+            self._records[key] = record
+            self.parsed_files += 1
+        return record
+
+    def get_info(self, filepath):
+        """Parsed info of one file (read on first request only)."""
+        return dict(self._get_record(filepath))
+
+    def get_info_by_name(self, file_name):
+        """Parsed info of a file directly in ConfigInfo, or None if there is no such file."""
+        if not self.has_file(file_name):
+            return None
+        return self.get_info(os.path.join(self.config_info_folder, file_name))
+
+    def find_fallback_info(self, picture_filename):
+        """
+        Info for a picture without an info file of its own: the first non-empty info file
+        named "..._<base name>.json" for the first ZIP_BASE_NAMES entry found in the
+        picture's file name. Returns {} if there is none.
+        """
+        lower_filename = picture_filename.lower()
+        info = self._fallback_by_picture.get(lower_filename)
+        if info is None:
+            self._ensure_built()
+            info = {}
+            for base_name in self.zip_base_names:
+                if base_name in lower_filename:
+                    for info_path in self._base_name_files.get(base_name, ()):
+                        record = self._get_record(info_path)
+                        if record:
+                            info = record
+                            break
+                    if info:
+                        break
+            self._fallback_by_picture[lower_filename] = info
+        return dict(info)
@@ -6,6 +6,11 @@ from pathlib import Path
 from datetime import datetime
 from PIL import Image
 
+from modules.processed_data_store import mark_processed_data_stale
+from modules.app_logging import get_logger
+
+log = get_logger("data")
+
 
 
 # --- DEBUG PRINT SWITCH ---
@@ -616,10 +621,11 @@ def process_lines(self, lines, full_data, is_custom):
     missing_custom_pic_path = os.path.join(self.script_dir, "data/MissingCustomConfigPic.png")
     missing_zip_pic_path = os.path.join(self.script_dir, "data/MissingZipConfigPic.png")
     last_picture_path = None
+    info_index = self.get_config_info_index() # Existence checks and parsed info files, one ConfigInfo walk per load
 
     # Ensure missing pictures exist (add checks if needed)
 
-    print(f"\n--- process_lines() PROCESSING {'CUSTOM' if is_custom else 'REGULAR'} LINES ---")
+    log.debug('\n--- process_lines() PROCESSING %s LINES ---', 'CUSTOM' if is_custom else 'REGULAR')
 
     for line in lines:
         line = line.strip()
@@ -638,11 +644,11 @@ def process_lines(self, lines, full_data, is_custom):
                     if file_name.lower().startswith(prefix.lower()):
                         file_name = file_name[len(prefix):]
                 except ValueError:
-                    print(f"  process_lines - Skipping line due to ValueError (custom config picture): {line}")
+                    log.debug('  process_lines - Skipping line due to ValueError (custom config picture): %s', line)
                     continue
 
                 if folder_name is None:
-                        print(f"  process_lines - Skipping line, folder_name is None (custom config picture): {line}")
+                        log.debug('  process_lines - Skipping line, folder_name is None (custom config picture): %s', line)
                         continue
 
                 picture_path = self.find_image_path(folder_name, file_name)
@@ -665,11 +671,11 @@ def process_lines(self, lines, full_data, is_custom):
                         folder_name = folder_name_raw.lower()
                         file_name = "nil_config"
                     else:
-                        print(f"  process_lines - Skipping line, regex failed (custom spawn): {line}")
+                        log.debug('  process_lines - Skipping line, regex failed (custom spawn): %s', line)
                         continue
 
                 if folder_name is None:
-                    print(f"  process_lines - Skipping line, folder_name is None (custom spawn): {line}")
+                    log.debug('  process_lines - Skipping line, folder_name is None (custom spawn): %s', line)
                     continue
 
                 current_zip_file = "user_custom_configs"
@@ -680,14 +686,15 @@ def process_lines(self, lines, full_data, is_custom):
                 if use_match:
                     use_info_json = use_match.group(1)
                     info_path = os.path.join(self.config_info_folder, use_info_json)
-                    if os.path.exists(info_path):
-                        info_data = self.extract_fallback_info(info_path)
+                    if info_index.has_file(use_info_json):
+                        info_data = info_index.get_info(info_path)
                     else:
-                        print(f"  process_lines - USE info file not found: {info_path}")
+                        log.debug('  process_lines - USE info file not found: %s', info_path)
                         info_data = self.find_fallback_info(
                         os.path.basename(last_picture_path) if last_picture_path else ""
                         )
                 else:
+                    individual_info_file = None
                     if last_picture_path and last_picture_path != missing_custom_pic_path:
                          img_basename = os.path.basename(last_picture_path)
                          img_name_no_ext = os.path.splitext(img_basename)[0]
@@ -696,8 +703,8 @@ def process_lines(self, lines, full_data, is_custom):
                          individual_info_file = f"{img_name_no_ext}_info.json" # Check this format
                          info_path = os.path.join(self.config_info_folder, individual_info_file)
 
-                    if info_path and os.path.exists(info_path):
-                         info_data = self.extract_fallback_info(info_path)
+                    if info_path and info_index.has_file(individual_info_file):
+                         info_data = info_index.get_info(info_path)
                     else:
                          info_data = self.find_fallback_info(
                              os.path.basename(last_picture_path) if last_picture_path else ""
@@ -713,7 +720,7 @@ def process_lines(self, lines, full_data, is_custom):
                     full_data[folder_name] = []
 
                 if not isinstance(info_data, dict):
-                     print(f"ERROR: process_lines - info_data is not a dict for custom line: {line}. Resetting.")
+                     log.error('ERROR: process_lines - info_data is not a dict for custom line: %s. Resetting.', line)
                      info_data = {"Name": "Data Error", "Value": 0}
                 if 'Value' not in info_data or not isinstance(info_data.get('Value'), (int, float)):
                      info_data['Value'] = 0
@@ -754,9 +761,9 @@ def process_lines(self, lines, full_data, is_custom):
                              folder_name = folder_name_raw.lower()
                              file_name = "unknown_config" # Placeholder if config missing
                              candidate_base = f"vehicles--{folder_name}_{current_zip_file}--{file_name}"
-                             print(f"  process_lines - Warning: Config path missing/malformed, using folder only for: {line}")
+                             log.warning('  process_lines - Warning: Config path missing/malformed, using folder only for: %s', line)
                          else:
-                              print(f"  process_lines - Skipping line, cannot extract folder/config (non-custom): {line}")
+                              log.debug('  process_lines - Skipping line, cannot extract folder/config (non-custom): %s', line)
                               continue
                     else:
                          # Standard case with config path
@@ -765,11 +772,11 @@ def process_lines(self, lines, full_data, is_custom):
                          candidate_base = f"vehicles--{folder_name}_{current_zip_file}--{file_name}"
 
             except Exception as e:
-                 print(f"  process_lines - Skipping line due to unexpected error during split (non-custom): {line} - Error: {e}")
+                 log.debug('  process_lines - Skipping line due to unexpected error during split (non-custom): %s - Error: %s', line, e)
                  continue
 
             if folder_name is None:
-                    print(f"  process_lines - Skipping line, folder_name is None (non-custom): {line}")
+                    log.debug('  process_lines - Skipping line, folder_name is None (non-custom): %s', line)
                     continue
 
             extensions = ['jpg', 'jpeg', 'png']
@@ -798,14 +805,14 @@ def process_lines(self, lines, full_data, is_custom):
                 info_path = os.path.join(self.config_info_folder, info_file)
 
 
-            if info_path and os.path.exists(info_path):
-                info_data = self.extract_fallback_info(info_path)
+            if info_path and info_index.has_file(info_file):
+                info_data = info_index.get_info(info_path)
             else:
                  # Fallback to zip-level info
                  old_info_file = f"vehicles--{folder_name}_{current_zip_file}--info.json"
                  old_info_path = os.path.join(self.config_info_folder, old_info_file)
-                 if os.path.exists(old_info_path):
-                      info_data = self.extract_fallback_info(old_info_path)
+                 if info_index.has_file(old_info_file):
+                      info_data = info_index.get_info(old_info_path)
                  else:
                       info_data = self.find_fallback_info(os.path.basename(picture_path))
 
@@ -820,7 +827,7 @@ def process_lines(self, lines, full_data, is_custom):
                 current_picture_path_to_use = missing_zip_pic_path
 
             if not isinstance(info_data, dict):
-                 print(f"ERROR: process_lines - info_data is not a dict for regular line: {line_clean}. Resetting.")
+                 log.error('ERROR: process_lines - info_data is not a dict for regular line: %s. Resetting.', line_clean)
                  info_data = {"Name": "Data Error", "Value": 0}
             if 'Value' not in info_data or not isinstance(info_data.get('Value'), (int, float)):
                 info_data['Value'] = 0
@@ -830,7 +837,7 @@ def process_lines(self, lines, full_data, is_custom):
             )
         # --- End of original processing logic ---
 
-    print(f"--- process_lines() FINISHED PROCESSING {'CUSTOM' if is_custom else 'REGULAR'} LINES ---")
+    log.debug('--- process_lines() FINISHED PROCESSING %s LINES ---', 'CUSTOM' if is_custom else 'REGULAR')
     # No post-processing here, just return the updated dictionary
     return full_data
 
@@ -855,13 +862,7 @@ def run_modify_output_good_integrated(self):
         - config_info_dir (str): Path to the configInfo directory containing info.json files.
         """
 
-        cache_file_path = self.script_dir / "data" / "config_processing_cache.json"
-        if cache_file_path.exists():
-            try:
-                cache_file_path.unlink()
-                print(f"DEBUG: Deleted cache file due to mod scan: {cache_file_path}")
-            except OSError as e:
-                print(f"Warning: Failed to delete cache file {cache_file_path}: {e}")
+        mark_processed_data_stale(self.script_dir)
 
 
         # Verify the existence of the output file
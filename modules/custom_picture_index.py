@@ -0,0 +1,102 @@
+import os
+import threading
+
+
+CUSTOM_PICTURE_EXTENSIONS = ("jpg", "jpeg", "png")  # In the order find_image_path tries them
+
+
+def split_picture_name(file_name):
+    """Returns (lowercase stem, lowercase extension without the dot)."""
+    stem, extension = os.path.splitext(file_name)
+    return stem.lower(), extension[1:].lower()
+
+
+class CustomPictureIndex:
+    """
+    Case-normalized map of the pictures in ConfigPicsCustom:
+    {lowercase stem: {lowercase extension: file name on disk}}.
+
+    Built with one scandir on the first lookup. CustomFileEventHandler keeps it current
+    with add()/discard() as pictures come and go, and invalidate() makes the next lookup
+    list the folder again (after the custom picture extractor rewrote it).
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self._normalized_folder = os.path.normcase(os.path.abspath(folder)) if folder else None
+        self._lock = threading.Lock()
+        self._stems = None
+        self.builds = 0
+
+    def _build_locked(self):
+        stems = {}
+        if self.folder and os.path.isdir(self.folder):
+            try:
+                with os.scandir(self.folder) as entries:
+                    for entry in entries:
+                        stem, extension = split_picture_name(entry.name)
+                        if extension in CUSTOM_PICTURE_EXTENSIONS and entry.is_file():
+                            stems.setdefault(stem, {})[extension] = entry.name
+            except OSError as e:
+                print(f"Warning: Could not list custom pictures in {self.folder}: {e}")
+        self._stems = stems
+        self.builds += 1
+
+    def invalidate(self):
+        with self._lock:
+            self._stems = None
+
+    def _picture_key(self, path):
+        """(stem, extension) for a picture directly in the folder, else None."""
+        if self._normalized_folder is None:
+            return None
+        if os.path.normcase(os.path.dirname(os.path.abspath(path))) != self._normalized_folder:
+            return None
+        stem, extension = split_picture_name(os.path.basename(path))
+        if extension not in CUSTOM_PICTURE_EXTENSIONS:
+            return None
+        return stem, extension
+
+    def add(self, path):
+        key = self._picture_key(path)
+        if key is None:
+            return
+        with self._lock:
+            if self._stems is not None: # Not built yet: the first lookup lists the folder anyway
+                self._stems.setdefault(key[0], {})[key[1]] = os.path.basename(path)
+
+    def discard(self, path):
+        key = self._picture_key(path)
+        if key is None:
+            return
+        with self._lock:
+            if self._stems is None:
+                return
+            extensions = self._stems.get(key[0])
+            if extensions is not None:
+                extensions.pop(key[1], None)
+                if not extensions:
+                    del self._stems[key[0]]
+
+    def find(self, stem, extensions=CUSTOM_PICTURE_EXTENSIONS):
+        """
+        Returns the path of the first picture named stem + one of extensions (case-insensitive),
+        or None.
+        """
+        with self._lock:
+            if self._stems is None:
+                self._build_locked()
+            found = self._stems.get(stem.lower())
+            if not found:
+                return None
+            for extension in extensions:
+                file_name = found.get(extension.lower())
+                if file_name is not None:
+                    return os.path.join(self.folder, file_name)
+        return None
+
+    def __len__(self):
+        with self._lock:
+            if self._stems is None:
+                self._build_locked()
+            return sum(len(extensions) for extensions in self._stems.values())
@@ -0,0 +1,38 @@
+class DataSubsetFilter:
+    """
+    Membership test of the main grid items against one data subset (the data_subset.txt /
+    data_subset_favorites.txt lines of a global filter run).
+
+    An item is in the subset if "vehicles--<its folder>" occurs in one of the subset lines,
+    case-insensitively (the lines look like "vehicles--<folder>_<zip>--<config>.png", so
+    this is a prefix test on the part after "vehicles--"). The lines are joined into one
+    lowercase text once; each folder is looked up there once and the answer is kept, so
+    checking an item is a dict lookup for as long as the subset doesn't change.
+    """
+
+    def __init__(self, lines):
+        normalized_lines = [line.strip().lower() for line in lines if line.strip()]
+        self.line_count = len(normalized_lines)
+        self._text = "\n".join(normalized_lines)
+        self._folder_matches = {}  # {folder name: bool}
+        self._line_set = None  # Lines with "/" separators, built on the first contains_line call
+
+    def __len__(self):
+        return self.line_count
+
+    def contains_folder(self, folder_name):
+        found = self._folder_matches.get(folder_name)
+        if found is None:
+            found = f"vehicles--{folder_name}".strip().lower() in self._text
+            self._folder_matches[folder_name] = found
+        return found
+
+    def contains_line(self, line):
+        """True if line (a picture path relative to ConfigPics) is one of the subset lines, ignoring case and slash direction."""
+        if self._line_set is None:
+            self._line_set = {subset_line.replace('\\', '/') for subset_line in self._text.split("\n") if subset_line}
+        return line.strip().lower().replace('\\', '/') in self._line_set
+
+    def contains_item(self, item):
+        """item is a main grid entry (picture path, spawn command, zip, info, folder); items without a picture are never in it."""
+        return bool(item[0]) and self.contains_folder(item[4])
@@ -1,5 +1,6 @@
 import os
 import threading
+from collections import namedtuple
 from pathlib import Path
 
 
@@ -127,6 +128,50 @@ def scan_folder_for_watched_files(folder_path):
                 except OSError: # Handle cases where file might be inaccessible
                     print(f"Warning: Could not get modification time for {filepath}. Skipping.")
     return file_list
+def normalize_zip_path(path):
+    """Same key scan_folders_for_mod_zips and WatcherOutput.txt use for a zip path."""
+    return os.path.normpath(str(path)).lower().replace('\\', '/')
+
+
+# Archives that changed since the last scan, each {normalized zip path: mtime} (mtime is None for removed ones)
+ZipDelta = namedtuple("ZipDelta", ["added", "removed", "modified"])
+
+
+def is_empty_zip_delta(delta):
+    return not (delta.added or delta.removed or delta.modified)
+
+
+class ZipChangeSet:
+    """
+    Collects the zip paths watchdog reported between two debounced scans.
+
+    Only paths are kept (the last event for a path doesn't matter, it is stat'ed when the
+    set is drained), so a burst of created/modified events for one archive being copied
+    in costs one entry. Events that can't be mapped to single archives (a watched
+    directory deleted or moved) ask for a full rescan instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paths = set()
+        self._needs_full_scan = False
+
+    def record(self, path):
+        with self._lock:
+            self._paths.add(str(path))
+
+    def request_full_scan(self):
+        with self._lock:
+            self._needs_full_scan = True
+
+    def drain(self):
+        """Returns (paths, needs_full_scan) and starts a new, empty set."""
+        with self._lock:
+            paths, needs_full_scan = self._paths, self._needs_full_scan
+            self._paths, self._needs_full_scan = set(), False
+        return paths, needs_full_scan
+
+
 # ------------------------------------------------------------
 # ModZipEventHandler Class - MODIFIED to update NewMods.txt and use local paths
 # ------------------------------------------------------------
@@ -143,6 +188,14 @@ class ModZipEventHandler(FileSystemEventHandler):
         self.repo_folder = self.script_dir.parent / "repo"  # Calculate repo_folder (Path object)
         self.mods_folder = self.script_dir.parent  # Calculate mods_folder (parent of script_dir) (Path object)
 
+        # --- NEW: Exact delta from the events instead of rescanning both folders ---
+        self.pending_changes = ZipChangeSet()
+        self.repo_prefix = normalize_zip_path(self.repo_folder) + "/"
+        self.watcher_output_file = self.script_dir / "data" / "WatcherOutput.txt"
+        # Last known zips, same shape as the [ModsFiles]/[RepoFiles] sections: the mods scan is
+        # recursive, so known_mods_files also holds the repo zips.
+        _, _, _, _, self.known_mods_files, self.known_repo_files, _ = read_watcher_output(self.watcher_output_file)
+
     def schedule_mod_scan_refresh(self):
         with self.lock:
             if self.debounce_timer:
@@ -154,50 +207,84 @@ class ModZipEventHandler(FileSystemEventHandler):
     def trigger_mod_scan(self):
         print("\n--- ModZipEventHandler.trigger_mod_scan() CALLED ---")  # Debug - Entry Point
 
-        # --- NEW: Identify newly added ZIP files BEFORE running mod scan ---
-        newly_detected_zip_files = self.identify_newly_added_zips()
-        print(f"DEBUG: ModZipEventHandler - Newly detected ZIP files: {newly_detected_zip_files}")  # Debug
+        changed_paths, needs_full_scan = self.pending_changes.drain()
+        if needs_full_scan:
+            print("DEBUG: ModZipEventHandler - Directory change in a watched folder, rescanning for the delta.")
+            delta = self.rescan_zip_delta()
+        else:
+            delta = self.compute_zip_delta(changed_paths)
+        print(f"DEBUG: ModZipEventHandler - {len(changed_paths)} changed path(s): {len(delta.added)} added, "
+              f"{len(delta.removed)} removed, {len(delta.modified)} modified.")  # Debug
+
+        if is_empty_zip_delta(delta):
+            print("--- ModZipEventHandler.trigger_mod_scan() EXIT - No archive changed ---\n")
+            return
 
-        # Schedule the mod scan and refresh in the main thread
-        self.app.master.after(0, self.app.clear_main_grid_cache)  # Clear main grid cache before refresh
-        self.app.master.after(0, self.app.trigger_full_data_refresh_and_ui_update)  # Run mod scan scripts (AHK)
-        self.app.master.after(0, self.app.refresh_data_from_files)  # Refresh data from files
-        self.app.master.after(0, self.app.perform_search)  # Re-apply search/filters
+        with self.lock:
+            self.apply_delta_to_known_zips(delta)
+            mods_files, repo_files = dict(self.known_mods_files), dict(self.known_repo_files)
 
-        # --- NEW: Update NewMods.txt with newly detected ZIP files ---
-        self.app.master.after(0, lambda: self.app.update_new_mods_txt_with_new_zips(newly_detected_zip_files))  # Call NewMods.txt update
+        # Schedule the delta update in the main thread (NewMods.txt, extraction, reload and one grid layout)
+        self.app.master.after(0, lambda: self.app.apply_mod_zip_delta(delta, mods_files, repo_files))
 
         #self.app.master.after(0, self.show_mods_changed_messagebox)  # NEW: Call "Mods Changed" messagebox display function # not necessary, the main file shows a scanning window with info
         print("--- ModZipEventHandler.trigger_mod_scan() EXIT ---\n")  # Debug - Exit Point
 
-    def identify_newly_added_zips(self):
+    def compute_zip_delta(self, changed_paths):
         """
-        Identifies newly added ZIP files by comparing current mod/repo folders with last known lists in WatcherOutput.txt.
-        Now using LOCALLY defined repo_folder and mods_folder - no longer relying on self.app attributes.
+        Classifies the paths the events reported against the last known zips. Only these
+        paths are stat'ed: one that exists and wasn't known is added, one whose mtime
+        changed is modified, and a known one that is gone is removed.
+
+        Returns:
+            ZipDelta
         """
-        # Read last known mod ZIP file lists from WatcherOutput.txt
-        _, _, _, _, last_mods_files, last_repo_files, _ = read_watcher_output(self.app.settings_file_path)  # Use app.settings_file_path
-        last_known_zip_files = set(last_mods_files.keys()) | set(last_repo_files.keys())
+        added, removed, modified = {}, {}, {}
+        with self.lock:
+            for path in changed_paths:
+                key = normalize_zip_path(path)
+                known_mtime = self.known_mods_files.get(key)
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    mtime = None
+
+                if mtime is None:
+                    if known_mtime is not None:
+                        removed[key] = None
+                elif known_mtime is None:
+                    added[key] = mtime
+                elif mtime != known_mtime:
+                    modified[key] = mtime
+        return ZipDelta(added, removed, modified)
+
+    def rescan_zip_delta(self):
+        """
+        Fallback for events that don't name single archives: rescans both folders and
+        diffs them against the last known zips.
+        Now using LOCALLY defined repo_folder and mods_folder - no longer relying on self.app attributes.
 
-        # Scan for currently existing mod ZIP files - using LOCAL repo_folder and mods_folder
+        Returns:
+            ZipDelta
+        """
         current_mods_files = scan_folders_for_mod_zips([str(self.mods_folder)])  # Use LOCAL self.mods_folder - converted to string
-        current_repo_files = scan_folders_for_mod_zips([str(self.repo_folder)])  # Use LOCAL self.repo_folder - converted to string
-        current_zip_files = set(current_mods_files.keys()) | set(current_repo_files.keys())
-
-        newly_detected_zip_files = []
-        # Check for newly added ZIP files in mods folder
-        for filepath, timestamp in current_mods_files.items(): # Iterate over items (filepath, timestamp)
-            normalized_filepath = filepath.lower().replace('\\', '/')
-            if normalized_filepath not in last_mods_files:  # If current file NOT in last known list, it's NEW
-                newly_detected_zip_files.append(os.path.basename(filepath))  # Add base filename to list
-
-        # Check for newly added ZIP files in repo folder
-        for filepath, timestamp in current_repo_files.items(): # Iterate over items (filepath, timestamp)
-            normalized_filepath = filepath.lower().replace('\\', '/')
-            if normalized_filepath not in last_repo_files:  # If current file NOT in last known list, it's NEW
-                newly_detected_zip_files.append(os.path.basename(filepath))  # Add base filename to list
-
-        return newly_detected_zip_files
+        with self.lock:
+            added = {key: mtime for key, mtime in current_mods_files.items() if key not in self.known_mods_files}
+            removed = {key: None for key in self.known_mods_files if key not in current_mods_files}
+            modified = {key: mtime for key, mtime in current_mods_files.items()
+                        if key in self.known_mods_files and self.known_mods_files[key] != mtime}
+        return ZipDelta(added, removed, modified)
+
+    def apply_delta_to_known_zips(self, delta):
+        """Updates the last known zips (caller holds self.lock). Repo zips are listed in both sections."""
+        for key in delta.removed:
+            self.known_mods_files.pop(key, None)
+            self.known_repo_files.pop(key, None)
+        for changes in (delta.added, delta.modified):
+            for key, mtime in changes.items():
+                self.known_mods_files[key] = mtime
+                if key.startswith(self.repo_prefix):
+                    self.known_repo_files[key] = mtime
 
     def center_window(self, window):
         """Centers a tkinter window on the screen."""
@@ -238,21 +325,34 @@ class ModZipEventHandler(FileSystemEventHandler):
         message = "Mod(s) Added or Removed!\nThe main grid has been updated to reflect the changes."
         self.show_temp_messagebox(message, self.app.master) # Use the temporary messagebox function
 
+    def record_zip_event(self, path):
+        if path and str(path).lower().endswith(".zip"):
+            self.pending_changes.record(path)
+            self.schedule_mod_scan_refresh()
+
     def on_created(self, event):
         if not event.is_directory:
-            if event.src_path.lower().endswith(".zip"):
-                self.schedule_mod_scan_refresh()
+            self.record_zip_event(event.src_path)
 
-    def on_deleted(self, event):
+    def on_modified(self, event):
         if not event.is_directory:
-            if event.src_path.lower().endswith(".zip"):
-                self.schedule_mod_scan_refresh()
+            self.record_zip_event(event.src_path) # Archive replaced/rewritten in place
+
+    def on_deleted(self, event):
+        if event.is_directory:
+            self.pending_changes.request_full_scan()
+            self.schedule_mod_scan_refresh()
+        else:
+            self.record_zip_event(event.src_path)
 
     def on_moved(self, event):
-        if not event.is_directory:
-            if event.dest_path.lower().endswith(".zip"):  # Use dest_path for moved files
-                self.schedule_mod_scan_refresh()
-        
+        if event.is_directory:
+            self.pending_changes.request_full_scan()
+            self.schedule_mod_scan_refresh()
+        else:
+            self.record_zip_event(event.src_path)  # Renamed away (or to another name)
+            self.record_zip_event(event.dest_path)  # Use dest_path for moved files
+
 # ------------------------------------------------------------
 # Watchdog Event Handler with Debouncefor custom configs
 # ------------------------------------------------------------
@@ -282,23 +382,46 @@ class CustomFileEventHandler(FileSystemEventHandler):
         self.app.master.after(0, self.app.trigger_custom_config_scan_and_refresh)
         # self.app.master.after(0, self.app.refresh_details_window)
         print("--- FileSystemEventHandler.trigger_scan() EXIT ---\n") # Debug - Exit Point
+
+    def get_custom_picture_index(self):
+        # The app's ConfigPicsCustom index (None until find_image_path first used it);
+        # it ignores paths outside that folder, so every event can be passed on.
+        return getattr(self.app, "custom_picture_index", None)
         
     def on_created(self, event):
         if not event.is_directory:
             ext = os.path.splitext(event.src_path)[1].lower()
             if ext in [".png", ".jpg", ".jpeg", ".pc"]:
+                index = self.get_custom_picture_index()
+                if index is not None:
+                    index.add(event.src_path)
                 self.schedule_refresh()
 
     def on_deleted(self, event):
         if not event.is_directory:
             ext = os.path.splitext(event.src_path)[1].lower()
             if ext in [".png", ".jpg", ".jpeg", ".pc"]:
+                index = self.get_custom_picture_index()
+                if index is not None:
+                    index.discard(event.src_path)
                 # Remove corresponding custom image from ConfigPicsCustom if it exists
                 self.app.remove_corresponding_custom_image(event.src_path)
                 self.schedule_refresh()
+        else:
+            index = self.get_custom_picture_index()
+            if index is not None:
+                index.invalidate() # Can't tell which pictures went with the folder
 
     def on_moved(self, event):
         if not event.is_directory:
+            index = self.get_custom_picture_index()
+            if index is not None:
+                index.discard(event.src_path)
+                index.add(event.dest_path)
             ext = os.path.splitext(event.dest_path)[1].lower()
             if ext in [".png", ".jpg", ".jpeg", ".pc"]:
-                self.schedule_refresh()
\ No newline at end of file
+                self.schedule_refresh()
+        else:
+            index = self.get_custom_picture_index()
+            if index is not None:
+                index.invalidate()
\ No newline at end of file
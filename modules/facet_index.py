@@ -0,0 +1,109 @@
+from collections import Counter
+
+
+FACET_FIELDS = ("Brand", "Name", "Country", "Body Style")  # info_data keys behind the sidebar dropdowns
+_FIELD_POSITIONS = {field: position for position, field in enumerate(FACET_FIELDS)}
+
+
+def item_facet_values(item):
+    """The stripped FACET_FIELDS values of a main grid item (picture, spawn command, zip, info, folder), "" where missing."""
+    info_data = item[3] if len(item) > 3 and isinstance(item[3], dict) else {}
+    values = []
+    for field in FACET_FIELDS:
+        value = info_data.get(field, "")
+        values.append(value.strip() if isinstance(value, str) else "")
+    return tuple(values)
+
+
+class FacetView:
+    """
+    Sidebar filter values of one set of items, with the number of items having each value.
+    Counts are worked out on first request and kept, so reopening a dropdown is a dict lookup.
+    """
+
+    def __init__(self, rows):
+        self._rows = rows  # item_facet_values() of each item
+        self._rows_by_value = {}  # {field position: {value: rows}}, built when a constraint first needs it
+        self._counts = {}  # {(field, constraints, excluded values): {value: count}}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def counts(self, field, constraints=None, exclude=("",)):
+        """
+        Returns {value: item count} of field.
+
+        Args:
+            field (str): One of FACET_FIELDS.
+            constraints (dict, optional): {field: value}; only items with all these values are counted.
+            exclude (tuple): Values left out of the result (empty values by default).
+        """
+        constraints = constraints or {}
+        key = (field, tuple(sorted(constraints.items())), tuple(exclude))
+        value_counts = self._counts.get(key)
+        if value_counts is None:
+            position = _FIELD_POSITIONS[field]
+            counter = Counter(row[position] for row in self._matching_rows(constraints))
+            for value in exclude:
+                counter.pop(value, None)
+            value_counts = dict(counter)
+            self._counts[key] = value_counts
+        return value_counts
+
+    def values(self, field, constraints=None, exclude=("",)):
+        """Sorted distinct values of field, as counts() would count them."""
+        return sorted(self.counts(field, constraints, exclude))
+
+    def _matching_rows(self, constraints):
+        if not constraints:
+            return self._rows
+        # Start from the smallest posting list of the constrained values, then check the others
+        candidates = min((self._rows_with_value(field, value) for field, value in constraints.items()), key=len)
+        checks = [(_FIELD_POSITIONS[field], value) for field, value in constraints.items()]
+        return [row for row in candidates if all(row[position] == value for position, value in checks)]
+
+    def _rows_with_value(self, field, value):
+        position = _FIELD_POSITIONS[field]
+        by_value = self._rows_by_value.get(position)
+        if by_value is None:
+            by_value = {}
+            for row in self._rows:
+                by_value.setdefault(row[position], []).append(row)
+            self._rows_by_value[position] = by_value
+        return by_value.get(value, ())
+
+
+class FacetIndex:
+    """
+    Sidebar filter values (FACET_FIELDS) of every main grid item of one data load.
+
+    get_unique_brands and friends used to read and strip the info data of every item each
+    time a dropdown was populated. Here each item's values are read once per load
+    (data_cache list). view() gives the values and counts of a subset of those items, such
+    as the current search and filter result, by looking the items up: its cost is the
+    size of the subset, and the whole data set reuses the view built with the index.
+    Items that weren't indexed are read directly.
+    """
+
+    def __init__(self, items):
+        self.items = items  # Keeps the items alive, so their id() stays theirs
+        self._rows = {id(item): item_facet_values(item) for item in items}
+        self.full_view = FacetView([self._rows[id(item)] for item in items])
+
+    def __len__(self):
+        return len(self._rows)
+
+    def view(self, items):
+        """FacetView of items (usually a subset of the indexed items)."""
+        rows = self._rows
+        subset_rows = []
+        unindexed = 0
+        for item in items:
+            row = rows.get(id(item))
+            if row is None:
+                row = item_facet_values(item)
+                unindexed += 1
+            subset_rows.append(row)
+        if not unindexed and len(subset_rows) == len(self.full_view):
+            return self.full_view
+        return FacetView(subset_rows)
@@ -0,0 +1,152 @@
+import os
+
+
+def split_favorite_key(fav_key):
+    """Returns (folder name, .pc file name) of a "folder|config.pc" favorites line, or None if it isn't one."""
+    parts = fav_key.split('|')
+    if len(parts) != 2:
+        return None
+    return parts[0], parts[1]
+
+
+def file_signature(path):
+    """(modification time in ns, size) of a file, or None if it doesn't exist. Used to notice rewritten input files."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _normalize_path(path):
+    return path.lower().replace('\\', '/')
+
+
+class FavoritePathIndex:
+    """
+    The "<folder>/<config>" pairs found in the WatcherOutput.txt file paths and
+    zip_structure.txt lines, for checking whether a favorite still exists.
+
+    read_favorites used to look for "<folder>/<config base name>" as a substring of every
+    path for every favorite. Most favorites are an exact pair of path components
+    (vehicles/<folder>/<config>.pc), which is a set lookup here; only favorites that
+    aren't fall back to the substring scan, so the answer is the same as before.
+    """
+
+    def __init__(self, paths):
+        self._normalized_paths = []
+        self._pairs = set()
+        for path in paths:
+            normalized_path = _normalize_path(path)
+            self._normalized_paths.append(normalized_path)
+            components = normalized_path.split('/')
+            for parent, name in zip(components, components[1:]):
+                self._pairs.add(f"{parent}/{name}")
+                stem = os.path.splitext(name)[0]
+                if stem != name:
+                    self._pairs.add(f"{parent}/{stem}")
+        self.substring_scans = 0
+
+    def __len__(self):
+        return len(self._normalized_paths)
+
+    def contains(self, folder_name, pc_filename):
+        """True if some path contains "<folder_name>/<pc_filename without extension>" (case-insensitive)."""
+        search_substring = f"{folder_name.lower()}/{os.path.splitext(pc_filename)[0].lower()}"
+        if search_substring in self._pairs:
+            return True
+        self.substring_scans += 1
+        return any(search_substring in path for path in self._normalized_paths)
+
+
+class FavoriteFolders:
+    """
+    Folder view of a favorites set, built once per favorites change:
+    {folder: set of favorite .pc file names}, plus the lowercase folder names for the
+    main grid's Favorites filter.
+    """
+
+    def __init__(self, favorite_configs):
+        self.by_folder = {}
+        for fav_key in favorite_configs:
+            parts = split_favorite_key(fav_key)
+            if parts is not None:
+                self.by_folder.setdefault(parts[0], set()).add(parts[1])
+        self.lower_folders = frozenset(folder.lower() for folder in self.by_folder)
+
+    def __len__(self):
+        return len(self.by_folder)
+
+    def has_folder(self, folder_name):
+        return folder_name in self.by_folder
+
+    def count_in_folder(self, folder_name):
+        return len(self.by_folder.get(folder_name, ()))
+
+
+class PinnedFavoriteFolders:
+    """
+    Folders shown in the pinned "Favorites" category of the main grid: those with at least
+    one config in the loaded data (full_data) whose .pc file name is a favorite.
+
+    format_grouped_data used to extract the .pc name of every config of every folder on
+    each regroup to find them. Here the set is worked out from the favorites side, reading
+    only the configs of favorited folders, and kept until the favorites change
+    (favorites_generation), full_data is replaced by a reload, or invalidate() is called
+    after full_data was changed in place.
+    """
+
+    def __init__(self):
+        self._full_data = None
+        self._generation = None
+        self._folders = frozenset()
+        self._config_names = {}  # {folder name: set of .pc file names of its configs in full_data}
+
+    def __len__(self):
+        return len(self._folders)
+
+    def invalidate(self):
+        self._full_data = None
+        self._generation = None
+        self._config_names.clear()
+
+    def get(self, full_data, favorite_folders, favorites_generation, extract_config_name):
+        """
+        Returns the pinned folders as a frozenset.
+
+        Args:
+            full_data (dict): {folder name: list of config tuples (picture, spawn command, ...)}.
+            favorite_folders (FavoriteFolders): Folder view of the current favorites.
+            favorites_generation (int): Changes whenever the favorites do.
+            extract_config_name (callable): Spawn command -> config name without ".pc".
+        """
+        if full_data is not self._full_data:
+            self._full_data = full_data
+            self._generation = None
+            self._config_names.clear()
+        if favorites_generation != self._generation:
+            self._folders = frozenset(
+                folder_name for folder_name, favorite_pcs in favorite_folders.by_folder.items()
+                if folder_name in full_data
+                and not favorite_pcs.isdisjoint(self._folder_config_names(folder_name, extract_config_name))
+            )
+            self._generation = favorites_generation
+        return self._folders
+
+    def _folder_config_names(self, folder_name, extract_config_name):
+        config_names = self._config_names.get(folder_name)
+        if config_names is None:
+            folder_data_entry = self._full_data[folder_name]
+            configs = []
+            if isinstance(folder_data_entry, list):
+                configs = folder_data_entry
+            elif isinstance(folder_data_entry, dict) and 'configs' in folder_data_entry:
+                configs = folder_data_entry.get('configs', [])
+            config_names = set()
+            for config_tuple in configs:
+                if not isinstance(config_tuple, (list, tuple)) or len(config_tuple) < 2:
+                    continue
+                if isinstance(config_tuple[1], str):
+                    config_names.add(extract_config_name(config_tuple[1]) + ".pc")
+            self._config_names[folder_name] = config_names
+        return config_names
@@ -0,0 +1,324 @@
+import os
+import re
+import json
+from bisect import bisect_left, bisect_right
+
+FILTER_ATTRIBUTES_FILE_NAME = "filter_attributes.json"
+FILTER_ATTRIBUTES_VERSION = 1
+
+# Same patterns the global filter used to run against each Matches.txt entry on every apply
+ATTRIBUTE_PATTERNS = {
+    "Brand": re.compile(r'"Brand"\s*:\s*"([^"]*)"', re.IGNORECASE | re.MULTILINE),
+    "Country": re.compile(r'"Country"\s*:\s*"([^"]*)"', re.IGNORECASE | re.MULTILINE),
+    "Configuration": re.compile(r'"Configuration"\s*:\s*"([^"]*)"', re.IGNORECASE | re.MULTILINE),
+    "Top Speed (km/h)": re.compile(r'"Top Speed"\s*:\s*([\d.]*)', re.IGNORECASE | re.MULTILINE),
+    "Power": re.compile(r'"Power"\s*:\s*([\d.]*)', re.IGNORECASE | re.MULTILINE),
+    "0-100 km/h": re.compile(r'"0-100 km/h"\s*:\s*([\d.]*)', re.IGNORECASE | re.MULTILINE),
+    "Off-Road Score": re.compile(r'"Off-Road Score"\s*:\s*([\d.]*)', re.IGNORECASE | re.MULTILINE),
+    "Braking G": re.compile(r'"Braking G"\s*:\s*([\d.]*)', re.IGNORECASE | re.MULTILINE),
+    "Fuel Type": re.compile(r'"Fuel Type"\s*:\s*"([^"]*)"', re.IGNORECASE | re.MULTILINE),
+    "Drivetrain": re.compile(r'"Drivetrain"\s*:\s*"([^"]*)"', re.IGNORECASE | re.MULTILINE),
+    "Transmission": re.compile(r'"Transmission"\s*:\s*"([^"]*)"', re.IGNORECASE | re.MULTILINE),
+}
+
+MAIN_ZIP_NAME_PATTERN = re.compile(r'vehicles--(.+?\.zip)--info\.json', re.IGNORECASE)
+INDIVIDUAL_ZIP_NAME_PATTERN = re.compile(r'vehicles--INDIVIDUAL--(.+?\.zip)--info_info_.*\.json', re.IGNORECASE)
+
+BELOW_TYPES = ("Below", "Below (m/s)")
+ABOVE_TYPES = ("Above", "Above (m/s)")
+
+
+def read_matches_entries(matches_file_path):
+    """
+    Splits Matches.txt into (filename, content) entries, the same way the global filter
+    always has: a filename line followed by stripped content lines up to a lone '}'.
+
+    Raises:
+        FileNotFoundError: If Matches.txt does not exist.
+    """
+    entries = []
+    with open(matches_file_path, 'r', encoding="utf-8") as f:
+        current_filename = None
+        current_content_lines = []
+        reading_content = False
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if not reading_content:
+                if line == '}': # A stray '}' is never a filename
+                    continue
+                current_filename = line
+                reading_content = True
+            elif line == '}':
+                current_content_lines.append(line)
+                entries.append((current_filename, "\n".join(current_content_lines)))
+                current_filename = None
+                current_content_lines = []
+                reading_content = False
+            else:
+                current_content_lines.append(line)
+    return entries
+
+
+def extract_attribute(content, filename, criterion):
+    """
+    Returns the value of one filter criterion for a Matches.txt entry as a string, or None.
+    Matches what _check_condition used to compute: the first regex match, with Top Speed
+    converted from m/s to km/h.
+    """
+    match = ATTRIBUTE_PATTERNS[criterion].search(content)
+    value = match.group(1).strip() if match else None
+    if criterion == "Configuration" and not value:
+        # Fall back to the config name carried by INDIVIDUAL filenames
+        name_parts = filename.split('--info_info_')
+        value = name_parts[1].replace(".json", "") if len(name_parts) > 1 else None
+    elif criterion == "Top Speed (km/h)":
+        if not value:
+            return None
+        try:
+            value = str(float(value) * 3.6)
+        except ValueError:
+            return None
+    return value
+
+
+def get_matches_fingerprint(matches_file_path):
+    """Returns [size, mtime_ns] for Matches.txt, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(matches_file_path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _to_number(value):
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if number == number else None # NaN never compares true
+
+
+class FilterAttributeTable:
+    """
+    Typed, columnar view of Matches.txt for the global filter.
+
+    Every filter criterion is parsed once per Matches.txt version into its own column
+    (one value per entry). Text columns are dictionary-encoded so 'Contains' only looks
+    at distinct values; numeric columns keep a sorted copy so 'Below'/'Above' are a
+    bisect. A filter run is then a handful of set operations over row numbers instead
+    of one regex per criterion per entry.
+    """
+
+    def __init__(self, filenames, columns, main_file_for_zip, fingerprint=None):
+        self.filenames = filenames
+        self.columns = columns                      # criterion -> [str or None], one per row
+        self.main_file_for_zip = main_file_for_zip  # zip name -> first main info filename containing it
+        self.fingerprint = fingerprint
+        self.is_individual = ["INDIVIDUAL" in filename for filename in filenames]
+        self.zip_names = []
+        for filename, individual in zip(filenames, self.is_individual):
+            pattern = INDIVIDUAL_ZIP_NAME_PATTERN if individual else MAIN_ZIP_NAME_PATTERN
+            match = pattern.search(filename)
+            self.zip_names.append(match.group(1) if match else None)
+        self.main_rows = [row for row, individual in enumerate(self.is_individual) if not individual]
+        self.individual_rows = [row for row, individual in enumerate(self.is_individual) if individual]
+        self._text_indexes = {}
+        self._number_indexes = {}
+
+    # --- Building and persistence ---
+
+    @classmethod
+    def from_matches_file(cls, matches_file_path):
+        fingerprint = get_matches_fingerprint(matches_file_path)
+        entries = read_matches_entries(matches_file_path)
+        filenames = [filename for filename, _ in entries]
+        columns = {
+            criterion: [extract_attribute(content, filename, criterion) for filename, content in entries]
+            for criterion in ATTRIBUTE_PATTERNS
+        }
+
+        main_info_files = [filename for filename in filenames if "INDIVIDUAL" not in filename and "info.json" in filename]
+        main_file_for_zip = {}
+        for filename in filenames:
+            if "INDIVIDUAL" not in filename:
+                continue
+            match = INDIVIDUAL_ZIP_NAME_PATTERN.search(filename)
+            zip_name = match.group(1) if match else None
+            if not zip_name or zip_name in main_file_for_zip:
+                continue
+            # Substring lookup, first hit wins, exactly as the data subset pairing did it
+            main_file_for_zip[zip_name] = next((main for main in main_info_files if zip_name in main), None)
+        return cls(filenames, columns, main_file_for_zip, fingerprint)
+
+    @classmethod
+    def load(cls, table_path, fingerprint):
+        """Loads a saved table, or returns None if it is missing, unreadable or stale."""
+        if fingerprint is None or not os.path.isfile(table_path):
+            return None
+        try:
+            with open(table_path, 'r', encoding="utf-8") as f:
+                payload = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read {os.path.basename(table_path)}, rebuilding filter attributes: {e}")
+            return None
+        if payload.get("version") != FILTER_ATTRIBUTES_VERSION or payload.get("matches_fingerprint") != fingerprint:
+            return None
+        return cls(payload["filenames"], payload["columns"], payload["main_file_for_zip"], fingerprint)
+
+    def save(self, table_path):
+        """Writes the table atomically (temp file + replace)."""
+        temp_path = table_path + ".tmp"
+        payload = {
+            "version": FILTER_ATTRIBUTES_VERSION,
+            "matches_fingerprint": self.fingerprint,
+            "filenames": self.filenames,
+            "columns": self.columns,
+            "main_file_for_zip": self.main_file_for_zip,
+        }
+        try:
+            with open(temp_path, 'w', encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(temp_path, table_path)
+        except Exception as e:
+            print(f"Error writing {os.path.basename(table_path)}: {e}")
+
+    def is_current(self, matches_file_path):
+        return self.fingerprint is not None and self.fingerprint == get_matches_fingerprint(matches_file_path)
+
+    # --- Column indexes (built on first use) ---
+
+    def _text_index(self, criterion):
+        index = self._text_indexes.get(criterion)
+        if index is None:
+            index = {}
+            for row, value in enumerate(self.columns[criterion]):
+                if value is not None:
+                    index.setdefault(value.lower(), []).append(row)
+            self._text_indexes[criterion] = index
+        return index
+
+    def _number_index(self, criterion):
+        index = self._number_indexes.get(criterion)
+        if index is None:
+            pairs = sorted(
+                (number, row) for row, number in enumerate(map(_to_number, self.columns[criterion])) if number is not None
+            )
+            index = ([number for number, _ in pairs], [row for _, row in pairs])
+            self._number_indexes[criterion] = index
+        return index
+
+    # --- Evaluation ---
+
+    def matching_rows(self, condition):
+        """Returns the set of rows meeting one {'criterion', 'type', 'value'} condition."""
+        criterion = condition['criterion']
+        filter_type = condition['type']
+        if criterion not in self.columns:
+            # Unknown criterion: the value can never be determined
+            return set(range(len(self.filenames))) if filter_type == "DoesNotContain" else set()
+
+        if filter_type in ("Contains", "DoesNotContain"):
+            needle = condition['value'].lower()
+            contains = set()
+            for value, rows in self._text_index(criterion).items():
+                if needle in value:
+                    contains.update(rows)
+            if filter_type == "Contains":
+                return contains
+            return set(range(len(self.filenames))) - contains
+
+        try:
+            threshold = float(condition['value'])
+        except (ValueError, TypeError):
+            return set()
+        numbers, rows = self._number_index(criterion)
+        if filter_type in BELOW_TYPES:
+            return set(rows[:bisect_left(numbers, threshold)])
+        if filter_type in ABOVE_TYPES:
+            return set(rows[bisect_right(numbers, threshold):])
+        return set()
+
+    def evaluate(self, filter_conditions, brand_filter, country_filter):
+        """
+        Applies the parsed global filters.
+
+        Brand and Country are checked on the main info file of each zip and inherited by
+        its INDIVIDUAL files; every other criterion is checked on the INDIVIDUAL file itself.
+
+        Returns:
+            list: Matching INDIVIDUAL rows, in Matches.txt order.
+        """
+        brand_rows = self.matching_rows(brand_filter) if brand_filter else None
+        country_rows = self.matching_rows(country_filter) if country_filter else None
+
+        main_brand_passed = {}
+        main_country_passed = {}
+        for row in self.main_rows:
+            country_failed = country_rows is not None and row not in country_rows
+            brand_failed = (brand_rows is not None and row not in brand_rows) or country_failed
+            main_brand_passed[self.zip_names[row]] = not brand_failed
+            main_country_passed[self.zip_names[row]] = not country_failed
+
+        zip_names = self.zip_names
+        rows = self.individual_rows
+        if brand_filter:
+            rows = [row for row in rows if main_brand_passed.get(zip_names[row], False)]
+        if country_filter:
+            rows = [row for row in rows if main_country_passed.get(zip_names[row], True)]
+        for condition in filter_conditions:
+            if condition['criterion'] in ("Brand", "Country"):
+                continue
+            allowed = self.matching_rows(condition)
+            rows = [row for row in rows if row in allowed]
+        return rows
+
+    def subset_lines(self, rows):
+        """
+        Builds the data_subset.txt lines for matched INDIVIDUAL rows: each main info
+        file once, before the first of its INDIVIDUAL files.
+        """
+        lines = []
+        main_files_written = set()
+        for row in rows:
+            main_info_filename = self.main_file_for_zip.get(self.zip_names[row]) if self.zip_names[row] else None
+            if not main_info_filename:
+                continue
+            if main_info_filename not in main_files_written:
+                lines.append(main_info_filename)
+                main_files_written.add(main_info_filename)
+            lines.append(self.filenames[row])
+        return lines
+
+    def describe_failure(self, row, condition):
+        """Human-readable reason a row fails a condition, for filter_results.txt."""
+        criterion = condition['criterion']
+        value = self.columns[criterion][row] if criterion in self.columns else None
+        if value is None and condition['type'] not in ("Contains", "DoesNotContain"):
+            return f"{criterion}: Value not found in file."
+        if value is not None:
+            return f"{criterion} {condition['type']} {condition['value']}, but file has value: '{value}'"
+        return f"{criterion} {condition['type']} {condition['value']}, but value could not be determined in file."
+
+
+def load_filter_attribute_table(matches_file_path, table_path):
+    """
+    Returns the FilterAttributeTable for Matches.txt, loading the saved table when it
+    still matches Matches.txt and rebuilding (and saving) it otherwise.
+
+    Raises:
+        FileNotFoundError: If Matches.txt does not exist.
+    """
+    fingerprint = get_matches_fingerprint(matches_file_path)
+    table = FilterAttributeTable.load(table_path, fingerprint)
+    if table is not None:
+        print(f"DEBUG: Loaded filter attributes for {len(table.filenames)} Matches.txt entries from {os.path.basename(table_path)}")
+        return table
+    table = FilterAttributeTable.from_matches_file(matches_file_path)
+    print(f"DEBUG: Parsed filter attributes for {len(table.filenames)} Matches.txt entries")
+    if table.fingerprint is not None:
+        table.save(table_path)
+    return table
@@ -0,0 +1,59 @@
+import re
+
+
+def _trie_pattern(words):
+    """
+    Regex source matching any of words, with the words merged into a prefix tree:
+    "pick", "pickup" and "piper" become "pi(?:ck(?:up)?|per)". At every character at
+    most one alternative per distinct next character is tried, so matching doesn't get
+    slower as words are added.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True  # A word ends here
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char != ""]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            pattern = "(?:" + pattern + ")?"
+        return pattern
+
+    return build(trie)
+
+
+class HiddenFolderMatcher:
+    """
+    Tells whether a config list line belongs to a hidden vehicle folder (Hidden.txt).
+
+    Same test load_data did with an any() over every hidden folder, as one compiled regex
+    over the lowercased line: "vehicles/<folder>/" or "vehicles\\<folder>\\", plus
+    "vehicles--<folder>" for the custom configs list (custom_format=True). The folders are
+    compared as written in Hidden.txt against the lowercased line, as before.
+    """
+
+    def __init__(self, hidden_folders, custom_format=False):
+        folders = sorted(set(hidden_folders))
+        self.folder_count = len(folders)
+        self._pattern = None
+        if folders:
+            folder_pattern = _trie_pattern(folders)
+            alternatives = [r"vehicles/" + folder_pattern + r"/", r"vehicles\\" + folder_pattern + r"\\"]
+            if custom_format:
+                alternatives.append(r"vehicles--" + folder_pattern)
+            self._pattern = re.compile("|".join(alternatives))
+
+    def matches(self, line):
+        return self._pattern is not None and self._pattern.search(line.lower()) is not None
+
+    def filter_lines(self, lines):
+        """Returns the lines that don't belong to a hidden folder."""
+        if self._pattern is None:
+            return list(lines)
+        search = self._pattern.search
+        return [line for line in lines if search(line.lower()) is None]
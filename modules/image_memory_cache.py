@@ -0,0 +1,157 @@
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_IMAGE_MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PHOTO_IMAGE = "photo"  # ImageTk.PhotoImage / tk.PhotoImage (Tk keeps 4 bytes per pixel)
+PIL_IMAGE = "pil"  # PIL.Image.Image
+_PIL_MODE_BYTES = {"1": 1, "L": 1, "P": 1, "LA": 2, "I;16": 2, "RGB": 3, "YCbCr": 3, "LAB": 3, "HSV": 3,
+                   "RGBA": 4, "RGBa": 4, "CMYK": 4, "I": 4, "F": 4}
+
+
+def estimate_image_bytes(image, kind=PHOTO_IMAGE):
+    """
+    Estimates the memory an in-memory picture holds: width x height x bytes per pixel.
+    PhotoImages are counted at 4 bytes per pixel (Tk's photo storage), PIL images by mode.
+    """
+    try:
+        if kind == PIL_IMAGE:
+            width, height = image.size
+            return width * height * _PIL_MODE_BYTES.get(image.mode, 4)
+        return int(image.width()) * int(image.height()) * 4
+    except Exception:
+        return 0
+
+
+class ImageMemoryCache:
+    """
+    Memory-bounded LRU of decoded pictures for the main grid, sized by bytes instead of
+    entry count. PhotoImages and PIL images share one budget and one LRU order, keyed by
+    (kind, key), so the same picture held both ways counts twice against max_bytes.
+
+    put() evicts least recently used entries until the cache is back under max_bytes.
+    A picture larger than the whole budget is not cached. All methods are thread-safe.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_IMAGE_MEMORY_CACHE_MAX_BYTES, on_evict=None):
+        """
+        Args:
+            max_bytes (int): Ceiling for the estimated bytes of all cached pictures.
+            on_evict (callable, optional): on_evict(key, kind) after an entry was evicted for space.
+        """
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()  # {(kind, key): (image, byte size)}, least recently used first
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def contains(self, key, kind=PHOTO_IMAGE):
+        """Membership test that neither counts as a hit/miss nor changes the LRU order."""
+        with self._lock:
+            return (kind, key) in self._entries
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def get(self, key, kind=PHOTO_IMAGE, record_stats=True):
+        """
+        Returns the cached picture (and marks it recently used), or None.
+        record_stats=False for a re-check that shouldn't count as another hit or miss.
+        """
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is None:
+                if record_stats:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end((kind, key))
+            if record_stats:
+                self.hits += 1
+            return entry[0]
+
+    def put(self, key, image, kind=PHOTO_IMAGE, byte_size=None):
+        """
+        Adds or replaces a picture and evicts down to max_bytes.
+
+        Returns:
+            list: The (key, kind) pairs evicted to make room.
+        """
+        if byte_size is None:
+            byte_size = estimate_image_bytes(image, kind)
+        with self._lock:
+            self._discard_locked((kind, key))
+            if byte_size > self.max_bytes:
+                return []
+            self._entries[(kind, key)] = (image, byte_size)
+            self._total_bytes += byte_size
+            return self._evict_locked()
+
+    def _discard_locked(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return False
+        self._total_bytes -= entry[1]
+        return True
+
+    def _evict_locked(self):
+        evicted = []
+        while self._total_bytes > self.max_bytes and self._entries:
+            (kind, key), (_, byte_size) = self._entries.popitem(last=False)
+            self._total_bytes -= byte_size
+            self.evictions += 1
+            evicted.append((key, kind))
+        if self.on_evict is not None:
+            for key, kind in evicted:
+                self.on_evict(key, kind)
+        return evicted
+
+    def discard(self, key, kind=None):
+        """Drops a picture (of every kind if kind is None). Returns True if something was dropped."""
+        with self._lock:
+            kinds = (PHOTO_IMAGE, PIL_IMAGE) if kind is None else (kind,)
+            dropped = [self._discard_locked((k, key)) for k in kinds]
+            return any(dropped)
+
+    def discard_where(self, predicate):
+        """Drops every entry whose key matches predicate(key). Returns the number dropped."""
+        with self._lock:
+            stale = [entry_key for entry_key in self._entries if predicate(entry_key[1])]
+            for entry_key in stale:
+                self._discard_locked(entry_key)
+            return len(stale)
+
+    def keys(self, kind=PHOTO_IMAGE):
+        with self._lock:
+            return [key for entry_kind, key in self._entries if entry_kind == kind]
+
+    def set_max_bytes(self, max_bytes):
+        """Changes the ceiling, evicting right away if the cache is over it. Returns the evicted pairs."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            return self._evict_locked()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            photo_entries = sum(1 for kind, _ in self._entries if kind == PHOTO_IMAGE)
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "entries": len(self._entries),
+                "photo_entries": photo_entries,
+                "pil_entries": len(self._entries) - photo_entries,
+            }
@@ -0,0 +1,448 @@
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import threading
+from collections.abc import MutableMapping
+
+
+PROCESSED_DATA_DB_NAME = "config_processing_cache.sqlite3"
+PROCESSED_DATA_SCHEMA_VERSION = "1"
+
+# The same captures process_lines uses to decide which folder a spawn line belongs to
+CUSTOM_SPAWN_PATTERN = re.compile(r'core_vehicles\.spawnNewVehicle\("(.+?)", \{config = \'vehicles/(.+?)/(.+?)\.pc\'\}\)')
+CUSTOM_NIL_SPAWN_PATTERN = re.compile(r'core_vehicles\.spawnNewVehicle\("(.+?)",\s*\{(?:config\s*=\s*(?:nil|\'\'))?\}\)')
+REGULAR_NIL_PATTERN = re.compile(r'"(.+?)",\s*\{(?:config\s*=\s*(?:nil|\'\'))?\}\)')
+REGULAR_CONFIG_PATTERN = re.compile(r", \{config = 'vehicles/(.+?)/(.+?)\.pc'\}\)")
+REGULAR_FOLDER_PATTERN = re.compile(r'"([^"]+)"')
+
+
+def get_processed_data_db_path(script_dir):
+    """Returns the path of the processed-data store inside the data folder."""
+    return os.path.join(str(script_dir), "data", PROCESSED_DATA_DB_NAME)
+
+
+def mark_processed_data_stale(script_dir):
+    """
+    Marks the processed-data store as stale so the next load_data() re-reads the
+    outputGOOD files and reprocesses only the folders whose lines changed.
+    Replaces deleting config_processing_cache.json.
+    """
+    db_path = get_processed_data_db_path(script_dir)
+    if not os.path.exists(db_path):
+        return
+    try:
+        store = ProcessedDataStore(db_path)
+        store.mark_stale()
+        store.close()
+        print(f"DEBUG: Marked processed data store stale: {db_path}")
+    except sqlite3.Error as e:
+        print(f"Warning: Failed to mark processed data store stale {db_path}: {e}")
+
+
+def get_spawn_line_folder(line, is_custom):
+    """
+    Returns the lowercase folder key process_lines files a spawn line under, or None.
+    Regular lines use the folder from the config path, custom lines the model argument.
+    """
+    if is_custom:
+        match = CUSTOM_SPAWN_PATTERN.search(line) or CUSTOM_NIL_SPAWN_PATTERN.search(line)
+        return match.group(1).lower() if match else None
+    parts = line.split("core_vehicles.spawnNewVehicle(", 1)
+    if len(parts) < 2:
+        return None
+    match = (REGULAR_NIL_PATTERN.search(parts[1]) or REGULAR_CONFIG_PATTERN.search(parts[1])
+             or REGULAR_FOLDER_PATTERN.search(parts[1]))
+    return match.group(1).lower() if match else None
+
+
+def group_lines_by_folder(lines, is_custom):
+    """
+    Splits outputGOOD / outputGOODcustom lines into per-folder blocks without doing
+    any of the expensive work in process_lines.
+
+    Regular blocks start at a "(package)" line and custom blocks at a "(config picture)"
+    line, which is exactly the context process_lines carries from one line to the next,
+    so processing a folder's blocks alone gives the same rows as processing the whole file.
+
+    Returns:
+        dict: {folder_lower: [line, ...]} in first-appearance order.
+    """
+    block_marker = "(config picture)" if is_custom else "(package)"
+    grouped = {}
+    block = []
+    block_folder = None
+
+    def flush():
+        if block and block_folder is not None:
+            grouped.setdefault(block_folder, []).extend(block)
+
+    for line in lines:
+        if block_marker in line:
+            flush()
+            block = [line]
+            block_folder = None
+            continue
+        block.append(line)
+        if "core_vehicles.spawnNewVehicle" in line:
+            folder = get_spawn_line_folder(line.strip(), is_custom)
+            if folder is not None:
+                if block_folder is not None and folder != block_folder:
+                    # A second spawn line for another folder inside one block. Regular blocks keep
+                    # their package line (process_lines keeps the zip across spawn lines); custom
+                    # blocks do not, since the picture is consumed by the first spawn line.
+                    grouped.setdefault(block_folder, []).extend(block[:-1])
+                    has_header = block_marker in block[0]
+                    block = [block[0], line] if has_header and not is_custom else [line]
+                block_folder = folder
+    flush()
+    return grouped
+
+
+def _file_name_folder(file_name_lower, folders):
+    """
+    The folder a ConfigInfo / ConfigPics / ConfigPicsCustom file belongs to, or None.
+    Those files are named "vehicles--[individual--]<folder>_<zip or user>--...", and folder
+    names may contain "_" themselves, so the longest known folder prefix wins.
+    """
+    if not file_name_lower.startswith("vehicles--"):
+        return None
+    name = file_name_lower[len("vehicles--"):]
+    if name.startswith("individual--"):
+        name = name[len("individual--"):]
+    head = name.split("--", 1)[0]
+    cut = head.rfind("_")
+    while cut > 0:
+        if head[:cut] in folders:
+            return head[:cut]
+        cut = head.rfind("_", 0, cut)
+    return None
+
+
+def collect_folder_file_signatures(directories, folders):
+    """
+    Lists the info and picture folders process_lines reads from, once each.
+
+    Args:
+        directories (list): ConfigInfo, ConfigPics and ConfigPicsCustom paths (missing ones are skipped).
+        folders (iterable): Lowercase folder keys, as group_lines_by_folder returns them.
+
+    Returns:
+        dict: {folder: [(file name, mtime_ns, size), ...]} sorted, for hash_folder_lines.
+    """
+    folders = set(folders)
+    signatures = {}
+    for directory in directories:
+        if not directory or not os.path.isdir(directory):
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    folder = _file_name_folder(entry.name.lower(), folders)
+                    if folder is None:
+                        continue
+                    try:
+                        stat_result = entry.stat()
+                    except OSError:
+                        continue
+                    signatures.setdefault(folder, []).append((entry.name, stat_result.st_mtime_ns, stat_result.st_size))
+        except OSError as e:
+            print(f"Warning: Could not list {directory} for processed data fingerprints: {e}")
+    for folder_signatures in signatures.values():
+        folder_signatures.sort()
+    return signatures
+
+
+def hash_folder_lines(regular_lines, custom_lines, file_signatures=()):
+    """
+    Fingerprint of every source line that contributes to one folder's rows, plus the
+    (name, mtime, size) of the folder's info and picture files, so editing an info file or
+    adding a picture reprocesses the folder even when its lines are unchanged.
+    """
+    digest = hashlib.sha1()
+    for line in regular_lines:
+        digest.update(line.strip().encode("utf-8", "replace"))
+        digest.update(b"\n")
+    digest.update(b"\x00custom\x00")
+    for line in custom_lines:
+        digest.update(line.strip().encode("utf-8", "replace"))
+        digest.update(b"\n")
+    digest.update(b"\x00files\x00")
+    for file_name, mtime_ns, size in file_signatures:
+        digest.update(f"{file_name}|{mtime_ns}|{size}\n".encode("utf-8", "replace"))
+    return digest.hexdigest()
+
+
+def _row_to_item(row):
+    pic_path, spawn_line, zip_file, info_json, folder_name_item = row
+    return [pic_path, spawn_line, zip_file, json.loads(info_json), folder_name_item]
+
+
+def _item_to_row(item):
+    pic_path, spawn_line, zip_file, info_data, folder_name_item = item
+    return (pic_path, spawn_line, zip_file, json.dumps(info_data), folder_name_item)
+
+
+class ProcessedDataStore:
+    """
+    SQLite-backed store for the processed config dataset, keyed by folder and config.
+
+    - folders: one representative row per folder (the main grid item) plus the hash of
+      the source lines it was built from.
+    - configs: every processed config row, keyed by (folder, position).
+    - meta:    schema version and whether the store is "valid" or "stale".
+
+    Rows are written and deleted per folder, so a change to one vehicle only touches
+    that vehicle's rows.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is not None and row[0] != PROCESSED_DATA_SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS folders")
+                self._conn.execute("DROP TABLE IF EXISTS configs")
+                self._conn.execute("DELETE FROM meta")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS folders ("
+                " folder TEXT PRIMARY KEY, sort_order INTEGER NOT NULL,"
+                " pic_path TEXT, spawn_line TEXT, zip_file TEXT, info_json TEXT, folder_name_item TEXT,"
+                " source_hash TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS configs ("
+                " folder TEXT NOT NULL, position INTEGER NOT NULL,"
+                " pic_path TEXT, spawn_line TEXT, zip_file TEXT, info_json TEXT, folder_name_item TEXT,"
+                " PRIMARY KEY (folder, position))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS folders_sort_order ON folders (sort_order)")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (PROCESSED_DATA_SCHEMA_VERSION,)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- State ---
+
+    def _get_meta(self, key, default=None):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def is_valid(self):
+        """True if the rows match the current outputGOOD files and can be used as-is."""
+        with self._lock:
+            return self._get_meta("state") == "valid"
+
+    def mark_valid(self):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('state', 'valid')")
+
+    def mark_stale(self):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('state', 'stale')")
+
+    def clear(self):
+        """Drops every row (used when a setting changes how all folders are processed)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM folders")
+            self._conn.execute("DELETE FROM configs")
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('state', 'stale')")
+
+    # --- Reads ---
+
+    def get_source_hashes(self):
+        """Returns {folder: source_hash} for every stored folder."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT folder, source_hash FROM folders"))
+
+    def count_folders(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM folders").fetchone()[0]
+
+    def load_representatives(self, limit=None, offset=0):
+        """
+        Returns the main grid items in stored order as an ordered {folder: item} dict.
+        With a limit only that page of folders is read.
+        """
+        query = ("SELECT folder, pic_path, spawn_line, zip_file, info_json, folder_name_item"
+                 " FROM folders ORDER BY sort_order")
+        params = ()
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params = (limit, offset)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return {row[0]: _row_to_item(row[1:]) for row in rows}
+
+    def load_folder_names(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT folder FROM folders ORDER BY sort_order")]
+
+    def load_folder_configs(self, folder):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pic_path, spawn_line, zip_file, info_json, folder_name_item"
+                " FROM configs WHERE folder = ? ORDER BY position",
+                (folder,)
+            ).fetchall()
+        return [_row_to_item(row) for row in rows]
+
+    def load_all_configs(self):
+        """Returns {folder: [item, ...]} for every folder in one query."""
+        full_data = {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT c.folder, c.pic_path, c.spawn_line, c.zip_file, c.info_json, c.folder_name_item"
+                " FROM configs c JOIN folders f ON f.folder = c.folder"
+                " ORDER BY f.sort_order, c.position"
+            ).fetchall()
+        for row in rows:
+            full_data.setdefault(row[0], []).append(_row_to_item(row[1:]))
+        return full_data
+
+    # --- Writes ---
+
+    def apply_changes(self, upserts, deleted_folders, folder_order):
+        """
+        Writes one load's worth of changes in a single transaction.
+
+        Args:
+            upserts (dict): {folder: (representative_item or None, [config items], source_hash)}
+            deleted_folders (iterable): Folders whose rows should be removed.
+            folder_order (list): Every live folder in display order (updates sort_order).
+        """
+        with self._lock, self._conn:
+            for folder in deleted_folders:
+                self._conn.execute("DELETE FROM folders WHERE folder = ?", (folder,))
+                self._conn.execute("DELETE FROM configs WHERE folder = ?", (folder,))
+            for folder, (representative, configs, source_hash) in upserts.items():
+                self._conn.execute("DELETE FROM configs WHERE folder = ?", (folder,))
+                self._conn.executemany(
+                    "INSERT INTO configs (folder, position, pic_path, spawn_line, zip_file, info_json, folder_name_item)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(folder, position) + _item_to_row(item) for position, item in enumerate(configs)]
+                )
+                if representative is None:
+                    self._conn.execute("DELETE FROM folders WHERE folder = ?", (folder,))
+                    continue
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO folders"
+                    " (folder, sort_order, pic_path, spawn_line, zip_file, info_json, folder_name_item, source_hash)"
+                    " VALUES (?, 0, ?, ?, ?, ?, ?, ?)",
+                    (folder,) + _item_to_row(representative) + (source_hash,)
+                )
+            self._conn.executemany(
+                "UPDATE folders SET sort_order = ? WHERE folder = ?",
+                [(index, folder) for index, folder in enumerate(folder_order)]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('state', 'valid')")
+
+    def invalidate_zip_files(self, zip_files):
+        """
+        Forgets the source hash of every folder with configs from one of zip_files, so the
+        next load reprocesses those folders even when their outputGOOD lines are unchanged
+        (an archive replaced in place keeps its lines but can ship new info files and pictures).
+
+        Returns:
+            list: The affected folders.
+        """
+        zip_names = sorted({str(zip_file).lower() for zip_file in zip_files})
+        if not zip_names:
+            return []
+        placeholders = ", ".join("?" for _ in zip_names)
+        with self._lock, self._conn:
+            folders = [row[0] for row in self._conn.execute(
+                f"SELECT DISTINCT folder FROM configs WHERE lower(zip_file) IN ({placeholders})", zip_names
+            )]
+            self._conn.executemany("UPDATE folders SET source_hash = NULL WHERE folder = ?", [(folder,) for folder in folders])
+        return folders
+
+    def delete_folders(self, folders):
+        """Removes the rows of individual folders (e.g. a vehicle that was hidden)."""
+        with self._lock, self._conn:
+            for folder in folders:
+                self._conn.execute("DELETE FROM folders WHERE folder = ?", (folder,))
+                self._conn.execute("DELETE FROM configs WHERE folder = ?", (folder,))
+
+
+class LazyFullData(MutableMapping):
+    """
+    Drop-in replacement for the full_data dict ({folder: [config items]}) that only
+    reads a folder's configs from the store the first time it is accessed.
+    Iterating items()/values() loads everything that is still missing in one query.
+    """
+
+    def __init__(self, store, folder_names, loaded=None):
+        self._store = store
+        self._keys = dict.fromkeys(folder_names)
+        self._loaded = dict(loaded) if loaded else {}
+        self._all_loaded = False
+
+    def __getitem__(self, folder):
+        if folder in self._loaded:
+            return self._loaded[folder]
+        if folder not in self._keys:
+            raise KeyError(folder)
+        configs = self._store.load_folder_configs(folder)
+        self._loaded[folder] = configs
+        return configs
+
+    def __setitem__(self, folder, configs):
+        self._keys[folder] = None
+        self._loaded[folder] = configs
+
+    def __delitem__(self, folder):
+        if folder not in self._keys:
+            raise KeyError(folder)
+        del self._keys[folder]
+        self._loaded.pop(folder, None)
+
+    def __contains__(self, folder):
+        return folder in self._keys
+
+    def __iter__(self):
+        return iter(list(self._keys))
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _load_all(self):
+        if self._all_loaded:
+            return
+        missing = [folder for folder in self._keys if folder not in self._loaded]
+        if missing:
+            all_configs = self._store.load_all_configs()
+            for folder in missing:
+                self._loaded[folder] = all_configs.get(folder, [])
+        self._all_loaded = True
+
+    def items(self):
+        self._load_all()
+        return [(folder, self._loaded[folder]) for folder in self._keys]
+
+    def values(self):
+        self._load_all()
+        return [self._loaded[folder] for folder in self._keys]
+
+    def copy(self):
+        """Shallow copy that shares already loaded config lists, like dict(full_data)."""
+        clone = LazyFullData(self._store, self._keys, self._loaded)
+        clone._all_loaded = self._all_loaded
+        return clone
+
+    def __repr__(self):
+        return f"LazyFullData({len(self._keys)} folders, {len(self._loaded)} loaded)"
@@ -1,6 +1,7 @@
 import os
 import tkinter as tk
-import inspect 
+
+from modules.caller_trace import trace_caller
 
 
 def throttled_resize(app, event):
@@ -447,22 +448,7 @@ def calculate_columns_for_width(app, width, is_details=False): #using the window
     """
 
 
-    stack = inspect.stack()
-    caller_function_name = "<unknown>"
-    caller_filename = "<unknown>"
-    caller_lineno = 0
-    if len(stack) > 1:
-        # stack[0] is the current frame (update_grid_layout)
-        # stack[1] is the caller's frame
-        caller_frame_record = stack[1]
-        caller_function_name = caller_frame_record.function
-        caller_filename = caller_frame_record.filename
-        caller_lineno = caller_frame_record.lineno
-        # You can even get the specific code line that made the call:
-        caller_code_context = caller_frame_record.code_context
-        print(f"    Code context: {caller_code_context}") # Might be None
-
-    print(f"--- calculate_columns_for_width CALLED BY: {caller_function_name} in {caller_filename} at line {caller_lineno} ---")
+    trace_caller("calculate_columns_for_width")
 
 
     image_width = 252
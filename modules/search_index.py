@@ -0,0 +1,231 @@
+import re
+from collections import defaultdict
+
+
+# Filenames in matches_config.txt look like
+# "vehicles--INDIVIDUAL--{folder}_{zip}.zip--info_info_{config}.json"
+INDIVIDUAL_PREFIX = "--INDIVIDUAL--"
+MATCHES_CONFIG_NAME_PATTERN = re.compile(r'--info_info_([^\.]+)\.json', re.IGNORECASE)
+SPAWN_CONFIG_NAME_PATTERN = re.compile(r"config\s*=\s*'vehicles/[^/]+/([^\.]+)\.pc'")
+
+
+def extract_config_name_from_matches_filename(matches_config_filename):
+    """Same result as ConfigViewerApp.extract_name_from_spawn_command_from_matches_config_filename."""
+    match = MATCHES_CONFIG_NAME_PATTERN.search(matches_config_filename)
+    return match.group(1) if match else None
+
+
+def candidate_folders_for_matches_filename(matches_config_filename):
+    """
+    Yields every folder name an INDIVIDUAL matches_config.txt filename can belong to:
+    each underscore-delimited prefix of the "{folder}_{zip}" part. Folder names may
+    contain underscores themselves, so all prefixes are offered and the caller keeps
+    the ones that are real folders.
+    """
+    start = matches_config_filename.find(INDIVIDUAL_PREFIX)
+    if start == -1:
+        return
+    rest = matches_config_filename[start + len(INDIVIDUAL_PREFIX):]
+    end = rest.find(".zip--")
+    if end != -1:
+        rest = rest[:end]
+    index = rest.find("_")
+    while index != -1:
+        yield rest[:index]
+        index = rest.find("_", index + 1)
+    yield rest
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ConfigSearchIndex:
+    """
+    Inverted index for 'Configs' search mode.
+
+    Every searchable string (config names from matches_config.txt and .pc names taken
+    from spawn commands) is stored once, lowercased, with the (folder, favorite key)
+    pairs it belongs to. A trigram index over the distinct strings narrows a query down
+    to the strings that can contain it; those are then confirmed with a plain substring
+    check, so results are identical to scanning every config.
+
+    Entries are grouped per (source, folder) so a single folder can be replaced or
+    removed without touching the rest of the index.
+    """
+
+    def __init__(self):
+        self._text_ids = {}                      # text -> text id
+        self._texts = []                         # text id -> text
+        self._trigram_postings = defaultdict(set)  # trigram -> {text id}
+        self._postings = defaultdict(dict)       # text id -> {(folder, fav_key): refcount}
+        self._text_folders = defaultdict(dict)   # text id -> {folder: refcount}, for unfiltered searches
+        self._folder_entries = {}                # (source, folder) -> [(text id, fav_key)]
+        self._last_query = None
+        self._last_text_ids = None
+        self.generation = 0
+
+    # --- Building ---
+
+    def _text_id(self, text):
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = len(self._texts)
+            self._text_ids[text] = text_id
+            self._texts.append(text)
+            for gram in _trigrams(text):
+                self._trigram_postings[gram].add(text_id)
+        return text_id
+
+    def _changed(self):
+        self.generation += 1
+        self._last_query = None
+        self._last_text_ids = None
+
+    def set_folder_entries(self, source, folder, entries):
+        """
+        Replaces the entries of one folder for one source.
+
+        Args:
+            source (str): "configs" (full_data) or "matches" (matches_config.txt).
+            folder (str): Folder name as used by the grid items.
+            entries (iterable): (text, fav_key) pairs. fav_key None means the entry
+                                is never hidden by the Favorites filter.
+        """
+        self._remove_folder_entries(source, folder)
+        stored = []
+        for text, fav_key in entries:
+            if not text:
+                continue
+            text_id = self._text_id(text.lower())
+            postings = self._postings[text_id]
+            postings[(folder, fav_key)] = postings.get((folder, fav_key), 0) + 1
+            text_folders = self._text_folders[text_id]
+            text_folders[folder] = text_folders.get(folder, 0) + 1
+            stored.append((text_id, fav_key))
+        if stored:
+            self._folder_entries[(source, folder)] = stored
+        self._changed()
+
+    def _remove_folder_entries(self, source, folder):
+        for text_id, fav_key in self._folder_entries.pop((source, folder), ()):
+            postings = self._postings[text_id]
+            count = postings.get((folder, fav_key), 0) - 1
+            if count > 0:
+                postings[(folder, fav_key)] = count
+            else:
+                postings.pop((folder, fav_key), None)
+            text_folders = self._text_folders[text_id]
+            if text_folders.get(folder, 0) > 1:
+                text_folders[folder] -= 1
+            else:
+                text_folders.pop(folder, None)
+
+    def remove_folder(self, folder):
+        """Drops every entry of a folder (all sources)."""
+        for source in ("configs", "matches"):
+            self._remove_folder_entries(source, folder)
+        self._changed()
+
+    def set_folder_configs(self, folder, config_items, extract_name):
+        """Indexes the .pc names of a folder's full_data config items."""
+        entries = []
+        for config_item in config_items:
+            config_name = extract_name(config_item[1])
+            entries.append((config_name, f"{folder}|{config_name}.pc"))
+        self.set_folder_entries("configs", folder, entries)
+
+    def set_matches_config(self, matches_config_data, folders):
+        """
+        Indexes matches_config.txt ({filename: configuration name}) for the given folders,
+        replacing whatever those folders had indexed from it before.
+        """
+        folder_set = set(folders)
+        grouped = defaultdict(list)
+        for filename, config_name in matches_config_data.items():
+            if INDIVIDUAL_PREFIX not in filename:
+                continue
+            config_base = extract_config_name_from_matches_filename(filename)
+            for folder in candidate_folders_for_matches_filename(filename):
+                if folder in folder_set:
+                    fav_key = f"{folder}|{config_base}.pc" if config_base else None
+                    grouped[folder].append((config_name, fav_key))
+        for folder in folder_set:
+            self.set_folder_entries("matches", folder, grouped.get(folder, ()))
+
+    # --- Querying ---
+
+    def _matching_text_ids(self, query):
+        if self._last_query is not None and query.startswith(self._last_query):
+            # Typing extends the previous query: only its matches can still match
+            candidates = self._last_text_ids
+        elif len(query) >= 3:
+            grams = sorted((self._trigram_postings.get(gram, set()) for gram in _trigrams(query)), key=len)
+            candidates = set.intersection(*grams) if grams else set()
+        else:
+            candidates = range(len(self._texts))
+        texts = self._texts
+        text_ids = [text_id for text_id in candidates if query in texts[text_id]]
+        self._last_query = query
+        self._last_text_ids = text_ids
+        return text_ids
+
+    def search(self, query, favorite_keys=None):
+        """
+        Returns the set of folders with at least one entry containing query.
+        With favorite_keys, entries whose favorite key is not in it are ignored.
+        """
+        query = query.lower()
+        folders = set()
+        if not query:
+            return folders
+        text_ids = self._matching_text_ids(query)
+        if favorite_keys is None:
+            for text_id in text_ids:
+                folders.update(self._text_folders[text_id])
+            return folders
+        for text_id in text_ids:
+            for folder, fav_key in self._postings[text_id]:
+                if fav_key is None or fav_key in favorite_keys:
+                    folders.add(folder)
+        return folders
+
+
+
+class SearchMatchMemo:
+    """
+    Search predicate results of one search state, by item, so a search pass and the grid
+    layout that follows it evaluate the predicate once per item.
+
+    reset() starts over whenever the state (query, search mode, ...) differs or the data
+    the predicate reads (source, compared by identity) was replaced. Items are keyed by
+    identity and kept referenced, so a key never stands for another item.
+    """
+
+    def __init__(self):
+        self.state = None
+        self._source = None
+        self._results = {}  # id(item) -> (item, matched)
+        self.evaluations = 0
+
+    def reset(self, state, source=None):
+        if state != self.state or source is not self._source:
+            self.state = state
+            self._source = source
+            self._results = {}
+
+    def clear(self):
+        self.state = None
+        self._source = None
+        self._results = {}
+
+    def get(self, item):
+        """The recorded result for item, or None if it wasn't evaluated in this state."""
+        entry = self._results.get(id(item))
+        if entry is not None and entry[0] is item:
+            return entry[1]
+        return None
+
+    def record(self, item, matched):
+        self._results[id(item)] = (item, matched)
+        self.evaluations += 1
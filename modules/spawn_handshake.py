@@ -0,0 +1,202 @@
+import os
+import time
+import threading
+from collections import namedtuple
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+
+COMMAND_CONFIRMATION_FILE_NAME = "commandconfirmation.txt"
+DEFAULT_ATTEMPT_TIMEOUT = 3.0  # Seconds to wait for the game before sending the hotkey again
+DEFAULT_MAX_ATTEMPTS = 7
+
+# status is "confirmed", "timeout", "cancelled" or "failed" (the hotkey could not be sent).
+# latency is seconds from the first hotkey to the confirmation, attempt_latency from the last one.
+SpawnResult = namedtuple("SpawnResult", ["status", "attempts", "latency", "attempt_latency"])
+
+
+class _ConfirmationEventHandler(FileSystemEventHandler):
+    def __init__(self, watcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event):
+        self.watcher._on_file_event(event.src_path)
+
+    def on_modified(self, event):
+        self.watcher._on_file_event(event.src_path)
+
+    def on_moved(self, event):
+        self.watcher._on_file_event(event.dest_path)
+
+
+class SpawnConfirmationWatcher:
+    """
+    Watches for the confirmation file the game's Lua side writes after it ran a spawn queue
+    (mods/EllexiumModManager/data/commandconfirmation.txt), using a watchdog observer on its
+    folder instead of sleeping and checking for it.
+
+    on_confirmation, when set, is called from the observer thread as soon as the file appears.
+    """
+
+    def __init__(self, confirmation_path):
+        self.confirmation_path = str(confirmation_path)
+        self._normalized_path = os.path.normcase(os.path.abspath(self.confirmation_path))
+        self._event = threading.Event()
+        self._observer = None
+        self.on_confirmation = None
+
+    def start(self):
+        folder = os.path.dirname(self._normalized_path)
+        os.makedirs(folder, exist_ok=True)
+        observer = Observer()
+        observer.schedule(_ConfirmationEventHandler(self), folder, recursive=False)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+
+    def is_watching(self):
+        return self._observer is not None and self._observer.is_alive()
+
+    def _on_file_event(self, path):
+        if os.path.normcase(os.path.abspath(path)) != self._normalized_path:
+            return
+        if not os.path.exists(self.confirmation_path):
+            return # Late event for a confirmation that was already consumed
+        self._event.set()
+        callback = self.on_confirmation
+        if callback is not None:
+            callback()
+
+    def arm(self):
+        """Forgets earlier confirmations, including a stale file, before a hotkey is sent."""
+        self._event.clear()
+        self.consume()
+
+    def is_confirmed(self):
+        return self._event.is_set() or os.path.exists(self.confirmation_path)
+
+    def wait(self, timeout):
+        """Blocks until the confirmation arrives or timeout seconds pass. Returns True if confirmed."""
+        return self._event.wait(timeout) or os.path.exists(self.confirmation_path)
+
+    def consume(self):
+        try:
+            os.remove(self.confirmation_path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            print(f"Warning: Could not delete confirmation file '{self.confirmation_path}': {e}")
+            return False
+
+
+class SpawnHandshake:
+    """
+    One spawn request: sends the hotkey through trigger(attempt), then waits for the watcher's
+    confirmation without blocking. If the game doesn't confirm within attempt_timeout seconds
+    the hotkey is sent again, up to max_attempts times.
+
+    Nothing here sleeps. Timers go through schedule(delay_ms, callback) / unschedule(timer_id),
+    which the app maps to Tk's after/after_cancel so every callback runs on the Tk thread;
+    watcher events are handed over with schedule(0, ...).
+    """
+
+    def __init__(self, watcher, trigger, schedule, unschedule, attempt_timeout=DEFAULT_ATTEMPT_TIMEOUT,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, on_retry=None, on_done=None):
+        """
+        Args:
+            watcher (SpawnConfirmationWatcher): Watcher for the confirmation file.
+            trigger (callable): trigger(attempt) sends the hotkey; returning False aborts with "failed".
+            schedule (callable): schedule(delay_ms, callback) -> timer id.
+            unschedule (callable): unschedule(timer id).
+            attempt_timeout (float): Seconds to wait for a confirmation per attempt.
+            max_attempts (int): Number of times the hotkey is sent before giving up.
+            on_retry (callable, optional): on_retry(attempt) before the hotkey is sent again.
+            on_done (callable, optional): on_done(SpawnResult), called exactly once.
+        """
+        self.watcher = watcher
+        self.trigger = trigger
+        self._schedule = schedule
+        self._unschedule = unschedule
+        self.attempt_timeout = attempt_timeout
+        self.max_attempts = max_attempts
+        self.on_retry = on_retry
+        self.on_done = on_done
+        self._lock = threading.Lock()
+        self._timeout_id = None
+        self.attempt = 0
+        self.started_at = None
+        self.attempt_started_at = None
+        self.result = None
+
+    @property
+    def done(self):
+        return self.result is not None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.watcher.on_confirmation = self._on_watcher_signal
+        self._run_attempt(1)
+        return self
+
+    def cancel(self):
+        self._finish("cancelled")
+
+    def _run_attempt(self, attempt):
+        with self._lock:
+            if self.done:
+                return
+            self.attempt = attempt
+            self.attempt_started_at = time.perf_counter()
+            self.watcher.arm()
+            self._timeout_id = self._schedule(int(self.attempt_timeout * 1000), lambda a=attempt: self._on_timeout(a))
+        if self.trigger(attempt) is False:
+            self._finish("failed")
+
+    def _on_watcher_signal(self):
+        # Observer thread: hand over to the scheduler's thread
+        self._schedule(0, self._on_confirmed)
+
+    def _on_confirmed(self):
+        if not self.done and self.watcher.is_confirmed():
+            self._finish("confirmed")
+
+    def _on_timeout(self, attempt):
+        with self._lock:
+            if self.done or attempt != self.attempt:
+                return
+            self._timeout_id = None
+        if self.watcher.is_confirmed(): # Also covers a watcher that couldn't start
+            self._finish("confirmed")
+        elif attempt >= self.max_attempts:
+            self._finish("timeout")
+        else:
+            if self.on_retry:
+                self.on_retry(attempt + 1)
+            self._run_attempt(attempt + 1)
+
+    def _finish(self, status):
+        with self._lock:
+            if self.done:
+                return
+            finished_at = time.perf_counter()
+            if self._timeout_id is not None:
+                self._unschedule(self._timeout_id)
+                self._timeout_id = None
+            if self.watcher.on_confirmation == self._on_watcher_signal:
+                self.watcher.on_confirmation = None
+            if status == "confirmed":
+                self.watcher.consume()
+                self.result = SpawnResult(status, self.attempt, finished_at - self.started_at, finished_at - self.attempt_started_at)
+            else:
+                self.result = SpawnResult(status, self.attempt, None, None)
+        if self.on_done:
+            self.on_done(self.result)
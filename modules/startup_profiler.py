@@ -0,0 +1,232 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+import psutil
+
+try:
+    import resource # Not available on Windows, where psutil reports the peak working set instead
+except ImportError:
+    resource = None
+
+
+STARTUP_PROFILE_HISTORY_FILE_NAME = "startup_profile_history.jsonl"
+STARTUP_PROFILE_HISTORY_VERSION = 1
+MAX_HISTORY_LAUNCHES = 100  # Older launches are dropped from the history file
+DEFAULT_BASELINE_LAUNCHES = 5  # The latest launch is compared with the median of this many launches before it
+REGRESSION_RATIO = 1.25  # A phase regressed if it got 25% slower...
+REGRESSION_MIN_SECONDS = 0.05  # ...and at least 50 ms slower, so tiny phases don't flag on noise
+
+
+def get_startup_profile_history_path(script_dir):
+    """Returns the path of the startup timing history inside the data folder."""
+    return os.path.join(str(script_dir), "data", STARTUP_PROFILE_HISTORY_FILE_NAME)
+
+
+def get_peak_rss(process=None):
+    """
+    Returns the process's peak resident memory so far in bytes: the peak working set on
+    Windows, ru_maxrss elsewhere (kilobytes on Linux, bytes on macOS). Falls back to the
+    current RSS if neither is available.
+    """
+    process = process or psutil.Process()
+    memory_info = process.memory_info()
+    peak_wset = getattr(memory_info, "peak_wset", None)
+    if peak_wset is not None:
+        return peak_wset
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+    return memory_info.rss
+
+
+class StartupProfiler:
+    """
+    Times the phases of main() one after another: start_phase(name) ends the running phase
+    and starts the next, so the startup code only needs a call at each phase boundary.
+
+    For every phase it records wall time, CPU time (user + system of this process) and the
+    peak RSS reached by the end of the phase. finish() appends the launch to the history
+    file and returns it.
+    """
+
+    def __init__(self, history_path, label=None):
+        self.history_path = str(history_path)
+        self.label = label
+        self._process = psutil.Process()
+        self.phases = []
+        self._current = None
+        self._started_at = time.perf_counter()
+        self._started_cpu = time.process_time()
+        self.finished = False
+
+    def start_phase(self, name):
+        self.end_phase()
+        self._current = (name, time.perf_counter(), time.process_time(), self._process.memory_info().rss)
+
+    def end_phase(self):
+        if self._current is None:
+            return
+        name, wall_start, cpu_start, rss_start = self._current
+        self._current = None
+        rss_end = self._process.memory_info().rss
+        self.phases.append({
+            "name": name,
+            "wall_seconds": round(time.perf_counter() - wall_start, 6),
+            "cpu_seconds": round(time.process_time() - cpu_start, 6),
+            "peak_rss_bytes": get_peak_rss(self._process),
+            "rss_delta_bytes": rss_end - rss_start,
+        })
+
+    def finish(self):
+        """Ends the running phase and appends this launch to the history file. Only the first call records."""
+        if self.finished:
+            return None
+        self.finished = True
+        self.end_phase()
+        launch = {
+            "version": STARTUP_PROFILE_HISTORY_VERSION,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "label": self.label,
+            "total_wall_seconds": round(time.perf_counter() - self._started_at, 6),
+            "total_cpu_seconds": round(time.process_time() - self._started_cpu, 6),
+            "peak_rss_bytes": get_peak_rss(self._process),
+            "phases": self.phases,
+        }
+        append_startup_profile(self.history_path, launch)
+        return launch
+
+
+def read_startup_profile_history(history_path):
+    """Returns the recorded launches, oldest first. Unreadable lines are skipped."""
+    launches = []
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    launches.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"Warning: Skipping unreadable line in {history_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Warning: Could not read startup profile history {history_path}: {e}")
+    return launches
+
+
+def append_startup_profile(history_path, launch, max_launches=MAX_HISTORY_LAUNCHES):
+    """Appends one launch to the history file, rewriting it without the oldest launches once it holds too many."""
+    try:
+        os.makedirs(os.path.dirname(history_path), exist_ok=True)
+        launches = read_startup_profile_history(history_path)
+        if len(launches) >= max_launches:
+            launches = launches[-(max_launches - 1):] + [launch]
+            with open(history_path, "w", encoding="utf-8") as f:
+                for item in launches:
+                    f.write(json.dumps(item) + "\n")
+        else:
+            with open(history_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(launch) + "\n")
+    except OSError as e:
+        print(f"Warning: Could not write startup profile history {history_path}: {e}")
+
+
+def compare_startup_profiles(launches, baseline_launches=DEFAULT_BASELINE_LAUNCHES):
+    """
+    Compares the latest launch with the median of up to baseline_launches launches before it,
+    phase by phase (a phase is only compared with launches that also ran it).
+
+    Returns:
+        list: One dict per phase of the latest launch, in phase order, with its timings, the
+              baseline medians (None without history) and whether the phase regressed.
+    """
+    if not launches:
+        return []
+    latest = launches[-1]
+    previous = launches[-(baseline_launches + 1):-1] if baseline_launches > 0 else []
+    rows = []
+    for phase in latest.get("phases", []):
+        history = [p for launch in previous for p in launch.get("phases", []) if p.get("name") == phase["name"]]
+        baseline_wall = statistics.median(p["wall_seconds"] for p in history) if history else None
+        baseline_cpu = statistics.median(p["cpu_seconds"] for p in history) if history else None
+        regressed = (
+            baseline_wall is not None
+            and phase["wall_seconds"] > baseline_wall * REGRESSION_RATIO
+            and phase["wall_seconds"] - baseline_wall >= REGRESSION_MIN_SECONDS
+        )
+        rows.append({
+            "name": phase["name"],
+            "wall_seconds": phase["wall_seconds"],
+            "cpu_seconds": phase["cpu_seconds"],
+            "peak_rss_bytes": phase["peak_rss_bytes"],
+            "baseline_wall_seconds": baseline_wall,
+            "baseline_cpu_seconds": baseline_cpu,
+            "baseline_launches": len(history),
+            "regressed": regressed,
+        })
+    return rows
+
+
+def format_startup_profile_summary(launches, baseline_launches=DEFAULT_BASELINE_LAUNCHES):
+    """Returns a plain-text table of the latest launch's phases against the baseline, plus the regressed phases."""
+    if not launches:
+        return "No startup profile recorded yet."
+    latest = launches[-1]
+    rows = compare_startup_profiles(launches, baseline_launches)
+    lines = [
+        f"Startup profile {latest.get('timestamp', '?')}: {latest['total_wall_seconds']:.2f} s wall, "
+        f"{latest['total_cpu_seconds']:.2f} s CPU, peak RSS {latest['peak_rss_bytes'] / (1024 * 1024):.0f} MB "
+        f"(launch {len(launches)}; baseline: median of up to {baseline_launches} previous launches)",
+        f"{'phase':<32}{'wall ms':>10}{'cpu ms':>10}{'peak MB':>10}{'base ms':>10}{'change':>10}",
+    ]
+    for row in rows:
+        if row["baseline_wall_seconds"] is None:
+            baseline_text, change_text = "-", "new"
+        else:
+            baseline_text = f"{row['baseline_wall_seconds'] * 1000:.0f}"
+            change_text = f"{(row['wall_seconds'] - row['baseline_wall_seconds']) * 1000:+.0f}"
+        lines.append(
+            f"{row['name'][:31]:<32}{row['wall_seconds'] * 1000:>10.0f}{row['cpu_seconds'] * 1000:>10.0f}"
+            f"{row['peak_rss_bytes'] / (1024 * 1024):>10.0f}{baseline_text:>10}{change_text:>10}"
+            + ("  <-- REGRESSED" if row["regressed"] else "")
+        )
+    regressed = [row for row in rows if row["regressed"]]
+    if regressed:
+        lines.append("Regressed phases: " + ", ".join(
+            f"{row['name']} ({row['baseline_wall_seconds'] * 1000:.0f} -> {row['wall_seconds'] * 1000:.0f} ms)"
+            for row in regressed
+        ))
+    elif len(launches) > 1:
+        lines.append("No phase regressed.")
+    return "\n".join(lines)
+
+
+# ========================
+# Summary view (run this file directly)
+# ========================
+#   python modules/startup_profiler.py                # latest launch vs. the 5 before it
+#   python modules/startup_profiler.py --baseline 10 --json
+
+def main():
+    default_history_path = get_startup_profile_history_path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser = argparse.ArgumentParser(description="Shows the latest startup's phase timings and which phases regressed.")
+    parser.add_argument("--history", default=default_history_path, help="Startup profile history file.")
+    parser.add_argument("--baseline", type=int, default=DEFAULT_BASELINE_LAUNCHES, help="Previous launches to compare against.")
+    parser.add_argument("--json", action="store_true", help="Print the phase comparison as JSON.")
+    args = parser.parse_args()
+
+    launches = read_startup_profile_history(args.history)
+    if args.json:
+        print(json.dumps(compare_startup_profiles(launches, args.baseline), indent=2))
+    else:
+        print(format_startup_profile_summary(launches, args.baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+import os
+import time
+import zlib
+import sqlite3
+import threading
+from PIL import Image
+
+
+THUMBNAIL_CACHE_DB_NAME = "thumbnails.sqlite3"
+THUMBNAIL_CACHE_SCHEMA_VERSION = "1"
+DEFAULT_THUMBNAIL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+EVICTION_TARGET_RATIO = 0.9  # Evict down to 90% of the ceiling so a full cache doesn't evict on every insert
+TOUCH_FLUSH_THRESHOLD = 256  # Pending last-access updates written in one transaction
+
+
+def get_thumbnail_cache_db_path(disk_image_cache_dir):
+    """Returns the path of the thumbnail cache inside the disk image cache folder."""
+    return os.path.join(str(disk_image_cache_dir), THUMBNAIL_CACHE_DB_NAME)
+
+
+def get_source_fingerprint(source_path):
+    """Returns (size, mtime_ns) for a source picture, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def make_thumbnail_key(source_path, size, mode, resample):
+    """Cache key for one rendition of a picture: the same source can be cached at several sizes/modes."""
+    normalized_path = os.path.normcase(os.path.normpath(os.path.abspath(source_path)))
+    return f"{normalized_path}|{size[0]}x{size[1]}|{mode}|{int(resample)}"
+
+
+class ThumbnailCache:
+    """
+    Persistent, size-bounded LRU cache of resized pictures, stored as zlib-compressed raw
+    pixels in one SQLite blob table (instead of one loose file per picture).
+
+    Entries are keyed by source path + target size + mode + resample filter, and are only
+    used while the source file's size and mtime still match what was cached, so an edited
+    or replaced picture is decoded again. When the stored bytes exceed max_bytes, the
+    least recently used entries are evicted.
+    """
+
+    def __init__(self, db_path, max_bytes=DEFAULT_THUMBNAIL_CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(byte_size), 0) FROM thumbnails").fetchone()[0]
+        self._pending_touches = {}
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0  # Full-size source decodes done through get_or_create
+        self.evictions = 0
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is not None and row[0] != THUMBNAIL_CACHE_SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS thumbnails")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS thumbnails ("
+                " key TEXT PRIMARY KEY, source_size INTEGER NOT NULL, source_mtime_ns INTEGER NOT NULL,"
+                " mode TEXT NOT NULL, width INTEGER NOT NULL, height INTEGER NOT NULL,"
+                " data BLOB NOT NULL, byte_size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS thumbnails_last_access ON thumbnails (last_access)")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (THUMBNAIL_CACHE_SCHEMA_VERSION,)
+            )
+
+    def close(self):
+        with self._lock:
+            try:
+                self._flush_touches()
+                self._conn.close()
+            except sqlite3.Error as e:
+                print(f"Warning: Error closing thumbnail cache {self.db_path}: {e}")
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM thumbnails")
+            self._pending_touches.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "decodes": self.decodes,
+                "evictions": self.evictions,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    # --- LRU bookkeeping ---
+
+    def _flush_touches(self):
+        if not self._pending_touches:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE thumbnails SET last_access = ? WHERE key = ?",
+                [(last_access, key) for key, last_access in self._pending_touches.items()]
+            )
+        self._pending_touches.clear()
+
+    def _evict_if_needed(self):
+        if self._total_bytes <= self.max_bytes:
+            return
+        self._flush_touches()
+        target_bytes = int(self.max_bytes * EVICTION_TARGET_RATIO)
+        evicted_keys = []
+        for key, byte_size in self._conn.execute("SELECT key, byte_size FROM thumbnails ORDER BY last_access"):
+            if self._total_bytes <= target_bytes:
+                break
+            evicted_keys.append((key,))
+            self._total_bytes -= byte_size
+        with self._conn:
+            self._conn.executemany("DELETE FROM thumbnails WHERE key = ?", evicted_keys)
+        self.evictions += len(evicted_keys)
+
+    # --- Reads and writes ---
+
+    def get(self, source_path, size, mode, resample, fingerprint=None):
+        """
+        Returns the cached PIL image for this rendition, or None if it is missing or the
+        source file changed since it was cached.
+        """
+        fingerprint = fingerprint or get_source_fingerprint(source_path)
+        if fingerprint is None:
+            return None
+        key = make_thumbnail_key(source_path, size, mode, resample)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT source_size, source_mtime_ns, mode, width, height, data FROM thumbnails WHERE key = ?",
+                    (key,)
+                ).fetchone()
+                if row is None or (row[0], row[1]) != fingerprint:
+                    self.misses += 1
+                    return None
+                self.hits += 1
+                self._pending_touches[key] = time.time()
+                if len(self._pending_touches) >= TOUCH_FLUSH_THRESHOLD:
+                    self._flush_touches()
+        except sqlite3.Error as e:
+            print(f"Warning: Thumbnail cache read failed for {source_path}: {e}")
+            return None
+        try:
+            return Image.frombytes(row[2], (row[3], row[4]), zlib.decompress(row[5]))
+        except Exception as e:
+            print(f"Warning: Corrupt thumbnail cache entry for {source_path}: {e}")
+            return None
+
+    def put(self, source_path, size, mode, resample, image, fingerprint):
+        """Stores a resized image for the source fingerprint it was decoded from."""
+        if fingerprint is None:
+            return
+        key = make_thumbnail_key(source_path, size, mode, resample)
+        data = zlib.compress(image.tobytes(), 1)
+        try:
+            with self._lock:
+                old_row = self._conn.execute("SELECT byte_size FROM thumbnails WHERE key = ?", (key,)).fetchone()
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO thumbnails"
+                        " (key, source_size, source_mtime_ns, mode, width, height, data, byte_size, last_access)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (key, fingerprint[0], fingerprint[1], image.mode, image.width, image.height,
+                         sqlite3.Binary(data), len(data), time.time())
+                    )
+                self._pending_touches.pop(key, None)
+                self._total_bytes += len(data) - (old_row[0] if old_row else 0)
+                self._evict_if_needed()
+        except sqlite3.Error as e:
+            print(f"Warning: Thumbnail cache write failed for {source_path}: {e}")
+
+    def get_or_create(self, source_path, size, mode, resample):
+        """
+        Returns the resized picture, decoding and resizing the source only on a cache miss.
+        Raises whatever Image.open raises if the source cannot be decoded.
+        """
+        fingerprint = get_source_fingerprint(source_path)
+        image = self.get(source_path, size, mode, resample, fingerprint)
+        if image is not None:
+            return image
+        image = Image.open(source_path).convert(mode).resize(size, resample)
+        with self._lock:
+            self.decodes += 1
+        self.put(source_path, size, mode, resample, image, fingerprint)
+        return image
+
+
+def load_thumbnail(thumbnail_cache, source_path, size, mode, resample):
+    """
+    Opens, converts and resizes a picture, going through thumbnail_cache when one is given
+    (None means the disk image cache is disabled).
+    """
+    if thumbnail_cache is None:
+        return Image.open(source_path).convert(mode).resize(size, resample)
+    return thumbnail_cache.get_or_create(source_path, size, mode, resample)
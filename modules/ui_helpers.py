@@ -1,13 +1,15 @@
 import os
+import sys
 import tkinter as tk
 from tkinter import messagebox
 
-import win32gui
-import win32con
-import win32api
+if sys.platform == "win32":
+    import win32gui
+    import win32con
+    import win32api
 
-import win32process
-import pywintypes
+    import win32process
+    import pywintypes
 import psutil
 import time
 
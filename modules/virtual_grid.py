@@ -0,0 +1,72 @@
+MAIN_GRID_OVERSCAN_ROWS = 2  # Rows bound above and below the viewport so scrolling doesn't show empty cells
+HIDDEN_BORDER_SLACK = 4  # Hidden items get a 2px red highlight border on each side
+
+
+class VirtualGridLayout:
+    """
+    Geometry of the virtualized main grid.
+
+    The grid is split into sections (one per visible category), each a block of
+    fixed-size cells laid out in `columns` columns starting at a known y offset in
+    the scrollable frame. Nothing here touches Tk: the app measures one cell, builds
+    the layout, and asks it which cells intersect the viewport so only those get
+    widgets from the slot pool.
+    """
+
+    def __init__(self, columns, cell_width, cell_height, padding_x, padding_y):
+        """
+        Args:
+            columns (int): Number of columns.
+            cell_width (int): Item widget width plus horizontal padding on both sides.
+            cell_height (int): Item widget height plus vertical padding on both sides.
+            padding_x (int): Horizontal padding left of each item widget.
+            padding_y (int): Vertical padding above each item widget.
+        """
+        self.columns = max(1, int(columns))
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.padding_x = padding_x
+        self.padding_y = padding_y
+        self.sections = []  # (section key, items, top y)
+
+    def rows_for(self, item_count):
+        return (item_count + self.columns - 1) // self.columns
+
+    def section_height(self, item_count):
+        """Height in pixels of a section holding item_count items."""
+        return self.rows_for(item_count) * self.cell_height
+
+    def grid_width(self):
+        return self.columns * self.cell_width
+
+    def add_section(self, key, items, top):
+        self.sections.append((key, items, top))
+
+    def item_count(self):
+        return sum(len(items) for _, items, _ in self.sections)
+
+    def cell_position(self, top, index):
+        """Returns the (x, y) of the item widget at index in a section starting at top."""
+        row, col = divmod(index, self.columns)
+        return (self.padding_x + col * self.cell_width,
+                top + row * self.cell_height + self.padding_y)
+
+    def visible_cells(self, view_top, view_bottom, overscan_rows=MAIN_GRID_OVERSCAN_ROWS):
+        """
+        Returns the cells intersecting [view_top, view_bottom] plus overscan_rows rows on
+        either side, as (section key, index, item, x, y) tuples in layout order.
+        """
+        cells = []
+        overscan = overscan_rows * self.cell_height
+        for key, items, top in self.sections:
+            if not items:
+                continue
+            last_section_row = self.rows_for(len(items)) - 1
+            first_row = max(0, int((view_top - overscan - top) // self.cell_height))
+            last_row = min(last_section_row, int((view_bottom + overscan - top) // self.cell_height))
+            if first_row > last_row:
+                continue
+            for index in range(first_row * self.columns, min(len(items), (last_row + 1) * self.columns)):
+                x, y = self.cell_position(top, index)
+                cells.append((key, index, items[index], x, y))
+        return cells
@@ -0,0 +1,47 @@
+import os
+
+
+class ZipInstallTimes:
+    """
+    Install dates (modification times) of the mod archives, for sorting the main grid by
+    install date without touching the disk on every regroup.
+
+    An archive is looked up in the repo folder first, then directly in the mods folder,
+    the same two places format_grouped_data used to stat; a missing one has time 0. Each
+    name is stat'ed once. apply_mod_zip_delta drops the names of archives that changed
+    and a full rescan drops everything, so the next lookup stats again.
+    """
+
+    def __init__(self, repo_folder, mods_folder):
+        self.repo_folder = repo_folder
+        self.mods_folder = mods_folder
+        self._times = {}  # {zip file name as in the data items, with ".zip": mtime or 0}
+        self.stat_lookups = 0
+
+    def __len__(self):
+        return len(self._times)
+
+    def get(self, zip_file):
+        """Modification time of the archive zip_file (".zip" is added if missing), or 0 if it is in neither folder."""
+        zip_file_name = zip_file if zip_file.lower().endswith(".zip") else zip_file + ".zip"
+        modification_time = self._times.get(zip_file_name)
+        if modification_time is None:
+            modification_time = 0
+            self.stat_lookups += 1
+            for folder in (self.repo_folder, self.mods_folder):
+                try:
+                    modification_time = os.path.getmtime(os.path.join(folder, zip_file_name))
+                    break
+                except OSError:
+                    continue
+            self._times[zip_file_name] = modification_time
+        return modification_time
+
+    def invalidate(self, zip_names=None):
+        """Forgets the given archive file names (case-insensitive), or every archive if zip_names is None."""
+        if zip_names is None:
+            self._times.clear()
+            return
+        stale_names = {name.lower() for name in zip_names}
+        for zip_file_name in [name for name in self._times if name.lower() in stale_names]:
+            del self._times[zip_file_name]
@@ -2,41 +2,73 @@ import os
 import zipfile
 import pathlib # Use pathlib for easier path handling
 import re
+import json
 
-# --- get_zip_tree_optimized remains the same ---
-def get_zip_tree_optimized(zip_path, output_file, indent_str="    "):
+ZIP_INDEX_FILE_NAME = "zip_index.json"
+ZIP_INDEX_VERSION = 1
+VEHICLE_FOLDER_PATTERN = re.compile(r"vehicles/([^/]+)/")
+
+# --- read_zip_namelist (NEW: single read of the central directory) ---
+def read_zip_namelist(zip_path):
     """
-    Extracts and writes the folder structure and files from a ZIP file, optimized for speed
-    by reducing write operations. (No changes needed here)
+    Opens a ZIP file once and returns its central directory entry names.
+
+    Args:
+        zip_path: Path to the zip file.
+
+    Returns:
+        tuple: (namelist, error_line). On success error_line is None, on failure
+               namelist is None and error_line holds the line written to zip_structure.txt.
     """
-    output_lines = []
-    zip_path_str = str(zip_path)
+    namelist, error_line, _ = _read_zip_namelist(zip_path)
+    return namelist, error_line
 
+def _read_zip_namelist(zip_path):
+    """read_zip_namelist plus whether a failure may go away on its own (anything but a corrupt archive, e.g. a locked file)."""
+    zip_path_str = str(zip_path)
     try:
         with zipfile.ZipFile(zip_path_str, 'r') as zfile:
-            namelist = zfile.namelist()
-            output_lines.append(f"Path = {zip_path_str}\n")
-            dir_set = set()
-            file_set = set()
-            for name in namelist:
-                normalized_name = name.replace("/", "\\")
-                if name.endswith('/'):
-                    dir_set.add(normalized_name)
-                else:
-                    file_set.add(normalized_name)
-
-            for dir_path in sorted(list(dir_set)):
-                output_lines.append(f"Path = {dir_path}\n")
-            for file_path in sorted(list(file_set)):
-                output_lines.append(f"Path = {file_path}\n")
-
-            output_lines.append("\n")
-            output_file.writelines(output_lines)
-
+            return zfile.namelist(), None, False
     except zipfile.BadZipFile:
-        output_file.writelines([f"Error: Invalid or corrupt ZIP file: {zip_path_str}\n", "\n"])
+        return None, f"Error: Invalid or corrupt ZIP file: {zip_path_str}\n", False
     except Exception as e:
-        output_file.writelines([f"Error processing ZIP file: {zip_path_str}: {e}\n", "\n"])
+        return None, f"Error processing ZIP file: {zip_path_str}: {e}\n", True
+
+# --- format_zip_tree_lines (NEW: builds the zip_structure.txt block from a namelist) ---
+def format_zip_tree_lines(zip_path, namelist):
+    """
+    Builds the lines describing a ZIP file's folder structure, in the same layout
+    get_zip_tree_optimized writes them.
+    """
+    output_lines = [f"Path = {str(zip_path)}\n"]
+    dir_set = set()
+    file_set = set()
+    for name in namelist:
+        normalized_name = name.replace("/", "\\")
+        if name.endswith('/'):
+            dir_set.add(normalized_name)
+        else:
+            file_set.add(normalized_name)
+
+    for dir_path in sorted(dir_set):
+        output_lines.append(f"Path = {dir_path}\n")
+    for file_path in sorted(file_set):
+        output_lines.append(f"Path = {file_path}\n")
+
+    output_lines.append("\n")
+    return output_lines
+
+# --- get_zip_tree_optimized (now a thin wrapper over read_zip_namelist) ---
+def get_zip_tree_optimized(zip_path, output_file, indent_str="    "):
+    """
+    Extracts and writes the folder structure and files from a ZIP file, optimized for speed
+    by reducing write operations.
+    """
+    namelist, error_line = read_zip_namelist(zip_path)
+    if namelist is None:
+        output_file.writelines([error_line, "\n"])
+        return
+    output_file.writelines(format_zip_tree_lines(zip_path, namelist))
 
 # --- find_all_zip_files remains the same ---
 def find_all_zip_files(folder_path: pathlib.Path) -> list:
@@ -54,15 +86,16 @@ def find_all_zip_files(folder_path: pathlib.Path) -> list:
     print(f"    Found {len(zip_paths)} zip files.")
     return zip_paths
 
-# --- check_zip_for_prioritization_criteria (MODIFIED NAME & LOGIC) ---
-def check_zip_for_prioritization_criteria(zip_path: pathlib.Path) -> bool:
+# --- namelist_meets_prioritization_criteria (NEW: works on an already read namelist) ---
+def namelist_meets_prioritization_criteria(namelist, zip_name=""):
     """
-    Checks if a zip file meets prioritization criteria (likely defines a base vehicle):
-    1. Contains at least one .jbeam file inside a 'vehicles/[foldername]/' path.
+    Checks if a zip's entry names meet prioritization criteria (likely defines a base vehicle):
+    1. Contains at least one .pc file inside a 'vehicles/[foldername]/' path.
     2. Contains an 'info.json' file inside that *same* 'vehicles/[foldername]/' path.
 
     Args:
-        zip_path (pathlib.Path): Path to the zip file.
+        namelist (list): Entry names from the zip's central directory.
+        zip_name (str): Zip file name, only used for logging.
 
     Returns:
         bool: True if criteria are met, False otherwise.
@@ -70,37 +103,142 @@ def check_zip_for_prioritization_criteria(zip_path: pathlib.Path) -> bool:
     vehicle_folders_with_jbeam = set()
     vehicle_folders_with_info = set()
 
-    try:
-        with zipfile.ZipFile(str(zip_path), 'r') as zf:
-            for name in zf.namelist():
-                normalized_name = name.replace('\\', '/').lower() # Normalize to forward slash and lowercase
+    for name in namelist:
+        normalized_name = name.replace('\\', '/').lower() # Normalize to forward slash and lowercase
 
-                # Check for paths starting with vehicles/ followed by a folder name
-                match = re.match(r"vehicles/([^/]+)/", normalized_name)
-                if match:
-                    foldername = match.group(1) # Extract folder name (e.g., 'pickup', 'rg_rc')
+        # Check for paths starting with vehicles/ followed by a folder name
+        match = VEHICLE_FOLDER_PATTERN.match(normalized_name)
+        if match:
+            foldername = match.group(1) # Extract folder name (e.g., 'pickup', 'rg_rc')
 
-                    # Check if it's a jbeam within this folder
-                    if normalized_name.endswith(".pc"):
-                        vehicle_folders_with_jbeam.add(foldername)
+            # Check if it's a .pc within this folder
+            if normalized_name.endswith(".pc"):
+                vehicle_folders_with_jbeam.add(foldername)
 
-                    # Check if it's an info.json within this folder
-                    if os.path.basename(normalized_name) == "info.json":
-                        vehicle_folders_with_info.add(foldername)
+            # Check if it's an info.json within this folder
+            if os.path.basename(normalized_name) == "info.json":
+                vehicle_folders_with_info.add(foldername)
 
-        # Check if there's any folder that has BOTH a jbeam AND an info.json
-        common_folders = vehicle_folders_with_jbeam.intersection(vehicle_folders_with_info)
+    # Check if there's any folder that has BOTH a .pc AND an info.json
+    common_folders = vehicle_folders_with_jbeam.intersection(vehicle_folders_with_info)
 
-        if common_folders:
-            print(f"    PRIORITIZE: {zip_path.name} (Found folder(s) with both .pc and info.json: {common_folders})")
-            return True
-        else:
-            print(f"    DEFER: {zip_path.name} (No folder found containing both .pc and info.json)")
-            return False
+    if common_folders:
+        print(f"    PRIORITIZE: {zip_name} (Found folder(s) with both .pc and info.json: {common_folders})")
+        return True
+    print(f"    DEFER: {zip_name} (No folder found containing both .pc and info.json)")
+    return False
+
+# --- check_zip_for_prioritization_criteria (kept for callers that only have a path) ---
+def check_zip_for_prioritization_criteria(zip_path: pathlib.Path) -> bool:
+    """
+    Opens a zip file and checks it with namelist_meets_prioritization_criteria.
+
+    Args:
+        zip_path (pathlib.Path): Path to the zip file.
 
-    except (zipfile.BadZipFile, FileNotFoundError, Exception) as e:
-        print(f"    Warning: Could not check zip file {zip_path} for prioritization: {e}")
+    Returns:
+        bool: True if criteria are met, False otherwise.
+    """
+    namelist, error_line = read_zip_namelist(zip_path)
+    if namelist is None:
+        print(f"    Warning: Could not check zip file {zip_path} for prioritization: {error_line.strip()}")
         return False # Assume does not meet criteria if error
+    return namelist_meets_prioritization_criteria(namelist, zip_path.name)
+
+# --- Persistent per-archive index (NEW) ---
+def load_zip_index(index_path: pathlib.Path) -> dict:
+    """
+    Loads the per-archive index written by save_zip_index.
+
+    Returns:
+        dict: {zip_path_str: {"size", "mtime_ns", "prioritized", "lines"}}, or an
+              empty dict if the index is missing, unreadable or from another version.
+              Archives that failed with a transient error are never saved, so they are
+              read again on the next run.
+    """
+    if not index_path.is_file():
+        return {}
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != ZIP_INDEX_VERSION:
+            print(f"INFO (zippy): {index_path.name} version mismatch, rebuilding index.")
+            return {}
+        return payload.get("archives", {})
+    except Exception as e:
+        print(f"WARN (zippy): Could not read {index_path.name}, rebuilding index: {e}")
+        return {}
+
+def save_zip_index(index_path: pathlib.Path, archives: dict):
+    """Writes the per-archive index atomically (temp file + replace), leaving out transient read failures."""
+    temp_path = index_path.with_suffix(index_path.suffix + ".tmp")
+    persistent_archives = {key: entry for key, entry in archives.items() if not entry.get("transient_error")}
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": ZIP_INDEX_VERSION, "archives": persistent_archives}, f)
+        os.replace(temp_path, index_path)
+    except Exception as e:
+        print(f"ERROR (zippy): Failed to write {index_path.name}: {e}")
+
+def get_zip_fingerprint(zip_path: pathlib.Path):
+    """Returns (size, mtime_ns) for a zip file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(zip_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+def index_zip_archive(zip_path: pathlib.Path, fingerprint) -> dict:
+    """
+    Reads one archive's central directory exactly once and returns its index entry,
+    holding both the prioritization result and its zip_structure.txt block.
+    A read that failed for a reason other than a corrupt archive (locked file, missing
+    permission, ...) is flagged "transient_error" so it is retried instead of kept.
+    """
+    namelist, error_line, transient_error = _read_zip_namelist(zip_path)
+    if namelist is None:
+        print(f"    Warning: Could not check zip file {zip_path} for prioritization: {error_line.strip()}")
+        prioritized = False
+        lines = [error_line, "\n"]
+    else:
+        prioritized = namelist_meets_prioritization_criteria(namelist, zip_path.name)
+        lines = format_zip_tree_lines(zip_path, namelist)
+    entry = {
+        "size": fingerprint[0],
+        "mtime_ns": fingerprint[1],
+        "prioritized": prioritized,
+        "lines": lines,
+    }
+    if transient_error:
+        entry["transient_error"] = True
+    return entry
+
+def update_zip_index(zip_paths, previous_index: dict):
+    """
+    Brings the archive index up to date for the given zip paths.
+    Only archives whose (path, size, mtime) fingerprint changed, or whose last read
+    failed transiently, are re-read.
+
+    Returns:
+        tuple: (new_index, stats) where stats counts reused, indexed and removed archives.
+    """
+    new_index = {}
+    stats = {"reused": 0, "indexed": 0, "removed": 0}
+    for zip_path in zip_paths:
+        key = str(zip_path)
+        fingerprint = get_zip_fingerprint(zip_path)
+        if fingerprint is None:
+            continue
+        cached = previous_index.get(key)
+        if (cached and not cached.get("transient_error")
+                and cached.get("size") == fingerprint[0] and cached.get("mtime_ns") == fingerprint[1]):
+            new_index[key] = cached
+            stats["reused"] += 1
+        else:
+            new_index[key] = index_zip_archive(zip_path, fingerprint)
+            stats["indexed"] += 1
+    stats["removed"] = len(set(previous_index) - set(new_index))
+    return new_index, stats
 
 # --- main function (MODIFIED to use new check function) ---
 def main():
@@ -142,13 +280,25 @@ def main():
     all_zip_paths = sorted(list(set(all_zip_paths)))
     print(f"\nTotal unique zip files found: {len(all_zip_paths)}")
 
-    # --- Prioritize Zips based on NEW criteria ---
+    # --- Index Zips (each central directory is read at most once, unchanged zips are reused) ---
+    index_path = parent_dir / "data" / ZIP_INDEX_FILE_NAME
+    previous_index = load_zip_index(index_path)
+    print(f"\n--- Indexing Zips ({len(previous_index)} previously indexed) ---")
+    zip_index, index_stats = update_zip_index(all_zip_paths, previous_index)
+    print(f"  Reused: {index_stats['reused']}, Re-indexed: {index_stats['indexed']}, Removed: {index_stats['removed']}")
+    index_changed = index_stats["indexed"] > 0 or index_stats["removed"] > 0
+    if index_changed or not index_path.is_file():
+        save_zip_index(index_path, zip_index)
+
+    # --- Prioritize Zips based on NEW criteria (read from the index) ---
     print("\n--- Prioritizing Zips (Root info.json AND vehicles/ path) ---")
     prioritized_zips = []
     deferred_zips = []
     for zip_path in all_zip_paths:
-        # Use the new checking function
-        if check_zip_for_prioritization_criteria(zip_path):
+        entry = zip_index.get(str(zip_path))
+        if entry is None:
+            continue # Vanished between scan and stat
+        if entry["prioritized"]:
             prioritized_zips.append(zip_path)
         else:
             deferred_zips.append(zip_path)
@@ -156,22 +306,26 @@ def main():
     # Combine for final processing order
     final_zip_order = prioritized_zips + deferred_zips
     print(f"\n--- Final Zip Processing Order ---")
-    print(f"  Prioritized ({len(prioritized_zips)}): {[p.name for p in prioritized_zips]}") # Print names for brevity
-    print(f"  Deferred ({len(deferred_zips)}): {[p.name for p in deferred_zips]}")
+    print(f"  Prioritized ({len(prioritized_zips)}), Deferred ({len(deferred_zips)})")
 
     # --- Write Output File in Prioritized Order ---
+    if not index_changed and output_file_path.is_file():
+        print(f"\n--- No zip changes detected, keeping existing {output_file_path} ---")
+        return
+
     print(f"\n--- Writing prioritized structure to {output_file_path} ---")
     try:
         with open(output_file_path, "w", encoding="utf-8", errors="replace") as output_file:
             output_file.write("--- Zip Structure (Prioritized: Root info.json AND vehicles/ path) ---\n\n")
             print(f"  Writing {len(final_zip_order)} zip file structures...")
             for zip_path in final_zip_order: # Iterate through the final combined list
-                get_zip_tree_optimized(zip_path, output_file)
+                output_file.writelines(zip_index[str(zip_path)]["lines"])
             output_file.write("\nDone.\n")
         print(f"Output written successfully.")
     except Exception as e:
         print(f"ERROR: Failed to write output file {output_file_path}: {e}")
-
+        # Force a full rewrite next run so zip_structure.txt never lags the index
+        save_zip_index(index_path, {})
 
 if __name__ == "__main__":
     main()